@@ -6,7 +6,13 @@ Potential Aerodynamics Module
 .. toctree:
     :hidden:
 
+    Potential.assembly
+    Potential.backends
     Potential.lifting_surfaces
+    Potential.linear_solvers
+    Potential.matrix_cache
+    Potential.treecode
+    Potential.unsteady
     Potential.vorticity
     Potential.wing_lspt
 
@@ -18,20 +24,42 @@ Potential Aerodynamics Module
 .. currentmodule:: ICARUS.Aerodynamics.Potential
 
 This package contains class and routines for potential aerodynamic analysis on ICARUS objects.
-The package is divided in three libraries:
+The package is divided in the following libraries:
 
 Lifting Surfaces Potential Theory
 ==================================
 .. autosummary::
     :toctree:
 
+    ICARUS.Aerodynamics.Potential.assembly - Vectorized assembly of the influence matrices and velocity field of a vortex lattice
+    ICARUS.Aerodynamics.Potential.backends - Numpy and optional numba kernels of the Biot-Savart law
     ICARUS.Aerodynamics.Potential.lifting_surfaces - Interface for solver class
+    ICARUS.Aerodynamics.Potential.linear_solvers - Iterative solvers of the panel system and their convergence reports
+    ICARUS.Aerodynamics.Potential.matrix_cache - On disk cache of factorized influence matrices
+    ICARUS.Aerodynamics.Potential.treecode - Barnes-Hut treecode for the induced velocities and matrix free operators of large lattices
+    ICARUS.Aerodynamics.Potential.unsteady - Free wake of the time marching vortex lattice solver
     ICARUS.Aerodynamics.Potential.vorticity - Functions to solve the Biotsavart equation for different elements
     ICARUS.Aerodynamics.Potential.wing_lspt - A class modeling a wing for solving the lifting surfaces using panels and a potential theory formulation
 
 """
+from . import assembly
+from . import backends
 from . import lifting_surfaces
+from . import linear_solvers
+from . import matrix_cache
+from . import treecode
+from . import unsteady
 from . import vorticity
 from . import wing_lspt
 
-__all__ = ["lifting_surfaces", "vorticity", "wing_lspt"]
+__all__ = [
+    "assembly",
+    "backends",
+    "lifting_surfaces",
+    "linear_solvers",
+    "matrix_cache",
+    "treecode",
+    "unsteady",
+    "vorticity",
+    "wing_lspt",
+]
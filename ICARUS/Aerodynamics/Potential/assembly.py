@@ -0,0 +1,607 @@
+"""
+Assembly of the influence matrices of a vortex lattice. The matrices are
+built as whole array operations using the batched vorticity elements instead
+of calling the scalar elements once for every (control point, panel) pair.
+Large matrices can be split into row blocks assembled by a pool of processes
+that write into shared memory. The velocity field of a solved lattice is
+evaluated at off body points the same way, streaming the points in chunks.
+"""
+from multiprocessing import Pool
+from multiprocessing import shared_memory
+from typing import Callable
+
+import numpy as np
+from scipy.sparse.linalg import LinearOperator
+
+from ICARUS.Aerodynamics.Potential.backends import get_backend
+from ICARUS.Aerodynamics.Potential.backends import ring_field
+from ICARUS.Aerodynamics.Potential.backends import ring_influences
+from ICARUS.Aerodynamics.Potential.vorticity import CHUNK_SIZE
+from ICARUS.Aerodynamics.Potential.vorticity import ground_effect
+from ICARUS.Aerodynamics.Potential.vorticity import ground_effect_batch
+from ICARUS.Aerodynamics.Potential.vorticity import hshoe2
+from ICARUS.Aerodynamics.Potential.vorticity import hshoe2_batch
+from ICARUS.Aerodynamics.Potential.vorticity import hshoeSL2
+from ICARUS.Aerodynamics.Potential.vorticity import hshoeSL2_batch
+from ICARUS.Aerodynamics.Potential.vorticity import symm_wing_panels
+from ICARUS.Aerodynamics.Potential.vorticity import symm_wing_panels_batch
+from ICARUS.Aerodynamics.Potential.vorticity import voring
+from ICARUS.Aerodynamics.Potential.vorticity import voring_batch
+from ICARUS.Core.types import BoolArray
+from ICARUS.Core.types import FloatArray
+from ICARUS.Core.types import IntArray
+
+# Batched counterpart of each scalar vorticity element
+BATCHED_ELEMENTS: dict[
+    Callable[..., tuple[FloatArray, FloatArray]],
+    Callable[..., tuple[FloatArray, FloatArray]],
+] = {
+    voring: voring_batch,
+    symm_wing_panels: symm_wing_panels_batch,
+    hshoe2: hshoe2_batch,
+    hshoeSL2: hshoeSL2_batch,
+    ground_effect: ground_effect_batch,
+}
+
+# Reflections of the images of a lattice of vortex rings that each element adds up. The
+# numba backend evaluates these elements with its fused ring kernels.
+RING_ELEMENT_REFLECTIONS: dict[Callable[..., tuple[FloatArray, FloatArray]], list[list[float]]] = {
+    voring_batch: [[1.0, 1.0, 1.0]],
+    symm_wing_panels_batch: [[1.0, 1.0, 1.0], [1.0, -1.0, 1.0]],
+}
+
+
+def get_batched_element(
+    solve_fun: Callable[..., tuple[FloatArray, FloatArray]],
+) -> Callable[..., tuple[FloatArray, FloatArray]]:
+    """
+    Returns the batched counterpart of a vorticity element. Batched elements are returned as is.
+
+    Args:
+        solve_fun (Callable[..., tuple[FloatArray, FloatArray]]): Scalar or batched vorticity element
+
+    Raises:
+        ValueError: If the element has no batched counterpart
+
+    Returns:
+        Callable[..., tuple[FloatArray, FloatArray]]: Batched vorticity element
+    """
+    if solve_fun in BATCHED_ELEMENTS.values():
+        return solve_fun
+    try:
+        return BATCHED_ELEMENTS[solve_fun]
+    except KeyError:
+        raise ValueError(f"No batched counterpart for element {solve_fun.__name__}")
+
+
+def ring_images(element: Callable[..., tuple[FloatArray, FloatArray]]) -> FloatArray | None:
+    """
+    Returns the reflections and offsets of the images of a lattice of vortex rings that an
+    element adds up, in the layout of the ring kernels of the numba backend.
+
+    Args:
+        element (Callable[..., tuple[FloatArray, FloatArray]]): Scalar, batched or ground image element
+
+    Returns:
+        FloatArray | None: (I, 2, 3) reflections and offsets, or None if the element has no ring kernel
+    """
+    ground: float | None = getattr(element, "ground", None)
+    if ground is not None:
+        element = getattr(element, "source_element")
+    reflections: list[list[float]] | None = RING_ELEMENT_REFLECTIONS.get(BATCHED_ELEMENTS.get(element, element))
+    if reflections is None:
+        return None
+
+    images: FloatArray = np.zeros((len(reflections), 2, 3))
+    images[:, 0] = reflections
+    if ground is not None:
+        images[:, 0, 2] *= -1
+        images[:, 1, 2] = 2 * ground
+    return images
+
+
+def lattice_chunk(grid: FloatArray, chunk_size: int = CHUNK_SIZE) -> int:
+    """
+    Returns the number of points that can be evaluated at once against a grid
+    without exceeding chunk_size (point, panel) pairs.
+
+    Args:
+        grid (FloatArray): Grid of the lattice
+        chunk_size (int, optional): Maximum number of (point, panel) pairs evaluated at once.
+
+    Returns:
+        int: Number of points per chunk
+    """
+    return max(1, chunk_size // (grid.shape[0] * grid.shape[1]))
+
+
+def influence_matrices(
+    points: FloatArray,
+    normals: FloatArray,
+    grid: FloatArray,
+    element: Callable[..., tuple[FloatArray, FloatArray]],
+    chunk_size: int = CHUNK_SIZE,
+) -> tuple[FloatArray, FloatArray]:
+    """
+    Computes the normal velocities induced at each point by every unit element of the grid.
+    The points are processed in chunks so that the (P, K, 3) velocities are never held at once.
+    With the numba backend lattices of vortex rings are evaluated by a fused kernel instead.
+
+    Args:
+        points (FloatArray): (P, 3) array of evaluation points
+        normals (FloatArray): (P, 3) array of unit normals at the points
+        grid (FloatArray): Grid of the lattice
+        element (Callable[..., tuple[FloatArray, FloatArray]]): Batched vorticity element
+        chunk_size (int, optional): Maximum number of (point, panel) pairs evaluated at once.
+
+    Returns:
+        tuple[FloatArray, FloatArray]: (P, K) influence matrices of the elements (a) and of their
+        trailing lines (b)
+    """
+    points = np.atleast_2d(points)
+    normals = np.atleast_2d(normals)
+    if get_backend() == "numba":
+        images: FloatArray | None = ring_images(element)
+        if images is not None:
+            return ring_influences(points, normals, grid, images)
+
+    a: FloatArray | None = None
+    b: FloatArray | None = None
+    step: int = lattice_chunk(grid, chunk_size)
+    for start in range(0, points.shape[0], step):
+        stop: int = start + step
+        U, Ustar = element(points[start:stop], grid, chunk_size=chunk_size)
+        if a is None or b is None:
+            a = np.empty((points.shape[0], U.shape[1]))
+            b = np.empty((points.shape[0], U.shape[1]))
+        a[start:stop] = np.einsum("pki,pi->pk", U, normals[start:stop])
+        b[start:stop] = np.einsum("pki,pi->pk", Ustar, normals[start:stop])
+
+    if a is None or b is None:
+        raise ValueError("No points to evaluate")
+    return a, b
+
+
+def ground_image(
+    element: Callable[..., tuple[FloatArray, FloatArray]],
+    ground: float,
+) -> Callable[..., tuple[FloatArray, FloatArray]]:
+    """
+    Returns a batched element that computes only the velocities induced by the image
+    of the grid about the ground plane z = ground. The image carries the opposite
+    circulation, so at a point P it induces the reflection of the velocity that the
+    grid induces at the image of P. The images of all the points are evaluated in one pass.
+
+    Args:
+        element (Callable[..., tuple[FloatArray, FloatArray]]): Scalar or batched vorticity element
+        ground (float): Height of the ground plane
+
+    Returns:
+        Callable[..., tuple[FloatArray, FloatArray]]: Batched element of the image lattice
+    """
+    element = get_batched_element(element)
+    reflection: FloatArray = np.array([1.0, 1.0, -1.0])
+    offset: FloatArray = np.array([0.0, 0.0, 2 * ground])
+
+    def image_element(
+        points: FloatArray,
+        grid: FloatArray,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> tuple[FloatArray, FloatArray]:
+        U, Ustar = element(points * reflection + offset, grid, chunk_size=chunk_size)
+        return U * reflection, Ustar * reflection
+
+    # Lets the numba backend recognize the image of a lattice of vortex rings
+    setattr(image_element, "source_element", element)
+    setattr(image_element, "ground", ground)
+    return image_element
+
+
+def _fill_rows(
+    a_np: FloatArray,
+    b_np: FloatArray,
+    rows: IntArray,
+    points: FloatArray,
+    normals: FloatArray,
+    grid: FloatArray,
+    element: Callable[..., tuple[FloatArray, FloatArray]],
+    chunk_size: int = CHUNK_SIZE,
+) -> None:
+    """
+    Writes the influences on the given points into the given rows of a_np and b_np.
+    """
+    step: int = lattice_chunk(grid, chunk_size)
+    for start in range(0, rows.shape[0], step):
+        a_np[rows[start : start + step]], b_np[rows[start : start + step]] = influence_matrices(
+            points[start : start + step],
+            normals[start : start + step],
+            grid,
+            element,
+            chunk_size,
+        )
+
+
+def _fill_shared_rows(
+    names: tuple[str, str],
+    n_panels: int,
+    rows: IntArray,
+    points: FloatArray,
+    normals: FloatArray,
+    grid: FloatArray,
+    element: Callable[..., tuple[FloatArray, FloatArray]],
+    ground: float | None,
+    chunk_size: int = CHUNK_SIZE,
+    b_dtype: type = float,
+) -> None:
+    """
+    Worker of _assemble_body_rows. Attaches to the shared matrices and fills a block of rows.
+    The ground image element is a closure, so it is built here instead of being pickled.
+    """
+    blocks: list[shared_memory.SharedMemory] = [shared_memory.SharedMemory(name=name) for name in names]
+    try:
+        a_np: FloatArray = np.ndarray((n_panels, n_panels), buffer=blocks[0].buf)
+        b_np: FloatArray = np.ndarray((n_panels, n_panels), dtype=b_dtype, buffer=blocks[1].buf)
+        if ground is not None:
+            element = ground_image(element, ground)
+        _fill_rows(a_np, b_np, rows, points, normals, grid, element, chunk_size)
+        # The views must be released before the blocks are closed
+        del a_np, b_np
+    finally:
+        for block in blocks:
+            block.close()
+
+
+def _assemble_body_rows(
+    control_points: FloatArray,
+    control_nj: FloatArray,
+    grid: FloatArray,
+    element: Callable[..., tuple[FloatArray, FloatArray]],
+    ground: float | None = None,
+    chunk_size: int = CHUNK_SIZE,
+    workers: int = 1,
+    b_dtype: type = float,
+) -> tuple[FloatArray, FloatArray]:
+    """
+    Fills the no penetration rows of the influence matrices. The Kutta condition rows are left zero.
+    With more than one worker the rows are split into blocks that a pool of processes writes into
+    shared memory. The matrices are copied out of shared memory once all the blocks are done.
+    b_np is allocated with b_dtype, so a float32 b_np never exists in float64.
+    """
+    element = get_batched_element(element)
+    M: int = control_points.shape[1]
+    n_panels: int = control_points.shape[0] * M
+
+    rows: IntArray = np.arange(n_panels)
+    body: IntArray = rows[rows % M != M - 1]
+    body_points: FloatArray = control_points.reshape(-1, 3)[body]
+    body_normals: FloatArray = control_nj.reshape(-1, 3)[body]
+
+    # A few blocks per worker balance the load, but a block is never smaller than a chunk
+    n_blocks: int = min(4 * workers, -(-body.shape[0] // lattice_chunk(grid, chunk_size)))
+    if workers <= 1 or n_blocks <= 1:
+        a_np: FloatArray = np.zeros((n_panels, n_panels))
+        b_np: FloatArray = np.zeros((n_panels, n_panels), dtype=b_dtype)
+        if ground is not None:
+            element = ground_image(element, ground)
+        _fill_rows(a_np, b_np, body, body_points, body_normals, grid, element, chunk_size)
+        return a_np, b_np
+
+    blocks: list[shared_memory.SharedMemory] = []
+    try:
+        for dtype in (float, b_dtype):
+            nbytes: int = n_panels * n_panels * np.dtype(dtype).itemsize
+            blocks.append(shared_memory.SharedMemory(create=True, size=nbytes))
+            np.ndarray((n_panels, n_panels), dtype=dtype, buffer=blocks[-1].buf)[:] = 0
+
+        names: tuple[str, str] = (blocks[0].name, blocks[1].name)
+        tasks = [
+            (names, n_panels, body[idx], body_points[idx], body_normals[idx], grid, element, ground)
+            + (chunk_size, b_dtype)
+            for idx in np.array_split(np.arange(body.shape[0]), n_blocks)
+        ]
+        with Pool(min(workers, n_blocks)) as pool:
+            pool.starmap(_fill_shared_rows, tasks)
+
+        a_np = np.array(np.ndarray((n_panels, n_panels), buffer=blocks[0].buf))
+        b_np = np.array(np.ndarray((n_panels, n_panels), dtype=b_dtype, buffer=blocks[1].buf))
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+    return a_np, b_np
+
+
+def assemble_LHS(
+    control_points: FloatArray,
+    control_nj: FloatArray,
+    grid: FloatArray,
+    element: Callable[..., tuple[FloatArray, FloatArray]],
+    chunk_size: int = CHUNK_SIZE,
+    workers: int = 1,
+    b_dtype: type = float,
+) -> tuple[FloatArray, FloatArray]:
+    """
+    Assembles the influence matrices of a lifting surface lattice. The last chordwise
+    panel of every strip is the wake panel and its row enforces the Kutta condition.
+
+    Args:
+        control_points (FloatArray): (N - 1, M, 3) control points of the panels
+        control_nj (FloatArray): (N - 1, M, 3) unit normals at the control points
+        grid (FloatArray): (N, M + 1, 3) grid of the lattice, wake included
+        element (Callable[..., tuple[FloatArray, FloatArray]]): Scalar or batched vorticity element
+        chunk_size (int, optional): Maximum number of (point, panel) pairs evaluated at once.
+        workers (int, optional): Number of processes assembling row blocks. Defaults to 1.
+        b_dtype (type, optional): Data type of b, e.g. np.float32 to halve its memory. Defaults to float.
+
+    Returns:
+        tuple[FloatArray, FloatArray]: Influence matrices a and b
+    """
+    a_np, b_np = _assemble_body_rows(control_points, control_nj, grid, element, None, chunk_size, workers, b_dtype)
+
+    M: int = control_points.shape[1]
+    rows: IntArray = np.arange(a_np.shape[0])
+    wake: IntArray = rows[rows % M == M - 1]
+
+    # Kutta condition rows
+    for mat in (a_np, b_np):
+        mat[wake, wake] = 1
+        mat[wake, wake - 1] = -1
+    return a_np, b_np
+
+
+def assemble_ground_image_LHS(
+    control_points: FloatArray,
+    control_nj: FloatArray,
+    grid: FloatArray,
+    element: Callable[..., tuple[FloatArray, FloatArray]],
+    ground: float,
+    chunk_size: int = CHUNK_SIZE,
+    workers: int = 1,
+    b_dtype: type = float,
+) -> tuple[FloatArray, FloatArray]:
+    """
+    Assembles the influence matrices of the image of a lifting surface lattice about
+    the ground plane z = ground. The Kutta condition rows are zero so that the result
+    is added to the free air matrices of assemble_LHS, which do not depend on the height.
+
+    Args:
+        control_points (FloatArray): (N - 1, M, 3) control points of the panels
+        control_nj (FloatArray): (N - 1, M, 3) unit normals at the control points
+        grid (FloatArray): (N, M + 1, 3) grid of the lattice, wake included
+        element (Callable[..., tuple[FloatArray, FloatArray]]): Scalar or batched vorticity element
+        ground (float): Height of the ground plane
+        chunk_size (int, optional): Maximum number of (point, panel) pairs evaluated at once.
+        workers (int, optional): Number of processes assembling row blocks. Defaults to 1.
+        b_dtype (type, optional): Data type of b. Defaults to float.
+
+    Returns:
+        tuple[FloatArray, FloatArray]: Image contributions to the influence matrices a and b
+    """
+    return _assemble_body_rows(control_points, control_nj, grid, element, ground, chunk_size, workers, b_dtype)
+
+
+def strip_panels(strips: IntArray, M: int) -> IntArray:
+    """
+    Returns the indices of the panels of spanwise strips. Strip j holds the panels j * M to j * M + M - 1.
+
+    Args:
+        strips (IntArray): Indices of the strips
+        M (int): Number of chordwise panels of a strip
+
+    Returns:
+        IntArray: Indices of the panels, strip by strip
+    """
+    return (np.asarray(strips, dtype=int)[:, None] * M + np.arange(M)).ravel()
+
+
+def assemble_strips_LHS(
+    control_points: FloatArray,
+    control_nj: FloatArray,
+    grid: FloatArray,
+    element: Callable[..., tuple[FloatArray, FloatArray]],
+    row_strips: IntArray,
+    column_strips: IntArray,
+    ground: float | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> tuple[FloatArray, FloatArray]:
+    """
+    Assembles the block of the influence matrices of assemble_LHS (plus the ground image if a
+    ground is given) that couples the panels of some strips (rows) with the panels of others
+    (columns). The elements of strip j only depend on grid[j] and grid[j + 1], so the columns of
+    a run of consecutive strips are computed against a slice of the grid.
+
+    Args:
+        control_points (FloatArray): (N - 1, M, 3) control points of the panels
+        control_nj (FloatArray): (N - 1, M, 3) unit normals at the control points
+        grid (FloatArray): (N, M + 1, 3) grid of the lattice, wake included
+        element (Callable[..., tuple[FloatArray, FloatArray]]): Scalar or batched vorticity element
+        row_strips (IntArray): Sorted indices of the strips of the rows
+        column_strips (IntArray): Sorted indices of the strips of the columns
+        ground (float | None, optional): Height of the ground plane. None for free air. Defaults to None.
+        chunk_size (int, optional): Maximum number of (point, panel) pairs evaluated at once.
+
+    Returns:
+        tuple[FloatArray, FloatArray]: Blocks of the influence matrices a and b
+    """
+    elements: list[Callable[..., tuple[FloatArray, FloatArray]]] = [get_batched_element(element)]
+    if ground is not None:
+        elements.append(ground_image(element, ground))
+
+    M: int = control_points.shape[1]
+    column_strips = np.asarray(column_strips, dtype=int)
+    rows: IntArray = strip_panels(row_strips, M)
+    columns: IntArray = strip_panels(column_strips, M)
+    a_np: FloatArray = np.zeros((rows.shape[0], columns.shape[0]))
+    b_np: FloatArray = np.zeros((rows.shape[0], columns.shape[0]))
+
+    body: IntArray = np.flatnonzero(rows % M != M - 1)
+    if body.shape[0] > 0 and column_strips.shape[0] > 0:
+        body_points: FloatArray = control_points.reshape(-1, 3)[rows[body]]
+        body_normals: FloatArray = control_nj.reshape(-1, 3)[rows[body]]
+        runs: list[IntArray] = np.split(
+            np.arange(column_strips.shape[0]),
+            np.flatnonzero(np.diff(column_strips) != 1) + 1,
+        )
+        for run in runs:
+            sub_grid: FloatArray = grid[column_strips[run[0]] : column_strips[run[-1]] + 2]
+            run_columns = slice(run[0] * M, (run[-1] + 1) * M)
+            for image in elements:
+                a, b = influence_matrices(body_points, body_normals, sub_grid, image, chunk_size)
+                a_np[body, run_columns] += a
+                b_np[body, run_columns] += b
+
+    # Kutta condition rows of the strips that are also columns
+    wake: IntArray = np.flatnonzero(rows % M == M - 1)
+    position: IntArray = np.searchsorted(columns, rows[wake])
+    inside: BoolArray = position < columns.shape[0]
+    inside[inside] = columns[position[inside]] == rows[wake[inside]]
+    for mat in (a_np, b_np):
+        mat[wake[inside], position[inside]] = 1
+        mat[wake[inside], position[inside] - 1] = -1
+    return a_np, b_np
+
+
+def influence_operators(
+    control_points: FloatArray,
+    control_nj: FloatArray,
+    grid: FloatArray,
+    element: Callable[..., tuple[FloatArray, FloatArray]],
+    ground: float | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> tuple[LinearOperator, LinearOperator]:
+    """
+    Matrix free counterparts of the influence matrices of assemble_LHS. Every product
+    recomputes the influences chunk by chunk and multiplies them with the circulations,
+    so at most chunk_size (point, panel) pairs of the matrices are held at once.
+
+    Args:
+        control_points (FloatArray): (N - 1, M, 3) control points of the panels
+        control_nj (FloatArray): (N - 1, M, 3) unit normals at the control points
+        grid (FloatArray): (N, M + 1, 3) grid of the lattice, wake included
+        element (Callable[..., tuple[FloatArray, FloatArray]]): Scalar or batched vorticity element
+        ground (float | None, optional): Height of the ground plane. None for free air. Defaults to None.
+        chunk_size (int, optional): Maximum number of (point, panel) pairs evaluated at once.
+
+    Returns:
+        tuple[LinearOperator, LinearOperator]: Operators a and b
+    """
+    elements: list[Callable[..., tuple[FloatArray, FloatArray]]] = [get_batched_element(element)]
+    if ground is not None:
+        elements.append(ground_image(element, ground))
+
+    M: int = control_points.shape[1]
+    n_panels: int = control_points.shape[0] * M
+    rows: IntArray = np.arange(n_panels)
+    body: IntArray = rows[rows % M != M - 1]
+    wake: IntArray = rows[rows % M == M - 1]
+
+    body_points: FloatArray = control_points.reshape(-1, 3)[body]
+    body_normals: FloatArray = control_nj.reshape(-1, 3)[body]
+    step: int = lattice_chunk(grid, chunk_size)
+
+    def operator(trailing: bool) -> Callable[[FloatArray], FloatArray]:
+        def matvec(gammas: FloatArray) -> FloatArray:
+            gammas = np.ravel(gammas)
+            out: FloatArray = np.zeros(n_panels)
+            for start in range(0, body.shape[0], step):
+                chunk: IntArray = body[start : start + step]
+                for image in elements:
+                    a, b = influence_matrices(
+                        body_points[start : start + step],
+                        body_normals[start : start + step],
+                        grid,
+                        image,
+                        chunk_size,
+                    )
+                    out[chunk] += (b if trailing else a) @ gammas
+            # Kutta condition rows
+            out[wake] = gammas[wake] - gammas[wake - 1]
+            return out
+
+        return matvec
+
+    a_op = LinearOperator((n_panels, n_panels), matvec=operator(False), dtype=float)
+    b_op = LinearOperator((n_panels, n_panels), matvec=operator(True), dtype=float)
+    return a_op, b_op
+
+
+def _field_velocities(
+    points: FloatArray,
+    grid: FloatArray,
+    element: Callable[..., tuple[FloatArray, FloatArray]],
+    gammas: FloatArray,
+    ground: float | None,
+    chunk_size: int = CHUNK_SIZE,
+) -> tuple[FloatArray, FloatArray]:
+    """
+    Worker of induced_velocities. Evaluates a block of points chunk by chunk.
+    The ground image element is a closure, so it is built here instead of being pickled.
+    """
+    elements: list[Callable[..., tuple[FloatArray, FloatArray]]] = [get_batched_element(element)]
+    if ground is not None:
+        elements.append(ground_image(element, ground))
+
+    if get_backend() == "numba":
+        images: list[FloatArray | None] = [ring_images(image) for image in elements]
+        if all(image is not None for image in images):
+            return ring_field(points, grid, np.concatenate([image for image in images if image is not None]), gammas)
+
+    U: FloatArray = np.zeros((points.shape[0], 3, gammas.shape[1]))
+    Ustar: FloatArray = np.zeros((points.shape[0], 3, gammas.shape[1]))
+    step: int = lattice_chunk(grid, chunk_size)
+    for start in range(0, points.shape[0], step):
+        stop: int = start + step
+        for image in elements:
+            u, ustar = image(points[start:stop], grid, chunk_size=chunk_size)
+            U[start:stop] += np.tensordot(u, gammas, axes=(1, 0))
+            Ustar[start:stop] += np.tensordot(ustar, gammas, axes=(1, 0))
+    return U, Ustar
+
+
+def induced_velocities(
+    points: FloatArray,
+    grid: FloatArray,
+    element: Callable[..., tuple[FloatArray, FloatArray]],
+    gammas: FloatArray,
+    ground: float | None = None,
+    chunk_size: int = CHUNK_SIZE,
+    workers: int = 1,
+) -> tuple[FloatArray, FloatArray]:
+    """
+    Computes the velocities induced at arbitrary points by a solved lattice (plus its ground
+    image if a ground is given), for one or many solutions at once. The points are streamed
+    in chunks, so only the (chunk, panel) influences are held and memory does not grow with
+    the number of points. With more than one worker blocks of points are evaluated by a pool
+    of processes.
+
+    Args:
+        points (FloatArray): (P, 3) array of evaluation points
+        grid (FloatArray): (N, M + 1, 3) grid of the lattice, wake included
+        element (Callable[..., tuple[FloatArray, FloatArray]]): Scalar or batched vorticity element
+        gammas (FloatArray): ((N - 1) * M) circulations or ((N - 1) * M, K) circulations of K solutions
+        ground (float | None, optional): Height of the ground plane. None for free air. Defaults to None.
+        chunk_size (int, optional): Maximum number of (point, panel) pairs evaluated at once.
+        workers (int, optional): Number of processes evaluating blocks of points. Defaults to 1.
+
+    Returns:
+        tuple[FloatArray, FloatArray]: Velocities induced by the elements (U) and by their trailing
+        lines (Ustar), (P, 3) for one solution or (P, 3, K) for K solutions
+    """
+    points = np.atleast_2d(np.asarray(points, dtype=float))
+    gammas = np.asarray(gammas, dtype=float)
+    gammas_2d: FloatArray = np.reshape(gammas, (gammas.shape[0], -1))
+
+    # A few blocks per worker balance the load, but a block is never smaller than a chunk
+    n_blocks: int = min(4 * workers, -(-points.shape[0] // lattice_chunk(grid, chunk_size)))
+    if workers <= 1 or n_blocks <= 1:
+        U, Ustar = _field_velocities(points, grid, element, gammas_2d, ground, chunk_size)
+    else:
+        tasks = [(block, grid, element, gammas_2d, ground, chunk_size) for block in np.array_split(points, n_blocks)]
+        with Pool(min(workers, n_blocks)) as pool:
+            results: list[tuple[FloatArray, FloatArray]] = pool.starmap(_field_velocities, tasks)
+        U = np.concatenate([U_block for U_block, _ in results])
+        Ustar = np.concatenate([Ustar_block for _, Ustar_block in results])
+
+    if gammas.ndim == 1:
+        return U[:, :, 0], Ustar[:, :, 0]
+    return U, Ustar
@@ -0,0 +1,348 @@
+"""
+Kernel backends of the potential flow solvers. The numpy backend (the default) evaluates
+the Biot-Savart law as whole array operations over chunks of (point, line) pairs, which
+creates several (P, K, 3) temporaries per chunk. The numba backend compiles the loops of
+this module instead: every point is handled by a thread that sums the lines of the lattice
+into the influence matrices or the field directly, with no temporary larger than the
+(N, M, 3) velocities of the lines of one point.
+
+The backend is read from the ICARUS_POTENTIAL_BACKEND environment variable and can be
+changed with set_backend. The numba backend is only available if numba is installed.
+Without numba the kernels below are plain Python, which is only fit for tests on tiny inputs.
+"""
+import math
+import os
+from typing import Any
+from typing import Callable
+
+import numpy as np
+
+from ICARUS.Core.types import FloatArray
+
+try:
+    import numba
+
+    HAS_NUMBA: bool = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Available kernel backends:
+#   numpy - whole array operations on chunks of (point, line) pairs
+#   numba - compiled loops over the points run in parallel, requires numba
+KERNEL_BACKENDS: tuple[str, ...] = ("numpy", "numba")
+BACKEND_VARIABLE: str = "ICARUS_POTENTIAL_BACKEND"
+
+_backend: str = os.environ.get(BACKEND_VARIABLE, "numpy")
+
+
+def get_backend() -> str:
+    """
+    Returns the kernel backend in use.
+
+    Raises:
+        ValueError: If the backend is unknown or numba is requested but not installed
+
+    Returns:
+        str: One of KERNEL_BACKENDS
+    """
+    if _backend not in KERNEL_BACKENDS:
+        raise ValueError(f"Unknown kernel backend {_backend}. The options are: {', '.join(KERNEL_BACKENDS)}")
+    if _backend == "numba" and not HAS_NUMBA:
+        raise ValueError("The numba kernel backend requires numba. Install it with pip install numba")
+    return _backend
+
+
+def set_backend(name: str) -> None:
+    """
+    Sets the kernel backend. The environment variable is set as well, so that worker
+    processes started afterwards use the same backend.
+
+    Args:
+        name (str): One of KERNEL_BACKENDS
+
+    Raises:
+        ValueError: If the backend is unknown or numba is requested but not installed
+    """
+    global _backend
+    previous: str = _backend
+    _backend = name
+    try:
+        get_backend()
+    except ValueError:
+        _backend = previous
+        raise
+    os.environ[BACKEND_VARIABLE] = name
+
+
+def _compile(parallel: bool) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Returns a decorator that compiles a kernel with numba, or leaves it as is without numba."""
+    if not HAS_NUMBA:
+        return lambda function: function
+    return numba.njit(parallel=parallel, cache=True)
+
+
+prange = numba.prange if HAS_NUMBA else range
+
+
+@_compile(parallel=False)
+def _line_velocity(
+    px: float,
+    py: float,
+    pz: float,
+    x1: float,
+    y1: float,
+    z1: float,
+    x2: float,
+    y2: float,
+    z2: float,
+) -> tuple[float, float, float]:
+    """Velocity induced at a point by a vortex line of unit circulation, with the cutoff of vortexL."""
+    r1x: float = px - x1
+    r1y: float = py - y1
+    r1z: float = pz - z1
+    r2x: float = px - x2
+    r2y: float = py - y2
+    r2z: float = pz - z2
+
+    crossx: float = r1y * r2z - r1z * r2y
+    crossy: float = -r1x * r2z + r1z * r2x
+    crossz: float = r1x * r2y - r1y * r2x
+
+    cross_mag: float = crossx**2 + crossy**2 + crossz**2
+    r1: float = math.sqrt(r1x**2 + r1y**2 + r1z**2)
+    r2: float = math.sqrt(r2x**2 + r2y**2 + r2z**2)
+
+    e: float = 1e-9
+    if r1 < e or r2 < e or cross_mag < e:
+        return 0.0, 0.0, 0.0
+
+    r0dr1: float = (x2 - x1) * r1x + (y2 - y1) * r1y + (z2 - z1) * r1z
+    r0dr2: float = (x2 - x1) * r2x + (y2 - y1) * r2y + (z2 - z1) * r2z
+    K: float = (1 / (4 * math.pi * cross_mag)) * (r0dr1 / r1 - r0dr2 / r2)
+    return K * crossx, K * crossy, K * crossz
+
+
+@_compile(parallel=False)
+def _grid_lines_velocities(
+    px: float,
+    py: float,
+    pz: float,
+    grid: FloatArray,
+    span: FloatArray,
+    chord: FloatArray,
+) -> None:
+    """
+    Fills span[j, k] with the velocity induced at a point by the line from grid[j, k] to grid[j + 1, k]
+    and chord[j, k] with the one induced by the line from grid[j, k] to grid[j, k + 1].
+    """
+    n: int = grid.shape[0]
+    m: int = grid.shape[1]
+    for j in range(n):
+        for k in range(m):
+            if j < n - 1:
+                ux, uy, uz = _line_velocity(
+                    px,
+                    py,
+                    pz,
+                    grid[j, k, 0],
+                    grid[j, k, 1],
+                    grid[j, k, 2],
+                    grid[j + 1, k, 0],
+                    grid[j + 1, k, 1],
+                    grid[j + 1, k, 2],
+                )
+                span[j, k, 0] = ux
+                span[j, k, 1] = uy
+                span[j, k, 2] = uz
+            if k < m - 1:
+                ux, uy, uz = _line_velocity(
+                    px,
+                    py,
+                    pz,
+                    grid[j, k, 0],
+                    grid[j, k, 1],
+                    grid[j, k, 2],
+                    grid[j, k + 1, 0],
+                    grid[j, k + 1, 1],
+                    grid[j, k + 1, 2],
+                )
+                chord[j, k, 0] = ux
+                chord[j, k, 1] = uy
+                chord[j, k, 2] = uz
+
+
+@_compile(parallel=True)
+def _vortex_lines_kernel(points: FloatArray, x1: FloatArray, x2: FloatArray, gammas: FloatArray, U: FloatArray) -> None:
+    for p in prange(points.shape[0]):
+        ux: float = 0.0
+        uy: float = 0.0
+        uz: float = 0.0
+        for k in range(x1.shape[0]):
+            vx, vy, vz = _line_velocity(
+                points[p, 0],
+                points[p, 1],
+                points[p, 2],
+                x1[k, 0],
+                x1[k, 1],
+                x1[k, 2],
+                x2[k, 0],
+                x2[k, 1],
+                x2[k, 2],
+            )
+            ux += gammas[k] * vx
+            uy += gammas[k] * vy
+            uz += gammas[k] * vz
+        U[p, 0] = ux
+        U[p, 1] = uy
+        U[p, 2] = uz
+
+
+@_compile(parallel=True)
+def _ring_influences_kernel(
+    points: FloatArray,
+    normals: FloatArray,
+    grid: FloatArray,
+    images: FloatArray,
+    a: FloatArray,
+    b: FloatArray,
+) -> None:
+    n: int = grid.shape[0]
+    m: int = grid.shape[1]
+    for p in prange(points.shape[0]):
+        span: FloatArray = np.empty((n - 1, m, 3))
+        chord: FloatArray = np.empty((n, m - 1, 3))
+        for col in range(a.shape[1]):
+            a[p, col] = 0.0
+            b[p, col] = 0.0
+        for i in range(images.shape[0]):
+            # The image induces at p the reflection of what the lattice induces at the image of p,
+            # so its normal velocity is the one of the lattice along the reflected normal
+            qx: float = images[i, 0, 0] * points[p, 0] + images[i, 1, 0]
+            qy: float = images[i, 0, 1] * points[p, 1] + images[i, 1, 1]
+            qz: float = images[i, 0, 2] * points[p, 2] + images[i, 1, 2]
+            nx: float = images[i, 0, 0] * normals[p, 0]
+            ny: float = images[i, 0, 1] * normals[p, 1]
+            nz: float = images[i, 0, 2] * normals[p, 2]
+            _grid_lines_velocities(qx, qy, qz, grid, span, chord)
+            for j in range(n - 1):
+                for k in range(m - 1):
+                    # Ring (j, k) is made of span[j, k], chord[j + 1, k], -span[j, k + 1] and -chord[j, k]
+                    tx: float = chord[j + 1, k, 0] - chord[j, k, 0]
+                    ty: float = chord[j + 1, k, 1] - chord[j, k, 1]
+                    tz: float = chord[j + 1, k, 2] - chord[j, k, 2]
+                    ux: float = span[j, k, 0] - span[j, k + 1, 0] + tx
+                    uy: float = span[j, k, 1] - span[j, k + 1, 1] + ty
+                    uz: float = span[j, k, 2] - span[j, k + 1, 2] + tz
+                    a[p, j * (m - 1) + k] += ux * nx + uy * ny + uz * nz
+                    b[p, j * (m - 1) + k] += tx * nx + ty * ny + tz * nz
+
+
+@_compile(parallel=True)
+def _ring_field_kernel(
+    points: FloatArray,
+    grid: FloatArray,
+    images: FloatArray,
+    gammas: FloatArray,
+    U: FloatArray,
+    Ustar: FloatArray,
+) -> None:
+    n: int = grid.shape[0]
+    m: int = grid.shape[1]
+    for p in prange(points.shape[0]):
+        span: FloatArray = np.empty((n - 1, m, 3))
+        chord: FloatArray = np.empty((n, m - 1, 3))
+        for x in range(3):
+            for c in range(gammas.shape[1]):
+                U[p, x, c] = 0.0
+                Ustar[p, x, c] = 0.0
+        for i in range(images.shape[0]):
+            qx: float = images[i, 0, 0] * points[p, 0] + images[i, 1, 0]
+            qy: float = images[i, 0, 1] * points[p, 1] + images[i, 1, 1]
+            qz: float = images[i, 0, 2] * points[p, 2] + images[i, 1, 2]
+            _grid_lines_velocities(qx, qy, qz, grid, span, chord)
+            for j in range(n - 1):
+                for k in range(m - 1):
+                    tx: float = images[i, 0, 0] * (chord[j + 1, k, 0] - chord[j, k, 0])
+                    ty: float = images[i, 0, 1] * (chord[j + 1, k, 1] - chord[j, k, 1])
+                    tz: float = images[i, 0, 2] * (chord[j + 1, k, 2] - chord[j, k, 2])
+                    ux: float = images[i, 0, 0] * (span[j, k, 0] - span[j, k + 1, 0]) + tx
+                    uy: float = images[i, 0, 1] * (span[j, k, 1] - span[j, k + 1, 1]) + ty
+                    uz: float = images[i, 0, 2] * (span[j, k, 2] - span[j, k + 1, 2]) + tz
+                    for c in range(gammas.shape[1]):
+                        gamma: float = gammas[j * (m - 1) + k, c]
+                        U[p, 0, c] += ux * gamma
+                        U[p, 1, c] += uy * gamma
+                        U[p, 2, c] += uz * gamma
+                        Ustar[p, 0, c] += tx * gamma
+                        Ustar[p, 1, c] += ty * gamma
+                        Ustar[p, 2, c] += tz * gamma
+
+
+def vortex_lines(points: FloatArray, x1: FloatArray, x2: FloatArray, gammas: FloatArray) -> FloatArray:
+    """
+    Compiled counterpart of vorticity.vortexL_batch.
+
+    Args:
+        points (FloatArray): (P, 3) array of evaluation points
+        x1 (FloatArray): (K, 3) array of line startpoints
+        x2 (FloatArray): (K, 3) array of line endpoints
+        gammas (FloatArray): (K,) array of vorticities
+
+    Returns:
+        FloatArray: (P, 3) array of induced velocities
+    """
+    U: FloatArray = np.empty((points.shape[0], 3))
+    _vortex_lines_kernel(points, x1, x2, gammas, U)
+    return U
+
+
+def ring_influences(
+    points: FloatArray,
+    normals: FloatArray,
+    grid: FloatArray,
+    images: FloatArray,
+) -> tuple[FloatArray, FloatArray]:
+    """
+    Compiled counterpart of assembly.influence_matrices for lattices of vortex rings.
+
+    Args:
+        points (FloatArray): (P, 3) array of evaluation points
+        normals (FloatArray): (P, 3) array of unit normals at the points
+        grid (FloatArray): (n, m, 3) grid of the lattice
+        images (FloatArray): (I, 2, 3) reflections and offsets of the images of the lattice that the
+            element adds up. Image i induces at p the reflection images[i, 0] of the velocity the
+            lattice induces at images[i, 0] * p + images[i, 1].
+
+    Returns:
+        tuple[FloatArray, FloatArray]: (P, (n - 1) * (m - 1)) influence matrices of the rings (a) and
+        of their trailing lines (b)
+    """
+    n_panels: int = (grid.shape[0] - 1) * (grid.shape[1] - 1)
+    a: FloatArray = np.empty((points.shape[0], n_panels))
+    b: FloatArray = np.empty((points.shape[0], n_panels))
+    _ring_influences_kernel(points, normals, np.ascontiguousarray(grid), images, a, b)
+    return a, b
+
+
+def ring_field(
+    points: FloatArray,
+    grid: FloatArray,
+    images: FloatArray,
+    gammas: FloatArray,
+) -> tuple[FloatArray, FloatArray]:
+    """
+    Compiled counterpart of the field evaluation of assembly.induced_velocities for lattices of vortex rings.
+
+    Args:
+        points (FloatArray): (P, 3) array of evaluation points
+        grid (FloatArray): (n, m, 3) grid of the lattice
+        images (FloatArray): (I, 2, 3) reflections and offsets of the images of the lattice (see ring_influences)
+        gammas (FloatArray): ((n - 1) * (m - 1), K) circulations of K solutions
+
+    Returns:
+        tuple[FloatArray, FloatArray]: (P, 3, K) velocities induced by the rings (U) and by their trailing lines (Ustar)
+    """
+    U: FloatArray = np.empty((points.shape[0], 3, gammas.shape[1]))
+    Ustar: FloatArray = np.empty((points.shape[0], 3, gammas.shape[1]))
+    _ring_field_kernel(points, np.ascontiguousarray(grid), images, gammas, U, Ustar)
+    return U, Ustar
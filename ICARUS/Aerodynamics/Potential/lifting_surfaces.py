@@ -1,15 +1,19 @@
 import os
+from multiprocessing import Pool
 from re import L
 from typing import Any
 from typing import Callable
 
+import numpy as np
 import pandas as pd
 from regex import D
 
+from ICARUS import CPU_TO_USE
 from ICARUS.Aerodynamics.Potential.vorticity import symm_wing_panels
 from ICARUS.Aerodynamics.Potential.vorticity import voring
 from ICARUS.Aerodynamics.Potential.wing_lspt import Wing_LSPT
 from ICARUS.Core.types import FloatArray
+from ICARUS.Core.types import IntArray
 from ICARUS.Database import DB
 from ICARUS.Database import DB3D
 from ICARUS.Environment.definition import Environment
@@ -33,12 +37,25 @@ def run_lstp_angles(
         solver_options (dict[str, Any]): Solver Options
     """
 
+    # Factorizations of previous runs of the plane are kept next to its results. The Inflow-* wakes
+    # change with the angle, so only the TE-Geometrical wake is cached.
+    wake_geom_type: str = solver_options.get("Wake_Geom_Type", "TE-Geometrical")
+    cache_dir: str | None = None
+    if solver_options.get("Matrix_Cache", True) and wake_geom_type == "TE-Geometrical":
+        cache_dir = os.path.join(DB3D, plane.name, "LSPT_matrices")
+
     # Generate the wing LLT solver
     wing = Wing_LSPT(
         plane=plane,
         environment=environment,
         alpha=0,
         beta=0,
+        ground_clearence=solver_options.get("Ground_Effect"),
+        wake_geom_type=wake_geom_type,
+        linear_solver=solver_options.get("Linear_Solver", "direct"),
+        solver_tol=solver_options.get("Solver_Tolerance", 1e-6),
+        assembly_workers=solver_options.get("Assembly_Workers", CPU_TO_USE),
+        cache_dir=cache_dir,
     )
 
     if wing.is_symmetric:
@@ -57,6 +74,129 @@ def run_lstp_angles(
     save_results(plane, df)
 
 
+def run_lspt_variants(
+    planes: list[Airplane],
+    environment: Environment,
+    u_freestream: float,
+    angles: FloatArray | list[float],
+    solver_options: dict[str, Any] | None = None,
+    batch_size: int = 16,
+    workers: int = 1,
+) -> pd.DataFrame:
+    """
+    Solves many variants of an airplane, e.g. the candidates of a planform optimization, for the
+    same angles. The systems of batch_size variants at a time are stacked into (K, n, n) arrays
+    and solved with one batched LAPACK call per panel count. Nothing is written to the database.
+
+    Args:
+        planes (list[Airplane]): Airplane variants
+        environment (Environment): Environment
+        u_freestream (float): Freestream velocity magnitude
+        angles (FloatArray | list[float]): Angles of attack in degrees
+        solver_options (dict[str, Any] | None, optional): Solver options. Ground_Effect and Wake_Geom_Type
+            are used. Defaults to None for the default options.
+        batch_size (int, optional): Number of variants solved together. Defaults to 16.
+        workers (int, optional): Number of processes solving batches. Defaults to 1.
+
+    Returns:
+        pd.DataFrame: Forces and coefficients with a row per variant and angle. The Variant
+        column is the index of the airplane in planes.
+    """
+    if solver_options is None:
+        solver_options = {}
+    batches: list[tuple[list[Airplane], int, Environment, float, FloatArray | list[float], dict[str, Any]]] = [
+        (planes[start : start + batch_size], start, environment, u_freestream, angles, solver_options)
+        for start in range(0, len(planes), batch_size)
+    ]
+    if workers <= 1 or len(batches) <= 1:
+        dfs: list[pd.DataFrame] = [solve_variants_batch(*batch) for batch in batches]
+    else:
+        with Pool(min(workers, len(batches))) as pool:
+            dfs = pool.starmap(solve_variants_batch, batches)
+    return pd.concat(dfs, ignore_index=True)
+
+
+def solve_variants_batch(
+    planes: list[Airplane],
+    first_variant: int,
+    environment: Environment,
+    u_freestream: float,
+    angles: FloatArray | list[float],
+    solver_options: dict[str, Any],
+) -> pd.DataFrame:
+    """
+    Solves a batch of run_lspt_variants. Every variant contributes a system per group of angles
+    that share its lattice geometry (one for the TE-Geometrical wake). Systems with the same
+    number of panels are solved together.
+
+    Args:
+        planes (list[Airplane]): Airplane variants of the batch
+        first_variant (int): Index of the first variant of the batch
+        environment (Environment): Environment
+        u_freestream (float): Freestream velocity magnitude
+        angles (FloatArray | list[float]): Angles of attack in degrees
+        solver_options (dict[str, Any]): Solver options
+
+    Returns:
+        pd.DataFrame: Forces and coefficients with a row per variant and angle
+    """
+    wings: list[Wing_LSPT] = [
+        Wing_LSPT(
+            plane=plane,
+            environment=environment,
+            alpha=0,
+            beta=0,
+            ground_clearence=solver_options.get("Ground_Effect"),
+            wake_geom_type=solver_options.get("Wake_Geom_Type", "TE-Geometrical"),
+        )
+        for plane in planes
+    ]
+
+    # One system per variant and group of angles, stacked by number of panels
+    stacks: dict[int, list[tuple[int, FloatArray, FloatArray, IntArray]]] = {}
+    for variant, wing in enumerate(wings):
+        alphas, Qs, groups = wing.angle_groups(angles, u_freestream)
+        stacks.setdefault((wing.N - 1) * wing.M, []).extend((variant, alphas, Qs, group) for group in groups)
+
+    loads: list[FloatArray] = [np.zeros((6, len(angles))) for _ in wings]
+    for n_panels, systems in stacks.items():
+        group_size: int = max(len(group) for _, _, _, group in systems)
+        a_np: FloatArray = np.empty((len(systems), n_panels, n_panels))
+        b_np: FloatArray = np.empty((len(systems), n_panels, n_panels))
+        RHS_np: FloatArray = np.zeros((len(systems), n_panels, group_size))
+        for i, (variant, alphas, Qs, group) in enumerate(systems):
+            wing = wings[variant]
+            wing.alpha = alphas[group[0]]
+            solve_fun: Callable[..., tuple[FloatArray, FloatArray]] = symm_wing_panels if wing.is_symmetric else voring
+            a_np[i], b_np[i] = wing.get_LHS(solve_fun)
+            RHS_np[i, :, : len(group)] = wing.get_RHS_matrix(Qs[group])
+
+        gammas: FloatArray = np.linalg.solve(a_np, RHS_np)
+        w: FloatArray = np.matmul(b_np, gammas)
+        del a_np, b_np
+
+        for i, (variant, alphas, _, group) in enumerate(systems):
+            wing = wings[variant]
+            if wing.alpha != alphas[group[0]]:
+                wing.alpha = alphas[group[0]]
+            loads[variant][:, group] = wing.group_loads(
+                alphas[group],
+                gammas[i, :, : len(group)],
+                w[i, :, : len(group)],
+                u_freestream,
+                verbose=False,
+                set_loads=False,
+            )
+
+    dfs: list[pd.DataFrame] = []
+    for variant, (plane, wing) in enumerate(zip(planes, wings)):
+        df: pd.DataFrame = wing.loads_dataframe(angles, loads[variant], u_freestream)
+        df.insert(0, "Variant", first_variant + variant)
+        df.insert(1, "Plane", plane.name)
+        dfs.append(df)
+    return pd.concat(dfs, ignore_index=True)
+
+
 def save_results(
     plane: Airplane,
     df: pd.DataFrame,
@@ -76,10 +216,5 @@ def save_results(
     plane.save()
 
     print("Adding Results to Database")
-    # Add plane to database
-    file_plane: str = os.path.join(DB3D, plane.name, f"{plane.name}.json")
-    _ = DB.vehicles_db.load_plane_from_file(name=plane.name, file=file_plane)
-
-    # Add Forces to Database
-    file_gnvp: str = os.path.join(DB3D, plane.name, f"forces.lspt")
-    DB.vehicles_db.load_lspt_forces(planename=plane.name, file=file_gnvp)
+    # Add the plane and the forces to the Database
+    DB.vehicles_db.refresh([plane.name])
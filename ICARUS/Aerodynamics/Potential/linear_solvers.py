@@ -0,0 +1,229 @@
+"""
+Linear solvers of the vortex lattice system a gamma = RHS. The dense direct solve
+needs the influence matrices and their LU factorization in memory. The iterative
+solves only need products with a and report how many iterations each right hand
+side took, so that the cheapest solver that fits in memory can be chosen per case.
+When only a few unknowns change between solves, SchurFactorization reuses the
+factorization of the block of the unknowns that did not change. InPlaceLU factorizes
+a matrix in its own memory when it is not needed after the factorization.
+"""
+import time
+import tracemalloc
+
+import numpy as np
+from scipy.linalg import lu_factor
+from scipy.linalg import lu_solve
+from scipy.sparse.linalg import gmres
+from scipy.sparse.linalg import LinearOperator
+
+from ICARUS.Core.types import FloatArray
+from ICARUS.Core.types import IntArray
+
+# Available linear solvers of Wing_LSPT:
+#   direct      - LU factorization of the assembled matrix
+#   gmres       - GMRES on the assembled matrix, preconditioned with its strip blocks
+#   matrix-free - GMRES recomputing the influences in chunks at every product
+#   treecode    - GMRES on the treecode approximation of the influences
+LINEAR_SOLVERS: tuple[str, ...] = ("direct", "gmres", "matrix-free", "treecode")
+
+
+class SolveReport:
+    """
+    Convergence and memory figures of one solve of a lattice.
+
+    Args:
+        solver (str): Name of the linear solver
+        n_panels (int): Number of unknowns
+    """
+
+    def __init__(self, solver: str, n_panels: int) -> None:
+        self.solver: str = solver
+        self.n_panels: int = n_panels
+        # Iterations and final relative residual of every right hand side. Empty for direct solves.
+        # The residual is 0 when the initial guess already met the tolerance.
+        self.iterations: list[int] = []
+        self.residuals: list[float] = []
+        # Bytes of the matrices, factorizations and preconditioners held during the solve
+        self.stored_bytes: int = 0
+        # Peak of the memory traced by tracemalloc during the solve. 0 when tracemalloc is not tracing.
+        self.peak_bytes: int = 0
+        self.time: float = 0.0
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        self._start: float = time.perf_counter()
+
+    def stop(self) -> None:
+        """Records the time and the peak memory since the report was created."""
+        self.time = time.perf_counter() - self._start
+        if tracemalloc.is_tracing():
+            self.peak_bytes = tracemalloc.get_traced_memory()[1]
+
+    def __str__(self) -> str:
+        string: str = f"{self.solver}: {self.n_panels} panels | {self.stored_bytes / 2**20:.1f} MB | {self.time:.3f} s"
+        if self.peak_bytes:
+            string += f" | peak {self.peak_bytes / 2**20:.1f} MB"
+        if self.iterations:
+            string += f" | iterations {self.iterations} | max residual {max(self.residuals):.1e}"
+        return string
+
+
+class SchurFactorization:
+    """
+    Factorization of a matrix split into the unknowns that keep their influences between
+    solves (clean) and the ones that change (dirty):
+
+        a = [[a_cc, a_cd],
+             [a_dc, a_dd]]
+
+    The LU factorization of a_cc is given and only the Schur complement
+    s = a_dd - a_dc a_cc^-1 a_cd is factorized. With n_d dirty unknowns this costs
+    O(n_c^2 n_d) instead of the O(n^3) of a new factorization of a.
+
+    Args:
+        a_np (FloatArray): Matrix to factorize
+        clean_lu (tuple[FloatArray, FloatArray]): LU factorization of a_cc as returned by lu_factor
+        clean (IntArray): Indices of the clean unknowns
+        dirty (IntArray): Indices of the dirty unknowns
+    """
+
+    def __init__(
+        self,
+        a_np: FloatArray,
+        clean_lu: tuple[FloatArray, FloatArray],
+        clean: IntArray,
+        dirty: IntArray,
+    ) -> None:
+        self.clean_lu: tuple[FloatArray, FloatArray] = clean_lu
+        self.clean: IntArray = clean
+        self.dirty: IntArray = dirty
+        self.a_cd: FloatArray = a_np[np.ix_(clean, dirty)]
+        self.a_dc: FloatArray = a_np[np.ix_(dirty, clean)]
+        # a_cc^-1 a_cd, the clean unknowns driven by a unit value of each dirty unknown
+        self.coupling: FloatArray = lu_solve(clean_lu, self.a_cd)
+        self.schur_lu: tuple[FloatArray, FloatArray] = lu_factor(
+            a_np[np.ix_(dirty, dirty)] - self.a_dc @ self.coupling,
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes of the factorizations and blocks held."""
+        arrays = (*self.clean_lu, *self.schur_lu, self.a_cd, self.a_dc, self.coupling)
+        return sum(array.nbytes for array in arrays)
+
+    def solve(self, RHS: FloatArray, trans: int = 0) -> FloatArray:
+        """
+        Solves a x = RHS, or a^T x = RHS, by block elimination.
+
+        Args:
+            RHS (FloatArray): (n,) or (n, K) right hand sides
+            trans (int, optional): 0 to solve with a, 1 to solve with its transpose. Defaults to 0.
+
+        Returns:
+            FloatArray: Solutions, shaped like RHS
+        """
+        x: FloatArray = np.empty_like(RHS, dtype=float)
+        if trans == 0:
+            y_c: FloatArray = lu_solve(self.clean_lu, RHS[self.clean])
+            x[self.dirty] = lu_solve(self.schur_lu, RHS[self.dirty] - self.a_dc @ y_c)
+            x[self.clean] = y_c - self.coupling @ x[self.dirty]
+        else:
+            y_c = lu_solve(self.clean_lu, RHS[self.clean], trans=1)
+            x[self.dirty] = lu_solve(self.schur_lu, RHS[self.dirty] - self.a_cd.T @ y_c, trans=1)
+            x[self.clean] = y_c - lu_solve(self.clean_lu, self.a_dc.T @ x[self.dirty], trans=1)
+        return x
+
+
+class InPlaceLU:
+    """
+    LU factorization that overwrites the matrix it factorizes, so that the matrix and its
+    factors are never in memory together. LAPACK only factorizes Fortran ordered arrays in
+    place, so the factors are those of the transpose of a C ordered a and solves with a
+    use the transposed back substitution.
+
+    Args:
+        a_np (FloatArray): C ordered matrix to factorize. Its contents are destroyed.
+    """
+
+    def __init__(self, a_np: FloatArray) -> None:
+        lu, piv = lu_factor(a_np.T, overwrite_a=True, check_finite=False)
+        self.lu: FloatArray = lu
+        self.piv: IntArray = piv
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes of the factors and the pivots."""
+        return self.lu.nbytes + self.piv.nbytes
+
+    def solve(self, RHS: FloatArray, trans: int = 0) -> FloatArray:
+        """
+        Solves a x = RHS, or a^T x = RHS.
+
+        Args:
+            RHS (FloatArray): (n,) or (n, K) right hand sides
+            trans (int, optional): 0 to solve with a, 1 to solve with its transpose. Defaults to 0.
+
+        Returns:
+            FloatArray: Solutions, shaped like RHS
+        """
+        x: FloatArray = lu_solve((self.lu, self.piv), RHS, trans=1 - trans, check_finite=False)
+        return x
+
+
+def gmres_solve(
+    a_op: LinearOperator | FloatArray,
+    RHS: FloatArray,
+    preconditioner: LinearOperator | None = None,
+    x0: FloatArray | None = None,
+    tol: float = 1e-6,
+    restart: int = 100,
+    maxiter: int = 1000,
+    report: SolveReport | None = None,
+) -> FloatArray:
+    """
+    Solves a system for every column of RHS with restarted GMRES. The first column starts
+    from x0. Since the system is linear, every other column starts from the combination
+    of the previous solutions whose right hand sides best match its own. Right hand sides
+    of consecutive angles of attack are close to each other, and once they span the
+    freestream directions the guess is exact.
+
+    Args:
+        a_op (LinearOperator | FloatArray): Matrix or operator of the system
+        RHS (FloatArray): (n, K) right hand sides
+        preconditioner (LinearOperator | None, optional): Approximate inverse of a_op. Defaults to None.
+        x0 (FloatArray | None, optional): (n,) initial guess of the first column. Defaults to None.
+        tol (float, optional): Relative tolerance. Defaults to 1e-6.
+        restart (int, optional): Iterations between restarts. Defaults to 100.
+        maxiter (int, optional): Maximum number of restarts. Defaults to 1000.
+        report (SolveReport | None, optional): Report where the iterations and residuals are stored.
+
+    Raises:
+        ValueError: If GMRES does not converge for a column
+
+    Returns:
+        FloatArray: (n, K) solutions
+    """
+    RHS = np.reshape(RHS, (RHS.shape[0], -1))
+    solution: FloatArray = np.empty_like(RHS)
+    guess: FloatArray | None = x0
+    for col in range(RHS.shape[1]):
+        if col > 0:
+            coeffs: FloatArray = np.linalg.lstsq(RHS[:, :col], RHS[:, col], rcond=None)[0]
+            guess = solution[:, :col] @ coeffs
+        residuals: list[float] = []
+        solution[:, col], info = gmres(
+            a_op,
+            RHS[:, col],
+            x0=guess,
+            rtol=tol,
+            restart=restart,
+            maxiter=maxiter,
+            M=preconditioner,
+            callback=residuals.append,
+            callback_type="pr_norm",
+        )
+        if info != 0:
+            raise ValueError(f"GMRES did not converge for right hand side {col} after {len(residuals)} iterations")
+        if report is not None:
+            report.iterations.append(len(residuals))
+            report.residuals.append(residuals[-1] if residuals else 0.0)
+    return solution
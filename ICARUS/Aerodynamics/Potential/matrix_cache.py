@@ -0,0 +1,117 @@
+"""
+Persistent cache of the factorized influence matrices of a lattice. Every entry is a
+directory named after the geometry key of the lattice that holds the matrices as .npy
+files. Entries are loaded memory mapped, so a hit costs no assembly, no factorization
+and no read of the matrices until they are used. The key hashes the grid, so a change
+in the geometry of the wing gives a new key and the stale entries are evicted once the
+cache exceeds its size.
+"""
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from ICARUS.Core.types import FloatArray
+
+# Files of an entry, in the order of the arrays returned by MatrixCache.load
+ENTRY_FILES: tuple[str, ...] = ("a.npy", "b.npy", "lu.npy", "piv.npy")
+
+
+class MatrixCache:
+    """
+    On disk cache of influence matrices and their LU factorizations.
+
+    Args:
+        directory (str): Directory of the cache. It is created if it does not exist.
+        max_bytes (int, optional): Size above which the least recently used entries are evicted.
+            Defaults to 4 GB.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 4 * 2**30) -> None:
+        self.directory: str = directory
+        self.max_bytes: int = max_bytes
+
+    def entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    def load(self, key: str) -> tuple[FloatArray, FloatArray, tuple[FloatArray, FloatArray]] | None:
+        """
+        Loads an entry memory mapped and marks it as recently used.
+
+        Args:
+            key (str): Geometry key of the lattice
+
+        Returns:
+            tuple[FloatArray, FloatArray, tuple[FloatArray, FloatArray]] | None: a, b and the
+            LU factorization of a, or None if the entry does not exist
+        """
+        path: str = self.entry_path(key)
+        try:
+            # Copy on write maps: scipy's lu_solve does not accept read only arrays
+            a_np, b_np, lu, piv = (np.load(os.path.join(path, name), mmap_mode="c") for name in ENTRY_FILES)
+        except (FileNotFoundError, ValueError):
+            return None
+        os.utime(path)
+        return a_np, b_np, (lu, piv)
+
+    def save(
+        self,
+        key: str,
+        a_np: FloatArray,
+        b_np: FloatArray,
+        a_lu: tuple[FloatArray, FloatArray],
+    ) -> None:
+        """
+        Stores an entry and evicts the least recently used entries if the cache is too large.
+        The entry is written to a temporary directory and renamed, so that a reader never sees
+        a partial entry.
+
+        Args:
+            key (str): Geometry key of the lattice
+            a_np (FloatArray): Influence matrix a
+            b_np (FloatArray): Influence matrix b
+            a_lu (tuple[FloatArray, FloatArray]): LU factorization of a as returned by lu_factor
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path: str = tempfile.mkdtemp(dir=self.directory, prefix=".tmp_")
+        try:
+            for name, array in zip(ENTRY_FILES, (a_np, b_np, *a_lu)):
+                np.save(os.path.join(tmp_path, name), array)
+            os.replace(tmp_path, self.entry_path(key))
+        except OSError:
+            # Another process stored the same entry first
+            shutil.rmtree(tmp_path, ignore_errors=True)
+        self.evict()
+
+    def size(self) -> int:
+        """Returns the size of the cache in bytes."""
+        return sum(size for _, _, size in self._entries())
+
+    def evict(self) -> None:
+        """Removes the least recently used entries until the cache fits in max_bytes."""
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        total: int = sum(size for _, _, size in entries)
+        for path, _, size in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+    def clear(self) -> None:
+        """Removes every entry."""
+        for path, _, _ in self._entries():
+            shutil.rmtree(path, ignore_errors=True)
+
+    def _entries(self) -> list[tuple[str, float, int]]:
+        """Returns the path, last use and size of every entry."""
+        if not os.path.isdir(self.directory):
+            return []
+        entries: list[tuple[str, float, int]] = []
+        for name in os.listdir(self.directory):
+            path: str = os.path.join(self.directory, name)
+            if name.startswith(".") or not os.path.isdir(path):
+                continue
+            size: int = sum(os.path.getsize(os.path.join(path, file)) for file in os.listdir(path))
+            entries.append((path, os.path.getmtime(path), size))
+        return entries
@@ -0,0 +1,414 @@
+"""
+Barnes-Hut treecode for the velocities induced by many vortex lines. The lines are
+sorted in an octree and every node stores the moments of the vector strengths
+Gamma * dl of its lines up to the quadrupole. A node that is well separated from a
+cluster of evaluation points acts through its moments, while close lines are
+evaluated exactly with the direct kernel. The opening angle theta trades accuracy
+for speed and theta -> 0 recovers the direct sum. For a lattice of vortex rings the
+monopole of a node nearly cancels, so the quadrupole is needed for an error that
+decreases as theta ** 2.
+
+The geometry is processed once, so that the velocities for new circulations cost
+O(P log K). This gives a fast matrix vector product for the vortex lattice, which is
+solved matrix free with GMRES through lattice_operators.
+"""
+from typing import Callable
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.linalg import LinearOperator
+
+from ICARUS.Aerodynamics.Potential.vorticity import _grid_segments
+from ICARUS.Aerodynamics.Potential.vorticity import _vortexL_kernel
+from ICARUS.Aerodynamics.Potential.vorticity import CHUNK_SIZE
+from ICARUS.Core.types import BoolArray
+from ICARUS.Core.types import FloatArray
+from ICARUS.Core.types import IntArray
+
+
+class Octree:
+    """
+    Octree over a set of points. Every node covers a contiguous range of the points
+    in the order of perm, so the points of a node are perm[start[node]:end[node]].
+
+    Args:
+        points (FloatArray): (K, 3) positions used to subdivide the space
+        leaf_size (int, optional): Maximum number of points in a leaf. Defaults to 32.
+        extent (FloatArray | None, optional): (K, E, 3) points that each item spans, used for
+            the radius of the nodes. Defaults to the positions themselves.
+    """
+
+    def __init__(self, points: FloatArray, leaf_size: int = 32, extent: FloatArray | None = None) -> None:
+        points = np.atleast_2d(np.asarray(points, dtype=float))
+        if extent is None:
+            extent = points[:, None, :]
+
+        self.perm: IntArray = np.arange(points.shape[0])
+        starts: list[int] = [0]
+        ends: list[int] = [points.shape[0]]
+        self.children: list[list[int]] = [[]]
+
+        stack: list[int] = [0]
+        while stack:
+            node: int = stack.pop()
+            start, end = starts[node], ends[node]
+            if end - start <= leaf_size:
+                continue
+            idx: IntArray = self.perm[start:end]
+            pts: FloatArray = points[idx]
+            low: FloatArray = pts.min(axis=0)
+            high: FloatArray = pts.max(axis=0)
+            if np.all(high <= low):
+                # Coincident points can not be separated
+                continue
+            mid: FloatArray = (low + high) / 2
+            octant: IntArray = (pts[:, 0] > mid[0]) + 2 * (pts[:, 1] > mid[1]) + 4 * (pts[:, 2] > mid[2])
+            self.perm[start:end] = idx[np.argsort(octant, kind="stable")]
+            for count in np.bincount(octant, minlength=8):
+                if count == 0:
+                    continue
+                child: int = len(starts)
+                starts.append(start)
+                ends.append(start + count)
+                self.children.append([])
+                self.children[node].append(child)
+                stack.append(child)
+                start += count
+
+        self.start: IntArray = np.array(starts)
+        self.end: IntArray = np.array(ends)
+        self.is_leaf: BoolArray = np.array([len(c) == 0 for c in self.children])
+
+        n_nodes: int = len(starts)
+        self.center: FloatArray = np.empty((n_nodes, 3))
+        self.radius: FloatArray = np.empty(n_nodes)
+        for node in range(n_nodes):
+            idx = self.perm[self.start[node] : self.end[node]]
+            pts = points[idx]
+            self.center[node] = (pts.min(axis=0) + pts.max(axis=0)) / 2
+            self.radius[node] = np.max(np.linalg.norm(extent[idx] - self.center[node], axis=-1))
+
+    def __len__(self) -> int:
+        return self.start.shape[0]
+
+    def items(self, node: int) -> IntArray:
+        """Returns the indices of the points of a node."""
+        return self.perm[self.start[node] : self.end[node]]
+
+
+def _interaction_lists(
+    targets: Octree,
+    sources: Octree,
+    theta: float,
+) -> tuple[list[tuple[int, int]], list[tuple[int, int]]]:
+    """
+    Dual traversal of a target and a source tree. A source node acts on a target node
+    through its moments when its radius is smaller than theta times the distance from
+    its center to the closest possible target point.
+
+    Returns:
+        tuple[list[tuple[int, int]], list[tuple[int, int]]]: Well separated (far) pairs of nodes and
+        pairs of leaves that are evaluated directly (near)
+    """
+    far: list[tuple[int, int]] = []
+    near: list[tuple[int, int]] = []
+    stack: list[tuple[int, int]] = [(0, 0)]
+    while stack:
+        t, s = stack.pop()
+        dist: float = float(np.linalg.norm(targets.center[t] - sources.center[s]))
+        if theta * (dist - targets.radius[t]) > sources.radius[s]:
+            far.append((t, s))
+        elif targets.is_leaf[t] and sources.is_leaf[s]:
+            near.append((t, s))
+        elif sources.is_leaf[s] or (not targets.is_leaf[t] and targets.radius[t] >= sources.radius[s]):
+            stack.extend((child, s) for child in targets.children[t])
+        else:
+            stack.extend((t, child) for child in sources.children[s])
+    return far, near
+
+
+class Treecode:
+    """
+    Treecode evaluator of the velocities induced at fixed points by fixed vortex lines.
+    The trees, the interaction lists and the exact near field are computed once. The
+    velocities for any set of circulations are then given by velocities.
+
+    Args:
+        points (FloatArray): (P, 3) array of evaluation points
+        x1 (FloatArray): (K, 3) array of line startpoints
+        x2 (FloatArray): (K, 3) array of line endpoints
+        theta (float, optional): Opening angle. Smaller is more accurate. Defaults to 0.3.
+        leaf_size (int, optional): Maximum number of points or lines in a leaf. Defaults to 32.
+        normals (FloatArray | None, optional): (P, 3) directions onto which the velocities are
+            projected. When given only the projections are stored and returned. Defaults to None.
+        chunk_size (int, optional): Maximum number of (point, node) pairs evaluated at once.
+    """
+
+    def __init__(
+        self,
+        points: FloatArray,
+        x1: FloatArray,
+        x2: FloatArray,
+        theta: float = 0.3,
+        leaf_size: int = 32,
+        normals: FloatArray | None = None,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> None:
+        if theta <= 0:
+            raise ValueError("theta must be positive")
+        self.points: FloatArray = np.atleast_2d(np.asarray(points, dtype=float))
+        self.x1: FloatArray = np.atleast_2d(np.asarray(x1, dtype=float))
+        self.x2: FloatArray = np.atleast_2d(np.asarray(x2, dtype=float))
+        self.normals: FloatArray | None = None if normals is None else np.atleast_2d(normals)
+        self.theta: float = theta
+        self.chunk_size: int = chunk_size
+
+        # Every line acts as a vortex particle of strength Gamma * (x2 - x1) at its midpoint
+        self.midpoints: FloatArray = (self.x1 + self.x2) / 2
+        self.dl: FloatArray = self.x2 - self.x1
+        self.sources = Octree(self.midpoints, leaf_size, extent=np.stack((self.x1, self.x2), axis=1))
+        self.targets = Octree(self.points, leaf_size)
+
+        far, near = _interaction_lists(self.targets, self.sources, theta)
+
+        # Far field as (point, source node) pairs
+        far_t: IntArray = np.array([t for t, _ in far], dtype=int)
+        far_s: IntArray = np.array([s for _, s in far], dtype=int)
+        counts: IntArray = self.targets.end[far_t] - self.targets.start[far_t]
+        offsets: IntArray = np.repeat(self.targets.start[far_t] - np.cumsum(counts) + counts, counts)
+        self.far_points: IntArray = self.targets.perm[offsets + np.arange(int(np.sum(counts)))]
+        self.far_nodes: IntArray = np.repeat(far_s, counts)
+
+        # Exact near field, stored as a sparse matrix from circulations to velocities
+        near_sources: dict[int, list[int]] = {}
+        for t, s in near:
+            near_sources.setdefault(t, []).append(s)
+        n_comp: int = 1 if self.normals is not None else 3
+        rows: list[IntArray] = []
+        cols: list[IntArray] = []
+        data: list[FloatArray] = []
+        for t, source_leaves in near_sources.items():
+            pts: IntArray = self.targets.items(t)
+            lines: IntArray = np.concatenate([self.sources.items(s) for s in source_leaves])
+            U: FloatArray = _vortexL_kernel(self.points[pts], self.x1[lines], self.x2[lines])
+            if self.normals is not None:
+                U = np.einsum("pki,pi->pk", U, self.normals[pts])[:, :, None]
+            rows.append(np.repeat(pts[:, None, None] * n_comp + np.arange(n_comp), lines.shape[0], axis=1).ravel())
+            cols.append(np.broadcast_to(lines[None, :, None], U.shape).ravel())
+            data.append(U.ravel())
+        self.near: csr_matrix = csr_matrix(
+            (
+                np.concatenate(data) if data else np.zeros(0),
+                (
+                    np.concatenate(rows) if rows else np.zeros(0, dtype=int),
+                    np.concatenate(cols) if cols else np.zeros(0, dtype=int),
+                ),
+            ),
+            shape=(self.points.shape[0] * n_comp, self.x1.shape[0]),
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the near field matrix and the far field pair lists."""
+        return int(
+            self.near.data.nbytes
+            + self.near.indices.nbytes
+            + self.near.indptr.nbytes
+            + self.far_points.nbytes
+            + self.far_nodes.nbytes,
+        )
+
+    def moments(self, gammas: FloatArray) -> tuple[FloatArray, FloatArray, FloatArray]:
+        """
+        Computes the moments of the vector strengths alpha = Gamma * dl of every node about
+        its center: the monopole sum(alpha), the dipole sum(alpha d) and the quadrupole sum(alpha d d),
+        where d is the position of the midpoint relative to the center.
+
+        Args:
+            gammas (FloatArray): (K,) circulations of the lines
+
+        Returns:
+            tuple[FloatArray, FloatArray, FloatArray]: (nodes, 3) monopoles, (nodes, 3, 3) dipoles
+            and (nodes, 3, 3, 3) quadrupoles
+        """
+        # The nodes are contiguous in the tree order, so their sums are differences of prefix sums.
+        # Positions are taken relative to the root to keep the prefix sums small.
+        perm: IntArray = self.sources.perm
+        x: FloatArray = self.midpoints[perm] - self.sources.center[0]
+        alpha: FloatArray = (gammas[:, None] * self.dl)[perm]
+        alpha_x: FloatArray = alpha[:, :, None] * x[:, None, :]
+        alpha_xx: FloatArray = alpha_x[:, :, :, None] * x[:, None, None, :]
+
+        start, end = self.sources.start, self.sources.end
+        sums: list[FloatArray] = []
+        for moment in (alpha, alpha_x, alpha_xx):
+            cum: FloatArray = np.concatenate((np.zeros((1,) + moment.shape[1:]), np.cumsum(moment, axis=0)))
+            sums.append(cum[end] - cum[start])
+        A, AX, AXX = sums
+
+        # Shift from the root to the center of every node
+        c: FloatArray = self.sources.center - self.sources.center[0]
+        D: FloatArray = AX - A[:, :, None] * c[:, None, :]
+        T: FloatArray = (
+            AXX
+            - AX[:, :, None, :] * c[:, None, :, None]
+            - AX[:, :, :, None] * c[:, None, None, :]
+            + A[:, :, None, None] * c[:, None, :, None] * c[:, None, None, :]
+        )
+        return A, D, T
+
+    def velocities(self, gammas: FloatArray | float = 1.0) -> FloatArray:
+        """
+        Computes the velocities induced at the points by the lines.
+
+        Args:
+            gammas (FloatArray | float, optional): (K,) circulations of the lines or one for all. Defaults to 1.
+
+        Returns:
+            FloatArray: (P, 3) induced velocities, or (P,) projections when normals were given
+        """
+        gammas = np.broadcast_to(np.asarray(gammas, dtype=float), (self.x1.shape[0],))
+        n_comp: int = 1 if self.normals is not None else 3
+        U: FloatArray = np.asarray(self.near @ gammas).reshape(-1, n_comp)
+
+        def skew(mat: FloatArray) -> FloatArray:
+            return np.stack(
+                (mat[..., 1, 2] - mat[..., 2, 1], mat[..., 2, 0] - mat[..., 0, 2], mat[..., 0, 1] - mat[..., 1, 0]),
+                axis=-1,
+            )
+
+        A, D, T = self.moments(gammas)
+        skew_D: FloatArray = skew(D)
+        trace_T: FloatArray = np.einsum("nacc->na", T)
+        for start in range(0, self.far_points.shape[0], self.chunk_size):
+            pts: IntArray = self.far_points[start : start + self.chunk_size]
+            nodes: IntArray = self.far_nodes[start : start + self.chunk_size]
+            R: FloatArray = self.points[pts] - self.sources.center[nodes]
+            r2: FloatArray = np.sum(R**2, axis=-1, keepdims=True)
+            DR: FloatArray = np.einsum("kab,kb->ka", D[nodes], R)
+            TR: FloatArray = np.einsum("kabe,ke->kab", T[nodes], R)
+            RTR: FloatArray = np.einsum("kab,kb->ka", TR, R)
+            # Taylor expansion of sum_k alpha_k x K(R - d_k) / (4 pi) with K(r) = r / |r|^3
+            u: FloatArray = (
+                np.cross(A[nodes], R)
+                - skew_D[nodes]
+                + (3 * np.cross(DR, R) - 3 * skew(TR) - 1.5 * np.cross(trace_T[nodes], R)) / r2
+                + 7.5 * np.cross(RTR, R) / r2**2
+            ) / (4 * np.pi * r2 ** (3 / 2))
+            if self.normals is not None:
+                u = np.sum(u * self.normals[pts], axis=-1, keepdims=True)
+            for i in range(n_comp):
+                U[:, i] += np.bincount(pts, weights=u[:, i], minlength=U.shape[0])
+
+        if self.normals is not None:
+            return U[:, 0]
+        return U
+
+
+def lattice_strengths(gammas: FloatArray, shape: tuple[int, int], trailing: bool = False) -> FloatArray:
+    """
+    Returns the circulations of the unique lines of a grid of vortex rings, in the
+    order of _grid_segments: the spanwise lines followed by the chordwise lines.
+
+    Args:
+        gammas (FloatArray): ((n - 1) * (m - 1)) circulations of the rings
+        shape (tuple[int, int]): Shape (n, m) of the grid
+        trailing (bool, optional): Keep only the chordwise lines (the Ustar part of voring). Defaults to False.
+
+    Returns:
+        FloatArray: ((n - 1) * m + n * (m - 1)) circulations of the lines
+    """
+    n, m = shape
+    g: FloatArray = np.reshape(gammas, (n - 1, m - 1))
+    # Ring (j, k) is made of span[j, k], chord[j + 1, k], -span[j, k + 1] and -chord[j, k]
+    span: FloatArray = np.zeros((n - 1, m))
+    if not trailing:
+        span[:, :-1] += g
+        span[:, 1:] -= g
+    chord: FloatArray = np.zeros((n, m - 1))
+    chord[1:] += g
+    chord[:-1] -= g
+    return np.concatenate((span.ravel(), chord.ravel()))
+
+
+def lattice_operators(
+    control_points: FloatArray,
+    control_nj: FloatArray,
+    grid: FloatArray,
+    images: list[tuple[FloatArray, FloatArray]],
+    theta: float = 0.3,
+    leaf_size: int = 32,
+) -> tuple[LinearOperator, LinearOperator]:
+    """
+    Matrix free counterparts of the influence matrices of assemble_LHS for a lattice of
+    vortex rings. Mirror images of the lattice (symmetry plane, ground) are added by
+    evaluating the velocities at the images of the control points: an image (R, o)
+    contributes R u(R p + o) at the control point p, with R a diagonal reflection.
+
+    Args:
+        control_points (FloatArray): (N - 1, M, 3) control points of the panels
+        control_nj (FloatArray): (N - 1, M, 3) unit normals at the control points
+        grid (FloatArray): (N, M + 1, 3) grid of the lattice, wake included
+        images (list[tuple[FloatArray, FloatArray]]): (reflection, offset) of every image,
+            the identity included
+        theta (float, optional): Opening angle of the treecode. Defaults to 0.3.
+        leaf_size (int, optional): Maximum number of points or lines in a leaf. Defaults to 32.
+
+    Returns:
+        tuple[LinearOperator, LinearOperator]: Operators a and b. Both share the Treecode,
+        available as their tree attribute.
+    """
+    M: int = control_points.shape[1]
+    n_panels: int = control_points.shape[0] * M
+    rows: IntArray = np.arange(n_panels)
+    body: IntArray = rows[rows % M != M - 1]
+    wake: IntArray = rows[rows % M == M - 1]
+
+    points: FloatArray = control_points.reshape(-1, 3)[body]
+    normals: FloatArray = control_nj.reshape(-1, 3)[body]
+    span_start, span_end, chord_start, chord_end = _grid_segments(grid)
+    tree = Treecode(
+        np.concatenate([points * reflection + offset for reflection, offset in images]),
+        np.concatenate((span_start, chord_start)),
+        np.concatenate((span_end, chord_end)),
+        theta=theta,
+        leaf_size=leaf_size,
+        normals=np.concatenate([normals * reflection for reflection, _ in images]),
+    )
+
+    def operator(trailing: bool) -> Callable[[FloatArray], FloatArray]:
+        def matvec(gammas: FloatArray) -> FloatArray:
+            gammas = np.ravel(gammas)
+            out: FloatArray = np.empty(n_panels)
+            strengths: FloatArray = lattice_strengths(gammas, (grid.shape[0], grid.shape[1]), trailing)
+            out[body] = tree.velocities(strengths).reshape(len(images), -1).sum(axis=0)
+            # Kutta condition rows
+            out[wake] = gammas[wake] - gammas[wake - 1]
+            return out
+
+        return matvec
+
+    a_op = LinearOperator((n_panels, n_panels), matvec=operator(False), dtype=float)
+    b_op = LinearOperator((n_panels, n_panels), matvec=operator(True), dtype=float)
+    a_op.tree = b_op.tree = tree
+    return a_op, b_op
+
+
+def block_jacobi(blocks: FloatArray) -> LinearOperator:
+    """
+    Returns the block Jacobi preconditioner of a matrix given its diagonal blocks.
+
+    Args:
+        blocks (FloatArray): (B, M, M) diagonal blocks of the matrix
+
+    Returns:
+        LinearOperator: Operator applying the inverse of the block diagonal
+    """
+    inverses: FloatArray = np.linalg.inv(blocks)
+    n: int = blocks.shape[0] * blocks.shape[1]
+
+    def matvec(x: FloatArray) -> FloatArray:
+        y: FloatArray = np.einsum("jab,jb->ja", inverses, np.reshape(x, blocks.shape[:2]))
+        return y.ravel()
+
+    return LinearOperator((n, n), matvec=matvec, dtype=float)
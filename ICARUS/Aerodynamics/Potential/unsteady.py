@@ -0,0 +1,103 @@
+"""
+Wake of the unsteady vortex lattice solver of Wing_LSPT. Instead of a rigid straight
+wake, every time step the trailing edge sheds a row of vortex rings that carries the
+circulation of the trailing edge rings. The rings are convected with the local velocity
+(free wake) or with the onset flow only (prescribed wake), so the wake rolls up and
+remembers the history of the loads. The wake grows by a row per step, which makes
+every step cost more than the previous one. Its length can be capped by merging or
+dropping the oldest rows.
+"""
+from typing import Callable
+
+import numpy as np
+
+from ICARUS.Aerodynamics.Potential.assembly import induced_velocities
+from ICARUS.Aerodynamics.Potential.vorticity import CHUNK_SIZE
+from ICARUS.Core.types import FloatArray
+
+
+class UnsteadyWake:
+    """
+    Free wake of vortex rings shed by a lattice. The wake is a grid of spanwise stations
+    (rows of the grid of the lattice) by shed rows, newest first. Ring (j, k) lies between
+    the stations j and j + 1 and the shed rows k and k + 1.
+
+    Args:
+        origin (FloatArray): (N, 3) points where the wake leaves the lattice
+    """
+
+    def __init__(self, origin: FloatArray) -> None:
+        self.grid: FloatArray = np.array(origin, dtype=float)[:, None, :]
+        self.gammas: FloatArray = np.zeros((origin.shape[0] - 1, 0))
+
+    @property
+    def n_rows(self) -> int:
+        """Number of shed rows of rings."""
+        return self.gammas.shape[1]
+
+    def velocities(
+        self,
+        points: FloatArray,
+        element: Callable[..., tuple[FloatArray, FloatArray]],
+        chunk_size: int = CHUNK_SIZE,
+    ) -> FloatArray:
+        """
+        Returns the velocities that the wake induces at some points.
+
+        Args:
+            points (FloatArray): (P, 3) array of points
+            element (Callable[..., tuple[FloatArray, FloatArray]]): Vortex ring element, voring or symm_wing_panels
+            chunk_size (int, optional): Maximum number of (point, ring) pairs evaluated at once.
+
+        Returns:
+            FloatArray: (P, 3) induced velocities
+        """
+        points = np.reshape(points, (-1, 3))
+        if self.n_rows == 0:
+            return np.zeros_like(points, dtype=float)
+        U, _ = induced_velocities(points, self.grid, element, self.gammas.ravel(), chunk_size=chunk_size)
+        return U
+
+    def convect(self, velocities: FloatArray, dt: float) -> None:
+        """
+        Moves every point of the wake with its velocity for a time step.
+
+        Args:
+            velocities (FloatArray): (N * (n_rows + 1), 3) velocities of the points of the grid
+            dt (float): Time step
+        """
+        self.grid += np.reshape(velocities, self.grid.shape) * dt
+
+    def shed(self, origin: FloatArray, gammas: FloatArray) -> None:
+        """
+        Adds a row of rings between the points where the wake leaves the lattice and
+        the newest row of the wake.
+
+        Args:
+            origin (FloatArray): (N, 3) points where the wake leaves the lattice
+            gammas (FloatArray): (N - 1) circulations of the new rings
+        """
+        self.grid = np.concatenate((origin[:, None, :], self.grid), axis=1)
+        self.gammas = np.concatenate((np.reshape(gammas, (-1, 1)), self.gammas), axis=1)
+
+    def limit(self, max_rows: int | None, merge: bool = True) -> None:
+        """
+        Caps the number of rows of the wake. The two oldest rows are merged into one ring
+        with their mean circulation, which keeps the length of the wake and most of the
+        starting vortex. Otherwise the oldest row is dropped.
+
+        Args:
+            max_rows (int | None): Maximum number of rows. None for an unbounded wake.
+            merge (bool, optional): Whether to merge the oldest rows instead of dropping them. Defaults to True.
+        """
+        if max_rows is None:
+            return
+        if max_rows < 1:
+            raise ValueError("The wake must keep at least one row")
+        while self.n_rows > max_rows:
+            if merge and self.n_rows > 1:
+                self.gammas[:, -2] = (self.gammas[:, -2] + self.gammas[:, -1]) / 2
+                self.grid = np.delete(self.grid, -2, axis=1)
+            else:
+                self.grid = self.grid[:, :-1]
+            self.gammas = self.gammas[:, :-1]
@@ -1,5 +1,10 @@
+from typing import Callable
+
 import numpy as np
 
+from ICARUS.Aerodynamics.Potential.backends import get_backend
+from ICARUS.Aerodynamics.Potential.backends import vortex_lines
+from ICARUS.Core.types import BoolArray
 from ICARUS.Core.types import FloatArray
 
 
@@ -375,3 +380,317 @@ def ground_effect(x: float, y: float, z: float, i: int, j: int, panel: FloatArra
     U_ind = np.array([U1[0] + U2[0], U1[1] + U2[1], U1[2] - U2[2]])
     U_ind_st = np.array([U1st[0] + U2st[0], U1st[1] + U2st[1], U1st[2] - U2st[2]])
     return U_ind, U_ind_st
+
+
+# Maximum number of (point, segment) pairs evaluated at once by the batched kernels.
+# Bounds the size of the (P, K, 3) temporaries to a few MB so that they stay in cache.
+CHUNK_SIZE: int = 2**16
+
+
+def _vortexL_kernel(
+    points: FloatArray,
+    x1: FloatArray,
+    x2: FloatArray,
+) -> FloatArray:
+    """Computes the velocities induced at every point by every vortex line
+    of unit circulation. Array counterpart of vortexL with the same cutoff.
+
+    Args:
+        points: (P, 3) array of evaluation points
+        x1: (K, 3) array of line startpoints
+        x2: (K, 3) array of line endpoints
+
+    Returns:
+        FloatArray: (P, K, 3) array of induced velocities
+    """
+    r1x: FloatArray = points[:, None, 0] - x1[None, :, 0]
+    r1y: FloatArray = points[:, None, 1] - x1[None, :, 1]
+    r1z: FloatArray = points[:, None, 2] - x1[None, :, 2]
+    r2x: FloatArray = points[:, None, 0] - x2[None, :, 0]
+    r2y: FloatArray = points[:, None, 1] - x2[None, :, 1]
+    r2z: FloatArray = points[:, None, 2] - x2[None, :, 2]
+
+    crossx: FloatArray = r1y * r2z - r1z * r2y
+    crossy: FloatArray = -r1x * r2z + r1z * r2x
+    crossz: FloatArray = r1x * r2y - r1y * r2x
+
+    cross_mag: FloatArray = crossx**2 + crossy**2 + crossz**2
+    r1: FloatArray = np.sqrt(r1x**2 + r1y**2 + r1z**2)
+    r2: FloatArray = np.sqrt(r2x**2 + r2y**2 + r2z**2)
+
+    r0: FloatArray = x2 - x1
+    r0dr1: FloatArray = r0[None, :, 0] * r1x + r0[None, :, 1] * r1y + r0[None, :, 2] * r1z
+    r0dr2: FloatArray = r0[None, :, 0] * r2x + r0[None, :, 1] * r2y + r0[None, :, 2] * r2z
+
+    e: float = 1e-9
+    mask: BoolArray = (r1 < e) | (r2 < e) | (cross_mag < e)
+    # Guard the masked entries so that the division below stays finite
+    cross_mag[mask] = 1.0
+    r1[mask] = 1.0
+    r2[mask] = 1.0
+
+    K: FloatArray = (1 / (4 * np.pi * cross_mag)) * (r0dr1 / r1 - r0dr2 / r2)
+    K[mask] = 0.0
+
+    return np.stack((K * crossx, K * crossy, K * crossz), axis=-1)
+
+
+def vortexL_batch(
+    points: FloatArray,
+    x1: FloatArray,
+    x2: FloatArray,
+    gammas: FloatArray | float = 1.0,
+    chunk_size: int = CHUNK_SIZE,
+) -> FloatArray:
+    """Computes the velocities induced at P points by K vortex lines
+    given their end points and circulations. The points are processed in
+    chunks so that at most chunk_size (point, line) pairs are held in memory.
+    With the numba kernel backend the lines are summed by a compiled kernel instead.
+
+    Args:
+        points: (P, 3) array of evaluation points
+        x1: (K, 3) array of line startpoints
+        x2: (K, 3) array of line endpoints
+        gammas: (K,) array of vorticities or a single vorticity for all lines. Defaults to 1.
+        chunk_size: Maximum number of (point, line) pairs evaluated at once.
+
+    Returns:
+        FloatArray: (P, 3) array of induced velocities
+    """
+    points = np.atleast_2d(np.asarray(points, dtype=float))
+    x1 = np.atleast_2d(np.asarray(x1, dtype=float))
+    x2 = np.atleast_2d(np.asarray(x2, dtype=float))
+    gammas = np.broadcast_to(np.asarray(gammas, dtype=float), (x1.shape[0],))
+    if get_backend() == "numba":
+        return vortex_lines(points, x1, x2, np.ascontiguousarray(gammas))
+
+    U: FloatArray = np.zeros((points.shape[0], 3))
+    step: int = max(1, chunk_size // max(1, x1.shape[0]))
+    for start in range(0, points.shape[0], step):
+        stop: int = start + step
+        U[start:stop] = np.einsum(
+            "pki,k->pi",
+            _vortexL_kernel(points[start:stop], x1, x2),
+            gammas,
+        )
+    return U
+
+
+def _grid_segments(grid: FloatArray) -> tuple[FloatArray, FloatArray, FloatArray, FloatArray]:
+    """Returns the unique vortex lines of a grid. Spanwise lines go from
+    grid[j, k] to grid[j + 1, k] and chordwise lines from grid[j, k] to grid[j, k + 1].
+
+    Args:
+        grid: (n, m, 3) grid of geometry
+
+    Returns:
+        tuple[FloatArray, FloatArray, FloatArray, FloatArray]: Start and end points of the
+        spanwise lines, each (n - 1) * m long, and of the chordwise lines, each n * (m - 1) long.
+    """
+    span_start: FloatArray = grid[:-1, :, :].reshape(-1, 3)
+    span_end: FloatArray = grid[1:, :, :].reshape(-1, 3)
+    chord_start: FloatArray = grid[:, :-1, :].reshape(-1, 3)
+    chord_end: FloatArray = grid[:, 1:, :].reshape(-1, 3)
+    return span_start, span_end, chord_start, chord_end
+
+
+def _grid_segments_influence(points: FloatArray, grid: FloatArray) -> tuple[FloatArray, FloatArray]:
+    """Computes the velocities induced at every point by every unique vortex line of the grid.
+
+    Args:
+        points: (P, 3) array of evaluation points
+        grid: (n, m, 3) grid of geometry
+
+    Returns:
+        tuple[FloatArray, FloatArray]: (P, n - 1, m, 3) velocities induced by the spanwise lines
+        and (P, n, m - 1, 3) velocities induced by the chordwise lines
+    """
+    n, m = grid.shape[0], grid.shape[1]
+    span_start, span_end, chord_start, chord_end = _grid_segments(grid)
+    U: FloatArray = _vortexL_kernel(
+        points,
+        np.concatenate((span_start, chord_start)),
+        np.concatenate((span_end, chord_end)),
+    )
+    n_span: int = (n - 1) * m
+    U_span: FloatArray = U[:, :n_span].reshape(-1, n - 1, m, 3)
+    U_chord: FloatArray = U[:, n_span:].reshape(-1, n, m - 1, 3)
+    return U_span, U_chord
+
+
+def _chunked_panels(
+    points: FloatArray,
+    grid: FloatArray,
+    n_panels: int,
+    element: Callable[[FloatArray, FloatArray], tuple[FloatArray, FloatArray]],
+    chunk_size: int,
+) -> tuple[FloatArray, FloatArray]:
+    """Evaluates a batched element over chunks of points.
+
+    Args:
+        points: (P, 3) array of evaluation points
+        grid: (n, m, 3) grid of geometry
+        n_panels: Number of elements generated by the grid
+        element: Function returning the (U, Ustar) influences for a chunk of points
+        chunk_size: Maximum number of (point, line) pairs evaluated at once.
+
+    Returns:
+        tuple[FloatArray, FloatArray]: (P, n_panels, 3) arrays U and Ustar
+    """
+    points = np.atleast_2d(np.asarray(points, dtype=float))
+    U: FloatArray = np.empty((points.shape[0], n_panels, 3))
+    Ustar: FloatArray = np.empty((points.shape[0], n_panels, 3))
+
+    n_lines: int = 2 * grid.shape[0] * grid.shape[1]
+    step: int = max(1, chunk_size // n_lines)
+    for start in range(0, points.shape[0], step):
+        stop: int = start + step
+        U[start:stop], Ustar[start:stop] = element(points[start:stop], grid)
+    return U, Ustar
+
+
+def _voring_chunk(points: FloatArray, grid: FloatArray) -> tuple[FloatArray, FloatArray]:
+    U_span, U_chord = _grid_segments_influence(points, grid)
+    # Each ring (j, k) is made of the lines 1: span[j, k], 2: chord[j + 1, k],
+    # 3: -span[j, k + 1] and 4: -chord[j, k]
+    Ustar: FloatArray = U_chord[:, 1:, :, :] - U_chord[:, :-1, :, :]
+    U: FloatArray = U_span[:, :, :-1, :] - U_span[:, :, 1:, :] + Ustar
+    return U.reshape(points.shape[0], -1, 3), Ustar.reshape(points.shape[0], -1, 3)
+
+
+def _hshoe2_chunk(points: FloatArray, grid: FloatArray) -> tuple[FloatArray, FloatArray]:
+    U_span, U_chord = _grid_segments_influence(points, grid)
+    # Each horseshoe (j, k) is made of the lines 1: -chord[j, k], 2: span[j, k] and 3: chord[j + 1, k]
+    Ustar: FloatArray = U_chord[:, 1:, :, :] - U_chord[:, :-1, :, :]
+    U: FloatArray = U_span[:, :, :-1, :] + Ustar
+    return U.reshape(points.shape[0], -1, 3), Ustar.reshape(points.shape[0], -1, 3)
+
+
+def _hshoeSL2_chunk(points: FloatArray, grid: FloatArray) -> tuple[FloatArray, FloatArray]:
+    U_span, U_chord = _grid_segments_influence(points, grid)
+    # Each slanted horseshoe (j, i) is made of the lines 1: -chord[j, i + 1], 2: -chord[j, i],
+    # 3: span[j, i], 4: chord[j + 1, i] and 5: chord[j + 1, i + 1]
+    u12: FloatArray = -U_chord[:, :-1, 1:, :] - U_chord[:, :-1, :-1, :]
+    u3: FloatArray = U_span[:, :, :-2, :]
+    u4: FloatArray = U_chord[:, 1:, :-1, :]
+    u5: FloatArray = U_chord[:, 1:, 1:, :]
+    U: FloatArray = u12 + u3 + u4 + u5
+    Ustar: FloatArray = u12 - u3 - u4
+    return U.reshape(points.shape[0], -1, 3), Ustar.reshape(points.shape[0], -1, 3)
+
+
+def voring_batch(
+    points: FloatArray,
+    grid: FloatArray,
+    chunk_size: int = CHUNK_SIZE,
+) -> tuple[FloatArray, FloatArray]:
+    """Array counterpart of voring. Computes the velocities induced at every point
+    by every unit vortex ring of the grid in one pass.
+
+    Args:
+        points: (P, 3) array of evaluation points
+        grid: (n, m, 3) grid of geometry
+        chunk_size: Maximum number of (point, line) pairs evaluated at once.
+
+    Returns:
+        tuple[FloatArray, FloatArray]: (P, (n - 1) * (m - 1), 3) arrays U and Ustar.
+        Ring (j, k) is stored at index j * (m - 1) + k.
+    """
+    n_panels: int = (grid.shape[0] - 1) * (grid.shape[1] - 1)
+    return _chunked_panels(points, grid, n_panels, _voring_chunk, chunk_size)
+
+
+def hshoe2_batch(
+    points: FloatArray,
+    grid: FloatArray,
+    chunk_size: int = CHUNK_SIZE,
+) -> tuple[FloatArray, FloatArray]:
+    """Array counterpart of hshoe2. Computes the velocities induced at every point
+    by every unit horseshoe vortex of the grid in one pass.
+
+    Args:
+        points: (P, 3) array of evaluation points
+        grid: (n, m, 3) grid of geometry
+        chunk_size: Maximum number of (point, line) pairs evaluated at once.
+
+    Returns:
+        tuple[FloatArray, FloatArray]: (P, (n - 1) * (m - 1), 3) arrays U and Ustar.
+        The horseshoe on grid[j, k] is stored at index j * (m - 1) + k.
+    """
+    n_panels: int = (grid.shape[0] - 1) * (grid.shape[1] - 1)
+    return _chunked_panels(points, grid, n_panels, _hshoe2_chunk, chunk_size)
+
+
+def hshoeSL2_batch(
+    points: FloatArray,
+    grid: FloatArray,
+    chunk_size: int = CHUNK_SIZE,
+) -> tuple[FloatArray, FloatArray]:
+    """Array counterpart of hshoeSL2. Computes the velocities induced at every point
+    by every unit slanted horseshoe of the grid in one pass.
+
+    Args:
+        points: (P, 3) array of evaluation points
+        grid: (n, m, 3) grid of geometry
+        chunk_size: Maximum number of (point, line) pairs evaluated at once.
+
+    Returns:
+        tuple[FloatArray, FloatArray]: (P, (n - 1) * (m - 2), 3) arrays U and Ustar.
+        The horseshoe on grid[j, i] is stored at index j * (m - 2) + i.
+    """
+    n_panels: int = (grid.shape[0] - 1) * (grid.shape[1] - 2)
+    return _chunked_panels(points, grid, n_panels, _hshoeSL2_chunk, chunk_size)
+
+
+def symm_wing_panels_batch(
+    points: FloatArray,
+    grid: FloatArray,
+    chunk_size: int = CHUNK_SIZE,
+) -> tuple[FloatArray, FloatArray]:
+    """Array counterpart of symm_wing_panels. The points and their images
+    about the xz plane are evaluated in the same pass.
+
+    Args:
+        points: (P, 3) array of evaluation points
+        grid: (n, m, 3) grid of geometry
+        chunk_size: Maximum number of (point, line) pairs evaluated at once.
+
+    Returns:
+        tuple[FloatArray, FloatArray]: (P, (n - 1) * (m - 1), 3) arrays U and Ustar.
+    """
+    reflection: FloatArray = np.array([1.0, -1.0, 1.0])
+
+    def element(chunk: FloatArray, grid: FloatArray) -> tuple[FloatArray, FloatArray]:
+        U, Ustar = _voring_chunk(np.concatenate((chunk, chunk * reflection)), grid)
+        P: int = chunk.shape[0]
+        return U[:P] + U[P:] * reflection, Ustar[:P] + Ustar[P:] * reflection
+
+    n_panels: int = (grid.shape[0] - 1) * (grid.shape[1] - 1)
+    return _chunked_panels(points, grid, n_panels, element, chunk_size // 2)
+
+
+def ground_effect_batch(
+    points: FloatArray,
+    grid: FloatArray,
+    chunk_size: int = CHUNK_SIZE,
+) -> tuple[FloatArray, FloatArray]:
+    """Array counterpart of ground_effect. The points and their images
+    about the xy plane are evaluated in the same pass.
+
+    Args:
+        points: (P, 3) array of evaluation points
+        grid: (n, m, 3) grid of geometry
+        chunk_size: Maximum number of (point, line) pairs evaluated at once.
+
+    Returns:
+        tuple[FloatArray, FloatArray]: (P, (n - 1) * (m - 2), 3) arrays U and Ustar.
+    """
+    reflection: FloatArray = np.array([1.0, 1.0, -1.0])
+
+    def element(chunk: FloatArray, grid: FloatArray) -> tuple[FloatArray, FloatArray]:
+        U, Ustar = _hshoeSL2_chunk(np.concatenate((chunk, chunk * reflection)), grid)
+        P: int = chunk.shape[0]
+        return U[:P] + U[P:] * reflection, Ustar[:P] + Ustar[P:] * reflection
+
+    n_panels: int = (grid.shape[0] - 1) * (grid.shape[1] - 2)
+    return _chunked_panels(points, grid, n_panels, element, chunk_size // 2)
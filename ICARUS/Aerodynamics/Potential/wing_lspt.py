@@ -1,3 +1,6 @@
+import copy
+import hashlib
+from collections import OrderedDict
 from typing import Any
 from typing import Callable
 
@@ -11,12 +14,39 @@ from mpl_toolkits.mplot3d import Axes3D
 from numpy import dtype
 from numpy import floating
 from numpy import ndarray
-
+from scipy.linalg import lu_factor
+from scipy.linalg import lu_solve
+from scipy.sparse.linalg import LinearOperator
+
+from ICARUS.Aerodynamics.Potential.assembly import assemble_ground_image_LHS
+from ICARUS.Aerodynamics.Potential.assembly import assemble_LHS
+from ICARUS.Aerodynamics.Potential.assembly import assemble_strips_LHS
+from ICARUS.Aerodynamics.Potential.assembly import BATCHED_ELEMENTS
+from ICARUS.Aerodynamics.Potential.assembly import induced_velocities
+from ICARUS.Aerodynamics.Potential.assembly import influence_operators
+from ICARUS.Aerodynamics.Potential.assembly import strip_panels
+from ICARUS.Aerodynamics.Potential.linear_solvers import gmres_solve
+from ICARUS.Aerodynamics.Potential.linear_solvers import InPlaceLU
+from ICARUS.Aerodynamics.Potential.linear_solvers import LINEAR_SOLVERS
+from ICARUS.Aerodynamics.Potential.linear_solvers import SchurFactorization
+from ICARUS.Aerodynamics.Potential.linear_solvers import SolveReport
+from ICARUS.Aerodynamics.Potential.matrix_cache import MatrixCache
+from ICARUS.Aerodynamics.Potential.treecode import block_jacobi
+from ICARUS.Aerodynamics.Potential.treecode import lattice_operators
+from ICARUS.Aerodynamics.Potential.unsteady import UnsteadyWake
+from ICARUS.Aerodynamics.Potential.vorticity import CHUNK_SIZE
+from ICARUS.Aerodynamics.Potential.vorticity import symm_wing_panels
+from ICARUS.Aerodynamics.Potential.vorticity import symm_wing_panels_batch
+from ICARUS.Aerodynamics.Potential.vorticity import voring
+from ICARUS.Aerodynamics.Potential.vorticity import voring_batch
 from ICARUS.Airfoils.airfoil import Airfoil
+from ICARUS.Core.types import BoolArray
 from ICARUS.Core.types import FloatArray
+from ICARUS.Core.types import IntArray
 from ICARUS.Database import DB
 from ICARUS.Environment.definition import Environment
 from ICARUS.Vehicle.plane import Airplane
+from ICARUS.Vehicle.wing_segment import build_panels
 from ICARUS.Vehicle.wing_segment import Wing_Segment
 
 
@@ -27,6 +57,25 @@ class Wing_LSPT:
     the no penetration condition. Also, the Trefftz plane is used to
     calculate the induced drag. To calculate forces and moments db polars,
     can also be used.
+
+    If every wing segment is symmetric and use_symmetry is True, only the right half
+    of the wing is discretized and the system is solved for half of the panels.
+    Otherwise the symmetric segments are mirrored and the full span is solved.
+
+    The linear system is solved with one of the solvers of linear_solvers.LINEAR_SOLVERS.
+    The dense direct solve is the fastest while the influence matrices fit in memory.
+    The iterative solvers trade time for memory and record their convergence in solve_reports.
+
+    When a single surface changes between solves, e.g. the incidence of the tail in a trim
+    loop, update_plane rebuilds the lattice and marks the strips that moved as dirty. The
+    direct solver then only assembles the influences of the dirty strips and updates the
+    factorization of the others with their Schur complement.
+
+    With lean_memory the influence matrix a is factorized in its own memory (a_np is None
+    after a direct solve), b is stored in float32 and only the factorization of the current
+    geometry is kept. The matrices of the previous geometry are freed before the next one is
+    assembled, so an Inflow-* angle sequence needs about a third of the memory. The induced
+    velocities w then carry the float32 rounding of b, a relative error of about 1e-7.
     """
 
     def __init__(
@@ -35,18 +84,22 @@ class Wing_LSPT:
         environment: Environment,
         alpha: float,
         beta: float = 0,
-        ground_clearence: float = 5,
+        ground_clearence: float | None = None,
         wake_geom_type: str = "TE-Geometrical",
+        use_symmetry: bool = True,
+        linear_solver: str = "direct",
+        solver_tol: float = 1e-6,
+        assembly_workers: int = 1,
+        cache_dir: str | None = None,
+        lean_memory: bool = False,
     ) -> None:
         # Get the environment properties
         self.dens: float = environment.air_density
         self.visc: float = environment.air_dynamic_viscosity
 
-        # Store the wing segments
-        self.wing_segments: list[Wing_Segment] = plane.surfaces
-
-        # Add the ground effect distance ! NOT IMPLEMENTED AS OF NOW
-        self.ground_effect_dist: float = ground_clearence
+        # Distance of the ground plane below the z = 0 plane of the airplane. None for free air.
+        # The ground is modelled by mirroring the lattice about the plane z = -ground_effect_dist.
+        self.ground_effect_dist: float | None = ground_clearence
 
         # Get the angle of attack and sideslip
         self._alpha: float = alpha
@@ -55,30 +108,104 @@ class Wing_LSPT:
         # Store the wake geometry type
         self.wake_geom_type: str = wake_geom_type
 
-        self.N: int = 0
-        self._wing_segments: list[Wing_Segment] = plane.surfaces
-        self.M: int = plane.surfaces[0].M
-        self.is_symmetric: bool = True
+        # Linear solver of the system, relative tolerance of the iterative solvers
+        # and opening angle of the treecode solver
+        if linear_solver not in LINEAR_SOLVERS:
+            raise ValueError(f"Unknown linear solver {linear_solver}. The options are: {', '.join(LINEAR_SOLVERS)}")
+        self.linear_solver: str = linear_solver
+        self.solver_tol: float = solver_tol
+        self.treecode_theta: float = 0.3
+        # Number of processes assembling the influence matrices
+        self.assembly_workers: int = assembly_workers
+
+        # When every segment is symmetric only the right half of the wing is modelled and
+        # the left half enters the influence matrices as a mirror image (symm_wing_panels).
+        # Otherwise symmetric segments are mirrored about the xz plane into a full span lattice.
+        self.use_symmetry: bool = use_symmetry
+        self.build_lattice(plane)
+
+        # Strips whose geometry changed in update_plane. The direct solver reuses the
+        # factorization of the influences between the other strips while they stay few.
+        self.dirty_strips: IntArray = np.array([], dtype=int)
+        self.max_dirty_fraction: float = 0.5
+        # Key of the clean strips with their influence matrices and the LU factorization of a_np
+        self._clean_factorization: tuple[str, FloatArray, FloatArray, tuple[FloatArray, FloatArray]] | None = None
 
+        # Define the variables that will be used in the solver
+        self.a_np: ndarray[Any, dtype[floating]] = None  # type: ignore
+        self.b_np: ndarray[Any, dtype[floating]] = None  # type: ignore
+        self.RHS_np: ndarray[Any, dtype[floating]] = None  # type: ignore
+        self.a_lu: tuple[FloatArray, FloatArray] | SchurFactorization | InPlaceLU = None  # type: ignore
+
+        # LU factorizations of a_np together with a_np and b_np, keyed by the lattice geometry.
+        # The Inflow-* wakes change the geometry with alpha, so a few of them are kept.
+        self.lean_memory: bool = lean_memory
+        self.factorization_cache_size: int = 1 if lean_memory else 4
+        self._factorizations: OrderedDict[
+            str,
+            tuple[FloatArray, FloatArray, tuple[FloatArray, FloatArray] | SchurFactorization | InPlaceLU],
+        ] = OrderedDict()
+        # Factorizations persisted on disk across runs. None to keep them only in memory. Only the
+        # TE-Geometrical wake is stored: the Inflow-* wakes give every angle its own geometry.
+        self.matrix_cache: MatrixCache | None = None if cache_dir is None else MatrixCache(cache_dir)
+        # Free air influence matrices used with ground effect. They are reused across heights.
+        self._free_air_LHS: OrderedDict[str, tuple[FloatArray, FloatArray]] = OrderedDict()
+        # Geometry of the influence matrices assembled for the gmres solver
+        self._assembled_key: str | None = None
+        # Convergence and memory of every solve
+        self.solve_reports: list[SolveReport] = []
+
+    def build_lattice(self, plane: Airplane) -> None:
+        """
+        Discretizes the surfaces of the airplane into the grid, panels and control points of the lattice.
+
+        Args:
+            plane (Airplane): Airplane to discretize
+
+        Raises:
+            ValueError: If the segments have different numbers of chordwise panels
+        """
+        # Store the wing segments
+        self.wing_segments: list[Wing_Segment] = plane.surfaces
+
+        self.M: int = plane.surfaces[0].M
         for segment in plane.surfaces:
-            if not segment.is_symmetric:
-                self.is_symmetric = False
-            self.N += segment.N
             if segment.M != self.M:
                 raise ValueError("All wing segments must have the same number of chordwise panels")
 
+        self.is_symmetric: bool = self.use_symmetry and all(segment.is_symmetric for segment in plane.surfaces)
+
+        # Lattice of each segment as (segment, grid, span distribution)
+        lattice: list[tuple[Wing_Segment, FloatArray, FloatArray]] = []
+        for segment in plane.surfaces:
+            seg_grid: FloatArray = segment.grid
+            seg_span: FloatArray = segment._span_dist + segment.origin[1]
+            if segment.is_symmetric and not self.is_symmetric:
+                seg_grid = segment.get_grid("camber")
+                seg_span = np.concatenate((-seg_span[::-1], seg_span[1:]))
+            lattice.append((segment, seg_grid, seg_span))
+
+        # Segments and number of spanwise points of each segment in the lattice
+        self.lattice_segments: list[tuple[Wing_Segment, int]] = [
+            (segment, seg_grid.shape[0]) for segment, seg_grid, _ in lattice
+        ]
+        # The last row of every segment but the last one is dropped from the lattice. The strip between
+        # the row before it and the root of the next segment is kept on purpose, as the alpha and beta
+        # setters always built it
+        rows: list[int] = [n_points - 1 for _, n_points in self.lattice_segments[:-1]]
+        rows.append(self.lattice_segments[-1][1])
+        self.N: int = sum(rows)
+
         # Calculate the wing area
         self.S: float = plane.S
 
         self.cog = plane.CG
 
         self.MAC: float = plane.mean_aerodynamic_chord
+        self.span: float = plane.span
 
         # Create the span distribution
-        span_dist = []
-        for segment in plane.surfaces:
-            span_dist.append(segment._span_dist + segment.origin[1])
-        self.span_dist = np.concatenate(span_dist)
+        self.span_dist = np.concatenate([seg_span[:n_rows] for (_, _, seg_span), n_rows in zip(lattice, rows)])
 
         self.grid: FloatArray = np.empty((self.N, self.M + 1, 3))
 
@@ -91,7 +218,7 @@ class Wing_LSPT:
 
         # Get the angle of the trailing edge of each wing segment
         te_angle_dist: list[FloatArray] = []
-        for wing_segment in self.wing_segments:
+        for (wing_segment, _), n_rows in zip(self.lattice_segments, rows):
             airfoil: Airfoil = wing_segment.airfoil
             # The trailing edge is the last point of the airfoil
             # We will get the angle of the trailing edge by getting numerical derivative
@@ -99,27 +226,59 @@ class Wing_LSPT:
             # We will use the last 3 points to get the derivative
             x: FloatArray = airfoil._x_lower[-3:]
             y: FloatArray = airfoil.camber_line(x)
-            dydx: FloatArray = np.repeat(np.gradient(y, x), wing_segment.N)
+            dydx: FloatArray = np.repeat(np.gradient(y, x)[0], n_rows)
             te_angle_dist.append(np.arctan(dydx))
         self.te_angle_dist: FloatArray = np.concatenate(te_angle_dist)
 
         # Create the grid
         N_start: int = 0
-        for segment in self.wing_segments:
-            N_end: int = N_start + segment.N
-            self.grid[N_start:N_end, :-1, :] = segment.grid
+        for (_, seg_grid, _), n_rows in zip(lattice, rows):
+            N_end: int = N_start + n_rows
+            self.grid[N_start:N_end, :-1, :] = seg_grid[:n_rows]
             N_start = N_end + 0
 
         # THIS CALCULATIONS DEPEND ON THE ORIENTATION OF THE INFLOW
         self.make_wake_grid_points()
         self.make_nj()
         (self.panels, self.control_points, self.control_nj) = self.grid_to_panels(self.grid)
-        self.delete_middle_panels()
 
-        # Define the variables that will be used in the solver
-        self.a_np: ndarray[Any, dtype[floating]] = None  # type: ignore
-        self.b_np: ndarray[Any, dtype[floating]] = None  # type: ignore
-        self.RHS_np: ndarray[Any, dtype[floating]] = None  # type: ignore
+    def update_plane(self, plane: Airplane) -> None:
+        """
+        Rebuilds the lattice after some surfaces of the airplane changed, e.g. the incidence or
+        the span of the tail. The strips whose control points or vortex elements moved are added
+        to dirty_strips. While they are at most max_dirty_fraction of the strips, the direct solver
+        keeps the factorization of the influences between the other strips across updates.
+
+        Args:
+            plane (Airplane): Airplane with the updated surfaces
+        """
+        old_lattice: tuple[FloatArray, FloatArray, FloatArray] = self.lattice_arrays()
+        self.build_lattice(plane)
+        self.dirty_strips = np.union1d(self.dirty_strips, self.changed_strips(*old_lattice))
+
+    def changed_strips(self, control_points: FloatArray, control_nj: FloatArray, grid: FloatArray) -> IntArray:
+        """
+        Returns the strips whose influences differ from the ones of another lattice, i.e. whose
+        control points, normals or vortex elements moved. Every strip is returned if the
+        discretization differs.
+
+        Args:
+            control_points (FloatArray): (N - 1, M, 3) control points of the other lattice
+            control_nj (FloatArray): (N - 1, M, 3) normals of the other lattice
+            grid (FloatArray): (N, M + 1, 3) grid of the other lattice
+
+        Returns:
+            IntArray: Sorted indices of the strips
+        """
+        if control_points.shape != self.control_points.shape or grid.shape != self.grid.shape:
+            return np.arange(self.N - 1)
+
+        moved_rows: BoolArray = np.any(control_points != self.control_points, axis=(1, 2))
+        moved_rows |= np.any(control_nj != self.control_nj, axis=(1, 2))
+        # The elements of strip j lie between grid[j] and grid[j + 1], wake included
+        moved_grid: BoolArray = np.any(grid != self.grid, axis=(1, 2))
+        moved_columns: BoolArray = moved_grid[:-1] | moved_grid[1:]
+        return np.flatnonzero(moved_rows | moved_columns)
 
     @property
     def alpha(self) -> float:
@@ -128,10 +287,11 @@ class Wing_LSPT:
     @alpha.setter
     def alpha(self, value: float) -> None:
         self._alpha = value
+        self.make_nj()
+        # Only the Inflow-* wakes follow the angle of attack
         if self.wake_geom_type != "TE-Geometrical":
             self.make_wake_grid_points()
-        self.make_nj()
-        (self.panels, self.control_points, self.control_nj) = self.grid_to_panels(self.grid)
+            (self.panels, self.control_points, self.control_nj) = self.grid_to_panels(self.grid)
 
     @property
     def beta(self) -> float:
@@ -140,10 +300,8 @@ class Wing_LSPT:
     @beta.setter
     def beta(self, value: float) -> None:
         self._beta = value
-        if self.wake_geom_type != "TE-Geometrical":
-            self.make_wake_grid_points()
+        # No wake depends on the sideslip, so the lattice stays as it is
         self.make_nj()
-        (self.panels, self.control_points, self.control_nj) = self.grid_to_panels(self.grid)
 
     def make_nj(
         self,
@@ -163,79 +321,34 @@ class Wing_LSPT:
     def make_wake_grid_points(
         self,
     ) -> None:
-        N_start: int = 0
-        for segment in self.wing_segments:
-            N_end: int = N_start + segment.N
-
-            # Create the wake grid points
-            wake_dist = np.repeat(100 * self.max_chord, segment.N)
-            self.grid[N_start:N_end, -1, 0] = wake_dist
-            self.grid[N_start:N_end, -1, 1] = segment._span_dist + segment.origin[1]
-
-            if self.wake_geom_type == "Inflow-TE":
-                self.grid[N_start:N_end, -1, 2] = self.grid[N_start:N_end, -2, 2] + (
-                    wake_dist - self.grid[N_start:N_end, -2, 0]
-                ) * np.tan(self.alpha)
-            elif self.wake_geom_type == "Inflow-Uniform":
-                self.grid[N_start:N_end, -1, 2] = wake_dist * np.tan(self.alpha)
-            elif self.wake_geom_type == "TE-Geometrical":
-                self.grid[N_start:N_end, -1, 2] = self.grid[N_start:N_end, -2, 2] + (
-                    wake_dist - self.grid[N_start:N_end, -2, 0]
-                ) * np.tan(self.te_angle_dist[N_start:N_end])
-            else:
-                raise ValueError("Invalid wake geometry type")
-            N_start = N_end + 0
+        # Create the wake grid points
+        wake_dist: float = 100 * self.max_chord
+        self.grid[:, -1, 0] = wake_dist
+        self.grid[:, -1, 1] = self.span_dist
+
+        if self.wake_geom_type == "Inflow-TE":
+            self.grid[:, -1, 2] = self.grid[:, -2, 2] + (wake_dist - self.grid[:, -2, 0]) * np.tan(self.alpha)
+        elif self.wake_geom_type == "Inflow-Uniform":
+            self.grid[:, -1, 2] = wake_dist * np.tan(self.alpha)
+        elif self.wake_geom_type == "TE-Geometrical":
+            self.grid[:, -1, 2] = self.grid[:, -2, 2] + (wake_dist - self.grid[:, -2, 0]) * np.tan(
+                self.te_angle_dist,
+            )
+        else:
+            raise ValueError("Invalid wake geometry type")
 
     def grid_to_panels(self, grid: FloatArray) -> tuple[FloatArray, FloatArray, FloatArray]:
         """
-        Convert Grid to Panels
+        Convert Grid to Panels. The last panel of every strip is the wake panel.
 
         Args:
-            grid (FloatArray): Grid to convert
+            grid (FloatArray): (N, M + 1, 3) grid to convert, wake included
 
         Returns:
-            FloatArray: Panels
+            tuple[FloatArray, FloatArray, FloatArray]: (N - 1, M, 4, 3) panels, (N - 1, M, 3) control points
+            at 3/4 of the chord of the panels and (N - 1, M, 3) unit normals
         """
-        panels: FloatArray = np.empty((self.N - 1, self.M, 4, 3), dtype=float)
-        control_points: FloatArray = np.empty((self.N - 1, self.M, 3), dtype=float)
-        control_nj: FloatArray = np.empty((self.N - 1, self.M, 3), dtype=float)
-
-        # We need to remove all panels that are in between wing segments
-        # and create new panels for the wake
-        for i in np.arange(0, self.N - 1):
-            for j in np.arange(0, self.M):
-                panels[i, j, 0, :] = grid[i + 1, j]
-                panels[i, j, 1, :] = grid[i, j]
-                panels[i, j, 2, :] = grid[i, j + 1]
-                panels[i, j, 3, :] = grid[i + 1, j + 1]
-
-                control_points[i, j, :] = (self.grid[i, j] + self.grid[i + 1, j]) / 2 + 3 / 4 * (
-                    (self.grid[i, j + 1] + self.grid[i + 1, j + 1]) / 2 - (self.grid[i, j] + self.grid[i + 1, j]) / 2
-                )
-
-                Ak = panels[i, j, 0, :] - panels[i, j, 2, :]
-                Bk = panels[i, j, 1, :] - panels[i, j, 3, :]
-                cross_prod = np.cross(Ak, Bk)
-                control_nj[i, j, :] = cross_prod / np.linalg.norm(cross_prod)
-
-        return panels, control_points, control_nj
-
-    def delete_middle_panels(self) -> None:
-        # Remove the panels that are in between wing segments
-        Ns_to_delete: list[int] = []
-        N = 0
-        for wing_seg in self.wing_segments[:-1]:
-            Ns_to_delete.append(N + wing_seg.N - 1)
-            N += wing_seg.N
-
-        self.N = self.N - len(Ns_to_delete)
-
-        # Remove every row that has index in Ns_to_delete
-        self.panels = np.delete(self.panels, Ns_to_delete, axis=0)
-        self.control_points = np.delete(self.control_points, Ns_to_delete, axis=0)
-        self.control_nj = np.delete(self.control_nj, Ns_to_delete, axis=0)
-        self.grid = np.delete(self.grid, Ns_to_delete, axis=0)
-        self.span_dist = np.delete(self.span_dist, Ns_to_delete, axis=0)
+        return build_panels(grid)
 
     def plot_grid(self, show_wake: bool = False, show_airfoils: bool = False) -> None:
         fig: Figure = plt.figure()
@@ -287,16 +400,102 @@ class Wing_LSPT:
         fig.show()
 
     def get_RHS(self, Q: FloatArray) -> FloatArray:
-        RHS_np = np.zeros((self.N - 1) * (self.M))
-        for i in np.arange(0, (self.N - 1) * (self.M)):
-            lp, kp = divmod(i, (self.M))
-            if kp == self.M - 1:
-                RHS_np[i] = 0
-            else:
-                RHS_np[i] = -np.dot(Q, self.control_nj[lp, kp])
+        return self.get_RHS_matrix(np.atleast_2d(Q))[:, 0]
+
+    def get_RHS_matrix(self, Qs: FloatArray, rates: FloatArray | None = None) -> FloatArray:
+        """
+        Builds the right hand sides for many freestream velocities at once.
+
+        Args:
+            Qs (FloatArray): (K, 3) array of freestream velocities
+            rates (FloatArray | None, optional): (K, 3) angular rates p, q and r of the airplane about
+                the x, y and z axes of the lattice through the CG. Defaults to None for no rotation.
+
+        Raises:
+            ValueError: If a freestream has sideslip, roll or yaw rate and the lattice only models half of the wing
+
+        Returns:
+            FloatArray: ((N - 1) * M, K) array with one right hand side per column
+        """
+        if self.is_symmetric and np.any(np.atleast_2d(Qs)[:, 1] != 0):
+            raise ValueError("Sideslip breaks the symmetry of the flow. Use use_symmetry=False for the full span")
+        RHS_np: FloatArray = -np.matmul(self.control_nj.reshape(-1, 3), np.atleast_2d(Qs).T)
+        if rates is not None:
+            rates = np.atleast_2d(rates)
+            if self.is_symmetric and np.any(rates[:, [0, 2]] != 0):
+                raise ValueError("Roll and yaw rates break the symmetry of the flow. Use use_symmetry=False")
+            RHS_np += self.rate_normals() @ rates.T
+        # Kutta condition rows
+        RHS_np[self.M - 1 :: self.M, :] = 0
         return RHS_np
 
+    def rate_normals(self) -> FloatArray:
+        """
+        Returns the ((N - 1) * M, 3) products (r - CG) x n at the control points. A rotation omega
+        about the CG adds the onset velocity -omega x (r - CG), which changes the right hand side
+        -n . onset by rate_normals @ omega.
+        """
+        normals: FloatArray = self.control_nj.reshape(-1, 3)
+        return np.cross(self.control_points.reshape(-1, 3) - self.cog, normals)
+
     def get_LHS(self, solve_fun: Callable[..., tuple[FloatArray, FloatArray]]) -> tuple[FloatArray, FloatArray]:
+        """
+        Assembles the influence matrices a and b as whole array operations.
+        Elements without a batched counterpart fall back to get_LHS_loop.
+        With ground effect the image of the lattice is added to the free air
+        matrices, which are cached so that only the image is assembled for a new height.
+
+        Args:
+            solve_fun (Callable[..., tuple[FloatArray, FloatArray]]): Vorticity element
+
+        Raises:
+            ValueError: If ground effect is requested with an element without a batched counterpart
+
+        Returns:
+            tuple[FloatArray, FloatArray]: Influence matrices a and b
+        """
+        if solve_fun not in BATCHED_ELEMENTS and solve_fun not in BATCHED_ELEMENTS.values():
+            if self.ground_effect_dist is not None:
+                raise ValueError(f"Ground effect is not supported for element {solve_fun.__name__}")
+            return self.get_LHS_loop(solve_fun)
+
+        lattice = (self.control_points, self.control_nj, self.grid, solve_fun)
+        if self.ground_effect_dist is None:
+            return assemble_LHS(*lattice, workers=self.assembly_workers, b_dtype=self.b_dtype)
+
+        key: str = self.geometry_key(solve_fun, ground_effect=False)
+        if key in self._free_air_LHS:
+            self._free_air_LHS.move_to_end(key)
+        else:
+            if self.lean_memory:
+                self._free_air_LHS.clear()
+            self._free_air_LHS[key] = assemble_LHS(*lattice, workers=self.assembly_workers, b_dtype=self.b_dtype)
+            while len(self._free_air_LHS) > self.factorization_cache_size:
+                self._free_air_LHS.popitem(last=False)
+        a_free, b_free = self._free_air_LHS[key]
+
+        a_image, b_image = assemble_ground_image_LHS(
+            *lattice,
+            ground=-self.ground_effect_dist,
+            workers=self.assembly_workers,
+            b_dtype=self.b_dtype,
+        )
+        # The image matrices are overwritten, the cached free air ones are kept
+        a_image += a_free
+        b_image += b_free
+        return a_image, b_image
+
+    def get_LHS_loop(self, solve_fun: Callable[..., tuple[FloatArray, FloatArray]]) -> tuple[FloatArray, FloatArray]:
+        """
+        Assembles the influence matrices a and b calling solve_fun once for
+        every (control point, panel) pair.
+
+        Args:
+            solve_fun (Callable[..., tuple[FloatArray, FloatArray]]): Scalar vorticity element
+
+        Returns:
+            tuple[FloatArray, FloatArray]: Influence matrices a and b
+        """
         a_np = np.zeros(((self.N - 1) * (self.M), (self.N - 1) * (self.M)))
         b_np = np.zeros(((self.N - 1) * (self.M), (self.N - 1) * (self.M)))
 
@@ -322,24 +521,376 @@ class Wing_LSPT:
                 )
                 b_np[i, j] = np.dot(Ustar, self.control_nj[lp, kp])
                 a_np[i, j] = np.dot(U, self.control_nj[lp, kp])
-        return a_np, b_np
+        return a_np, b_np.astype(self.b_dtype, copy=False)
+
+    @property
+    def b_dtype(self) -> type:
+        """Data type of the influence matrix b, float32 with lean_memory."""
+        return np.float32 if self.lean_memory else float
+
+    def b_product(self, gammas: FloatArray, trans: int = 0) -> FloatArray:
+        """
+        Returns the induced velocities b_np gammas, or the product with the transpose of b_np.
+        A float32 b_np is multiplied in float32 instead of being cast to a float64 copy.
+
+        Args:
+            gammas (FloatArray): (n,) or (n, K) vector or matrix
+            trans (int, optional): 0 to multiply with b_np, 1 with its transpose. Defaults to 0.
+
+        Returns:
+            FloatArray: Float64 product, shaped like gammas
+        """
+        b_np: FloatArray = self.b_np.T if trans else self.b_np
+        product: FloatArray = np.matmul(b_np, np.asarray(gammas, dtype=b_np.dtype))
+        return product.astype(float, copy=False)
+
+    def lattice_images(
+        self,
+        solve_fun: Callable[..., tuple[FloatArray, FloatArray]],
+    ) -> list[tuple[FloatArray, FloatArray]]:
+        """
+        Returns the mirror images of the lattice that are modelled by the element and the ground.
+        An image (R, o) induces R u(R p + o) at the point p, where u is the velocity of the lattice.
+
+        Args:
+            solve_fun (Callable[..., tuple[FloatArray, FloatArray]]): voring or symm_wing_panels
+
+        Raises:
+            ValueError: If the element is not made of vortex rings
+
+        Returns:
+            list[tuple[FloatArray, FloatArray]]: (reflection, offset) of every image, the identity included
+        """
+        images: list[tuple[FloatArray, FloatArray]] = [(np.ones(3), np.zeros(3))]
+        if solve_fun in (symm_wing_panels, symm_wing_panels_batch):
+            images.append((np.array([1.0, -1.0, 1.0]), np.zeros(3)))
+        elif solve_fun not in (voring, voring_batch):
+            raise ValueError(f"Matrix free solves are not supported for element {solve_fun.__name__}")
+
+        if self.ground_effect_dist is not None:
+            ground_reflection: FloatArray = np.array([1.0, 1.0, -1.0])
+            ground_offset: FloatArray = np.array([0.0, 0.0, -2 * self.ground_effect_dist])
+            images += [(reflection * ground_reflection, ground_offset) for reflection, _ in images]
+        return images
+
+    def get_LHS_operators(
+        self,
+        solve_fun: Callable[..., tuple[FloatArray, FloatArray]],
+        theta: float = 0.3,
+    ) -> tuple[LinearOperator, LinearOperator]:
+        """
+        Returns matrix free operators for a_np and b_np that apply the influences
+        with the treecode instead of storing them.
+
+        Args:
+            solve_fun (Callable[..., tuple[FloatArray, FloatArray]]): voring or symm_wing_panels
+            theta (float, optional): Opening angle of the treecode. Defaults to 0.3.
+
+        Returns:
+            tuple[LinearOperator, LinearOperator]: Operators a and b
+        """
+        return lattice_operators(
+            self.control_points,
+            self.control_nj,
+            self.grid,
+            self.lattice_images(solve_fun),
+            theta=theta,
+        )
+
+    def get_strip_blocks(self, solve_fun: Callable[..., tuple[FloatArray, FloatArray]]) -> FloatArray:
+        """
+        Returns the diagonal blocks of a_np, the influences of every spanwise strip on itself.
+
+        Args:
+            solve_fun (Callable[..., tuple[FloatArray, FloatArray]]): Vorticity element
+
+        Returns:
+            FloatArray: (N - 1, M, M) diagonal blocks
+        """
+        blocks: FloatArray = np.empty((self.N - 1, self.M, self.M))
+        for j in range(self.N - 1):
+            strip = (self.control_points[j : j + 1], self.control_nj[j : j + 1], self.grid[j : j + 2])
+            blocks[j] = assemble_LHS(*strip, solve_fun)[0]
+            if self.ground_effect_dist is not None:
+                blocks[j] += assemble_ground_image_LHS(*strip, solve_fun, ground=-self.ground_effect_dist)[0]
+        return blocks
+
+    def solve_gamma_distributions_matrix_free(
+        self,
+        Qs: FloatArray,
+        solve_fun: Callable[..., tuple[FloatArray, FloatArray]],
+        theta: float = 0.3,
+        tol: float = 1e-6,
+        x0: FloatArray | None = None,
+        rates: FloatArray | None = None,
+    ) -> tuple[FloatArray, FloatArray]:
+        """
+        Solves the current lattice for many freestream velocities with GMRES on the
+        treecode operators, preconditioned with the strip blocks of get_strip_blocks.
+        No influence matrix is stored.
+
+        Args:
+            Qs (FloatArray): (K, 3) array of freestream velocities
+            solve_fun (Callable[..., tuple[FloatArray, FloatArray]]): voring or symm_wing_panels
+            theta (float, optional): Opening angle of the treecode. Defaults to 0.3.
+            tol (float, optional): Relative tolerance of GMRES. Defaults to 1e-6.
+            x0 (FloatArray | None, optional): ((N - 1) * M) initial guess of the first freestream.
+            rates (FloatArray | None, optional): (K, 3) angular rates p, q and r (see get_RHS_matrix).
+
+        Raises:
+            ValueError: If GMRES does not converge
+
+        Returns:
+            tuple[FloatArray, FloatArray]: ((N - 1) * M, K) arrays of gammas and induced velocities w
+        """
+        self.solve_fun = solve_fun
+        RHS_np: FloatArray = self.get_RHS_matrix(Qs, rates)
+        report = SolveReport("treecode", RHS_np.shape[0])
+
+        a_op, b_op = self.get_LHS_operators(solve_fun, theta)
+        blocks: FloatArray = self.get_strip_blocks(solve_fun)
+        gammas: FloatArray = gmres_solve(a_op, RHS_np, block_jacobi(blocks), x0, tol, report=report)
+        w: FloatArray = b_op.matmat(gammas)
+
+        report.stored_bytes = a_op.tree.nbytes + blocks.nbytes
+        report.stop()
+        self.solve_reports.append(report)
+        return gammas, w
 
     def solve_wing_panels(self, Q: FloatArray, solve_fun: Callable[..., tuple[FloatArray, FloatArray]]) -> None:
         self.solve_fun = solve_fun
         RHS_np = self.get_RHS(Q)
         self.RHS_np = RHS_np
+        self.factorize_LHS(solve_fun)
+
+    def geometry_key(
+        self,
+        solve_fun: Callable[..., tuple[FloatArray, FloatArray]],
+        ground_effect: bool = True,
+    ) -> str:
+        """
+        Returns a key identifying the influence matrices of the current lattice.
+
+        Args:
+            solve_fun (Callable[..., tuple[FloatArray, FloatArray]]): Vorticity element
+            ground_effect (bool, optional): Whether the height of the ground is part of the key. Defaults to True.
 
-        if (self.a_np is not None) and self.wake_geom_type == "TE-Geometrical":
-            # print(f"Using previous solution for a and b! Be smart")
+        Returns:
+            str: Hash of the grid and its shape, the element, the wake type, the symmetry and the height of the ground
+        """
+        hasher = hashlib.sha1(np.ascontiguousarray(self.grid).tobytes())
+        # The same values in another shape or dtype are another lattice
+        hasher.update(f"{self.grid.shape} {self.grid.dtype}".encode())
+        hasher.update(solve_fun.__name__.encode())
+        hasher.update(f"{self.wake_geom_type} {self.is_symmetric}".encode())
+        if ground_effect and self.ground_effect_dist is not None:
+            hasher.update(np.float64(self.ground_effect_dist).tobytes())
+        return hasher.hexdigest()
+
+    def factorize_LHS(self, solve_fun: Callable[..., tuple[FloatArray, FloatArray]]) -> None:
+        """
+        Assembles and LU factorizes the influence matrices of the current lattice.
+        Factorizations are cached per geometry so that they are computed only once,
+        in memory and, if the wing has a matrix_cache and a TE-Geometrical wake, on disk
+        across runs. If only a few strips are dirty, the factorization is updated by
+        factorize_dirty_strips.
+        With lean_memory only the current factorization is kept and a is factorized in
+        place. Such factorizations are read from the matrix_cache but not written to it.
+
+        Args:
+            solve_fun (Callable[..., tuple[FloatArray, FloatArray]]): Vorticity element
+        """
+        key: str = self.geometry_key(solve_fun)
+        if key in self._factorizations:
+            self._factorizations.move_to_end(key)
+            self.a_np, self.b_np, self.a_lu = self._factorizations[key]
+            self._assembled_key = None
             return
-        else:
+
+        if self.lean_memory:
+            # Free the matrices of the previous geometry before the new ones are assembled
+            self._factorizations.clear()
+            self.a_np, self.b_np, self.a_lu = None, None, None  # type: ignore
+
+        # The Inflow-* wakes move with alpha, so their entries would only be reused for the same angle
+        disk_cache: MatrixCache | None = self.matrix_cache if self.wake_geom_type == "TE-Geometrical" else None
+        entry = None if disk_cache is None else disk_cache.load(key)
+        if entry is not None:
+            self.a_np, self.b_np, self.a_lu = entry
+        elif not self.factorize_dirty_strips(solve_fun):
             print(f"Solving for a and b")
-            if self.wake_geom_type == "TE-Geometrical":
-                # print("We should be using LU decomposition")
-                pass
             a_np, b_np = self.get_LHS(solve_fun)
-            self.a_np = a_np
             self.b_np = b_np
+            if self.lean_memory:
+                self.a_lu = InPlaceLU(a_np)
+            else:
+                self.a_np = a_np
+                a_lu: tuple[FloatArray, FloatArray] = lu_factor(a_np)
+                self.a_lu = a_lu
+                if disk_cache is not None:
+                    disk_cache.save(key, self.a_np, self.b_np, a_lu)
+        self._assembled_key = None
+
+        self._factorizations[key] = (self.a_np, self.b_np, self.a_lu)
+        while len(self._factorizations) > self.factorization_cache_size:
+            self._factorizations.popitem(last=False)
+
+    def strips_key(self, strips: IntArray, solve_fun: Callable[..., tuple[FloatArray, FloatArray]]) -> str:
+        """
+        Returns a key identifying the influences between some strips of the current lattice.
+
+        Args:
+            strips (IntArray): Indices of the strips
+            solve_fun (Callable[..., tuple[FloatArray, FloatArray]]): Vorticity element
+
+        Returns:
+            str: Hash of the strips, their control points, normals and grid rows, the element and the ground
+        """
+        hasher = hashlib.sha1(np.ascontiguousarray(strips).tobytes())
+        for array in (self.control_points[strips], self.control_nj[strips], self.grid[np.union1d(strips, strips + 1)]):
+            hasher.update(np.ascontiguousarray(array).tobytes())
+        hasher.update(f"{solve_fun.__name__} {self.is_symmetric} {self.ground_effect_dist}".encode())
+        return hasher.hexdigest()
+
+    def factorize_dirty_strips(self, solve_fun: Callable[..., tuple[FloatArray, FloatArray]]) -> bool:
+        """
+        Factorizes the influence matrices by reusing the factorization of the clean strips,
+        the ones outside dirty_strips. The clean block is assembled and factorized when the
+        clean strips change. Otherwise only the rows and columns of the dirty strips are
+        assembled and the factorization of a_np is a SchurFactorization.
+
+        Args:
+            solve_fun (Callable[..., tuple[FloatArray, FloatArray]]): Vorticity element
+
+        Returns:
+            bool: False if there are no dirty strips, too many of them or the element has no
+            batched counterpart, in which case nothing is computed
+        """
+        n_strips: int = self.N - 1
+        dirty_strips: IntArray = self.dirty_strips
+        if (
+            dirty_strips.shape[0] == 0
+            or dirty_strips.shape[0] > self.max_dirty_fraction * n_strips
+            or (solve_fun not in BATCHED_ELEMENTS and solve_fun not in BATCHED_ELEMENTS.values())
+        ):
+            return False
+
+        clean_strips: IntArray = np.setdiff1d(np.arange(n_strips), dirty_strips)
+        lattice = (self.control_points, self.control_nj, self.grid, solve_fun)
+        ground: float | None = None if self.ground_effect_dist is None else -self.ground_effect_dist
+
+        key: str = self.strips_key(clean_strips, solve_fun)
+        if self._clean_factorization is None or self._clean_factorization[0] != key:
+            a_cc, b_cc = assemble_strips_LHS(*lattice, clean_strips, clean_strips, ground)
+            self._clean_factorization = (key, a_cc, b_cc.astype(self.b_dtype, copy=False), lu_factor(a_cc))
+        _, a_cc, b_cc, clean_lu = self._clean_factorization
+
+        clean: IntArray = strip_panels(clean_strips, self.M)
+        dirty: IntArray = strip_panels(dirty_strips, self.M)
+        a_np: FloatArray = np.empty((n_strips * self.M, n_strips * self.M))
+        b_np: FloatArray = np.empty((n_strips * self.M, n_strips * self.M), dtype=self.b_dtype)
+        a_np[np.ix_(clean, clean)] = a_cc
+        b_np[np.ix_(clean, clean)] = b_cc
+        # Rows of the dirty strips and columns of the dirty strips on the clean rows
+        a_np[dirty], b_np[dirty] = assemble_strips_LHS(*lattice, dirty_strips, np.arange(n_strips), ground)
+        a_np[np.ix_(clean, dirty)], b_np[np.ix_(clean, dirty)] = assemble_strips_LHS(
+            *lattice,
+            clean_strips,
+            dirty_strips,
+            ground,
+        )
+
+        self.b_np = b_np
+        self.a_lu = SchurFactorization(a_np, clean_lu, clean, dirty)
+        # The Schur factorization keeps the blocks it needs
+        self.a_np = None if self.lean_memory else a_np  # type: ignore
+        return True
+
+    def solve_LHS(self, RHS: FloatArray, trans: int = 0) -> FloatArray:
+        """
+        Solves a_np x = RHS, or its transpose, with the factorization of factorize_LHS.
+
+        Args:
+            RHS (FloatArray): (n,) or (n, K) right hand sides
+            trans (int, optional): 0 to solve with a_np, 1 to solve with its transpose. Defaults to 0.
+
+        Returns:
+            FloatArray: Solutions, shaped like RHS
+        """
+        if isinstance(self.a_lu, (SchurFactorization, InPlaceLU)):
+            return self.a_lu.solve(RHS, trans)
+        x: FloatArray = lu_solve(self.a_lu, RHS, trans=trans)
+        return x
+
+    def solve_gamma_distributions(
+        self,
+        Qs: FloatArray,
+        solve_fun: Callable[..., tuple[FloatArray, FloatArray]],
+        x0: FloatArray | None = None,
+        rates: FloatArray | None = None,
+    ) -> tuple[FloatArray, FloatArray]:
+        """
+        Solves the current lattice for many freestream velocities at once with the linear
+        solver of the wing. The direct solver factorizes the influence matrix once and back
+        substitutes all right hand sides together. The iterative solvers start the first
+        freestream from x0 and the others from the previous solutions (see gmres_solve).
+
+        Args:
+            Qs (FloatArray): (K, 3) array of freestream velocities
+            solve_fun (Callable[..., tuple[FloatArray, FloatArray]]): Vorticity element
+            x0 (FloatArray | None, optional): ((N - 1) * M) initial guess of the iterative solvers.
+            rates (FloatArray | None, optional): (K, 3) angular rates p, q and r of every freestream about
+                the x, y and z axes of the lattice through the CG. Defaults to None for no rotation.
+
+        Returns:
+            tuple[FloatArray, FloatArray]: ((N - 1) * M, K) arrays of gammas and induced velocities w
+        """
+        if self.linear_solver == "treecode":
+            return self.solve_gamma_distributions_matrix_free(
+                Qs,
+                solve_fun,
+                self.treecode_theta,
+                self.solver_tol,
+                x0,
+                rates,
+            )
+
+        self.solve_fun = solve_fun
+        RHS_np: FloatArray = self.get_RHS_matrix(Qs, rates)
+        report = SolveReport(self.linear_solver, RHS_np.shape[0])
+
+        if self.linear_solver == "direct":
+            self.factorize_LHS(solve_fun)
+            gammas: FloatArray = self.solve_LHS(RHS_np)
+            w: FloatArray = self.b_product(gammas)
+            report.stored_bytes = self.b_np.nbytes + (0 if self.a_np is None else self.a_np.nbytes)
+            if isinstance(self.a_lu, (SchurFactorization, InPlaceLU)):
+                report.stored_bytes += self.a_lu.nbytes
+            else:
+                report.stored_bytes += self.a_lu[0].nbytes
+        elif self.linear_solver == "gmres":
+            key: str = self.geometry_key(solve_fun)
+            if self._assembled_key != key:
+                self.a_np, self.b_np = self.get_LHS(solve_fun)
+                self.a_lu = None  # type: ignore
+                self._assembled_key = key
+            # Diagonal (M, M) blocks of the strips
+            strips: IntArray = np.arange(self.N - 1)
+            blocks: FloatArray = self.a_np.reshape(self.N - 1, self.M, self.N - 1, self.M)[strips, :, strips, :]
+            gammas = gmres_solve(self.a_np, RHS_np, block_jacobi(blocks), x0, self.solver_tol, report=report)
+            w = self.b_product(gammas)
+            report.stored_bytes = self.a_np.nbytes + self.b_np.nbytes + blocks.nbytes
+        else:
+            ground: float | None = None if self.ground_effect_dist is None else -self.ground_effect_dist
+            a_op, b_op = influence_operators(self.control_points, self.control_nj, self.grid, solve_fun, ground)
+            blocks = self.get_strip_blocks(solve_fun)
+            gammas = gmres_solve(a_op, RHS_np, block_jacobi(blocks), x0, self.solver_tol, report=report)
+            w = b_op.matmat(gammas)
+            report.stored_bytes = blocks.nbytes
+
+        report.stop()
+        self.solve_reports.append(report)
+        return gammas, w
 
     def solve_wing_horseshoe(self) -> None:
         # ! TODO: IMPLEMENT ACCORDING TO KATZ
@@ -352,39 +903,65 @@ class Wing_LSPT:
         pass
 
     def induced_vel_calc(self, i: int, j: int, gammas_mat: FloatArray) -> tuple[FloatArray, FloatArray]:
-        Us = np.zeros(3)
-        Uss = np.zeros(3)
-
-        for l in np.arange(0, self.N - 1):
-            for k in np.arange(0, self.M):
-                U, Ustar = self.solve_fun(
-                    self.control_points[i, j, 0],
-                    self.control_points[i, j, 1],
-                    self.control_points[i, j, 2],
-                    l,
-                    k,
-                    self.grid,
-                    gamma=gammas_mat[l, k],
-                )
-                Us = Us + U
-                Uss = Uss + Ustar
-        return Us, Uss
+        U, Ustar = induced_velocities(self.control_points[i, j], self.grid, self.solve_fun, gammas_mat.ravel())
+        return U[0], Ustar[0]
+
+    def induced_velocities(
+        self,
+        points: FloatArray,
+        gammas: FloatArray | None = None,
+        chunk_size: int = CHUNK_SIZE,
+        workers: int = 1,
+    ) -> tuple[FloatArray, FloatArray]:
+        """
+        Evaluates the velocity field induced by the solved lattice at arbitrary points, e.g. the
+        downwash at the tail, the sidewash at the fin or a slice of the flow field. The ground image
+        is included in ground effect. See assembly.induced_velocities.
+
+        Args:
+            points (FloatArray): (P, 3) array of points in the frame of the lattice
+            gammas (FloatArray | None, optional): ((N - 1) * M) circulations or ((N - 1) * M, K) circulations
+                of K solutions, e.g. the gammas of solve_gamma_distributions for a sweep. Defaults to the
+                solution set with set_gamma_distribution.
+            chunk_size (int, optional): Maximum number of (point, panel) pairs evaluated at once.
+            workers (int, optional): Number of processes evaluating blocks of points. Defaults to 1.
+
+        Raises:
+            ValueError: If the lattice has not been solved
+
+        Returns:
+            tuple[FloatArray, FloatArray]: Velocities induced by the lattice (U) and by its trailing lines
+            (Ustar), (P, 3) for one solution or (P, 3, K) for K solutions
+        """
+        if gammas is None:
+            if getattr(self, "gammas_mat", None) is None:
+                raise ValueError("Solve the lattice before evaluating its velocity field")
+            gammas = self.gammas_mat.ravel()
+        if getattr(self, "solve_fun", None) is None:
+            raise ValueError("Solve the lattice before evaluating its velocity field")
+        ground: float | None = None if self.ground_effect_dist is None else -self.ground_effect_dist
+        return induced_velocities(points, self.grid, self.solve_fun, gammas, ground, chunk_size, workers)
 
     def get_gamma_distribution(
         self,
     ) -> None:
-        if self.a_np is None:
+        if self.b_np is None or self.a_lu is None:
             raise ValueError("You must solve the wing panels first")
-        gammas = np.linalg.solve(self.a_np, self.RHS_np)
-        self.w = np.matmul(self.b_np, gammas)
+        gammas = self.solve_LHS(self.RHS_np)
+        w = self.b_product(gammas)
+        self.set_gamma_distribution(gammas, w)
 
-        self.gammas_mat = np.zeros((self.N - 1, self.M))
-        self.w_mat = np.zeros((self.N - 1, self.M))
+    def set_gamma_distribution(self, gammas: FloatArray, w: FloatArray) -> None:
+        """
+        Stores a solution of the lattice.
 
-        for i in np.arange(0, (self.N - 1) * (self.M)):
-            lp, kp = divmod(i, (self.M))
-            self.gammas_mat[lp, kp] = gammas[i]
-            self.w_mat[lp, kp] = self.w[i]
+        Args:
+            gammas (FloatArray): ((N - 1) * M) array of panel circulations
+            w (FloatArray): ((N - 1) * M) array of induced velocities
+        """
+        self.w = w
+        self.gammas_mat = np.reshape(gammas, (self.N - 1, self.M))
+        self.w_mat = np.reshape(w, (self.N - 1, self.M))
         self.calculate_strip_induced_velocities()
 
     def plot_gamma_distribution(self) -> None:
@@ -401,35 +978,81 @@ class Wing_LSPT:
         fig.colorbar(ax.matshow(self.gammas_mat))
         fig.show()
 
-    def get_aerodynamic_loads(self, umag: float, verbose: bool = True) -> None:
-        if self.gammas_mat is None:
-            self.get_gamma_distribution()
+    def integrate_panel_loads(
+        self,
+        gammas: FloatArray,
+        w: FloatArray,
+        umag: float,
+    ) -> tuple[FloatArray, FloatArray, FloatArray, FloatArray]:
+        """
+        Computes the panel loads, the Trefftz plane drag and the moments about the CG of
+        one or many solutions of the lattice at once.
 
-        L_pan: FloatArray = np.zeros((self.N - 1, self.M))
-        D_pan: FloatArray = np.zeros((self.N - 1, self.M))
-        D_trefftz = 0
-        for i in np.arange(0, self.N - 1):
-            for j in np.arange(0, self.M):
-                dy: float = self.grid[i + 1, j, 1] - self.grid[i, j, 1]
-                if j == 0:
-                    g = self.gammas_mat[i, j]
-                else:
-                    g = self.gammas_mat[i, j] - self.gammas_mat[i, j - 1]
-                L_pan[i, j] = self.dens * umag * dy * g
-                D_pan[i, j] = -self.dens * dy * g * self.w_mat[i, j]
-
-                if j == self.M - 2:
-                    D_trefftz += -self.dens / 2 * dy * self.gammas_mat[i, j] * self.w_mat[i, j]
+        Args:
+            gammas (FloatArray): ((N - 1) * M, K) circulations of K solutions, as returned by
+                solve_gamma_distributions, or ((N - 1) * M) for a single solution
+            w (FloatArray): Induced velocities with the same shape as gammas
+            umag (float): Freestream velocity magnitude
+
+        Returns:
+            tuple[FloatArray, FloatArray, FloatArray, FloatArray]: (K, N - 1, M) panel lift and drag,
+            (K) Trefftz plane drag and (K, 3) moments. The K axis is dropped for a single solution.
+        """
+        single: bool = np.ndim(gammas) == 1
+        gammas_mat: FloatArray = np.reshape(gammas, (self.N - 1, self.M, -1)).transpose(2, 0, 1)
+        w_mat: FloatArray = np.reshape(w, (self.N - 1, self.M, -1)).transpose(2, 0, 1)
+
+        # Every panel carries the difference of the circulations of its ring and the one ahead of it
+        dy: FloatArray = self.grid[1:, : self.M, 1] - self.grid[:-1, : self.M, 1]
+        g: FloatArray = np.diff(gammas_mat, axis=2, prepend=0)
+        L_pan: FloatArray = self.dens * umag * dy * g
+        D_pan: FloatArray = -self.dens * dy * g * w_mat
+
+        te: int = self.M - 2
+        D_trefftz: FloatArray = -self.dens / 2 * np.sum(dy[:, te] * gammas_mat[:, :, te] * w_mat[:, :, te], axis=1)
 
         # Calculate the torque. The torque is calculated w.r.t. the CG
         # and is the sum of the torques of each panel times the distance
         # from the CG to the control point of each panel
-        M = np.array([0, 0, 0], dtype=float)
-        for i in np.arange(0, self.N - 1):
-            for j in np.arange(0, self.M - 1):
-                M += L_pan[i, j] * np.cross(self.control_points[i, j, :] - self.cog, self.control_nj[i, j, :])
-                M += D_pan[i, j] * np.cross(self.control_points[i, j, :] - self.cog, self.control_nj[i, j, :])
-        Mx, My, Mz = M
+        arms: FloatArray = np.cross(self.control_points[:, :-1] - self.cog, self.control_nj[:, :-1])
+        moments: FloatArray = np.einsum("kij,ijx->kx", L_pan[:, :, :-1] + D_pan[:, :, :-1], arms)
+
+        if single:
+            return L_pan[0], D_pan[0], D_trefftz[0], moments[0]
+        return L_pan, D_pan, D_trefftz, moments
+
+    def get_aerodynamic_loads(self, umag: float, verbose: bool = True) -> None:
+        if self.gammas_mat is None:
+            self.get_gamma_distribution()
+
+        L_pan, D_pan, D_trefftz, moments = self.integrate_panel_loads(self.gammas_mat.ravel(), self.w_mat.ravel(), umag)
+        self.set_aerodynamic_loads(L_pan, D_pan, float(D_trefftz), moments, umag, verbose)
+
+    def set_aerodynamic_loads(
+        self,
+        L_pan: FloatArray,
+        D_pan: FloatArray,
+        D_trefftz: float,
+        moments: FloatArray,
+        umag: float,
+        verbose: bool = True,
+        polar_loads: tuple[float, float, float] | None = None,
+    ) -> None:
+        """
+        Stores the loads of the current solution, as computed by integrate_panel_loads, and
+        integrates the 2D polars of the strips unless their loads are given.
+
+        Args:
+            L_pan (FloatArray): (N - 1, M) panel lift
+            D_pan (FloatArray): (N - 1, M) panel drag
+            D_trefftz (float): Trefftz plane drag
+            moments (FloatArray): (3) moments about the CG
+            umag (float): Freestream velocity magnitude
+            verbose (bool, optional): Print the loads. Defaults to True.
+            polar_loads (tuple[float, float, float] | None, optional): L, D and My already integrated
+                from the 2D polars, NaN if the polars could not be interpolated. Defaults to None.
+        """
+        Mx, My, Mz = moments
 
         self.L_pan = L_pan
         self.D_pan = D_pan
@@ -437,21 +1060,25 @@ class Wing_LSPT:
         self.L: float = float(np.sum(L_pan))
         self.D: float = D_trefftz  # np.sum(D_pan)
         self.D2: float = float(np.sum(D_pan))
-        self.Mx: float = Mx
-        self.My: float = My
-        self.Mz: float = Mz
+        self.Mx: float = float(Mx)
+        self.My: float = float(My)
+        self.Mz: float = float(Mz)
 
         self.CL: float = 2 * self.L / (self.dens * (umag**2) * self.S)
         self.CD: float = 2 * self.D / (self.dens * (umag**2) * self.S)
         self.Cm: float = 2 * self.My / (self.dens * (umag**2) * self.S * self.MAC)
 
         interpolation_success: bool = True
-        try:
-            self.integrate_polars_from_reynolds(umag)
-        except ValueError as e:
-            print("\tCould not interpolate polars! Got error:")
-            print(f"\t{e}")
-            interpolation_success = False
+        if polar_loads is not None:
+            self.set_polar_loads(*polar_loads, umag)
+            interpolation_success = not np.isnan(self.L_2D)
+        else:
+            try:
+                self.integrate_polars_from_reynolds(umag)
+            except ValueError as e:
+                print("\tCould not interpolate polars! Got error:")
+                print(f"\t{e}")
+                interpolation_success = False
 
         if verbose:
             print(f"- Angle {self.alpha * 180 /np.pi}")
@@ -463,6 +1090,245 @@ class Wing_LSPT:
                 print(f"\t\tL:{self.L_2D}\t|\tD:{self.D_2D}\t|\tMy:{self.My_2D}")
                 print(f"\t\tCL:{self.CL_2D}\t|\tCD:{self.CD_2D}\t|\tCm:{self.Cm_2D}")
 
+    def coefficient_scales(self, umag: float) -> FloatArray:
+        """Returns the factors that turn L, D and My of the modelled lattice into the CL, CD and Cm of aseq."""
+        symmetry: float = 2.0 if self.is_symmetric else 1.0
+        scale: float = symmetry * 2 / (self.dens * (umag**2) * self.S)
+        return np.array([scale, scale, scale / self.MAC])
+
+    def load_coefficients(self, gammas: FloatArray, w: FloatArray, umag: float) -> FloatArray:
+        """
+        Returns the CL, CD (Trefftz plane) and Cm of a solution of the lattice, for the whole airplane as in aseq.
+
+        Args:
+            gammas (FloatArray): ((N - 1) * M) circulations
+            w (FloatArray): ((N - 1) * M) induced velocities
+            umag (float): Freestream velocity magnitude
+
+        Returns:
+            FloatArray: CL, CD and Cm
+        """
+        L_pan, _, D_trefftz, moments = self.integrate_panel_loads(gammas, w, umag)
+        coefficients: FloatArray = self.coefficient_scales(umag) * np.array([np.sum(L_pan), D_trefftz, moments[1]])
+        return coefficients
+
+    def coefficient_gradients(
+        self,
+        gammas: FloatArray,
+        w: FloatArray,
+        umag: float,
+    ) -> tuple[FloatArray, FloatArray]:
+        """
+        Returns the gradients of load_coefficients with respect to the circulations and the induced
+        velocities. L is linear in the circulations while the drag and the moment are quadratic.
+
+        Args:
+            gammas (FloatArray): ((N - 1) * M) circulations
+            w (FloatArray): ((N - 1) * M) induced velocities
+            umag (float): Freestream velocity magnitude
+
+        Returns:
+            tuple[FloatArray, FloatArray]: ((N - 1) * M, 3) gradients of CL, CD and Cm with respect to
+            gammas and to w
+        """
+        gammas_mat: FloatArray = np.reshape(gammas, (self.N - 1, self.M))
+        w_mat: FloatArray = np.reshape(w, (self.N - 1, self.M))
+        dy: FloatArray = self.grid[1:, : self.M, 1] - self.grid[:-1, : self.M, 1]
+        g: FloatArray = np.diff(gammas_mat, axis=1, prepend=0)
+        arms: FloatArray = np.zeros((self.N - 1, self.M))
+        arms[:, :-1] = np.cross(self.control_points[:, :-1] - self.cog, self.control_nj[:, :-1])[:, :, 1]
+
+        # Derivatives of L, D and My with respect to the panel circulations g and to w
+        d_g: FloatArray = np.zeros((3, self.N - 1, self.M))
+        d_w: FloatArray = np.zeros((3, self.N - 1, self.M))
+        d_g[0] = self.dens * umag * dy
+        d_g[2] = self.dens * arms * dy * (umag - w_mat)
+        d_w[2] = -self.dens * arms * dy * g
+
+        # The Trefftz plane drag depends on the rings at the trailing edge
+        te: int = self.M - 2
+        d_gammas: FloatArray = np.zeros((3, self.N - 1, self.M))
+        d_gammas[1, :, te] = -self.dens / 2 * dy[:, te] * w_mat[:, te]
+        d_w[1, :, te] = -self.dens / 2 * dy[:, te] * gammas_mat[:, te]
+
+        # Back through g[:, j] = gammas[:, j] - gammas[:, j - 1]
+        d_gammas += d_g
+        d_gammas[:, :, :-1] -= d_g[:, :, 1:]
+
+        scale: FloatArray = self.coefficient_scales(umag)
+        return d_gammas.reshape(3, -1).T * scale, d_w.reshape(3, -1).T * scale
+
+    def sensitivities(
+        self,
+        umag: float,
+        solve_fun: Callable[..., tuple[FloatArray, FloatArray]],
+        segment_parameters: bool = True,
+        step: float = 1e-6,
+    ) -> pd.DataFrame:
+        """
+        Derivatives of the CL, CD (Trefftz plane) and Cm of the current solution (set_gamma_distribution)
+        with respect to the angle of attack, the sideslip, the angular rates p, q and r about the x, y
+        and z axes of the lattice through the CG, and the incidence, chords and sweep offset of every
+        wing segment.
+
+        One adjoint solve with the transposed factorization gives the derivatives of the three outputs
+        with respect to every right hand side. The freestream and rate derivatives are then dot products.
+        For the lattice geometry the changes of a gammas, b gammas and of the loads at fixed gammas and w
+        are central differences of perturbed lattices. They only assemble the influences of the strips
+        that moved and need no new factorization. The reference area, chord and CG are held fixed.
+        With a half span lattice the derivatives with respect to sideslip, p and r are zero by symmetry.
+
+        Args:
+            umag (float): Freestream velocity magnitude of the solution
+            solve_fun (Callable[..., tuple[FloatArray, FloatArray]]): Vorticity element of the solution
+            segment_parameters (bool, optional): Whether to differentiate the segment geometry. Defaults to True.
+            step (float, optional): Step of the central differences of the geometry in rad and m. Defaults to 1e-6.
+
+        Raises:
+            ValueError: If the lattice has not been solved
+
+        Returns:
+            pd.DataFrame: Derivatives of CL, CD and Cm (columns) with respect to every parameter (index).
+            Angles are in radians and rates in rad/s.
+        """
+        if getattr(self, "gammas_mat", None) is None:
+            raise ValueError("Solve the lattice before computing its sensitivities")
+        gammas: FloatArray = self.gammas_mat.ravel()
+        w: FloatArray = self.w_mat.ravel()
+
+        # a^T adjoint = dJ/dgammas + b^T dJ/dw, reusing the factorization of the solve
+        self.factorize_LHS(solve_fun)
+        d_gammas, d_w = self.coefficient_gradients(gammas, w, umag)
+        adjoint: FloatArray = self.solve_LHS(d_gammas + self.b_product(d_w, trans=1), trans=1)
+
+        def rhs_derivative(d_RHS: FloatArray) -> FloatArray:
+            # Kutta condition rows
+            d_RHS[self.M - 1 :: self.M] = 0
+            return adjoint.T @ d_RHS
+
+        ground: float | None = None if self.ground_effect_dist is None else -self.ground_effect_dist
+
+        def lattice_derivative(plus: Wing_LSPT, minus: Wing_LSPT) -> FloatArray:
+            # The influences of the two lattices only differ in the rows and the columns of the strips
+            # that moved, so (a_plus - a_minus) gammas and (b_plus - b_minus) gammas only need those blocks
+            moved: IntArray = plus.changed_strips(*minus.lattice_arrays())
+            strips: IntArray = np.arange(self.N - 1)
+            still: IntArray = np.setdiff1d(strips, moved)
+            moved_panels: IntArray = strip_panels(moved, self.M)
+            still_panels: IntArray = strip_panels(still, self.M)
+            d_a: FloatArray = np.zeros_like(gammas)
+            d_b: FloatArray = np.zeros_like(gammas)
+            for wing, sign in ((plus, 1.0), (minus, -1.0)):
+                a_np, b_np = assemble_strips_LHS(*wing.lattice_arrays(), solve_fun, moved, strips, ground)
+                d_a[moved_panels] += sign * (a_np @ gammas)
+                d_b[moved_panels] += sign * (b_np @ gammas)
+                a_np, b_np = assemble_strips_LHS(*wing.lattice_arrays(), solve_fun, still, moved, ground)
+                d_a[still_panels] += sign * (a_np @ gammas[moved_panels])
+                d_b[still_panels] += sign * (b_np @ gammas[moved_panels])
+
+            d_RHS: FloatArray = plus.get_RHS(Q) - minus.get_RHS(Q)
+            d_loads: FloatArray = plus.load_coefficients(gammas, w, umag) - minus.load_coefficients(gammas, w, umag)
+            derivative: FloatArray = (adjoint.T @ (d_RHS - d_a) + d_w.T @ d_b + d_loads) / (2 * step)
+            return derivative
+
+        sin_a, cos_a = np.sin(self.alpha), np.cos(self.alpha)
+        sin_b, cos_b = np.sin(self.beta), np.cos(self.beta)
+        Q: FloatArray = umag * np.array([cos_a * cos_b, cos_a * sin_b, sin_a * cos_b])
+        normals: FloatArray = self.control_nj.reshape(-1, 3)
+        derivatives: dict[str, FloatArray] = {}
+
+        dQ_dalpha: FloatArray = umag * np.array([-sin_a * cos_b, -sin_a * sin_b, cos_a * cos_b])
+        dQ_dbeta: FloatArray = umag * np.array([-cos_a * sin_b, cos_a * cos_b, -sin_a * sin_b])
+        derivatives["alpha"] = rhs_derivative(-normals @ dQ_dalpha)
+        if self.wake_geom_type != "TE-Geometrical":
+            # The wake follows the freestream
+            derivatives["alpha"] += lattice_derivative(*(self.perturbed_alpha(sign * step) for sign in (1, -1)))
+        derivatives["beta"] = rhs_derivative(-normals @ dQ_dbeta)
+
+        # The onset velocity at r from the CG is Q - omega x r, so the right hand side changes by (r x n) . omega
+        rate_normals: FloatArray = self.rate_normals()
+        for axis, name in enumerate(["p", "q", "r"]):
+            derivatives[name] = rhs_derivative(rate_normals[:, axis].copy())
+        if self.is_symmetric:
+            for name in ["beta", "p", "r"]:
+                derivatives[name] = np.zeros(3)
+
+        if segment_parameters:
+            for index, segment in enumerate(self.wing_segments):
+                names: list[str] = ["incidence", "sweep_offset"] + [f"chord[{i}]" for i in range(len(segment.chord))]
+                for name in names:
+                    derivatives[f"{segment.name}.{name}"] = lattice_derivative(
+                        *(self.perturbed_segment(index, name, sign * step) for sign in (1, -1)),
+                    )
+
+        return pd.DataFrame.from_dict(derivatives, orient="index", columns=["CL", "CD", "Cm"])
+
+    def lattice_arrays(self) -> tuple[FloatArray, FloatArray, FloatArray]:
+        """Returns the control points, their normals and the grid of the lattice."""
+        return self.control_points, self.control_nj, self.grid
+
+    def perturbed_alpha(self, step: float) -> "Wing_LSPT":
+        """
+        Returns a shallow copy of the wing with its wake at the angle of attack alpha + step.
+        Only the wake rows of the grid follow alpha, the panels of the wing stay as they are.
+        """
+        wing: Wing_LSPT = copy.copy(self)
+        wing.grid = self.grid.copy()
+        wing._alpha = self.alpha + step
+        wing.make_wake_grid_points()
+        return wing
+
+    def perturbed_segment(self, index: int, parameter: str, step: float) -> "Wing_LSPT":
+        """
+        Returns a shallow copy of the wing with the lattice rebuilt after a change of one wing segment.
+        The reference area, chord and CG are kept.
+
+        Args:
+            index (int): Index of the segment in wing_segments
+            parameter (str): incidence (rad), sweep_offset or chord[i] (m)
+            step (float): Change of the parameter
+
+        Raises:
+            ValueError: If the parameter is unknown
+
+        Returns:
+            Wing_LSPT: Perturbed wing
+        """
+        segment: Wing_Segment = self.wing_segments[index]
+        orientation: FloatArray = np.array(segment.orientation, dtype=float)
+        sweep_offset: float = segment.sweep_offset
+        chord: FloatArray = np.array(segment.chord, dtype=float)
+        if parameter == "incidence":
+            orientation[0] += step * 180 / np.pi
+        elif parameter == "sweep_offset":
+            sweep_offset += step
+        elif parameter.startswith("chord[") and parameter.endswith("]"):
+            chord[int(parameter[6:-1])] += step
+        else:
+            raise ValueError(f"Unknown segment parameter {parameter}")
+
+        surfaces: list[Wing_Segment] = list(self.wing_segments)
+        surfaces[index] = Wing_Segment(
+            name=segment.name,
+            airfoil=segment.airfoil,
+            origin=segment.origin,
+            orientation=orientation,
+            is_symmetric=segment.is_symmetric,
+            span=segment.span,
+            sweep_offset=sweep_offset,
+            dih_angle=segment.dih_angle,
+            chord_fun=segment.chord_fun,
+            chord=chord,
+            span_fun=segment.span_fun,
+            N=segment.N,
+            M=segment.M,
+            mass=segment.mass,
+        )
+        wing: Wing_LSPT = copy.copy(self)
+        wing.build_lattice(Airplane(f"{segment.name}_{parameter}", surfaces))
+        wing.S, wing.MAC, wing.span, wing.cog = self.S, self.MAC, self.span, self.cog
+        return wing
+
     def calculate_strip_induced_velocities(self) -> None:
         if self.w_mat is None:
             self.get_gamma_distribution()
@@ -551,6 +1417,128 @@ class Wing_LSPT:
         fig.colorbar(ax[1].matshow(self.D_pan))
         fig.show()
 
+    def unsteady_run(
+        self,
+        Qs: FloatArray,
+        dt: float,
+        gust: Callable[[FloatArray, float], FloatArray] | None = None,
+        free_wake: bool = True,
+        max_wake_rows: int | None = None,
+        merge_wake: bool = True,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> pd.DataFrame:
+        """
+        Time marching vortex lattice solve with a wake shed from the trailing edge (see
+        unsteady.UnsteadyWake). Every step the lattice is solved against the onset flow and the
+        velocities induced by the wake, the loads are integrated and the wake is convected and
+        grows by a row.
+
+        The wake leaves the trailing edge through a near wake panel that spans one step of the
+        onset flow of the first step and carries the circulation of the trailing edge. Its geometry is fixed,
+        so the influence matrix of the lattice is factorized once for all the steps. The loads
+        are the Kutta-Joukowski forces of the bound vortices in the local velocity plus the
+        unsteady term rho dGamma/dt of every ring. Lift and drag are normal and parallel to the
+        freestream of the step, so the drag is the near field drag and not the Trefftz plane drag
+        of aseq. The moment is taken with the forces at the bound vortices. The solve starts
+        impulsively from rest.
+
+        Args:
+            Qs (FloatArray): (steps, 3) freestream velocity of every step in the frame of the lattice
+            dt (float): Time step
+            gust (Callable[[FloatArray, float], FloatArray] | None, optional): Velocity field added to the
+                freestream, called with (P, 3) points and the time. Defaults to None.
+            free_wake (bool, optional): Whether the wake is convected with the velocity it induces together
+                with the lattice (roll up), or with the onset flow only. Defaults to True.
+            max_wake_rows (int | None, optional): Maximum number of shed rows. None for an unbounded wake.
+            merge_wake (bool, optional): Whether the rows beyond max_wake_rows are merged instead of
+                dropped. Defaults to True.
+            chunk_size (int, optional): Maximum number of (point, panel) pairs evaluated at once.
+
+        Raises:
+            ValueError: In ground effect, or with sideslip on a half span lattice
+
+        Returns:
+            pd.DataFrame: Time, forces and coefficients of every step, for the whole airplane as in aseq
+        """
+        if self.ground_effect_dist is not None:
+            raise ValueError("The unsteady solver does not model ground effect")
+        Qs = np.atleast_2d(np.asarray(Qs, dtype=float))
+        if self.is_symmetric and np.any(Qs[:, 1] != 0):
+            raise ValueError("Sideslip breaks the symmetry of the flow. Use use_symmetry=False for the full span")
+        element: Callable[..., tuple[FloatArray, FloatArray]] = symm_wing_panels if self.is_symmetric else voring
+
+        def onset(points: FloatArray, Q: FloatArray, time: float) -> FloatArray:
+            if gust is None:
+                return np.broadcast_to(Q, points.shape)
+            return Q + gust(points, time)
+
+        # Lattice with the near wake panel in place of the steady wake
+        te: int = self.M - 1
+        grid: FloatArray = self.grid.copy()
+        grid[:, te + 1] = grid[:, te] + dt * onset(grid[:, te], Qs[0], 0.0)
+        a_np, _ = assemble_LHS(self.control_points, self.control_nj, grid, element, chunk_size)
+        a_lu: tuple[FloatArray, FloatArray] = lu_factor(a_np)
+        wake = UnsteadyWake(grid[:, te + 1])
+
+        points: FloatArray = self.control_points.reshape(-1, 3)
+        normals: FloatArray = self.control_nj.reshape(-1, 3)
+        # Bound vortices of the rings of the lattice, the near wake panel excluded
+        bound: FloatArray = grid[1:, :te] - grid[:-1, :te]
+        bound_points: FloatArray = ((grid[1:, :te] + grid[:-1, :te]) / 2).reshape(-1, 3)
+        ring_areas: FloatArray = np.cross(
+            grid[1:, 1 : te + 1] - grid[:-1, :te],
+            grid[:-1, 1 : te + 1] - grid[1:, :te],
+        )
+        areas: FloatArray = np.linalg.norm(ring_areas, axis=-1) / 2
+
+        symmetry: float = 2.0 if self.is_symmetric else 1.0
+        gammas_prev: FloatArray = np.zeros((self.N - 1, self.M))
+        records: list[list[float]] = []
+        for step, Q in enumerate(Qs):
+            time: float = step * dt
+            U_wake: FloatArray = wake.velocities(points, element, chunk_size)
+            RHS: FloatArray = -np.sum(normals * (onset(points, Q, time) + U_wake), axis=1)
+            # Kutta condition rows
+            RHS[te :: self.M] = 0
+            gammas: FloatArray = lu_solve(a_lu, RHS)
+            gammas_mat: FloatArray = np.reshape(gammas, (self.N - 1, self.M))
+
+            # Velocities induced by the lattice and the wake, which continues the near wake panel
+            field_grid: FloatArray = np.concatenate((grid, wake.grid[:, 1:]), axis=1)
+            field_gammas: FloatArray = np.concatenate((gammas_mat, wake.gammas), axis=1).ravel()
+            wake_points: FloatArray = wake.grid.reshape(-1, 3)
+            field_points: FloatArray = np.concatenate((bound_points, wake_points)) if free_wake else bound_points
+            U, _ = induced_velocities(field_points, field_grid, element, field_gammas, chunk_size=chunk_size)
+
+            # Loads of the bound vortices and of the change of the circulation of the rings
+            V: FloatArray = onset(bound_points, Q, time) + U[: bound_points.shape[0]]
+            g: FloatArray = np.diff(gammas_mat[:, :te], axis=1, prepend=0)
+            dgammas: FloatArray = (gammas_mat[:, :te] - gammas_prev[:, :te]) / dt
+            forces: FloatArray = self.dens * g[..., None] * np.cross(V.reshape(bound.shape), bound)
+            forces += self.dens * (dgammas * areas)[..., None] * self.control_nj[:, :te]
+            arms: FloatArray = bound_points.reshape(bound.shape) - self.cog
+            moment: float = float(np.sum(np.cross(arms, forces)[..., 1]))
+
+            umag: float = float(np.linalg.norm(Q))
+            drag_direction: FloatArray = Q / umag
+            lift_direction: FloatArray = np.cross(drag_direction, [0.0, 1.0, 0.0])
+            lift_direction /= np.linalg.norm(lift_direction)
+            force: FloatArray = np.sum(forces, axis=(0, 1))
+            loads: FloatArray = np.array([force @ lift_direction, force @ drag_direction, moment])
+            records.append([time, *(symmetry * loads), *(self.coefficient_scales(umag) * loads), wake.n_rows])
+
+            # Convect the wake and shed the circulation of the trailing edge
+            velocities: FloatArray = onset(wake_points, Q, time)
+            if free_wake:
+                velocities = velocities + U[bound_points.shape[0] :]
+            wake.convect(velocities, dt)
+            wake.shed(grid[:, te + 1], gammas_mat[:, te])
+            wake.limit(max_wake_rows, merge_wake)
+            gammas_prev = gammas_mat
+
+        self.unsteady_wake: UnsteadyWake = wake
+        return pd.DataFrame(records, columns=["Time", "L", "D", "My", "CL", "CD", "Cm", "Wake Rows"])
+
     def aseq(
         self,
         angles: list[float] | FloatArray,
@@ -558,53 +1546,227 @@ class Wing_LSPT:
         solver_fun: Callable[..., tuple[FloatArray, FloatArray]],
         verbose: bool = True,
     ) -> pd.DataFrame:
-        # Using no penetration condition
-        CL = np.zeros(len(angles))
-        CD = np.zeros(len(angles))
-        Cm = np.zeros(len(angles))
+        alphas, Qs, groups = self.angle_groups(angles, umag)
+        loads: FloatArray = np.zeros((6, len(alphas)))
+
+        # The iterative solvers start every group from the solution of the previous angle
+        x0: FloatArray | None = None
+        for group in groups:
+            self.alpha = alphas[group[0]]
+            gammas, w = self.solve_gamma_distributions(Qs[group], solver_fun, x0)
+            x0 = gammas[:, -1]
+            if verbose and (self.linear_solver != "direct" or self.lean_memory):
+                print(self.solve_reports[-1])
+            loads[:, group] = self.group_loads(alphas[group], gammas, w, umag, verbose)
+
+        return self.loads_dataframe(angles, loads, umag)
+
+    def angle_groups(
+        self,
+        angles: list[float] | FloatArray,
+        umag: float,
+        sideslips: list[float] | FloatArray | None = None,
+    ) -> tuple[FloatArray, FloatArray, list[IntArray]]:
+        """
+        Returns the freestreams of an angle sequence and groups the angles that share the lattice
+        geometry, so that each group is solved against one factorization. The TE-Geometrical wake
+        does not depend on alpha while the Inflow-* wakes do. No wake depends on the sideslip.
 
-        Ls = np.zeros(len(angles))
-        Ds = np.zeros(len(angles))
-        Mys = np.zeros(len(angles))
+        Args:
+            angles (list[float] | FloatArray): Angles of attack in degrees
+            umag (float): Freestream velocity magnitude
+            sideslips (list[float] | FloatArray | None, optional): Angle of sideslip of every angle of attack
+                in degrees. Defaults to the sideslip of the wing.
 
-        # Using 2D polars
-        CL_2D = np.zeros(len(angles))
-        CD_2D = np.zeros(len(angles))
-        Cm_2D = np.zeros(len(angles))
+        Returns:
+            tuple[FloatArray, FloatArray, list[IntArray]]: Angles in radians, (K, 3) freestream
+            velocities and the indices of the angles of every group
+        """
+        alphas: FloatArray = np.array(angles, dtype=float) * np.pi / 180
+        betas: FloatArray | float = self.beta if sideslips is None else np.array(sideslips, dtype=float) * np.pi / 180
+        Qs: FloatArray = umag * np.stack(
+            (
+                np.cos(alphas) * np.cos(betas),
+                np.cos(alphas) * np.sin(betas),
+                np.sin(alphas) * np.cos(betas),
+            ),
+            axis=-1,
+        )
 
-        Ls_2D = np.zeros(len(angles))
-        Ds_2D = np.zeros(len(angles))
-        Mys_2D = np.zeros(len(angles))
+        groups: list[IntArray]
+        if self.wake_geom_type == "TE-Geometrical":
+            groups = [np.arange(len(alphas))]
+        else:
+            groups = [np.flatnonzero(alphas == alpha) for alpha in np.unique(alphas)]
+        return alphas, Qs, groups
 
-        for i, aoa in enumerate(angles):
-            self.alpha = aoa * np.pi / 180
+    def group_loads(
+        self,
+        alphas: FloatArray,
+        gammas: FloatArray,
+        w: FloatArray,
+        umag: float,
+        verbose: bool = True,
+        set_loads: bool = True,
+    ) -> FloatArray:
+        """
+        Integrates the loads of a group of angles solved on the current lattice geometry, with the
+        no penetration solution and with the 2D polars of the strips, looked up for the whole group
+        at once. By default the loads of every angle are also set on the wing in turn, which leaves
+        the wing at the last angle of the group.
 
-            Uinf = umag * np.cos(self.alpha) * np.cos(self.beta)
-            Vinf = umag * np.cos(self.alpha) * np.sin(self.beta)
-            Winf = umag * np.sin(self.alpha) * np.cos(self.beta)
-            Q: FloatArray = np.array((Uinf, Vinf, Winf))
+        Args:
+            alphas (FloatArray): (K,) angles of attack of the group in radians
+            gammas (FloatArray): ((N - 1) * M, K) circulations of the group
+            w (FloatArray): ((N - 1) * M, K) induced velocities of the group
+            umag (float): Freestream velocity magnitude
+            verbose (bool, optional): Whether to print the loads of every angle. Defaults to True.
+            set_loads (bool, optional): Whether to set the loads of every angle on the wing. Defaults to True.
 
-            self.solve_wing_panels(Q, solver_fun)
-            self.get_gamma_distribution()
-            self.get_aerodynamic_loads(umag, verbose=verbose)
+        Returns:
+            FloatArray: (6, K) L, D, My, L_2D, D_2D and My_2D of the modelled lattice
+        """
+        loads: FloatArray = np.empty((6, len(alphas)))
 
-            # No pen
-            Ls[i] = self.L
-            Ds[i] = self.D
-            Mys[i] = self.My
+        # No pen
+        L_pan, D_pan, D_trefftz, moments = self.integrate_panel_loads(gammas, w, umag)
+        loads[0] = np.sum(L_pan, axis=(1, 2))
+        loads[1] = D_trefftz
+        loads[2] = moments[:, 1]
 
-            CL[i] = 2 * self.L / (self.dens * (umag**2) * self.S)
-            CD[i] = 2 * self.D / (self.dens * (umag**2) * self.S)
-            Cm[i] = 2 * self.My / (self.dens * (umag**2) * self.S * self.MAC)
+        # 2D polars of every strip and angle of the group in one lookup
+        w_strips: FloatArray = np.mean(np.reshape(w, (self.N - 1, self.M, -1)), axis=1).T
+        try:
+            _, reynolds, airfoil_aoa = self.strip_conditions(w_strips, alphas[:, None], umag)
+            strip_polars = self.interpolate_strip_polars(reynolds, airfoil_aoa)
+            loads[3], loads[4], loads[5] = self.integrate_strip_polars(w_strips, *strip_polars, umag)
+        except ValueError as e:
+            print("\tCould not interpolate polars! Got error:")
+            print(f"\t{e}")
+            loads[3:] = np.nan
+
+        if not set_loads:
+            return loads
+        for col, alpha in enumerate(alphas):
+            self.alpha = alpha
+            self.set_gamma_distribution(gammas[:, col], w[:, col])
+            self.set_aerodynamic_loads(
+                L_pan[col],
+                D_pan[col],
+                D_trefftz[col],
+                moments[col],
+                umag,
+                verbose,
+                polar_loads=(loads[3, col], loads[4, col], loads[5, col]),
+            )
+        return loads
+
+    def sweep(
+        self,
+        umag: float,
+        solve_fun: Callable[..., tuple[FloatArray, FloatArray]],
+        alpha: float | list[float] | FloatArray = 0.0,
+        beta: float | list[float] | FloatArray = 0.0,
+        p: float | list[float] | FloatArray = 0.0,
+        q: float | list[float] | FloatArray = 0.0,
+        r: float | list[float] | FloatArray = 0.0,
+    ) -> pd.DataFrame:
+        """
+        Solves the lattice for many flight conditions, e.g. a sideslip sweep for the lateral stability
+        or a set of body rates. The angles of attack, the angles of sideslip and the angular rates p, q
+        and r about the x, y and z axes of the lattice through the CG are broadcast against each other.
 
-            # 2D polars
-            Ls_2D[i] = self.L_2D
-            Ds_2D[i] = self.D_2D
-            Mys_2D[i] = self.My_2D
+        The conditions are grouped as in aseq (see angle_groups). The right hand sides of a group, with
+        the freestream and the rotational onset (see get_RHS_matrix), are built as one matrix and solved
+        against one factorization, so the geometry is only rebuilt between the groups of an Inflow-* wake.
+        The loads are integrated as in aseq, with the moments about the CG. The wing is left at the last
+        condition.
 
-            CL_2D[i] = self.CL_2D
-            CD_2D[i] = self.CD_2D
-            Cm_2D[i] = self.Cm_2D
+        Args:
+            umag (float): Freestream velocity magnitude
+            solve_fun (Callable[..., tuple[FloatArray, FloatArray]]): Vorticity element
+            alpha (float | list[float] | FloatArray, optional): Angles of attack in degrees. Defaults to 0.
+            beta (float | list[float] | FloatArray, optional): Angles of sideslip in degrees. Defaults to 0.
+            p (float | list[float] | FloatArray, optional): Roll rates in rad/s. Defaults to 0.
+            q (float | list[float] | FloatArray, optional): Pitch rates in rad/s. Defaults to 0.
+            r (float | list[float] | FloatArray, optional): Yaw rates in rad/s. Defaults to 0.
+
+        Raises:
+            ValueError: If a condition has sideslip, roll or yaw rate and the lattice only models half of the wing
+
+        Returns:
+            pd.DataFrame: Conditions (AoA, AoS, p, q, r) with the lift, the Trefftz plane drag and the moments
+            about the x, y and z axes of the lattice, and their coefficients. Cl and Cn are scaled with the span.
+        """
+        conditions: list[FloatArray] = np.broadcast_arrays(
+            *(np.atleast_1d(np.array(x, dtype=float)) for x in (alpha, beta, p, q, r)),
+        )
+        rates: FloatArray = np.stack(conditions[2:], axis=1)
+        alphas, Qs, groups = self.angle_groups(conditions[0], umag, conditions[1])
+        loads: FloatArray = np.empty((5, len(alphas)))
+
+        x0: FloatArray | None = None
+        for group in groups:
+            self.alpha = alphas[group[0]]
+            gammas, w = self.solve_gamma_distributions(Qs[group], solve_fun, x0, rates[group])
+            x0 = gammas[:, -1]
+            L_pan, _, D_trefftz, moments = self.integrate_panel_loads(gammas, w, umag)
+            loads[0, group] = np.sum(L_pan, axis=(1, 2))
+            loads[1, group] = D_trefftz
+            loads[2:, group] = moments.T
+        self.beta = conditions[1][-1] * np.pi / 180
+        self.set_gamma_distribution(gammas[:, -1], w[:, -1])
+
+        Ls, Ds, Mxs, Mys, Mzs = loads
+        if self.is_symmetric:
+            # The rolling and yawing moments of the two halves cancel out
+            Ls, Ds, Mys = 2 * Ls, 2 * Ds, 2 * Mys
+            Mxs, Mzs = np.zeros_like(Mxs), np.zeros_like(Mzs)
+        dynamic_pressure: float = self.dens * (umag**2) / 2
+        return pd.DataFrame(
+            {
+                "AoA": conditions[0],
+                "AoS": conditions[1],
+                "p": conditions[2],
+                "q": conditions[3],
+                "r": conditions[4],
+                "L": Ls,
+                "D": Ds,
+                "Mx": Mxs,
+                "My": Mys,
+                "Mz": Mzs,
+                "CL": Ls / (dynamic_pressure * self.S),
+                "CD": Ds / (dynamic_pressure * self.S),
+                "Cl": Mxs / (dynamic_pressure * self.S * self.span),
+                "Cm": Mys / (dynamic_pressure * self.S * self.MAC),
+                "Cn": Mzs / (dynamic_pressure * self.S * self.span),
+            },
+        )
+
+    def loads_dataframe(self, angles: list[float] | FloatArray, loads: FloatArray, umag: float) -> pd.DataFrame:
+        """
+        Turns the loads of group_loads into the forces and coefficients of the whole airplane.
+        The loads of a half span lattice are doubled.
+
+        Args:
+            angles (list[float] | FloatArray): Angles of attack in degrees
+            loads (FloatArray): (6, K) L, D, My, L_2D, D_2D and My_2D of the modelled lattice
+            umag (float): Freestream velocity magnitude
+
+        Returns:
+            pd.DataFrame: Forces and coefficients of every angle
+        """
+        Ls, Ds, Mys, Ls_2D, Ds_2D, Mys_2D = loads
+
+        # Using no penetration condition
+        CL = 2 * Ls / (self.dens * (umag**2) * self.S)
+        CD = 2 * Ds / (self.dens * (umag**2) * self.S)
+        Cm = 2 * Mys / (self.dens * (umag**2) * self.S * self.MAC)
+
+        # Using 2D polars
+        CL_2D = 2 * Ls_2D / (self.dens * (umag**2) * self.S)
+        CD_2D = 2 * Ds_2D / (self.dens * (umag**2) * self.S)
+        Cm_2D = 2 * Mys_2D / (self.dens * (umag**2) * self.S * self.MAC)
 
         if self.is_symmetric:
             CL = 2 * CL
@@ -643,90 +1805,154 @@ class Wing_LSPT:
 
     def calc_strip_chords(self) -> None:
         # Get the chord of each strip adding the chordwise distance of each panel
-        self.chords: FloatArray = np.zeros(self.N - 1)
-        for i in np.arange(0, self.N - 1):
-            for j in np.arange(0, self.M - 1):
-                self.chords[i] += (self.grid[i, j + 1, :] - self.grid[i, j, :])[0]
+        self.chords: FloatArray = np.sum(np.diff(self.grid[:-1, : self.M, 0], axis=1), axis=1)
 
-    def calc_strip_reynolds(self, umag: float) -> None:
-        if self.w_induced_strips is None:
-            self.calculate_strip_induced_velocities()
+    def strip_conditions(
+        self,
+        w_induced_strips: FloatArray,
+        alpha: float | FloatArray,
+        umag: float,
+    ) -> tuple[FloatArray, FloatArray, FloatArray]:
+        """
+        Computes the flow conditions of the strips for one or many solutions.
+
+        Args:
+            w_induced_strips (FloatArray): (N - 1) or (K, N - 1) mean induced velocities of the strips
+            alpha (float | FloatArray): Angle of attack in rad, or (K, 1) angles of the K solutions
+            umag (float): Freestream velocity magnitude
+
+        Returns:
+            tuple[FloatArray, FloatArray, FloatArray]: Effective angles of attack of the strips,
+            Reynolds numbers of the strips and effective angles of attack of their airfoils,
+            all with the shape of w_induced_strips
+        """
         self.calc_strip_chords()
 
         # Get the effective angle of attack of each strip
-        self.strip_effective_aoa: FloatArray = (
-            np.arctan(self.w_induced_strips / umag) * 180 / np.pi + self.alpha * 180 / np.pi
-        )
+        effective_aoa: FloatArray = np.arctan(w_induced_strips / umag) * 180 / np.pi + alpha * 180 / np.pi
 
         # Get the reynolds number of each strip
-        strip_vel: FloatArray = np.sqrt(self.w_induced_strips**2 + umag**2)
-        self.strip_reynolds: FloatArray = self.dens * strip_vel * self.chords / self.visc
+        strip_vel: FloatArray = np.sqrt(w_induced_strips**2 + umag**2)
+        reynolds: FloatArray = self.dens * strip_vel * self.chords / self.visc
 
         # Scan all wing segments and get the orientation of each airfoil
         # Match that orientation with the each strip and get the effective aoa
         # That is the angle of attack that the airfoil sees
-        self.strip_airfoil_effective_aoa = np.zeros(self.N - 1)
-        N: int = 0
-        for wing_seg in self.wing_segments:
-            for j in np.arange(0, wing_seg.N - 1):
-                self.strip_airfoil_effective_aoa[N + j] = self.strip_effective_aoa[N + j] + wing_seg.orientation[0]
-            N += wing_seg.N - 1
+        strip_orientation: FloatArray = np.repeat(
+            [wing_seg.orientation[0] for wing_seg, _ in self.lattice_segments],
+            [n_points - 1 for _, n_points in self.lattice_segments],
+        )
+        return effective_aoa, reynolds, effective_aoa + strip_orientation
 
-    def integrate_polars_from_reynolds(self, uinf: float, solver: str = "Xfoil") -> None:
-        # self.get_strip_reynolds(20, 1.225, 1.7894e-5)
-        # if self.strip_reynolds is None:
-        self.strip_CL_2D: FloatArray = np.zeros(self.N - 1)
-        self.strip_CD_2D: FloatArray = np.zeros(self.N - 1)
-        self.strip_Cm_2D: FloatArray = np.zeros(self.N - 1)
+    def calc_strip_reynolds(self, umag: float) -> None:
+        if self.w_induced_strips is None:
+            self.calculate_strip_induced_velocities()
+        (
+            self.strip_effective_aoa,
+            self.strip_reynolds,
+            self.strip_airfoil_effective_aoa,
+        ) = self.strip_conditions(self.w_induced_strips, self.alpha, umag)
 
-        self.L_2D: float | None = None
-        self.D_2D: float | None = None
-        self.My_2D: float | None = None
+    def interpolate_strip_polars(
+        self,
+        reynolds: FloatArray,
+        airfoil_aoa: FloatArray,
+        solver: str = "Xfoil",
+    ) -> tuple[FloatArray, FloatArray, FloatArray]:
+        """
+        Looks up the 2D polars of the strips of one or many solutions in one database call.
 
-        self.CL_2D: float | None = None
-        self.CD_2D: float | None = None
-        self.Cm_2D: float | None = None
+        Args:
+            reynolds (FloatArray): (N - 1) or (K, N - 1) Reynolds numbers of the strips
+            airfoil_aoa (FloatArray): Effective angles of attack of the airfoils with the same shape
+            solver (str, optional): 2D solver of the polars. Defaults to "Xfoil".
 
-        self.calc_strip_reynolds(uinf)
+        Raises:
+            ValueError: If a strip falls outside of the polars in the database
 
-        N: int = 0
-        L: float = 0
-        D: float = 0
-        My_at_quarter_chord: float = 0
-        for wing_seg in self.wing_segments:
-            airfoil: Airfoil = wing_seg.airfoil
-            for j in np.arange(0, wing_seg.N - 1):
-                dy: float = float(np.mean(self.grid[N + j + 1, :, 1] - self.grid[N + j, :, 1]))
-
-                CL, CD, Cm = DB.foils_db.interpolate_polars(
-                    reynolds=float(self.strip_reynolds[N + j]),
-                    airfoil_name=airfoil.name,
-                    aoa=float(self.strip_airfoil_effective_aoa[N + j]),
-                    solver=solver,
-                )
-                self.strip_CL_2D[N + j] = CL
-                self.strip_CD_2D[N + j] = CD
-                self.strip_Cm_2D[N + j] = Cm
+        Returns:
+            tuple[FloatArray, FloatArray, FloatArray]: CL, CD and Cm of the strips
+        """
+        airfoil_names: FloatArray = np.repeat(
+            [wing_seg.airfoil.name for wing_seg, _ in self.lattice_segments],
+            [n_points - 1 for _, n_points in self.lattice_segments],
+        )
+        return DB.foils_db.interpolate_polars_batch(reynolds, airfoil_names, airfoil_aoa, solver)
 
-                surface: float = float(self.chords[N + j]) * dy
-                vel_mag: float = float(np.sqrt(self.w_induced_strips[N + j] ** 2 + uinf**2))
-                dynamic_pressure: float = 0.5 * self.dens * vel_mag**2
+    def integrate_strip_polars(
+        self,
+        w_induced_strips: FloatArray,
+        CL: FloatArray,
+        CD: FloatArray,
+        Cm: FloatArray,
+        uinf: float,
+    ) -> tuple[FloatArray, FloatArray, FloatArray]:
+        """
+        Integrates the 2D coefficients of the strips of one or many solutions.
 
-                # "Integrate" the CL and CD of each strip to get the total L, D and My
-                L += CL * surface * dynamic_pressure
-                D += CD * surface * dynamic_pressure
-                My_at_quarter_chord += Cm * surface * dynamic_pressure * float(self.chords[N + j])
+        Args:
+            w_induced_strips (FloatArray): (N - 1) or (K, N - 1) mean induced velocities of the strips
+            CL (FloatArray): Lift coefficients of the strips with the same shape
+            CD (FloatArray): Drag coefficients of the strips with the same shape
+            Cm (FloatArray): Moment coefficients of the strips with the same shape
+            uinf (float): Freestream velocity magnitude
 
-            N += wing_seg.N - 1
+        Returns:
+            tuple[FloatArray, FloatArray, FloatArray]: L, D and My of every solution
+        """
+        self.calc_strip_chords()
+        dy: FloatArray = np.mean(self.grid[1:, :, 1] - self.grid[:-1, :, 1], axis=1)
+        surface: FloatArray = self.chords * dy
+        vel_mag: FloatArray = np.sqrt(w_induced_strips**2 + uinf**2)
+        dynamic_pressure: FloatArray = 0.5 * self.dens * vel_mag**2
 
-        self.L_2D = L
-        self.D_2D = D
+        # "Integrate" the CL and CD of each strip to get the total L, D and My
+        L: FloatArray = np.sum(CL * surface * dynamic_pressure, axis=-1)
+        D: FloatArray = np.sum(CD * surface * dynamic_pressure, axis=-1)
+        My_at_quarter_chord: FloatArray = np.sum(Cm * surface * dynamic_pressure * self.chords, axis=-1)
 
         # Calculate Total Moment moving the moment from the quarter chord
         # to the cg and then add the moment of the lift and drag
+        My: FloatArray = My_at_quarter_chord - D * self.cog[0] + L * self.cog[0]
+        return L, D, My
+
+    def set_polar_loads(self, L: float, D: float, My: float, uinf: float) -> None:
+        """
+        Stores the loads of the current solution integrated from the 2D polars.
 
-        self.My_2D = My_at_quarter_chord - D * self.cog[0] + L * self.cog[0]
+        Args:
+            L (float): Lift
+            D (float): Drag
+            My (float): Pitching moment about the CG
+            uinf (float): Freestream velocity magnitude
+        """
+        self.L_2D: float = float(L)
+        self.D_2D: float = float(D)
+        self.My_2D: float = float(My)
+
+        self.CL_2D: float = 2 * self.L_2D / (self.dens * (uinf**2) * self.S)
+        self.CD_2D: float = 2 * self.D_2D / (self.dens * (uinf**2) * self.S)
+        self.Cm_2D: float = 2 * self.My_2D / (self.dens * (uinf**2) * self.S * self.MAC)
+
+    def integrate_polars_from_reynolds(self, uinf: float, solver: str = "Xfoil") -> None:
+        self.strip_CL_2D: FloatArray = np.zeros(self.N - 1)
+        self.strip_CD_2D: FloatArray = np.zeros(self.N - 1)
+        self.strip_Cm_2D: FloatArray = np.zeros(self.N - 1)
+
+        # NaN as in group_loads until the polars are interpolated, so that a failed lookup leaves no stale loads
+        self.set_polar_loads(np.nan, np.nan, np.nan, uinf)
 
-        self.CL_2D = 2 * self.L_2D / (self.dens * (uinf**2) * self.S)
-        self.CD_2D = 2 * self.D_2D / (self.dens * (uinf**2) * self.S)
-        self.Cm_2D = 2 * self.My_2D / (self.dens * (uinf**2) * self.S * self.MAC)
+        self.calc_strip_reynolds(uinf)
+        self.strip_CL_2D, self.strip_CD_2D, self.strip_Cm_2D = self.interpolate_strip_polars(
+            self.strip_reynolds,
+            self.strip_airfoil_effective_aoa,
+            solver,
+        )
+        L, D, My = self.integrate_strip_polars(
+            self.w_induced_strips,
+            self.strip_CL_2D,
+            self.strip_CD_2D,
+            self.strip_Cm_2D,
+            uinf,
+        )
+        self.set_polar_loads(float(L), float(D), float(My), uinf)
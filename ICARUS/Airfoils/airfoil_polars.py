@@ -35,13 +35,18 @@ moment, and the slope of the Cl vs Alpha curve by calling:
 >>> polars.get_cl_slope(cl_curve)
 
 """
+import math
+from bisect import bisect_right
+
 import numpy as np
 import pandas as pd
 from pandas import DataFrame
 from pandas import Index
 
 from ICARUS.Core.struct import Struct
+from ICARUS.Core.types import BoolArray
 from ICARUS.Core.types import FloatArray
+from ICARUS.Core.types import IntArray
 
 # from ICARUS.Airfoils.airfoil import Airfoil
 
@@ -148,6 +153,21 @@ class Polars:
         self.df: DataFrame = df
         self.angles: FloatArray = df["AoA"].to_numpy()
 
+        # Numeric grid of the coefficients for vectorized lookups: (3, Reynolds, AoA) array of
+        # CL, CD and Cm with the Reynolds numbers sorted
+        order: list[int] = sorted(range(len(self.reynolds_nums)), key=lambda i: self.reynolds_nums[i])
+        self.reynolds_grid: FloatArray = np.array([self.reynolds_nums[i] for i in order])
+        self.angles_grid: FloatArray = self.angles.astype(float)
+        self.coefficient_grid: FloatArray = np.array(
+            [
+                [df[f"{name}_{self.reynolds_keys[i]}"].to_numpy(dtype=float) for i in order]
+                for name in ("CL", "CD", "Cm")
+            ],
+        )
+
+        # Dense grid interpolator of the coefficients, built on first use
+        self._interpolator: PolarInterpolator | None = None
+
         # Flap Angle
         self.flap_angle: float = 0.0  # airfoil.flap_angle
 
@@ -175,6 +195,66 @@ class Polars:
         # Slope of Cl vs Alpha (viscous)
         self.cl_slope_visc: float = self.get_cl_slope(viscous)
 
+    def interpolate(self, reynolds: FloatArray, aoa: FloatArray) -> tuple[FloatArray, FloatArray, FloatArray]:
+        """
+        Interpolates the coefficients at many (Reynolds, AoA) pairs at once. Each polar is
+        interpolated linearly in AoA, clamped at the ends of the table as np.interp does,
+        and the two polars around each Reynolds number are interpolated linearly in Reynolds.
+
+        Args:
+            reynolds (FloatArray): Reynolds numbers
+            aoa (FloatArray): Angles of attack in degrees, with the same shape as reynolds
+
+        Raises:
+            ValueError: If a Reynolds number is outside of the stored polars
+
+        Returns:
+            tuple[FloatArray, FloatArray, FloatArray]: CL, CD and Cm with the shape of reynolds
+        """
+        reynolds = np.asarray(reynolds, dtype=float)
+        aoa = np.broadcast_to(np.asarray(aoa, dtype=float), reynolds.shape)
+        min_reynolds: float = float(self.reynolds_grid[0])
+        max_reynolds: float = float(self.reynolds_grid[-1])
+        if np.any(reynolds > max_reynolds):
+            raise ValueError(f"Reynolds {np.max(reynolds)} not in database! Max Reynolds is {max_reynolds}")
+        if np.any(reynolds < min_reynolds):
+            raise ValueError(f"Reynolds {np.min(reynolds)} not in database! Min Reynolds is {min_reynolds}")
+
+        # Bracketing polars and weight of the upper one
+        if self.reynolds_grid.shape[0] == 1:
+            lower: IntArray = np.zeros(reynolds.shape, dtype=int)
+            upper: IntArray = lower
+            t: FloatArray = np.zeros(reynolds.shape)
+        else:
+            lower = np.searchsorted(self.reynolds_grid, reynolds, side="right") - 1
+            lower = np.clip(lower, 0, len(self.reynolds_grid) - 2)
+            upper = lower + 1
+            t = (reynolds - self.reynolds_grid[lower]) / (self.reynolds_grid[upper] - self.reynolds_grid[lower])
+
+        # Bracketing angles and weight of the upper one
+        angles: FloatArray = self.angles_grid
+        left: IntArray = np.clip(np.searchsorted(angles, aoa, side="right") - 1, 0, max(len(angles) - 2, 0))
+        right: IntArray = np.minimum(left + 1, len(angles) - 1)
+        span: FloatArray = angles[right] - angles[left]
+        s: FloatArray = np.clip(np.divide(aoa - angles[left], span, out=np.zeros(aoa.shape), where=span != 0), 0, 1)
+
+        grid: FloatArray = self.coefficient_grid
+        low: FloatArray = grid[:, lower, left] * (1 - s) + grid[:, lower, right] * s
+        up: FloatArray = grid[:, upper, left] * (1 - s) + grid[:, upper, right] * s
+        CL, CD, Cm = low * (1 - t) + up * t
+        return CL, CD, Cm
+
+    @property
+    def interpolator(self) -> "PolarInterpolator":
+        """
+        Interpolator of CL, CD and Cm on a dense (Reynolds, AoA) grid, with the angles clamped to the
+        table and a ValueError for Reynolds numbers outside of the stored polars as in interpolate.
+        It is built on first use and kept.
+        """
+        if self._interpolator is None:
+            self._interpolator = PolarInterpolator(self.reynolds_grid, self.angles_grid, self.coefficient_grid)
+        return self._interpolator
+
     def get_reynolds_subtable(self, reynolds: float | str) -> DataFrame:
         """Get Reynolds Subtable"""
         if isinstance(reynolds, float):
@@ -254,3 +334,189 @@ class Polars:
             )
         df.dropna(axis=0, subset=df.columns[1:], how="all", inplace=True)
         return df
+
+
+class PolarInterpolator:
+    """
+    Interpolator of the coefficients of a set of polars on a dense, regular (Reynolds, AoA) grid.
+    The polars are resampled once on a uniform AoA grid, so that a query only computes its two
+    grid indices and blends the four surrounding values, for any number of queries in one call.
+    The default step is the smallest spacing of the stored angles, which keeps every stored angle
+    on the grid when the angles are multiples of it (as the tables of the solvers are).
+
+    Queries outside of the grid follow the extrapolation rules:
+        aoa_extrapolation: "clamp" to the end angles as np.interp does, "linear" along the end
+            slopes or "nan"
+        reynolds_extrapolation: "raise" a ValueError, "clamp" to the end polars or "nan"
+
+    >>> interpolator = polars.interpolator
+    >>> CL, CD, Cm = interpolator(reynolds, aoa)
+    """
+
+    AOA_EXTRAPOLATION: tuple[str, ...] = ("clamp", "linear", "nan")
+    REYNOLDS_EXTRAPOLATION: tuple[str, ...] = ("raise", "clamp", "nan")
+
+    def __init__(
+        self,
+        reynolds: FloatArray,
+        angles: FloatArray,
+        coefficients: FloatArray,
+        aoa_step: float | None = None,
+        aoa_extrapolation: str = "clamp",
+        reynolds_extrapolation: str = "raise",
+    ) -> None:
+        """
+        Resamples the polars on the regular grid.
+
+        Args:
+            reynolds (FloatArray): (R,) sorted Reynolds numbers of the polars
+            angles (FloatArray): (A,) sorted angles of attack of the polars in degrees
+            coefficients (FloatArray): (C, R, A) coefficients of the polars, e.g. CL, CD and Cm
+            aoa_step (float | None, optional): Step of the AoA grid. Defaults to the smallest spacing of the angles.
+            aoa_extrapolation (str, optional): Rule for angles outside of the grid. Defaults to "clamp".
+            reynolds_extrapolation (str, optional): Rule for Reynolds numbers outside of the grid. Defaults to "raise".
+
+        Raises:
+            ValueError: If an extrapolation rule is unknown or the polars have no angles
+        """
+        if aoa_extrapolation not in self.AOA_EXTRAPOLATION:
+            raise ValueError(
+                f"Unknown AoA extrapolation {aoa_extrapolation}. The options are: {', '.join(self.AOA_EXTRAPOLATION)}",
+            )
+        if reynolds_extrapolation not in self.REYNOLDS_EXTRAPOLATION:
+            raise ValueError(
+                f"Unknown Reynolds extrapolation {reynolds_extrapolation}. "
+                f"The options are: {', '.join(self.REYNOLDS_EXTRAPOLATION)}",
+            )
+        angles = np.asarray(angles, dtype=float)
+        if angles.shape[0] == 0:
+            raise ValueError("The polars have no angles")
+        self.aoa_extrapolation: str = aoa_extrapolation
+        self.reynolds_extrapolation: str = reynolds_extrapolation
+        self.reynolds: FloatArray = np.asarray(reynolds, dtype=float)
+
+        # Uniform AoA grid from the first to the last angle. The step is adjusted so that the grid
+        # ends on the last angle, which also absorbs the float32 rounding of the stored angles.
+        aoa_range: float = float(angles[-1] - angles[0])
+        if aoa_step is None:
+            spacings: FloatArray = np.diff(angles)
+            spacings = spacings[spacings > 0]
+            aoa_step = float(np.min(spacings)) if spacings.shape[0] > 0 else 1.0
+        n_angles: int = max(1, int(round(aoa_range / aoa_step))) + 1 if aoa_range > 0 else 1
+        self.aoa_start: float = float(angles[0])
+        self.aoa_step: float = aoa_range / (n_angles - 1) if n_angles > 1 else 1.0
+        self.angles: FloatArray = self.aoa_start + self.aoa_step * np.arange(n_angles)
+
+        # (C, R, A) table of the resampled coefficients
+        coefficients = np.asarray(coefficients, dtype=float)
+        self.table: FloatArray = np.empty((coefficients.shape[0], coefficients.shape[1], n_angles))
+        for c in range(coefficients.shape[0]):
+            for r in range(coefficients.shape[1]):
+                self.table[c, r] = np.interp(self.angles, angles, coefficients[c, r])
+
+        # Plain Python copies of the grid for single queries, which would spend most of their time in numpy calls
+        self._reynolds_list: list[float] = self.reynolds.tolist()
+        self._table_list: list[list[list[float]]] = self.table.tolist()
+
+    def __call__(self, reynolds: FloatArray | float, aoa: FloatArray | float) -> tuple[FloatArray | float, ...]:
+        """
+        Interpolates the coefficients at many (Reynolds, AoA) pairs at once, bilinearly on the grid.
+        A single query skips numpy and is interpolated in plain Python with the same operations.
+
+        Args:
+            reynolds (FloatArray | float): Reynolds numbers
+            aoa (FloatArray | float): Angles of attack in degrees, broadcastable with reynolds
+
+        Raises:
+            ValueError: If a Reynolds number is outside of the grid and the Reynolds extrapolation is "raise"
+
+        Returns:
+            tuple[FloatArray, ...]: One array per coefficient with the broadcast shape of reynolds and aoa,
+            or one float per coefficient for a single query
+        """
+        single: bool = isinstance(reynolds, (int, float)) and isinstance(aoa, (int, float))
+        if single and math.isfinite(reynolds) and math.isfinite(aoa):
+            return self._interpolate_point(float(reynolds), float(aoa))
+        reynolds, aoa = np.broadcast_arrays(np.asarray(reynolds, dtype=float), np.asarray(aoa, dtype=float))
+        outside: BoolArray = np.zeros(reynolds.shape, dtype=bool)
+
+        # Bracketing polars and weight of the upper one
+        min_reynolds: float = float(self.reynolds[0])
+        max_reynolds: float = float(self.reynolds[-1])
+        if self.reynolds_extrapolation == "raise":
+            if np.any(reynolds > max_reynolds):
+                raise ValueError(f"Reynolds {np.max(reynolds)} not in database! Max Reynolds is {max_reynolds}")
+            if np.any(reynolds < min_reynolds):
+                raise ValueError(f"Reynolds {np.min(reynolds)} not in database! Min Reynolds is {min_reynolds}")
+        elif self.reynolds_extrapolation == "nan":
+            outside |= (reynolds < min_reynolds) | (reynolds > max_reynolds)
+        if self.reynolds.shape[0] == 1:
+            lower: IntArray = np.zeros(reynolds.shape, dtype=int)
+            t: FloatArray = np.zeros(reynolds.shape)
+            upper: IntArray = lower
+        else:
+            lower = np.clip(np.searchsorted(self.reynolds, reynolds, side="right") - 1, 0, self.reynolds.shape[0] - 2)
+            upper = lower + 1
+            t = (reynolds - self.reynolds[lower]) / (self.reynolds[upper] - self.reynolds[lower])
+            t = np.clip(t, 0, 1)
+
+        # Bracketing angles and weight of the right one. Linear extrapolation lets the weight leave [0, 1].
+        n_angles: int = self.angles.shape[0]
+        u: FloatArray = (aoa - self.aoa_start) / self.aoa_step
+        if self.aoa_extrapolation == "clamp":
+            u = np.clip(u, 0, n_angles - 1)
+        elif self.aoa_extrapolation == "nan":
+            outside |= (u < 0) | (u > n_angles - 1)
+        left: IntArray = np.clip(np.floor(u).astype(int), 0, max(n_angles - 2, 0))
+        right: IntArray = np.minimum(left + 1, n_angles - 1)
+        s: FloatArray = u - left if n_angles > 1 else np.zeros(u.shape)
+
+        table: FloatArray = self.table
+        low: FloatArray = table[:, lower, left] + (table[:, lower, right] - table[:, lower, left]) * s
+        up: FloatArray = table[:, upper, left] + (table[:, upper, right] - table[:, upper, left]) * s
+        values: FloatArray = low + (up - low) * t
+        if np.any(outside):
+            values[:, outside] = np.nan
+        return tuple(values)
+
+    def _interpolate_point(self, reynolds: float, aoa: float) -> tuple[float, ...]:
+        """Single query counterpart of __call__ on the plain Python copies of the grid."""
+        min_reynolds: float = self._reynolds_list[0]
+        max_reynolds: float = self._reynolds_list[-1]
+        outside: bool = False
+        if self.reynolds_extrapolation == "raise":
+            if reynolds > max_reynolds:
+                raise ValueError(f"Reynolds {reynolds} not in database! Max Reynolds is {max_reynolds}")
+            if reynolds < min_reynolds:
+                raise ValueError(f"Reynolds {reynolds} not in database! Min Reynolds is {min_reynolds}")
+        elif self.reynolds_extrapolation == "nan":
+            outside = reynolds < min_reynolds or reynolds > max_reynolds
+        n_reynolds: int = len(self._reynolds_list)
+        if n_reynolds == 1:
+            lower: int = 0
+            upper: int = 0
+            t: float = 0.0
+        else:
+            lower = min(max(bisect_right(self._reynolds_list, reynolds) - 1, 0), n_reynolds - 2)
+            upper = lower + 1
+            t = (reynolds - self._reynolds_list[lower]) / (self._reynolds_list[upper] - self._reynolds_list[lower])
+            t = min(max(t, 0.0), 1.0)
+
+        n_angles: int = self.angles.shape[0]
+        u: float = (aoa - self.aoa_start) / self.aoa_step
+        if self.aoa_extrapolation == "clamp":
+            u = min(max(u, 0.0), n_angles - 1.0)
+        elif self.aoa_extrapolation == "nan":
+            outside = outside or u < 0 or u > n_angles - 1
+        left: int = min(max(math.floor(u), 0), max(n_angles - 2, 0))
+        right: int = min(left + 1, n_angles - 1)
+        s: float = u - left if n_angles > 1 else 0.0
+        if outside:
+            return tuple(math.nan for _ in self._table_list)
+
+        values: list[float] = []
+        for table in self._table_list:
+            low: float = table[lower][left] + (table[lower][right] - table[lower][left]) * s
+            up: float = table[upper][left] + (table[upper][right] - table[upper][left]) * s
+            values.append(low + (up - low) * t)
+        return tuple(values)
@@ -224,5 +224,5 @@ def process_f2w_run(
 
         polars[reynolds_str] = make_polars(CASEDIR, DB.HOMEDIR)
 
-    DB.foils_db.load_data()
+    DB.foils_db.refresh([f"NACA{airfoil.name}"])
     return polars
@@ -18,7 +18,6 @@ from ICARUS.Computation.Solvers.GenuVP.utils.genu_surface import GenuSurface
 from ICARUS.Core.struct import Struct
 from ICARUS.Core.types import FloatArray
 from ICARUS.Database import DB
-from ICARUS.Database import DB3D
 from ICARUS.Database.utils import angle_to_case
 from ICARUS.Environment.definition import Environment
 from ICARUS.Vehicle.plane import Airplane
@@ -320,16 +319,7 @@ def process_gnvp_angles_run(plane: Airplane, genu_version: int) -> DataFrame:
     plane.save()
 
     print("Adding Results to Database")
-    # Add Plane to Database
-    file_plane: str = os.path.join(DB3D, plane.name, f"{plane.name}.json")
-    _ = DB.vehicles_db.load_plane_from_file(name=plane.name, file=file_plane)
-
-    # Add Forces to Database
-    file_gnvp: str = os.path.join(DB3D, plane.name, f"forces.gnvp{genu_version}")
-    DB.vehicles_db.load_gnvp_forces(planename=plane.name, file=file_gnvp, genu_version=genu_version)
-
-    # Add Convergence to Database
-    cases = next(os.walk(CASEDIR))[1]
-    DB.vehicles_db.load_gnvp_case_convergence(planename=plane.name, case=CASEDIR, genu_version=genu_version)
+    # Add the plane, the forces and the convergence of the changed cases to the Database
+    DB.vehicles_db.refresh([plane.name])
     # rotatedforces: DataFrame = rotate_forces(forces, forces["AoA"])
     return forces
@@ -1,5 +1,6 @@
 from typing import Any
 
+from ICARUS import CPU_TO_USE
 from ICARUS.Aerodynamics.Potential.lifting_surfaces import run_lstp_angles
 from ICARUS.Computation.Analyses.analysis import Analysis
 from ICARUS.Computation.Solvers.solver import Solver
@@ -46,13 +47,34 @@ def get_lspt() -> Solver:
         "Ground_Effect": (
             None,
             "Distance From Ground (m). None for no ground effect",
-            int,
+            float,
         ),
         "Wake_Geom_Type": (
             "TE-Geometrical",
             "Type of wake geometry. The options are: -TE-Geometrical -Inflow-Uniform -Inflow-TE",
             str,
         ),
+        "Linear_Solver": (
+            "direct",
+            "Solver of the panel system. The options are: -direct -gmres -matrix-free -treecode",
+            str,
+        ),
+        "Solver_Tolerance": (
+            1e-6,
+            "Relative tolerance of the iterative linear solvers",
+            float,
+        ),
+        "Assembly_Workers": (
+            CPU_TO_USE,
+            "Number of processes assembling the influence matrices",
+            int,
+        ),
+        "Matrix_Cache": (
+            True,
+            "Keep the factorized influence matrices of the TE-Geometrical wake under the plane directory and reuse them"
+            " across runs",
+            bool,
+        ),
     }
 
     angles: Analysis = Analysis(
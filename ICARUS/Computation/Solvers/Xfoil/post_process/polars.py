@@ -39,3 +39,4 @@ def save_multiple_reyn(
         fname = "clcd.xfoil"
         df.to_csv(fname, sep="\t", index=True, index_label="AoA")
     airfoil.save_selig_te(airfoil_dir)
+    DB.foils_db.refresh([f"NACA{airfoil.name}"])
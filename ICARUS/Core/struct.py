@@ -1,4 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Condition
+from threading import RLock
+from threading import get_ident
 from typing import Any
+from typing import Callable
 from typing import ItemsView
 from typing import Iterator
 from typing import KeysView
@@ -182,3 +187,196 @@ class Struct:
                 value.tree(indent + 1)
             else:
                 print(f" {value}")
+
+
+class LazyStruct(Struct):
+    """
+    Struct whose entries can be loaded on first access. A loader is a callable without arguments
+    that is called once, when its key is first read, and returns the value of the key. A loader
+    may also set its key (and keys of other structs) itself and return None. Until then the key is
+    listed by keys, len and in like any other key. Iterating over the values or the items loads
+    every pending entry.
+
+    Loaders run under a lock, so a key read from several threads is loaded once and every thread
+    gets its value. The threads of load_all run their loaders outside of it and a thread reading a
+    key they are loading waits for its value. A key keeps its loader until its value is set, so
+    other threads always list it. Structs whose loaders set keys of each other should share their lock.
+    """
+
+    __slots__: List[str] = ["_loaders", "_loading", "_lock", "_loaded"]
+    _loaders: dict[str, Callable[[], Any]]
+    # Keys whose loader is running and the thread running it
+    _loading: dict[str, int]
+    _lock: RLock
+    _loaded: Condition
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> "LazyStruct":
+        """Create a new LazyStruct instance."""
+        instance: "LazyStruct" = super().__new__(cls)  # type: ignore[assignment]
+        object.__setattr__(instance, "_loaders", {})
+        object.__setattr__(instance, "_loading", {})
+        object.__setattr__(instance, "_lock", RLock())
+        object.__setattr__(instance, "_loaded", Condition(instance._lock))
+        return instance
+
+    def share_lock(self, other: "LazyStruct") -> None:
+        """
+        Makes another struct load its entries under the lock of this one.
+
+        Args:
+            other (LazyStruct): Struct whose loaders set keys of this struct or the other way round
+        """
+        object.__setattr__(other, "_lock", self._lock)
+        object.__setattr__(other, "_loaded", self._loaded)
+
+    def set_loader(self, key: str, loader: Callable[[], Any]) -> None:
+        """
+        Sets the loader of a key. A value loaded before is dropped, so that it is read again.
+
+        Args:
+            key (str): Key
+            loader (Callable[[], Any]): Callable returning the value of the key
+        """
+        self._loaders[key] = loader
+        self._data.pop(key, None)
+
+    def cancel_loader(self, key: str) -> None:
+        """Drops the pending loader of a key, if any. The key is unset unless it was loaded."""
+        self._loaders.pop(key, None)
+
+    def is_loaded(self, key: str) -> bool:
+        """Returns whether a key has a value that is not pending a loader."""
+        return key in self._data
+
+    def load_all(self, max_workers: int | None = 1) -> None:
+        """
+        Loads every pending entry. Entries whose loader sets no value are dropped.
+
+        Args:
+            max_workers (int | None, optional): Number of threads that run the loaders. Keys that share a
+                loader run it once. None uses the default of ThreadPoolExecutor. Defaults to 1.
+        """
+        if max_workers == 1:
+            for key in list(self._loaders.keys()):
+                if key in self._loaders:
+                    try:
+                        self[key]
+                    except KeyError:
+                        pass
+            return
+
+        keys_of_loader: dict[int, list[str]] = {}
+        loaders: dict[int, Callable[[], Any]] = {}
+        for key, loader in list(self._loaders.items()):
+            keys_of_loader.setdefault(id(loader), []).append(key)
+            loaders[id(loader)] = loader
+
+        def load(loader_id: int) -> None:
+            loader: Callable[[], Any] = loaders[loader_id]
+            # Keys read or loaded by another thread since the loaders were listed are skipped
+            with self._lock:
+                keys: list[str] = [
+                    key
+                    for key in keys_of_loader[loader_id]
+                    if self._loaders.get(key) is loader and key not in self._loading
+                ]
+                if not keys:
+                    return
+                for key in keys:
+                    self._loading[key] = get_ident()
+
+            value: Any = None
+            try:
+                value = loader()
+            except KeyError:
+                pass
+            finally:
+                with self._lock:
+                    for key in keys:
+                        del self._loading[key]
+                        if self._loaders.get(key) is loader:
+                            if value is not None:
+                                self[key] = value
+                            else:
+                                del self._loaders[key]
+                    self._loaded.notify_all()
+
+        with ThreadPoolExecutor(max_workers) as executor:
+            for _ in executor.map(load, loaders):
+                pass
+
+    def __getitem__(self, key: str) -> Any:
+        """
+        Get an item from the LazyStruct instance by key. If it is pending, its loader is called
+        under the lock, while other threads reading it wait for its value.
+        """
+        if key not in self._data:
+            with self._lock:
+                # Wait for a key that a thread of load_all is loading
+                while self._loading.get(key, get_ident()) != get_ident():
+                    self._loaded.wait()
+                loader: Callable[[], Any] | None = self._loaders.get(key)
+                # A loader reading its own key gets a KeyError
+                if loader is not None and key not in self._loading:
+                    value: Any = None
+                    self._loading[key] = get_ident()
+                    try:
+                        value = loader()
+                    finally:
+                        # A loader that fails is dropped as well
+                        del self._loading[key]
+                        if value is not None:
+                            self[key] = value
+                        elif self._loaders.get(key) is loader:
+                            del self._loaders[key]
+        return self._data[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Set an item in the LazyStruct instance by key and value, dropping its pending loader."""
+        super().__setitem__(key, value)
+        self._loaders.pop(key, None)
+
+    def __delitem__(self, key: str) -> None:
+        """Delete an item from the LazyStruct instance by key, loaded or not."""
+        if self._loaders.pop(key, None) is None or key in self._data:
+            del self._data[key]
+
+    def __delattr__(self, name: str) -> None:
+        """Delete an attribute from the LazyStruct instance by name, loaded or not."""
+        try:
+            del self[name]
+        except KeyError:
+            raise AttributeError(f"Attribute {name} not found")
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether a key is set or pending."""
+        return key in self._loaders or key in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the set and the pending keys."""
+        return iter(list(self.keys()))
+
+    def __len__(self) -> int:
+        """Get the number of set and pending items."""
+        return len(self.keys())
+
+    def keys(self) -> KeysView[str]:
+        """Return the set and the pending keys without loading them."""
+        # The loaders are listed first, as a loaded key is set before its loader is dropped
+        loaders: list[str] = list(self._loaders)
+        return {**dict.fromkeys(self._data), **dict.fromkeys(loaders)}.keys()
+
+    def items(self) -> ItemsView[str, Any]:
+        """Load every pending entry and return a snapshot of the items."""
+        self.load_all()
+        return dict(self._data).items()
+
+    def values(self) -> ValuesView[Any]:
+        """Load every pending entry and return a snapshot of the values."""
+        self.load_all()
+        return dict(self._data).values()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Load every pending entry and get the state of the LazyStruct instance."""
+        self.load_all()
+        return self._data
@@ -2,8 +2,10 @@ from typing import Any
 from typing import Union
 
 import numpy as np
+from numpy import bool_
 from numpy import dtype
 from numpy import floating
+from numpy import intp
 from numpy import ndarray
 
 from ICARUS.Core.struct import Struct
@@ -11,4 +13,6 @@ from ICARUS.Core.struct import Struct
 Numeric = Union[int, float, np.number]
 DataDict = Union[dict[str, Any], Struct]
 FloatArray = ndarray[Any, dtype[floating[Any]]]
+IntArray = ndarray[Any, dtype[intp]]
+BoolArray = ndarray[Any, dtype[bool_]]
 FloatOrListArray = Union[FloatArray, list[float]]
@@ -1,6 +1,7 @@
 import os
 import re
 import shutil
+from functools import partial
 from time import sleep
 
 import numpy as np
@@ -12,8 +13,12 @@ from . import EXTERNAL_DB
 from ICARUS import APPHOME
 from ICARUS.Airfoils.airfoil import Airfoil
 from ICARUS.Airfoils.airfoil_polars import Polars
+from ICARUS.Core.struct import LazyStruct
 from ICARUS.Core.struct import Struct
+from ICARUS.Core.types import BoolArray
 from ICARUS.Core.types import FloatArray
+from ICARUS.Database.table_cache import SourceStat
+from ICARUS.Database.table_cache import TableCache
 
 
 class Database_2D:
@@ -30,67 +35,239 @@ class Database_2D:
         if not os.path.isdir(self.DATADIR):
             os.makedirs(self.DATADIR)
 
-        self.data: Struct = Struct()
+        self.use_cache: bool = True
+        self.data: LazyStruct = LazyStruct()
+        self.polars: LazyStruct = LazyStruct()
+        self.airfoils: LazyStruct = LazyStruct()
+        # Size and modification time of the polar files of every loaded airfoil, for refresh
+        self.manifest: dict[str, dict[str, SourceStat]] = {}
 
     def load_data(self) -> None:
         """
-        Scans the filesystem and load all the data.
+        Indexes the airfoils of the database. Only the names of the airfoil folders are read.
+        The data, the polars and the geometry of an airfoil are loaded when first accessed,
+        so entries loaded before are read again on their next access. Use preload to load
+        everything at once.
         """
         self.scan()
-        self.airfoils: Struct = self.set_available_airfoils()
-        self.polars = Struct()
-        for airfoil, data in self.data.items():
-            self.polars[airfoil] = Struct()
-            for solver in data.keys():
-                self.polars[airfoil][solver] = Polars(self.data[airfoil][solver])
+        for airfoil in self.data.keys():
+            self.polars.set_loader(airfoil, partial(self.load_polars, airfoil))
+            self.airfoils.set_loader(airfoil, partial(self.load_airfoil, airfoil))
+
+    def preload(self, max_workers: int | None = None) -> None:
+        """
+        Indexes the database and loads the data, the polars and the geometry of every airfoil.
+        The airfoils are loaded concurrently by a pool of threads.
+
+        Args:
+            max_workers (int | None, optional): Number of threads. None uses the default of
+                ThreadPoolExecutor and 1 loads the airfoils one after the other. Defaults to None.
+        """
+        self.load_data()
+        for struct in (self.data, self.polars, self.airfoils):
+            struct.load_all(max_workers)
 
     def scan(self) -> None:
         """
-        Scans the filesystem and loads data if not already loaded.
+        Indexes the airfoil folders of the filesystem. The data of each airfoil is read on first access.
         """
-        # Accessing Database Directory
-        try:
-            os.chdir(DB2D)
-        except FileNotFoundError:
-            print(f"Database not found! Initializing Database at {DB2D}")
-            os.makedirs(DB2D, exist_ok=True)
-        # Get Folders
-        folders: list[str] = next(os.walk("."))[1]
+        if not os.path.isdir(self.DATADIR):
+            print(f"Database not found! Initializing Database at {self.DATADIR}")
+            os.makedirs(self.DATADIR, exist_ok=True)
+        for airfoil in self.list_folders(self.DATADIR):
+            self.data.set_loader(airfoil, partial(self.load_airfoil_data, airfoil))
+
+    def load_airfoil_data(self, airfoil: str) -> Struct:
+        """
+        Reads the polars of an airfoil for every solver and Reynolds number. The parsed polar
+        files are kept in the table cache of the database, so only the files that changed
+        since the last read are parsed again.
+
+        Args:
+            airfoil (str): Airfoil folder name
+
+        Raises:
+            ValueError: If it encounters a solver not recognized.
+
+        Returns:
+            Struct: Polar DataFrames by solver and Reynolds number
+        """
+        sources: dict[str, tuple[str, str]] = self.get_polar_sources(airfoil)
+        self.manifest[airfoil] = {source: TableCache.source_stat(source) for source in sources}
+        tables: dict[str, DataFrame | None] = self.read_polar_tables(airfoil, list(sources))
+
         data = Struct()
-        for airfoil in folders:
-            os.chdir(airfoil)
-            data[airfoil] = self.scan_reynold_subdirs()
-            os.chdir(DB2D)
+        for source, (solver, reynolds) in sources.items():
+            table: DataFrame | None = tables[source]
+            if table is None:
+                continue
+            if solver not in data.keys():
+                data[solver] = Struct()
+            data[solver][reynolds] = table
+        return data
+
+    def get_polar_sources(self, airfoil: str) -> dict[str, tuple[str, str]]:
+        """
+        Lists the polar files of an airfoil.
 
-        for airfoil in data.keys():
-            if airfoil not in self.data.keys():
-                self.data[airfoil] = Struct()
+        Args:
+            airfoil (str): Airfoil folder name
 
-            for j in data[airfoil].keys():
-                for k in data[airfoil][j].keys():
-                    if k not in self.data[airfoil].keys():
-                        self.data[airfoil][k] = Struct()
-                    self.data[airfoil][k][j] = data[airfoil][j][k]
-        os.chdir(self.HOMEDIR)
+        Raises:
+            ValueError: If it encounters a solver not recognized.
 
-    def scan_reynold_subdirs(self) -> Struct:
+        Returns:
+            dict[str, tuple[str, str]]: Solver and Reynolds number of every polar file
+        """
+        airfoil_dir: str = os.path.join(self.DATADIR, airfoil)
+        sources: dict[str, tuple[str, str]] = {}
+        for folder in self.list_folders(airfoil_dir):  # folder = reynolds subdir
+            for file in self.list_polar_files(os.path.join(airfoil_dir, folder)):
+                sources[file] = (self.get_solver_name(file), folder[9:])
+        return sources
+
+    def read_polar_tables(self, airfoil: str, sources: list[str]) -> dict[str, DataFrame | None]:
         """
-        Scans the reynolds subdirectories and loads the data.
+        Reads polar files of an airfoil, through the table cache unless use_cache is False.
+
+        Args:
+            airfoil (str): Airfoil folder name
+            sources (list[str]): Polar files
+
+        Returns:
+            dict[str, DataFrame | None]: Polar of every file, or None if it is empty
+        """
+        if self.use_cache:
+            return self.table_cache.read(airfoil, sources, self.read_polar_file)
+        return {source: self.read_polar_file(source) for source in sources}
+
+    def refresh(self, airfoils: list[str] | None = None) -> list[str]:
+        """
+        Picks up the polars that were written, changed or removed since the airfoils were loaded,
+        for example by a solver run. New airfoils are indexed and airfoils that were not loaded yet
+        are left to be read on first access. For a loaded airfoil, the sizes and modification times
+        of its polar files are compared with the ones it was read with, only the files that differ
+        are read and their tables replace the old ones. The polars of the solvers whose tables
+        changed are built again from the tables in memory, and every other entry is kept.
+
+        Args:
+            airfoils (list[str] | None, optional): Airfoil folder names to refresh. Defaults to all
+                the airfoils of the filesystem and of the database.
+
+        Raises:
+            ValueError: If it encounters a solver not recognized.
+
+        Returns:
+            list[str]: Airfoils that were added, changed or removed
+        """
+        if airfoils is None:
+            on_disk: list[str] = self.list_folders(self.DATADIR) if os.path.isdir(self.DATADIR) else []
+            airfoils = list(dict.fromkeys(on_disk + list(self.data.keys())))
+
+        changed: list[str] = []
+        for airfoil in airfoils:
+            if not os.path.isdir(os.path.join(self.DATADIR, airfoil)):
+                if airfoil in self.data:
+                    for struct in (self.data, self.polars, self.airfoils):
+                        if airfoil in struct:
+                            del struct[airfoil]
+                    self.manifest.pop(airfoil, None)
+                    changed.append(airfoil)
+                continue
+            if airfoil not in self.data:
+                self.data.set_loader(airfoil, partial(self.load_airfoil_data, airfoil))
+                self.polars.set_loader(airfoil, partial(self.load_polars, airfoil))
+                self.airfoils.set_loader(airfoil, partial(self.load_airfoil, airfoil))
+                changed.append(airfoil)
+                continue
+            if not self.data.is_loaded(airfoil) or airfoil not in self.manifest:
+                continue
+
+            previous: dict[str, SourceStat] = self.manifest[airfoil]
+            sources: dict[str, tuple[str, str]] = self.get_polar_sources(airfoil)
+            stats: dict[str, SourceStat] = {source: TableCache.source_stat(source) for source in sources}
+            if stats == previous:
+                continue
+            self.manifest[airfoil] = stats
+            changed.append(airfoil)
+
+            modified: list[str] = [source for source in sources if previous.get(source) != stats[source]]
+            tables: dict[str, DataFrame | None] = self.read_polar_tables(airfoil, list(sources))
+            data: Struct = self.data[airfoil]
+            solvers: set[str] = set()
+            for source in modified:
+                solver, reynolds = sources[source]
+                solvers.add(solver)
+                table: DataFrame | None = tables[source]
+                if table is not None:
+                    if solver not in data.keys():
+                        data[solver] = Struct()
+                    data[solver][reynolds] = table
+                elif solver in data.keys() and reynolds in data[solver].keys():
+                    del data[solver][reynolds]
+            for source in previous.keys() - stats.keys():
+                solver = self.get_solver_name(source)
+                reynolds = os.path.basename(os.path.dirname(source))[9:]
+                solvers.add(solver)
+                if solver in data.keys() and reynolds in data[solver].keys():
+                    del data[solver][reynolds]
+
+            for solver in solvers:
+                if solver in data.keys() and len(data[solver]) == 0:
+                    del data[solver]
+
+            if not self.polars.is_loaded(airfoil):
+                continue
+            polars: Struct = self.polars[airfoil]
+            # A solver whose tables were all removed is dropped from the polars as well
+            for solver in solvers:
+                if solver in data.keys():
+                    polars[solver] = Polars(data[solver])
+                elif solver in polars.keys():
+                    del polars[solver]
+        return changed
+
+    @property
+    def table_cache(self) -> TableCache:
+        """Cache of the parsed polar files, kept in the .cache folder of the database."""
+        return TableCache(os.path.join(self.DATADIR, ".cache"))
+
+    def load_polars(self, airfoil: str) -> Struct:
+        """
+        Builds the polars of an airfoil for every solver.
+
+        Args:
+            airfoil (str): Airfoil name
+
+        Returns:
+            Struct: Polars by solver
+        """
+        polars = Struct()
+        for solver, data in self.data[airfoil].items():
+            polars[solver] = Polars(data)
+        return polars
+
+    def scan_reynold_subdirs(self, airfoil_dir: str) -> Struct:
+        """
+        Scans the reynolds subdirectories of an airfoil and loads the data.
+
+        Args:
+            airfoil_dir (str): Directory of the airfoil
 
         Returns:
             Struct: A struct containing the polars for all reynolds.
         """
         airfoil_data = Struct()
-        folders: list[str] = next(os.walk("."))[1]  # folder = reynolds subdir
-        for folder in folders:
-            os.chdir(folder)
-            airfoil_data[folder[9:]] = self.scan_different_solver()
-            os.chdir("..")
+        for folder in self.list_folders(airfoil_dir):  # folder = reynolds subdir
+            airfoil_data[folder[9:]] = self.scan_different_solver(os.path.join(airfoil_dir, folder))
         return airfoil_data
 
-    def scan_different_solver(self) -> Struct:
+    def scan_different_solver(self, reynolds_dir: str) -> Struct:
         """
-        Scans the different solver files and loads the data.
+        Scans the different solver files of a reynolds subdirectory and loads the data.
+
+        Args:
+            reynolds_dir (str): Reynolds subdirectory
 
         Raises:
             ValueError: If it encounters a solver not recognized.
@@ -99,87 +276,174 @@ class Database_2D:
             Struct: Struct containing the polars for all solvers.
         """
         current_reynolds_data = Struct()
-        files: list[str] = next(os.walk("."))[2]
-        for file in files:
-            if file.startswith("clcd"):
-                solver: str = file[5:]
-                if solver == "f2w":
-                    name = "Foil2Wake"
-                elif solver == "of":
-                    name = "OpenFoam"
-                elif solver == "xfoil":
-                    name = "Xfoil"
-                else:
-                    raise ValueError("Solver not recognized!")
-                try:
-                    current_reynolds_data[name] = pd.read_csv(file, dtype=float)
-                except ValueError:
-                    current_reynolds_data[name] = pd.read_csv(
-                        file,
-                        delimiter="\t",
-                        dtype=float,
-                    )
-                # Check if the dataframe read is nan or empty
-                try:
-                    if current_reynolds_data[name]["CL"].isnull().values.all() or current_reynolds_data[name].empty:
-                        del current_reynolds_data[name]
-                except:
-                    del current_reynolds_data[name]
-
+        for file in self.list_polar_files(reynolds_dir):
+            name: str = self.get_solver_name(file)
+            polar: DataFrame | None = self.read_polar_file(file)
+            if polar is not None:
+                current_reynolds_data[name] = polar
         return current_reynolds_data
 
-    def set_available_airfoils(self, verbose: bool = False) -> Struct:
-        airfoils = Struct()
+    @staticmethod
+    def list_folders(directory: str) -> list[str]:
+        """
+        Returns the names of the folders of a directory. Hidden folders, like the one of the
+        table cache, are left out.
+
+        Args:
+            directory (str): Directory
+
+        Returns:
+            list[str]: Folder names
+        """
+        with os.scandir(directory) as entries:
+            return [entry.name for entry in entries if entry.is_dir() and not entry.name.startswith(".")]
+
+    @staticmethod
+    def list_polar_files(directory: str) -> list[str]:
+        """
+        Returns the paths of the clcd.* polar files of a directory.
+
+        Args:
+            directory (str): Directory
+
+        Returns:
+            list[str]: Polar files
+        """
+        with os.scandir(directory) as entries:
+            return [entry.path for entry in entries if entry.is_file() and entry.name.startswith("clcd")]
+
+    @staticmethod
+    def get_solver_name(file: str) -> str:
+        """
+        Returns the solver of a clcd.* polar file from its extension.
+
+        Args:
+            file (str): Filename
+
+        Raises:
+            ValueError: If the solver is not recognized.
+
+        Returns:
+            str: Solver Name
+        """
+        solver: str = os.path.basename(file)[5:]
+        if solver == "f2w":
+            return "Foil2Wake"
+        elif solver == "of":
+            return "OpenFoam"
+        elif solver == "xfoil":
+            return "Xfoil"
+        raise ValueError("Solver not recognized!")
+
+    @staticmethod
+    def read_polar_file(file: str) -> DataFrame | None:
+        """
+        Reads a polar file, comma or tab separated.
+
+        Args:
+            file (str): Filename
+
+        Returns:
+            DataFrame | None: Polar, or None if it is empty or its CL is all NaN.
+        """
+        try:
+            polar: DataFrame = pd.read_csv(file, dtype=float)
+        except ValueError:
+            polar = pd.read_csv(
+                file,
+                delimiter="\t",
+                dtype=float,
+            )
+        # Check if the dataframe read is nan or empty
+        try:
+            if polar["CL"].isnull().values.all() or polar.empty:
+                return None
+        except:
+            return None
+        return polar
+
+    def set_available_airfoils(self, verbose: bool = False) -> LazyStruct:
+        """
+        Returns the geometry of every airfoil of the database. Each airfoil is loaded when first accessed.
+
+        Args:
+            verbose (bool, optional): Whether to print where each airfoil is loaded from. Defaults to False.
+
+        Returns:
+            LazyStruct: Airfoils by name
+        """
+        airfoils = LazyStruct()
         for airf in list(self.data.keys()):
+            airfoils.set_loader(airf, partial(self.load_airfoil, airf, verbose))
+        return airfoils
+
+    def load_airfoil(self, airf: str, verbose: bool = False) -> Airfoil | None:
+        """
+        Loads the geometry of an airfoil from its NACA digits, from its file in the database or
+        from the external database.
+
+        Args:
+            airf (str): Airfoil name
+            verbose (bool, optional): Whether to print where the airfoil is loaded from. Defaults to False.
+
+        Raises:
+            FileNotFoundError: If the airfoil is found nowhere
+
+        Returns:
+            Airfoil | None: Airfoil geometry, or None if its folder in the external database has no .dat file
+        """
+        try:
+            airfoil: Airfoil = Airfoil.naca(airf[4:], n_points=200)
+            if verbose:
+                print(f"Loaded airfoil {airf} from NACA Digits")
+            return airfoil
+        except:
+            # try to load the Airfoil from the DB2D
             try:
-                airfoils[airf] = Airfoil.naca(airf[4:], n_points=200)
+                filename = os.path.join(self.DATADIR, airf, airf.replace("NACA", "naca"))
+                airfoil = Airfoil.load_from_file(filename)
                 if verbose:
-                    print(f"Loaded airfoil {airf} from NACA Digits")
+                    print(f"Loaded airfoil {airf} from DB2D")
+                return airfoil
             except:
-                # try to load the Airfoil from the DB2D
-                try:
-                    filename = os.path.join(DB2D, airf, airf.replace("NACA", "naca"))
-                    airfoils[airf] = Airfoil.load_from_file(filename)
-                    if verbose:
-                        print(f"Loaded airfoil {airf} from DB2D")
-                except:
-                    #! TODO DEPRECATE THIS IT IS STUPID airfoilS SHOULD BE MORE ROBUST
-
-                    # list the folders in the EXTERNAL DB
-                    folders: list[str] = os.walk(EXTERNAL_DB).__next__()[1]
-                    flag = False
-                    name: str = ""
-                    for folder in folders:
-                        pattern = r"\([^)]*\)|[^0-9a-zA-Z]+"
-                        cleaned_string: str = re.sub(pattern, " ", folder)
-                        # Split the cleaned string into numeric and text parts
-                        foil: str = "".join(filter(str.isdigit, cleaned_string))
-                        text_part: str = "".join(filter(str.isalpha, cleaned_string))
-                        if text_part.find("flap") != -1:
-                            name = f"{foil + 'fl'}"
-                        else:
-                            name = foil
-
-                        if len(airf) == 4 or len(airf) == 5:
-                            name = "NACA" + name
-
-                        if name == airf:
-                            flag = True
-                            name = folder
-
-                    if flag:
-                        # list the files in the airfoil folder
-                        flap_files: list[str] = os.listdir(os.path.join(EXTERNAL_DB, name))
-                        # check if the airfoil is in the flap folder
-                        if name + ".dat" in flap_files:
-                            # load the airfoil from the flap folder
-                            filename = os.path.join(EXTERNAL_DB, name, name + ".dat")
-                            airfoils[airf] = Airfoil.load_from_file(filename)
-                            if verbose:
-                                print(f"Loaded airfoil {airf} from EXTERNAL DB")
+                #! TODO DEPRECATE THIS IT IS STUPID airfoilS SHOULD BE MORE ROBUST
+
+                # list the folders in the EXTERNAL DB
+                folders: list[str] = os.walk(EXTERNAL_DB).__next__()[1]
+                flag = False
+                name: str = ""
+                for folder in folders:
+                    pattern = r"\([^)]*\)|[^0-9a-zA-Z]+"
+                    cleaned_string: str = re.sub(pattern, " ", folder)
+                    # Split the cleaned string into numeric and text parts
+                    foil: str = "".join(filter(str.isdigit, cleaned_string))
+                    text_part: str = "".join(filter(str.isalpha, cleaned_string))
+                    if text_part.find("flap") != -1:
+                        name = f"{foil + 'fl'}"
                     else:
-                        raise FileNotFoundError(f"Couldnt Find airfoil {airf} in DB2D or EXTERNAL DB")
-        return airfoils
+                        name = foil
+
+                    if len(airf) == 4 or len(airf) == 5:
+                        name = "NACA" + name
+
+                    if name == airf:
+                        flag = True
+                        name = folder
+
+                if flag:
+                    # list the files in the airfoil folder
+                    flap_files: list[str] = os.listdir(os.path.join(EXTERNAL_DB, name))
+                    # check if the airfoil is in the flap folder
+                    if name + ".dat" in flap_files:
+                        # load the airfoil from the flap folder
+                        filename = os.path.join(EXTERNAL_DB, name, name + ".dat")
+                        airfoil = Airfoil.load_from_file(filename)
+                        if verbose:
+                            print(f"Loaded airfoil {airf} from EXTERNAL DB")
+                        return airfoil
+                    return None
+                else:
+                    raise FileNotFoundError(f"Couldnt Find airfoil {airf} in DB2D or EXTERNAL DB")
 
     def get_airfoil_solvers(self, airfoil_name: str) -> list[str] | None:
         """
@@ -229,7 +493,7 @@ class Database_2D:
         )
         os.makedirs(AFDIR, exist_ok=True)
         exists = False
-        for i in os.listdir():
+        for i in os.listdir(AFDIR):
             if i.startswith("naca"):
                 exists = True
         if not exists:
@@ -350,24 +614,20 @@ class Database_2D:
         df.dropna(axis=0, subset=df.columns[1:], how="all", inplace=True)
         return df
 
-    def interpolate_polars(
-        self,
-        reynolds: float,
-        airfoil_name: str,
-        aoa: float,
-        solver: str,
-    ) -> tuple[float, float, float]:
+    def get_polars(self, airfoil_name: str, solver: str) -> Polars:
         """
-        Interpolates the polars from the database.
+        Returns the polars of an airfoil computed with a solver. Airfoils stored with
+        a NACA prefix are also found by their digits.
 
         Args:
-            reynolds (float): Reynolds number
             airfoil_name (str): airfoil Name
-            aoa (float): Angle of Attack
             solver (str): Solver Name
 
+        Raises:
+            ValueError: If the airfoil or the solver is not in the database
+
         Returns:
-            tuple[float, float, float]: CL, CD, Cm
+            Polars: Polars of the airfoil
         """
         if airfoil_name not in self.polars.keys():
             if f"NACA{airfoil_name}" in self.polars.keys():
@@ -376,61 +636,63 @@ class Database_2D:
                 raise ValueError(f"Airfoil {airfoil_name} not in database!")
         if solver not in self.polars[airfoil_name].keys():
             raise ValueError(f"Solver {solver} not in database!")
-
         polars: Polars = self.polars[airfoil_name][solver]
-        reynolds_stored: list[float] = polars.reynolds_nums
-        max_reynolds_stored: float = max(reynolds_stored)
-        min_reynolds_stored: float = min(reynolds_stored)
+        return polars
 
-        if reynolds > max_reynolds_stored:
-            raise ValueError(f"Reynolds {reynolds} not in database! Max Reynolds is {max_reynolds_stored}")
-
-        if reynolds < min_reynolds_stored:
-            raise ValueError(f"Reynolds {reynolds} not in database! Min Reynolds is {min_reynolds_stored}")
-
-        reynolds_stored.sort()
-        upper_reynolds: float | None = None
-        lower_reynolds: float | None = None
+    def interpolate_polars(
+        self,
+        reynolds: float,
+        airfoil_name: str,
+        aoa: float,
+        solver: str,
+    ) -> tuple[float, float, float]:
+        """
+        Interpolates the polars from the database on the dense grid of the polars, which is
+        built on the first lookup.
 
-        # Check if the reynolds is an exact match
-        if reynolds in reynolds_stored:
-            upper_reynolds = reynolds
-            lower_reynolds = reynolds
-        else:
-            # Find the 2 reynolds numbers that our reynolds is between
-            for i in range(1, len(reynolds_stored)):
-                if reynolds_stored[i] > reynolds:
-                    upper_reynolds = reynolds_stored[i]
-                    lower_reynolds = reynolds_stored[i - 1]
-                    break
+        Args:
+            reynolds (float): Reynolds number
+            airfoil_name (str): airfoil Name
+            aoa (float): Angle of Attack
+            solver (str): Solver Name
 
-        if not upper_reynolds or not lower_reynolds:
-            raise ValueError(f"Reynolds {reynolds} not in database! Max Reynolds is {max_reynolds_stored}")
+        Returns:
+            tuple[float, float, float]: CL, CD, Cm
+        """
+        CL, CD, Cm = self.get_polars(airfoil_name, solver).interpolator(reynolds, aoa)
+        return float(CL), float(CD), float(Cm)
 
-        # Get the polars for the 2 reynolds numbers
-        upper_polar: DataFrame = polars.get_reynolds_subtable(upper_reynolds)
-        lower_polar: DataFrame = polars.get_reynolds_subtable(lower_reynolds)
+    def interpolate_polars_batch(
+        self,
+        reynolds: FloatArray,
+        airfoil_names: list[str] | FloatArray,
+        aoa: FloatArray,
+        solver: str,
+    ) -> tuple[FloatArray, FloatArray, FloatArray]:
+        """
+        Interpolates the polars from the database at many points at once. The points are
+        grouped by airfoil and every group is interpolated in one lookup on the dense grid of its polars.
 
-        # Interpolate the CL, CD and Cm values for the given aoa for each reynolds
-        try:
-            CL_up: float = float(np.interp(aoa, upper_polar["AoA"], upper_polar["CL"]))
-            CD_up: float = float(np.interp(aoa, upper_polar["AoA"], upper_polar["CD"]))
-            Cm_up: float = float(np.interp(aoa, upper_polar["AoA"], upper_polar["Cm"]))
-
-            CL_low: float = float(np.interp(aoa, lower_polar["AoA"], lower_polar["CL"]))
-            CD_low: float = float(np.interp(aoa, lower_polar["AoA"], lower_polar["CD"]))
-            Cm_low: float = float(np.interp(aoa, lower_polar["AoA"], lower_polar["Cm"]))
-
-            # Interpolate between the 2 CL, CD and Cm values
-            CL = float(np.interp(reynolds, [lower_reynolds, upper_reynolds], [CL_low, CL_up]))
-            CD = float(np.interp(reynolds, [lower_reynolds, upper_reynolds], [CD_low, CD_up]))
-            Cm = float(np.interp(reynolds, [lower_reynolds, upper_reynolds], [Cm_low, Cm_up]))
-        except KeyError as e:
-            print(airfoil_name)
-            print(upper_reynolds)
-            print(lower_reynolds)
-            raise KeyError(f"Key {e} not found in database!")
+        Args:
+            reynolds (FloatArray): Reynolds numbers
+            airfoil_names (list[str] | FloatArray): airfoil Name of every point
+            aoa (FloatArray): Angles of Attack
+            solver (str): Solver Name
 
+        Returns:
+            tuple[FloatArray, FloatArray, FloatArray]: CL, CD, Cm with the shape of reynolds
+        """
+        reynolds = np.asarray(reynolds, dtype=float)
+        names: FloatArray = np.broadcast_to(np.asarray(airfoil_names), reynolds.shape)
+        aoa = np.broadcast_to(np.asarray(aoa, dtype=float), reynolds.shape)
+
+        CL: FloatArray = np.empty(reynolds.shape)
+        CD: FloatArray = np.empty(reynolds.shape)
+        Cm: FloatArray = np.empty(reynolds.shape)
+        for airfoil_name in np.unique(names):
+            mask: BoolArray = names == airfoil_name
+            polars: Polars = self.get_polars(str(airfoil_name), solver)
+            CL[mask], CD[mask], Cm[mask] = polars.interpolator(reynolds[mask], aoa[mask])
         return CL, CD, Cm
 
     def __str__(self) -> str:
@@ -1,4 +1,5 @@
 import os
+from functools import partial
 from typing import Any
 from typing import Literal
 
@@ -14,13 +15,19 @@ from ICARUS import APPHOME
 from ICARUS.Computation.Solvers.GenuVP.post_process.convergence import (
     get_loads_convergence_3,
 )
+from ICARUS.Core.struct import LazyStruct
 from ICARUS.Core.struct import Struct
 from ICARUS.Core.types import FloatArray
+from ICARUS.Database.table_cache import SourceStat
+from ICARUS.Database.table_cache import TableCache
 from ICARUS.Flight_Dynamics.state import State
 from ICARUS.Vehicle.plane import Airplane
 
 jsonpickle_pd.register_handlers()
 
+# Forces files of a plane, read together through the table cache
+FORCES_FILES: tuple[str, ...] = ("forces.gnvp7", "forces.gnvp3", "forces.lspt")
+
 
 class Database_3D:
     """Class to represent the 3D Database. It contains all the information and results
@@ -29,51 +36,320 @@ class Database_3D:
     def __init__(self) -> None:
         self.HOMEDIR: str = APPHOME
         self.DATADIR: str = DB3D
-        self.raw_data = Struct()
-        self.data = Struct()
-        self.planes = Struct()
-        self.states = Struct()
-        self.convergence_data = Struct()
+        self.use_cache: bool = True
+        self.raw_data = LazyStruct()
+        self.data = LazyStruct()
+        self.planes = LazyStruct()
+        self.states = LazyStruct()
+        self.convergence_data = LazyStruct()
+        # Size and modification time of the files of every loaded plane, for refresh
+        self.manifest: dict[str, dict[str, SourceStat]] = {}
+        # A plane is loaded into all the structs at once
+        for struct in (self.data, self.planes, self.states, self.convergence_data):
+            self.raw_data.share_lock(struct)
 
     def load_data(self) -> None:
+        """
+        Indexes the planes of the database. The plane object, states, convergence and forces
+        of a plane are loaded when any of its entries is first accessed. Use preload to load
+        everything at once.
+        """
         self.scan_and_make_data()
 
+    def preload(self, max_workers: int | None = None) -> None:
+        """
+        Indexes the database and loads every plane. The planes are loaded concurrently by a pool of threads.
+
+        Args:
+            max_workers (int | None, optional): Number of threads. None uses the default of
+                ThreadPoolExecutor and 1 loads the planes one after the other. Defaults to None.
+        """
+        self.load_data()
+        for struct in (self.planes, self.states, self.convergence_data, self.raw_data, self.data):
+            struct.load_all(max_workers)
+
     def scan_and_make_data(self) -> None:
-        if not os.path.isdir(DB3D):
+        """
+        Indexes the plane folders of the filesystem. Only the names of the files and folders of
+        each plane are read, to know which entries the plane will have once it is loaded.
+        """
+        if not os.path.isdir(self.DATADIR):
             # print(f"Creating {DB3D} directory...")
-            os.makedirs(DB3D, exist_ok=True)
+            os.makedirs(self.DATADIR, exist_ok=True)
 
-        planenames: list[str] = next(os.walk(DB3D))[1]
+        with os.scandir(self.DATADIR) as entries:
+            # Hidden folders hold the cache, not planes
+            planenames: list[str] = [e.name for e in entries if e.is_dir() and not e.name.startswith(".")]
         for plane in planenames:  # For each plane planename == folder
-            # Load Plane object
-            file_plane: str = os.path.join(DB3D, plane, f"{plane}.json")
-            plane_found: bool = self.load_plane_from_file(plane, file_plane)
-
-            if plane_found:
-                # Load Convergence Data
-                if plane not in self.convergence_data.keys():
-                    self.convergence_data[plane] = Struct()
-                cases: list[str] = next(os.walk(os.path.join(DB3D, plane)))[1]
-                for case in cases:
-                    # Load States
-                    if case.startswith("Dyn"):
-                        self.states[plane] = self.load_plane_states(plane, case)
-                        continue
-                    if case.startswith("Sens"):
-                        continue
-                    if "gnvp3" in os.listdir(os.path.join(DB3D, plane, case)):
-                        self.load_gnvp_case_convergence(plane, case, 3)
-                    if "gnvp7" in os.listdir(os.path.join(DB3D, plane, case)):
-                        self.load_gnvp_case_convergence(plane, case, 7)
-
-            # Loading Forces from forces.* files
-            file_gnvp_7: str = os.path.join(DB3D, plane, "forces.gnvp7")
-            file_gnvp_3: str = os.path.join(DB3D, plane, "forces.gnvp3")
-            file_lspt: str = os.path.join(DB3D, plane, "forces.lspt")
-
-            self.load_gnvp_forces(plane, file_gnvp_7, genu_version=7)
-            self.load_gnvp_forces(plane, file_gnvp_3, genu_version=3)
-            self.load_lspt_forces(plane, file_lspt)
+            self.index_plane(plane)
+
+    def index_plane(self, plane: str) -> None:
+        """
+        Sets the loader of every entry a plane will have once it is loaded, from the names of
+        the files and folders of the plane.
+
+        Args:
+            plane (str): Plane folder name
+        """
+        with os.scandir(os.path.join(self.DATADIR, plane)) as entries:
+            folders: list[str] = []
+            files: list[str] = []
+            for entry in entries:
+                (folders if entry.is_dir() else files).append(entry.name)
+        loader: partial[None] = partial(self.load_plane, plane)
+        plane_found: bool = f"{plane}.json" in files
+        if plane_found:
+            self.planes.set_loader(plane, loader)
+            self.convergence_data.set_loader(plane, loader)
+            if any(case.startswith("Dyn") for case in folders):
+                self.states.set_loader(plane, loader)
+
+        has_gnvp_forces: bool = "forces.gnvp7" in files or "forces.gnvp3" in files
+        if has_gnvp_forces:
+            self.raw_data.set_loader(plane, loader)
+        if "forces.lspt" in files:
+            self.raw_data.set_loader(f"{plane}_LSPT", loader)
+        if plane_found and (has_gnvp_forces or "forces.lspt" in files):
+            self.data.set_loader(plane, loader)
+
+    def load_plane(self, plane: str) -> None:
+        """
+        Loads the plane object, the states, the convergence and the forces of a plane into
+        their structs. The plane is read into the structs of a new database first and its
+        entries are then set here, so other threads never see an entry that is half built.
+
+        Args:
+            plane (str): Plane folder name
+        """
+        manifest: dict[str, SourceStat] = self.get_plane_manifest(plane)
+        loaded = Database_3D()
+        loaded.DATADIR = self.DATADIR
+        loaded.use_cache = self.use_cache
+        try:
+            loaded.read_plane(plane)
+        finally:
+            # The entries read before an error are kept
+            structs: tuple[LazyStruct, ...] = (
+                self.planes,
+                self.states,
+                self.convergence_data,
+                self.raw_data,
+                self.data,
+            )
+            loaded_structs: tuple[LazyStruct, ...] = (
+                loaded.planes,
+                loaded.states,
+                loaded.convergence_data,
+                loaded.raw_data,
+                loaded.data,
+            )
+            for struct, loaded_struct in zip(structs, loaded_structs):
+                for key, value in loaded_struct.items():
+                    struct[key] = value
+                # The entries the plane does not have are dropped
+                struct.cancel_loader(plane)
+            self.raw_data.cancel_loader(f"{plane}_LSPT")
+        self.manifest[plane] = manifest
+
+    def get_plane_manifest(self, plane: str) -> dict[str, SourceStat]:
+        """
+        Returns the size and the modification time of the files of a plane and of its case folders.
+
+        Args:
+            plane (str): Plane folder name
+
+        Returns:
+            dict[str, SourceStat]: Stat of every file, by path relative to the plane folder
+        """
+        manifest: dict[str, SourceStat] = {}
+        with os.scandir(os.path.join(self.DATADIR, plane)) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    manifest[entry.name] = TableCache.source_stat(entry.path)
+                elif entry.is_dir():
+                    with os.scandir(entry.path) as case_entries:
+                        for case_entry in case_entries:
+                            if case_entry.is_file():
+                                name: str = os.path.join(entry.name, case_entry.name)
+                                manifest[name] = TableCache.source_stat(case_entry.path)
+        return manifest
+
+    def refresh(self, planes: list[str] | None = None) -> list[str]:
+        """
+        Picks up the results that were written, changed or removed since the planes were loaded,
+        for example by a solver run. New planes are indexed and planes that were not loaded yet
+        are indexed again, to be read on first access. For a loaded plane, the sizes and
+        modification times of its files and of the files of its case folders are compared with
+        the ones it was read with, and only what differs is read again: the plane object, the
+        forces and the coefficients computed from them, the states or the convergence of a case.
+
+        Args:
+            planes (list[str] | None, optional): Plane folder names to refresh. Defaults to all
+                the planes of the filesystem and of the database.
+
+        Returns:
+            list[str]: Planes that were added, changed or removed
+        """
+        structs: tuple[LazyStruct, ...] = (self.planes, self.states, self.convergence_data, self.raw_data, self.data)
+        if planes is None:
+            with os.scandir(self.DATADIR) as entries:
+                on_disk: list[str] = [e.name for e in entries if e.is_dir() and not e.name.startswith(".")]
+            indexed: list[str] = list(self.planes.keys()) + [key.removesuffix("_LSPT") for key in self.raw_data.keys()]
+            planes = list(dict.fromkeys(on_disk + indexed))
+
+        changed: list[str] = []
+        for plane in planes:
+            known: bool = any(plane in struct for struct in structs) or f"{plane}_LSPT" in self.raw_data
+            if not os.path.isdir(os.path.join(self.DATADIR, plane)):
+                if known:
+                    for struct in structs:
+                        if plane in struct:
+                            del struct[plane]
+                    if f"{plane}_LSPT" in self.raw_data:
+                        del self.raw_data[f"{plane}_LSPT"]
+                    self.manifest.pop(plane, None)
+                    changed.append(plane)
+                continue
+            if plane not in self.manifest:
+                self.index_plane(plane)
+                if not known:
+                    changed.append(plane)
+                continue
+
+            previous: dict[str, SourceStat] = self.manifest[plane]
+            manifest: dict[str, SourceStat] = self.get_plane_manifest(plane)
+            if manifest == previous:
+                continue
+            changed.append(plane)
+            differ: set[str] = {
+                name for name in manifest.keys() | previous.keys() if manifest.get(name) != previous.get(name)
+            }
+            files: set[str] = {name for name in differ if os.sep not in name}
+            cases: set[str] = {name.split(os.sep)[0] for name in differ if os.sep in name}
+
+            if f"{plane}.json" in files and plane not in self.planes:
+                # A new plane object, the whole plane is read
+                self.load_plane(plane)
+                continue
+            self.manifest[plane] = manifest
+
+            for case in sorted(cases):
+                if case.startswith("Dyn"):
+                    self.refresh_plane_states(plane)
+                elif not case.startswith("Sens"):
+                    self.refresh_case_convergence(plane, case)
+            # The coefficients depend on the plane object and on the states
+            if files & {f"{plane}.json", *FORCES_FILES} or any(case.startswith("Dyn") for case in cases):
+                self.refresh_plane_forces(plane, reload_plane=f"{plane}.json" in files)
+        return changed
+
+    def refresh_plane_states(self, plane: str) -> None:
+        """
+        Reads the states of a loaded plane again.
+
+        Args:
+            plane (str): Plane folder name
+        """
+        cases: list[str] = next(os.walk(os.path.join(self.DATADIR, plane)))[1]
+        dynamics: list[str] = [case for case in cases if case.startswith("Dyn")]
+        for case in dynamics:
+            self.states[plane] = self.load_plane_states(plane, case)
+        if not dynamics and plane in self.states:
+            del self.states[plane]
+
+    def refresh_case_convergence(self, plane: str, case: str) -> None:
+        """
+        Reads the convergence of a case of a loaded plane again.
+
+        Args:
+            plane (str): Plane folder name
+            case (str): Case folder name
+        """
+        if plane not in self.convergence_data:
+            return
+        case_dir: str = os.path.join(self.DATADIR, plane, case)
+        if not os.path.isdir(case_dir):
+            if case in self.convergence_data[plane].keys():
+                del self.convergence_data[plane][case]
+            return
+        case_files: list[str] = os.listdir(case_dir)
+        if "gnvp3" in case_files:
+            self.load_gnvp_case_convergence(plane, case, 3)
+        if "gnvp7" in case_files:
+            self.load_gnvp_case_convergence(plane, case, 7)
+
+    def refresh_plane_forces(self, plane: str, reload_plane: bool) -> None:
+        """
+        Reads the forces of a loaded plane again and computes its coefficients. Through the table
+        cache, only the forces files that changed are parsed.
+
+        Args:
+            plane (str): Plane folder name
+            reload_plane (bool): Whether to read the plane object again as well
+        """
+        loaded = Database_3D()
+        loaded.DATADIR = self.DATADIR
+        loaded.use_cache = self.use_cache
+        if reload_plane:
+            loaded.load_plane_from_file(plane, os.path.join(self.DATADIR, plane, f"{plane}.json"))
+        elif plane in self.planes:
+            loaded.planes[plane] = self.planes[plane]
+        if plane in self.states:
+            loaded.states[plane] = self.states[plane]
+        loaded.load_gnvp_forces(plane, os.path.join(self.DATADIR, plane, "forces.gnvp7"), genu_version=7)
+        loaded.load_gnvp_forces(plane, os.path.join(self.DATADIR, plane, "forces.gnvp3"), genu_version=3)
+        loaded.load_lspt_forces(plane, os.path.join(self.DATADIR, plane, "forces.lspt"))
+
+        for struct, loaded_struct, key in (
+            (self.planes, loaded.planes, plane),
+            (self.raw_data, loaded.raw_data, plane),
+            (self.raw_data, loaded.raw_data, f"{plane}_LSPT"),
+            (self.data, loaded.data, plane),
+        ):
+            if key in loaded_struct:
+                struct[key] = loaded_struct[key]
+            elif key in struct:
+                del struct[key]
+
+    def read_plane(self, plane: str) -> None:
+        """
+        Reads the plane object, the states, the convergence and the forces of a plane from the
+        filesystem into their structs. Only absolute paths are used, so planes can be read from
+        several threads.
+
+        Args:
+            plane (str): Plane folder name
+        """
+        # Load Plane object
+        file_plane: str = os.path.join(self.DATADIR, plane, f"{plane}.json")
+        plane_found: bool = self.load_plane_from_file(plane, file_plane)
+
+        if plane_found:
+            # Load Convergence Data
+            if plane not in self.convergence_data.keys():
+                self.convergence_data[plane] = Struct()
+            cases: list[str] = next(os.walk(os.path.join(self.DATADIR, plane)))[1]
+            for case in cases:
+                # Load States
+                if case.startswith("Dyn"):
+                    self.states[plane] = self.load_plane_states(plane, case)
+                    continue
+                if case.startswith("Sens"):
+                    continue
+                case_files: list[str] = os.listdir(os.path.join(self.DATADIR, plane, case))
+                if "gnvp3" in case_files:
+                    self.load_gnvp_case_convergence(plane, case, 3)
+                if "gnvp7" in case_files:
+                    self.load_gnvp_case_convergence(plane, case, 7)
+
+        # Loading Forces from forces.* files
+        file_gnvp_7: str = os.path.join(self.DATADIR, plane, "forces.gnvp7")
+        file_gnvp_3: str = os.path.join(self.DATADIR, plane, "forces.gnvp3")
+        file_lspt: str = os.path.join(self.DATADIR, plane, "forces.lspt")
+
+        self.load_gnvp_forces(plane, file_gnvp_7, genu_version=7)
+        self.load_gnvp_forces(plane, file_gnvp_3, genu_version=3)
+        self.load_lspt_forces(plane, file_lspt)
 
     def load_plane_states(self, plane: str, case: str) -> dict[str, Any]:
         """
@@ -83,10 +359,10 @@ class Database_3D:
             plane (str): Plane Name
             case (str): Case Directory
         """
-        dynamics_directory: str = os.path.join(DB3D, plane, case)
-        os.chdir(dynamics_directory)
-        files: list[str] = next(os.walk(dynamics_directory))[2]
+        dynamics_directory: str = os.path.join(self.DATADIR, plane, case)
         states: dict[str, Any] = {}
+        with os.scandir(dynamics_directory) as entries:
+            files: list[str] = [entry.path for entry in entries if entry.is_file()]
         for file in files:
             if file.endswith(".json"):
                 with open(file, encoding="UTF-8") as f:
@@ -101,7 +377,6 @@ class Database_3D:
                 except Exception as error:
                     # print(f"Error decoding states object {plane}! Got error {error}")
                     pass
-        os.chdir(self.HOMEDIR)
         return states
 
     def load_plane_from_file(self, name: str, file: str) -> bool:
@@ -142,7 +417,7 @@ class Database_3D:
             genu_version (int): GNVP Version
         """
         try:
-            self.raw_data[planename] = pd.read_csv(file)
+            self.raw_data[planename] = self.read_forces(planename, file)
             self.make_data_gnvp(planename, genu_version)
             return
         except FileNotFoundError:
@@ -168,6 +443,41 @@ class Database_3D:
             #     except Exception as e:
             #         print(f"Failed to create Polars! Got Error:\n{e}")
 
+    def read_forces(self, planename: str, file: str) -> DataFrame:
+        """
+        Reads a forces file of a plane. The forces files of the plane are kept together in the
+        table cache of the database, so only the files that changed since the last read are parsed.
+
+        Args:
+            planename (str): Planename
+            file (str): Filename Containing Forces
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+
+        Returns:
+            DataFrame: Forces
+        """
+        if not os.path.isfile(file):
+            raise FileNotFoundError(f"No forces file {file}")
+        if not self.use_cache:
+            return pd.read_csv(file)
+
+        folder: str = os.path.dirname(file)
+        sources: list[str] = [os.path.join(folder, name) for name in FORCES_FILES]
+        sources = [source for source in sources if os.path.isfile(source)]
+        if file not in sources:
+            sources.append(file)
+        forces: DataFrame | None = self.table_cache.read(planename, sources, pd.read_csv)[file]
+        if forces is None:
+            raise FileNotFoundError(f"No forces file {file}")
+        return forces
+
+    @property
+    def table_cache(self) -> TableCache:
+        """Cache of the parsed forces files, kept in the .cache folder of the database."""
+        return TableCache(os.path.join(self.DATADIR, ".cache"))
+
     def load_lspt_forces(self, planename: str, file: str) -> None:
         """
         Load Forces from forces file and store them in the raw_data dict.
@@ -177,7 +487,7 @@ class Database_3D:
             file (str): _description_
         """
         try:
-            self.raw_data[f"{planename}_LSPT"] = pd.read_csv(file)
+            self.raw_data[f"{planename}_LSPT"] = self.read_forces(planename, file)
             self.make_data_lspt(planename)
         except FileNotFoundError:
             # print(f"No forces.lspt file found in {planename} folder at {DB3D}!")
@@ -201,12 +511,12 @@ class Database_3D:
             genu_version (int): GNVP Version
         """
         # Get Load Convergence Data from LOADS_aer.dat
-        file: str = os.path.join(DB3D, planename, case, "LOADS_aer.dat")
+        file: str = os.path.join(self.DATADIR, planename, case, "LOADS_aer.dat")
 
         loads: DataFrame | None = get_loads_convergence_3(file)
         if loads is not None:
             # Get Error Convergence Data from gnvp.out
-            file = os.path.join(DB3D, planename, case, f"gnvp{genu_version}.out")
+            file = os.path.join(self.DATADIR, planename, case, f"gnvp{genu_version}.out")
             # self.Convergence[planename][case] = addErrorConvergence2df(file, loads) # IT OUTPUTS LOTS OF WARNINGS
             with open(file, encoding="UTF-8") as f:
                 lines: list[str] = f.readlines()
@@ -271,9 +581,10 @@ class Database_3D:
         Formats Polars from Forces, calculates the aerodynamic coefficients and stores them in the data dict.
         ! TODO: Should get deprecated in favor of analysis logic in the future. Handled by the unhook function.
         """
-        pln: Airplane = self.planes[plane]
-        if plane not in self.raw_data.keys():
+        # The coefficients need the plane object
+        if plane not in self.planes.keys() or plane not in self.raw_data.keys():
             return None
+        pln: Airplane = self.planes[plane]
         AoA: np.ndarray[Any, np.dtype[floating[Any]]] = self.raw_data[plane]["AoA"] * np.pi / 180
 
         for enc, name in zip(["", "2D", "DS2D"], ["Potential", "2D", "ONERA"]):
@@ -350,9 +661,10 @@ class Database_3D:
         Formats Polars from Forces, calculates the aerodynamic coefficients and stores them in the data dict.
         """
 
-        pln: Airplane = self.planes[plane]
-        if f"{plane}_LSPT" not in self.raw_data.keys():
+        # The coefficients need the plane object
+        if plane not in self.planes.keys() or f"{plane}_LSPT" not in self.raw_data.keys():
             return None
+        pln: Airplane = self.planes[plane]
 
         for enc, name in zip(["", "_2D"], ["Potential", "2D"]):
             AoA: np.ndarray[Any, np.dtype[floating[Any]]] = self.raw_data[f"{plane}_LSPT"]["AoA"] * np.pi / 180
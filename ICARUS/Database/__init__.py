@@ -10,6 +10,7 @@ ICARUS Database package
     ICARUS.Database.Database_2D
     ICARUS.Database.Database_3D
     ICARUS.Database.AnalysesDB
+    ICARUS.Database.table_cache
     ICARUS.Database.utils
 
 .. module:: ICARUS.Database
@@ -29,6 +30,7 @@ The package is divided in the following files:
     ICARUS.Database.Database_2D
     ICARUS.Database.Database_3D
     ICARUS.Database.AnalysesDB
+    ICARUS.Database.table_cache
     ICARUS.Database.utils
 
 """
@@ -65,6 +67,7 @@ __all__ = ["Database_2D", "Database_3D", "AnalysesDB", "db"]
 
 from .db import Database
 
+# Only the names of the entries are indexed at import. Call DB.preload() to load everything at once.
 cwd = os.getcwd()
 DB = Database()
 DB.load_data()
@@ -14,10 +14,20 @@ class Database:
         self.analyses_db: AnalysesDB = AnalysesDB()
 
     def load_data(self) -> None:
-        """Loads all the data from the databases"""
+        """Indexes the databases. Their entries are loaded from the filesystem on first access."""
         self.foils_db.load_data()
         self.vehicles_db.load_data()
 
+    def preload(self) -> None:
+        """Loads all the data from the databases at once"""
+        self.foils_db.preload()
+        self.vehicles_db.preload()
+
+    def refresh(self) -> None:
+        """Picks up the results written or changed since the databases were loaded, reading only those."""
+        self.foils_db.refresh()
+        self.vehicles_db.refresh()
+
     def __str__(self) -> str:
         return "Master Database"
 
@@ -0,0 +1,171 @@
+"""
+Persistent cache of the tables parsed from the text files of the database. Every entry is
+an .npz file named after its key (an airfoil or a plane) that holds the columns of the
+tables of all its source files, with the size and modification time of every source. A
+source whose size or modification time changed is parsed again and the entry is rewritten,
+while the tables of the other sources are read from the entry. Tables with columns that are
+not numeric are not stored: their sources are recorded in the entry and parsed on every read.
+Reading one .npz file is much cheaper than parsing the many small text files of an airfoil or
+a plane with pandas.
+"""
+import os
+import tempfile
+import zipfile
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from ICARUS.Core.types import FloatArray
+
+# Size and modification time in nanoseconds of a source file
+SourceStat = tuple[int, int]
+# Stat and table of a source and whether the table is stored in the entry
+CachedTable = tuple[SourceStat, DataFrame | None, bool]
+
+
+class TableCache:
+    """
+    On disk cache of parsed tables.
+
+    Args:
+        directory (str): Directory of the cache. It is created when the first entry is stored.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory: str = directory
+
+    def entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.npz")
+
+    def read(
+        self,
+        key: str,
+        sources: list[str],
+        parse: Callable[[str], DataFrame | None],
+    ) -> dict[str, DataFrame | None]:
+        """
+        Returns the tables of the sources of an entry. Sources that are not in the entry or that
+        changed since it was stored are parsed, and the entry is stored again if any was. Sources
+        whose table is not stored are parsed without storing the entry again.
+
+        Args:
+            key (str): Key of the entry
+            sources (list[str]): Paths of the source files
+            parse (Callable[[str], DataFrame | None]): Parser of a source file. None means the
+                source holds no table, which is cached as well.
+
+        Returns:
+            dict[str, DataFrame | None]: Table of every source
+        """
+        stats: dict[str, SourceStat] = {source: self.source_stat(source) for source in sources}
+        cached: dict[str, CachedTable] = self.load(key)
+
+        tables: dict[str, DataFrame | None] = {}
+        changed: bool = len(cached) != len(sources)
+        for source in sources:
+            entry: CachedTable | None = cached.get(self._relative(source))
+            if entry is None or entry[0] != stats[source]:
+                tables[source] = parse(source)
+                changed = True
+            elif entry[2]:
+                tables[source] = entry[1]
+            else:
+                tables[source] = parse(source)
+        if changed:
+            self.save(key, {source: (stats[source], table) for source, table in tables.items()})
+        return tables
+
+    def load(self, key: str) -> dict[str, CachedTable]:
+        """
+        Loads an entry.
+
+        Args:
+            key (str): Key of the entry
+
+        Returns:
+            dict[str, CachedTable]: Stat, table and whether the table is stored for every source, by
+            path relative to the cache directory. Empty if the entry does not exist or is unreadable.
+        """
+        try:
+            with np.load(self.entry_path(key), allow_pickle=False) as entry:
+                cached: dict[str, CachedTable] = {}
+                for i, (source, (size, mtime), present, stored) in enumerate(
+                    zip(entry["sources"], entry["stats"], entry["present"], entry["stored"]),
+                ):
+                    table: DataFrame | None = None
+                    if present and stored:
+                        columns: list[str] = entry[f"columns_{i}"].tolist()
+                        if f"table_{i}" in entry.files:
+                            table = pd.DataFrame(entry[f"table_{i}"], columns=columns)
+                        else:
+                            table = pd.DataFrame({column: entry[f"table_{i}_{j}"] for j, column in enumerate(columns)})
+                    cached[str(source)] = ((int(size), int(mtime)), table, bool(stored))
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            return {}
+        return cached
+
+    def save(self, key: str, tables: dict[str, tuple[SourceStat, DataFrame | None]]) -> None:
+        """
+        Stores an entry. A table whose columns share a dtype is stored as one array and any
+        other as one array per column. Tables with columns that are not numeric are not stored,
+        only the stat of their source. The entry is written to a temporary file and renamed, so
+        that a reader never sees a partial entry.
+
+        Args:
+            key (str): Key of the entry
+            tables (dict[str, tuple[SourceStat, DataFrame | None]]): Stat and table of every source
+        """
+        arrays: dict[str, FloatArray] = {}
+        sources: list[str] = []
+        stats: list[SourceStat] = []
+        present: list[bool] = []
+        stored: list[bool] = []
+        for i, (source, (stat, table)) in enumerate(tables.items()):
+            sources.append(self._relative(source))
+            stats.append(stat)
+            present.append(table is not None)
+            stored.append(table is None or all(dtype.kind in "biuf" for dtype in table.dtypes))
+            if table is not None and stored[-1]:
+                arrays[f"columns_{i}"] = np.array([str(column) for column in table.columns])
+                if table.dtypes.nunique() == 1:
+                    arrays[f"table_{i}"] = table.to_numpy()
+                else:
+                    for j, column in enumerate(table.columns):
+                        arrays[f"table_{i}_{j}"] = table[column].to_numpy()
+
+        os.makedirs(self.directory, exist_ok=True)
+        descriptor, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp_", suffix=".npz")
+        try:
+            with os.fdopen(descriptor, "wb") as f:
+                np.savez(
+                    f,
+                    sources=np.array(sources, dtype=str),
+                    stats=np.array(stats, dtype=np.int64).reshape(-1, 2),
+                    present=np.array(present, dtype=bool),
+                    stored=np.array(stored, dtype=bool),
+                    **arrays,
+                )
+            os.replace(tmp_path, self.entry_path(key))
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def clear(self) -> None:
+        """Removes every entry."""
+        if not os.path.isdir(self.directory):
+            return
+        for name in os.listdir(self.directory):
+            if name.endswith(".npz"):
+                os.remove(os.path.join(self.directory, name))
+
+    @staticmethod
+    def source_stat(source: str) -> SourceStat:
+        """Returns the size and the modification time in nanoseconds of a source file."""
+        stat: os.stat_result = os.stat(source)
+        return stat.st_size, stat.st_mtime_ns
+
+    def _relative(self, source: str) -> str:
+        """Path of a source relative to the cache directory, so that a moved database keeps its cache."""
+        return os.path.relpath(source, self.directory)
@@ -358,33 +358,9 @@ class Wing_Segment:
         Returns:
             tuple[FloatArray, FloatArray, FloatArray]: Panels, Control Points, Control Normal Vectors
         """
-        panels: FloatArray = np.empty((self.N - 1, self.M - 1, 4, 3), dtype=float)
-        control_points: FloatArray = np.empty((self.N - 1, self.M - 1, 3), dtype=float)
-        control_nj: FloatArray = np.empty((self.N - 1, self.M - 1, 3), dtype=float)
-        for i in np.arange(0, self.N - 1):
-            for j in np.arange(0, self.M - 1):
-                panels[i, j, 0, :] = grid[i + 1, j]
-                panels[i, j, 1, :] = grid[i, j]
-                panels[i, j, 2, :] = grid[i, j + 1]
-                panels[i, j, 3, :] = grid[i + 1, j + 1]
-
-                control_points[i, j, 0] = (self.grid[i, j][0] + self.grid[i + 1, j][0]) / 2 + 3 / 4 * (
-                    (self.grid[i, j + 1][0] + self.grid[i + 1, j + 1][0]) / 2
-                    - (self.grid[i, j][0] + self.grid[i + 1, j][0]) / 2
-                )
-                control_points[i, j, 1] = (self.grid[i, j][1] + self.grid[i + 1, j][1]) / 2 + 1 / 2 * (
-                    (self.grid[i, j + 1][1] + self.grid[i + 1, j + 1][1]) / 2
-                    - (self.grid[i, j][1] + self.grid[i + 1, j][1]) / 2
-                )
-                control_points[i, j, 2] = (self.grid[i, j][2] + self.grid[i + 1, j][2]) / 2 + 1 / 2 * (
-                    (self.grid[i, j + 1][2] + self.grid[i + 1, j + 1][2]) / 2
-                    - (self.grid[i, j][2] + self.grid[i + 1, j][2]) / 2
-                )
-                Ak = panels[i, j, 0, :] - panels[i, j, 2, :]
-                Bk = panels[i, j, 1, :] - panels[i, j, 3, :]
-                cross_prod = np.cross(Ak, Bk)
-                control_nj[i, j, :] = cross_prod / np.linalg.norm(cross_prod)
-        return panels, control_points, control_nj
+        # The control points of the upper and lower surfaces are those of the camber line,
+        # at 3/4 of the chord in x and at mid chord in y and z
+        return build_panels(grid, self.grid, np.array([3 / 4, 1 / 2, 1 / 2]))
 
     def create_grid(self) -> None:
         """Create Grid for Wing"""
@@ -721,6 +697,41 @@ class Wing_Segment:
         return f"Wing Segment: {self.name} with {self.N} Panels and {self.M} Panels"
 
 
+def build_panels(
+    grid: FloatArray,
+    control_grid: FloatArray | None = None,
+    control_fraction: FloatArray | float = 3 / 4,
+) -> tuple[FloatArray, FloatArray, FloatArray]:
+    """
+    Builds the quadrilateral panels of a grid with whole array operations. Panel (i, j) has the
+    corners grid[i + 1, j], grid[i, j], grid[i, j + 1] and grid[i + 1, j + 1]. Its control point
+    lies at control_fraction of the way from the middle of its leading edge to the middle of its
+    trailing edge and its normal is the unit cross product of its diagonals.
+
+    Args:
+        grid (FloatArray): (N, M, 3) grid of spanwise stations by chordwise points
+        control_grid (FloatArray | None, optional): Grid shaped like grid that the control points are
+            placed on. Defaults to grid.
+        control_fraction (FloatArray | float, optional): Chordwise position of the control points, for
+            all coordinates or (3,) one per coordinate. Defaults to 3/4.
+
+    Returns:
+        tuple[FloatArray, FloatArray, FloatArray]: (N - 1, M - 1, 4, 3) panels, (N - 1, M - 1, 3) control
+        points and (N - 1, M - 1, 3) unit normals
+    """
+    panels: FloatArray = np.stack((grid[1:, :-1], grid[:-1, :-1], grid[:-1, 1:], grid[1:, 1:]), axis=2)
+
+    if control_grid is None:
+        control_grid = grid
+    leading_edge: FloatArray = (control_grid[:-1, :-1] + control_grid[1:, :-1]) / 2
+    trailing_edge: FloatArray = (control_grid[:-1, 1:] + control_grid[1:, 1:]) / 2
+    control_points: FloatArray = leading_edge + control_fraction * (trailing_edge - leading_edge)
+
+    normals: FloatArray = np.cross(panels[:, :, 0] - panels[:, :, 2], panels[:, :, 1] - panels[:, :, 3])
+    control_nj: FloatArray = normals / np.linalg.norm(normals, axis=-1, keepdims=True)
+    return panels, control_points, control_nj
+
+
 def define_linear_span(
     sp: float,
     Ni: int,
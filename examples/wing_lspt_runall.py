@@ -89,7 +89,7 @@ def main() -> None:
         options.u_freestream.value = UINF[airplane.name]
         options.angles.value = angles
 
-        solver_parameters.Ground_Effect.value = True
+        solver_parameters.Ground_Effect.value = None
         solver_parameters.Wake_Geom_Type.value = "TE-Geometrical"
 
         lspt.print_analysis_options()
@@ -7,11 +7,36 @@ from pandas import Series
 import testing.wing_test as wing_test
 from ICARUS.Core.types import FloatArray
 from testing.airplane_polars_test import airplane_polars
+from testing.backends_test import kernel_backends
+from testing.database_test import concurrent_database_scans
+from testing.database_test import database_table_cache
+from testing.database_test import incremental_refresh
+from testing.database_test import lazy_database
 from testing.gnvp3_run_test import gnvp3_run
 from testing.gnvp7_run_test import gnvp7_run
+from testing.linear_solvers_test import lspt_linear_solvers
+from testing.lspt_cache_test import lspt_matrix_cache
+from testing.lspt_field_test import lspt_field
+from testing.lspt_ground_test import lspt_ground_effect
+from testing.lspt_incremental_test import lspt_incremental_solve
+from testing.lspt_loads_test import lspt_panel_loads
+from testing.lspt_memory_test import lspt_lean_memory
+from testing.lspt_parallel_test import lspt_parallel_assembly
 from testing.lspt_run_test import lspt_run
+from testing.lspt_sensitivities_test import lspt_sensitivities
+from testing.lspt_sweep_test import lspt_sweep
+from testing.lspt_symmetry_test import lspt_symmetry
+from testing.lspt_unsteady_test import lspt_unsteady
+from testing.lspt_variants_test import lspt_variants
+from testing.panels_test import panel_construction
+from testing.polars_interpolation_test import lspt_strip_polars
+from testing.polars_interpolation_test import polar_interpolator
+from testing.polars_interpolation_test import polars_interpolation
 from testing.solver_geom_test import gnvp3_geometry
 from testing.solver_geom_test import gnvp7_geometry
+from testing.treecode_test import lspt_matrix_free
+from testing.treecode_test import treecode_velocities
+from testing.vorticity_test import batched_vorticity
 
 
 class BaseAirplaneTests(unittest.TestCase):
@@ -52,6 +77,131 @@ class BaseAirplaneTests(unittest.TestCase):
     # def test7_lspt_run(self) -> None:
     #     lspt_run()
 
+    def test_batched_vorticity(self) -> None:
+        for name, (desired, actual) in batched_vorticity().items():
+            np.testing.assert_almost_equal(actual, desired, decimal=12, err_msg=name)
+
+    def test_panel_construction(self) -> None:
+        for name, (desired, actual) in panel_construction().items():
+            np.testing.assert_allclose(actual, desired, rtol=1e-14, atol=1e-14, err_msg=name)
+
+    def test_lspt_symmetry(self) -> None:
+        for name, (desired, actual) in lspt_symmetry().items():
+            np.testing.assert_almost_equal(actual.to_numpy(), desired.to_numpy(), decimal=10, err_msg=name)
+
+    def test_lspt_ground_effect(self) -> None:
+        results = lspt_ground_effect()
+        # A far away ground leaves the free air solution unchanged
+        np.testing.assert_almost_equal(results[1e6], results[None], decimal=8)
+        # Closer to the ground the lift increases and the induced drag factor decreases
+        heights: list[float] = [2.0, 0.5, 0.2]
+        CLs, CDs = np.array([results[None]] + [results[h] for h in heights]).T
+        self.assertTrue(np.all(np.diff(CLs) > 0))
+        self.assertTrue(np.all(np.diff(CDs / CLs**2) < 0))
+
+    def test_treecode(self) -> None:
+        for theta, (desired, actual) in treecode_velocities().items():
+            error = np.linalg.norm(actual - desired) / np.linalg.norm(desired)
+            self.assertLess(error, theta**2 / 10, msg=f"theta {theta}")
+
+        for name, (desired, actual) in lspt_matrix_free().items():
+            error = np.max(np.abs(actual - desired)) / np.max(np.abs(desired))
+            self.assertLess(error, 1e-3, msg=name)
+
+    def test_lspt_matrix_cache(self) -> None:
+        results = lspt_matrix_cache()
+        gammas, loaded, entries = results["first run"]
+        self.assertFalse(loaded)
+        self.assertEqual(entries, 1)
+        # A new wing with the same geometry loads the stored factorization
+        gammas_cached, loaded, entries = results["second run"]
+        self.assertTrue(loaded)
+        self.assertEqual(entries, 1)
+        np.testing.assert_array_equal(gammas_cached, gammas)
+        # A new geometry gets its own entry
+        _, loaded, entries = results["new geometry"]
+        self.assertFalse(loaded)
+        self.assertEqual(entries, 2)
+        self.assertEqual(results["evicted"], 1)
+        self.assertTrue(results["reshaped grid"])
+        self.assertEqual(results["inflow wake entries"], 0)
+
+    def test_lspt_panel_loads(self) -> None:
+        for name, (desired, actual) in lspt_panel_loads().items():
+            np.testing.assert_allclose(actual, desired, rtol=1e-12, atol=1e-12, err_msg=name)
+
+    def test_lspt_strip_polars(self) -> None:
+        results = {**polars_interpolation(), **polar_interpolator(), **lspt_strip_polars()}
+        for name, (desired, actual) in results.items():
+            np.testing.assert_allclose(actual, desired, rtol=1e-12, atol=1e-12, err_msg=name)
+
+    def test_lspt_incremental_solve(self) -> None:
+        for name, (desired, actual) in lspt_incremental_solve().items():
+            np.testing.assert_allclose(actual, desired, rtol=1e-10, atol=1e-10, err_msg=name)
+
+    def test_lspt_variants(self) -> None:
+        for name, (desired, actual) in lspt_variants().items():
+            np.testing.assert_allclose(actual, desired, rtol=1e-10, atol=1e-10, err_msg=name)
+
+    def test_lspt_parallel_assembly(self) -> None:
+        for name, (desired, actual) in lspt_parallel_assembly().items():
+            np.testing.assert_array_equal(actual, desired, err_msg=name)
+
+    def test_lspt_sensitivities(self) -> None:
+        for name, (desired, actual) in lspt_sensitivities().items():
+            np.testing.assert_allclose(actual, desired, rtol=1e-5, atol=1e-6, err_msg=name)
+
+    def test_lspt_sweep(self) -> None:
+        for name, (desired, actual) in lspt_sweep().items():
+            np.testing.assert_allclose(actual, desired, rtol=1e-10, atol=1e-9, err_msg=name)
+
+    def test_lspt_field(self) -> None:
+        for name, (desired, actual) in lspt_field().items():
+            np.testing.assert_allclose(actual, desired, rtol=1e-10, atol=1e-12, err_msg=name)
+
+    def test_lspt_unsteady(self) -> None:
+        for name, (desired, actual, rtol) in lspt_unsteady().items():
+            np.testing.assert_allclose(actual, desired, rtol=rtol, err_msg=name)
+
+    def test_lspt_lean_memory(self) -> None:
+        results, (peak_regular, peak_lean) = lspt_lean_memory()
+        for name, (desired, actual) in results.items():
+            np.testing.assert_allclose(actual, desired, rtol=1e-5, atol=1e-7, err_msg=name)
+        self.assertLess(peak_lean, peak_regular)
+
+    def test_lspt_linear_solvers(self) -> None:
+        results = lspt_linear_solvers()
+        CL_direct, _ = results["direct"]
+        for name, (CL, iterations) in results.items():
+            decimal: int = 3 if name == "treecode" else 8
+            np.testing.assert_almost_equal(CL, CL_direct, decimal=decimal, err_msg=name)
+            if name != "direct":
+                # The later angles start from a combination of the previous solutions
+                self.assertLess(iterations[-1], iterations[0], msg=name)
+
+    def test_kernel_backends(self) -> None:
+        for name, (desired, actual) in kernel_backends().items():
+            np.testing.assert_allclose(actual, desired, rtol=1e-10, atol=1e-12, err_msg=name)
+
+    def _assert_database_results(self, results: dict[str, tuple[FloatArray, FloatArray]]) -> None:
+        for name, (desired, actual) in results.items():
+            if desired.dtype.kind in "US":
+                np.testing.assert_array_equal(actual, desired, err_msg=name)
+            else:
+                np.testing.assert_allclose(actual, desired, rtol=1e-12, atol=1e-12, err_msg=name)
+
+    def test_incremental_refresh(self) -> None:
+        self._assert_database_results(incremental_refresh())
+
+    def test_lazy_database(self) -> None:
+        self._assert_database_results(lazy_database())
+
+    def test_concurrent_database_scans(self) -> None:
+        self._assert_database_results(concurrent_database_scans())
+
+    def test_database_table_cache(self) -> None:
+        self._assert_database_results(database_table_cache())
+
     def test_3d_polars(self) -> None:
         des, acts = airplane_polars(plot=True)
         solvers = ["GNVP3 2D", "GNVP7 2D", "LSPT 2D"]
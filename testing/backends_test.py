@@ -0,0 +1,90 @@
+from typing import Callable
+
+import numpy as np
+
+from ICARUS.Aerodynamics.Potential import backends
+from ICARUS.Aerodynamics.Potential.assembly import ground_image
+from ICARUS.Aerodynamics.Potential.assembly import induced_velocities
+from ICARUS.Aerodynamics.Potential.assembly import influence_matrices
+from ICARUS.Aerodynamics.Potential.assembly import ring_images
+from ICARUS.Aerodynamics.Potential.vorticity import symm_wing_panels
+from ICARUS.Aerodynamics.Potential.vorticity import symm_wing_panels_batch
+from ICARUS.Aerodynamics.Potential.vorticity import voring_batch
+from ICARUS.Aerodynamics.Potential.vorticity import vortexL_batch
+from ICARUS.Aerodynamics.Potential.wing_lspt import Wing_LSPT
+from ICARUS.Core.types import FloatArray
+from ICARUS.Environment.definition import EARTH_ISA
+from testing.lspt_assembly_benchmark import get_mesh_plane
+
+
+def kernel_backends() -> dict[str, tuple[FloatArray, FloatArray]]:
+    """
+    Compares the kernels of the numba backend with the numpy backend on a small random grid,
+    for the vortex lines, the influence matrices and the field of lattices of rings in free air
+    and in ground effect. Some of the evaluation points lie on the grid to exercise the cutoff.
+    Without numba the kernels run as plain Python. With numba an angle sequence and the velocity
+    field of the benchmark wing are also solved with every backend.
+
+    Returns:
+        dict[str, tuple[FloatArray, FloatArray]]: Numpy and compiled backend results
+    """
+    print("Testing Kernel Backends...")
+    rng = np.random.default_rng(7)
+    grid: FloatArray = rng.normal(size=(5, 6, 3))
+    points: FloatArray = np.vstack((rng.normal(size=(6, 3)), grid[2, 3], (grid[1, 1] + grid[2, 1]) / 2))
+    normals: FloatArray = rng.normal(size=points.shape)
+    normals /= np.linalg.norm(normals, axis=1, keepdims=True)
+    gammas: FloatArray = rng.normal(size=((grid.shape[0] - 1) * (grid.shape[1] - 1), 2))
+
+    results: dict[str, tuple[FloatArray, FloatArray]] = {}
+    x1: FloatArray = rng.normal(size=(9, 3))
+    x2: FloatArray = rng.normal(size=(9, 3))
+    line_gammas: FloatArray = rng.normal(size=9)
+    results["vortex lines"] = (
+        vortexL_batch(points, x1, x2, line_gammas),
+        backends.vortex_lines(points, x1, x2, line_gammas),
+    )
+
+    elements: list[Callable[..., tuple[FloatArray, FloatArray]]] = [voring_batch, symm_wing_panels_batch]
+    for element in elements:
+        free_images: FloatArray | None = ring_images(element)
+        if free_images is None:
+            raise ValueError(f"No ring kernel for {element.__name__}")
+        for ground in [None, 0.7]:
+            name: str = f"{element.__name__} {'free air' if ground is None else 'ground'}"
+            image = element if ground is None else ground_image(element, ground)
+            images: FloatArray | None = ring_images(image)
+            if images is None:
+                raise ValueError(f"No ring kernel for {name}")
+
+            a, b = influence_matrices(points, normals, grid, image, chunk_size=50)
+            a_kernel, b_kernel = backends.ring_influences(points, normals, grid, images)
+            results[f"{name} influences"] = (np.hstack((a, b)), np.hstack((a_kernel, b_kernel)))
+
+            if ground is not None:
+                images = np.concatenate((free_images, images))
+            U, Ustar = induced_velocities(points, grid, element, gammas, ground, chunk_size=50)
+            U_kernel, Ustar_kernel = backends.ring_field(points, grid, images, gammas)
+            results[f"{name} field"] = (np.hstack((U, Ustar)), np.hstack((U_kernel, Ustar_kernel)))
+
+    if not backends.HAS_NUMBA:
+        return results
+
+    angles: list[float] = [-2.0, 4.0]
+    wake_points: FloatArray = rng.uniform([0.5, 0.0, -0.3], [2.0, 1.0, 0.3], (40, 3))
+    outputs: dict[str, list[FloatArray]] = {}
+    try:
+        for backend in backends.KERNEL_BACKENDS:
+            backends.set_backend(backend)
+            wing = Wing_LSPT(get_mesh_plane(15, 5), EARTH_ISA, alpha=0, ground_clearence=0.5)
+            df = wing.aseq(angles, 20.0, symm_wing_panels, verbose=False)
+            Qs: FloatArray = 20.0 * np.array([[np.cos(a), 0.0, np.sin(a)] for a in np.deg2rad(angles)])
+            wing_gammas, _ = wing.solve_gamma_distributions(Qs, symm_wing_panels)
+            outputs[backend] = [df[["CL", "CD", "Cm"]].to_numpy(), wing.induced_velocities(wake_points, wing_gammas)[0]]
+    finally:
+        backends.set_backend("numpy")
+
+    for backend in backends.KERNEL_BACKENDS[1:]:
+        results[f"{backend} loads"] = (outputs["numpy"][0], outputs[backend][0])
+        results[f"{backend} wing field"] = (outputs["numpy"][1], outputs[backend][1])
+    return results
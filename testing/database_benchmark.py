@@ -0,0 +1,126 @@
+"""
+Benchmark of the database startup. Writes synthetic databases of growing size and
+times indexing them, as done at import, against loading them whole with preload,
+parsing every text file in one thread and in a pool of threads, filling the table
+cache and reading from the warm cache.
+Then times the first access of one airfoil and one plane of the indexed database
+and the import of ICARUS in a fresh interpreter. Finally times picking up one new
+polar with refresh against loading the whole database again.
+
+Run as a script:
+
+    python -m testing.database_benchmark
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from ICARUS.Database.Database_2D import Database_2D
+from ICARUS.Database.Database_3D import Database_3D
+from testing.database_test import make_synthetic_database
+from testing.database_test import rewrite_table
+
+
+def database_startup_benchmark(sizes: list[tuple[int, int]] = [(50, 5), (200, 20), (800, 40)]) -> dict[str, float]:
+    """
+    Runs the startup benchmark.
+
+    Args:
+        sizes (list[tuple[int, int]], optional): Numbers of airfoils and planes of the synthetic databases.
+
+    Returns:
+        dict[str, float]: Time in seconds of each step
+    """
+    results: dict[str, float] = {}
+    for n_airfoils, n_planes in sizes:
+        with tempfile.TemporaryDirectory() as root:
+            db2d, db3d = make_synthetic_database(root, n_airfoils, n_planes)
+            times: dict[str, float] = {}
+            for step in ["index", "serial", "preload", "cold cache", "warm cache"]:
+                foils_db = Database_2D()
+                foils_db.DATADIR = db2d
+                foils_db.use_cache = "cache" in step
+                vehicles_db = Database_3D()
+                vehicles_db.DATADIR = db3d
+                vehicles_db.use_cache = "cache" in step
+                start_time: float = time.perf_counter()
+                if step == "index":
+                    foils_db.load_data()
+                    vehicles_db.load_data()
+                else:
+                    max_workers: int | None = 1 if step == "serial" else None
+                    foils_db.preload(max_workers)
+                    vehicles_db.preload(max_workers)
+                times[step] = time.perf_counter() - start_time
+
+            foils_db.load_data()
+            vehicles_db.load_data()
+            start_time = time.perf_counter()
+            foils_db.get_polars(next(iter(foils_db.data.keys())), "Xfoil")
+            vehicles_db.data[next(iter(vehicles_db.planes.keys()))]
+            times["first access"] = time.perf_counter() - start_time
+
+        for name, value in times.items():
+            results[f"{n_airfoils}x{n_planes} {name}"] = value
+        print(
+            f"{n_airfoils:>4} airfoils {n_planes:>3} planes | index {1e3 * times['index']:9.2f} ms | "
+            f"serial {1e3 * times['serial']:9.2f} ms | "
+            f"preload {1e3 * times['preload']:9.2f} ms | cold cache {1e3 * times['cold cache']:9.2f} ms | "
+            f"warm cache {1e3 * times['warm cache']:9.2f} ms | first access {1e3 * times['first access']:7.2f} ms",
+        )
+
+    start_time = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "import ICARUS"], check=True)
+    results["import ICARUS"] = time.perf_counter() - start_time
+    print(f"import ICARUS: {results['import ICARUS']:.2f} s")
+    return results
+
+
+def database_refresh_benchmark(sizes: list[int] = [50, 200, 800]) -> dict[str, float]:
+    """
+    Runs the refresh benchmark. A synthetic database is loaded whole, a polar of a new
+    Reynolds number is written for one airfoil and it is picked up with refresh of every
+    airfoil, with refresh of that airfoil and with preload.
+
+    Args:
+        sizes (list[int], optional): Numbers of airfoils of the synthetic databases.
+
+    Returns:
+        dict[str, float]: Time in seconds of each step
+    """
+    results: dict[str, float] = {}
+    for n_airfoils in sizes:
+        with tempfile.TemporaryDirectory() as root:
+            db2d, _ = make_synthetic_database(root, n_airfoils, 0)
+            foils_db = Database_2D()
+            foils_db.DATADIR = db2d
+            foils_db.preload()
+
+            times: dict[str, float] = {}
+            for step, airfoils in [("refresh all", None), ("refresh one", ["NACA0000"]), ("preload", None)]:
+                reynolds_dir: str = os.path.join(db2d, "NACA0000", f"Reynolds_{len(times) + 4}.000e05")
+                os.makedirs(reynolds_dir)
+                shutil.copy(os.path.join(db2d, "NACA0000", "Reynolds_3.000e05", "clcd.xfoil"), reynolds_dir)
+                rewrite_table(os.path.join(reynolds_dir, "clcd.xfoil"), "CL", 1.05)
+                start_time: float = time.perf_counter()
+                if step == "preload":
+                    foils_db.preload()
+                else:
+                    foils_db.refresh(airfoils)
+                times[step] = time.perf_counter() - start_time
+
+        for name, value in times.items():
+            results[f"{n_airfoils} {name}"] = value
+        print(
+            f"{n_airfoils:>4} airfoils | refresh all {1e3 * times['refresh all']:8.2f} ms | "
+            f"refresh one {1e3 * times['refresh one']:8.2f} ms | preload {1e3 * times['preload']:9.2f} ms",
+        )
+    return results
+
+
+if __name__ == "__main__":
+    database_startup_benchmark()
+    database_refresh_benchmark()
@@ -0,0 +1,459 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from ICARUS.Core.struct import Struct
+from ICARUS.Core.types import FloatArray
+from ICARUS.Database.Database_2D import Database_2D
+from ICARUS.Database.Database_3D import Database_3D
+from ICARUS.Database.table_cache import TableCache
+from testing.lspt_assembly_benchmark import get_mesh_plane
+
+
+def database_contents(foils_db: Database_2D, vehicles_db: Database_3D) -> dict[str, FloatArray]:
+    """
+    Loads every entry of a 2D and a 3D database and flattens them to arrays.
+
+    Args:
+        foils_db (Database_2D): 2D Database
+        vehicles_db (Database_3D): 3D Database
+
+    Returns:
+        dict[str, FloatArray]: Arrays by entry
+    """
+    contents: dict[str, FloatArray] = {
+        "airfoils": np.array(sorted(foils_db.data.keys())),
+        "planes": np.array(sorted(vehicles_db.planes.keys())),
+    }
+    for airfoil in sorted(foils_db.data.keys()):
+        for solver, polars in foils_db.data[airfoil].items():
+            for reynolds, polar in polars.items():
+                contents[f"{airfoil} {solver} {reynolds}"] = polar.to_numpy()
+            contents[f"{airfoil} {solver} polars"] = foils_db.polars[airfoil][solver].coefficient_grid
+        contents[f"{airfoil} coordinates"] = foils_db.airfoils[airfoil].selig
+    for plane in sorted(vehicles_db.planes.keys()):
+        contents[f"{plane} span"] = np.array([vehicles_db.planes[plane].span])
+        contents[f"{plane} data"] = vehicles_db.data[plane].to_numpy()
+    for key in sorted(vehicles_db.raw_data.keys()):
+        contents[f"{key} forces"] = vehicles_db.raw_data[key].to_numpy()
+    return contents
+
+
+def make_synthetic_database(root: str, n_airfoils: int, n_planes: int, n_reynolds: int = 3) -> tuple[str, str]:
+    """
+    Writes a database of synthetic Xfoil polars and of planes with LSPT forces under root.
+
+    Args:
+        root (str): Directory of the database
+        n_airfoils (int): Number of airfoils
+        n_planes (int): Number of planes
+        n_reynolds (int, optional): Number of Reynolds numbers per airfoil. Defaults to 3.
+
+    Returns:
+        tuple[str, str]: Directories of the 2D and the 3D databases
+    """
+    db2d: str = os.path.join(root, "2D")
+    db3d: str = os.path.join(root, "3D")
+    aoa: FloatArray = np.arange(-8.0, 14.5, 0.5)
+    for i in range(n_airfoils):
+        for j in range(n_reynolds):
+            reynolds: str = np.format_float_scientific(1e5 * (j + 1), sign=False, precision=3, min_digits=3)
+            folder: str = os.path.join(db2d, f"NACA{i:04d}", f"Reynolds_{reynolds.replace('+', '')}")
+            os.makedirs(folder)
+            scale: float = 1 + 0.1 * j + 0.01 * i
+            pd.DataFrame(
+                {"AoA": aoa, "CL": 0.11 * scale * aoa, "CD": 0.01 / scale + 0.0004 * aoa**2, "Cm": -0.02 * scale},
+            ).to_csv(os.path.join(folder, "clcd.xfoil"), index=False)
+
+    for i in range(n_planes):
+        write_synthetic_plane(db3d, i)
+    return db2d, db3d
+
+
+def write_synthetic_plane(db3d: str, i: int) -> str:
+    """
+    Writes a synthetic plane with LSPT forces to a 3D database.
+
+    Args:
+        db3d (str): Directory of the 3D database
+        i (int): Index of the plane, which sets its mesh and its forces
+
+    Returns:
+        str: Name of the plane
+    """
+    aoa: FloatArray = np.arange(-8.0, 14.5, 0.5)
+    plane = get_mesh_plane(8 + i, 4)
+    folder: str = os.path.join(db3d, plane.name)
+    os.makedirs(folder)
+    with open(os.path.join(folder, f"{plane.name}.json"), "w", encoding="utf-8") as f:
+        f.write(plane.to_json())
+    forces: dict[str, FloatArray] = {"AoA": aoa}
+    for suffix in ["", "_2D"]:
+        forces[f"L{suffix}"] = 50 * aoa + i
+        forces[f"D{suffix}"] = 2 + 0.1 * aoa**2
+        forces[f"My{suffix}"] = -3 * aoa
+    pd.DataFrame(forces).to_csv(os.path.join(folder, "forces.lspt"), index=False)
+    return plane.name
+
+
+def lazy_database() -> dict[str, tuple[FloatArray, FloatArray]]:
+    """
+    Indexes a synthetic database and checks that nothing is loaded until it is accessed, that
+    the working directory is left alone and that the lazily loaded entries match the preloaded ones.
+
+    Returns:
+        dict[str, tuple[FloatArray, FloatArray]]: Expected and actual results
+    """
+    print("Testing Lazy Database...")
+    results: dict[str, tuple[FloatArray, FloatArray]] = {}
+    cwd: str = os.getcwd()
+    with tempfile.TemporaryDirectory() as root:
+        db2d, db3d = make_synthetic_database(root, n_airfoils=3, n_planes=2)
+
+        databases: list[tuple[Database_2D, Database_3D]] = []
+        for preload in [False, True]:
+            foils_db = Database_2D()
+            foils_db.DATADIR = db2d
+            vehicles_db = Database_3D()
+            vehicles_db.DATADIR = db3d
+            if preload:
+                foils_db.preload()
+                vehicles_db.preload()
+            else:
+                foils_db.load_data()
+                vehicles_db.load_data()
+            databases.append((foils_db, vehicles_db))
+        (lazy_foils, lazy_vehicles), (eager_foils, eager_vehicles) = databases
+
+        airfoils: list[str] = sorted(eager_foils.data.keys())
+        planes: list[str] = sorted(eager_vehicles.planes.keys())
+        results["airfoil names"] = (np.array(airfoils), np.array(sorted(lazy_foils.data.keys())))
+        results["plane names"] = (np.array(planes), np.array(sorted(lazy_vehicles.planes.keys())))
+        loaded: list[bool] = [lazy_foils.data.is_loaded(airfoil) for airfoil in airfoils]
+        loaded += [lazy_vehicles.planes.is_loaded(plane) for plane in planes]
+        results["nothing loaded"] = (np.zeros(len(loaded)), np.array(loaded, dtype=float))
+
+        reynolds: FloatArray = np.array([1.5e5, 2.5e5])
+        aoa: FloatArray = np.array([-3.0, 7.25])
+        for airfoil in airfoils:
+            results[f"{airfoil} polars"] = (
+                np.array(eager_foils.interpolate_polars_batch(reynolds, [airfoil], aoa, "Xfoil")),
+                np.array(lazy_foils.interpolate_polars_batch(reynolds, [airfoil], aoa, "Xfoil")),
+            )
+        lazy_foils.airfoils[airfoils[0]]
+        results["airfoil loaded alone"] = (
+            np.array([1.0, 0.0, 0.0]),
+            np.array([lazy_foils.airfoils.is_loaded(airfoil) for airfoil in airfoils], dtype=float),
+        )
+
+        data: pd.DataFrame = lazy_vehicles.data[planes[1]]
+        results[f"{planes[1]} data"] = (eager_vehicles.data[planes[1]].to_numpy(), data.to_numpy())
+        results["plane loaded alone"] = (
+            np.array([0.0, 1.0]),
+            np.array([lazy_vehicles.planes.is_loaded(plane) for plane in planes], dtype=float),
+        )
+        results[f"{planes[0]} span"] = (
+            np.array([eager_vehicles.planes[planes[0]].span]),
+            np.array([lazy_vehicles.planes[planes[0]].span]),
+        )
+        results["working directory"] = (np.array([cwd]), np.array([os.getcwd()]))
+    return results
+
+
+def database_table_cache() -> dict[str, tuple[FloatArray, FloatArray]]:
+    """
+    Reads the polar files of an airfoil through the table cache. A second read must parse nothing,
+    and after a file is rewritten or removed only the changed files are parsed. A table with a
+    text column is parsed on every read without rewriting its entry. The data of a
+    database read through its cache must match the data parsed from the text files, and the
+    cache folders must not be indexed as airfoils or planes.
+
+    Returns:
+        dict[str, tuple[FloatArray, FloatArray]]: Expected and actual results
+    """
+    print("Testing Database Table Cache...")
+    results: dict[str, tuple[FloatArray, FloatArray]] = {}
+    with tempfile.TemporaryDirectory() as root:
+        db2d, db3d = make_synthetic_database(root, n_airfoils=2, n_planes=2)
+        airfoil_dir: str = os.path.join(db2d, "NACA0000")
+        sources: list[str] = sorted(
+            os.path.join(airfoil_dir, folder, "clcd.xfoil") for folder in os.listdir(airfoil_dir)
+        )
+        parsed: list[str] = []
+
+        def parse(source: str) -> pd.DataFrame | None:
+            parsed.append(source)
+            return Database_2D.read_polar_file(source)
+
+        cache = TableCache(os.path.join(db2d, ".cache"))
+        parse_counts: list[int] = []
+        for step in ["cold", "warm", "rewritten", "removed"]:
+            if step == "rewritten":
+                polar: pd.DataFrame = pd.read_csv(sources[1])
+                polar["CL"] *= 1.1
+                polar.to_csv(sources[1], index=False)
+                stat: os.stat_result = os.stat(sources[1])
+                os.utime(sources[1], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            elif step == "removed":
+                os.remove(sources[2])
+                sources = sources[:2]
+            parsed.clear()
+            tables = cache.read("NACA0000", sources, parse)
+            parse_counts.append(len(parsed))
+            for i, source in enumerate(sources):
+                results[f"{step} table {i}"] = (pd.read_csv(source).to_numpy(), np.asarray(tables[source]))
+        results["parsed sources"] = (np.array([3, 0, 1, 0]), np.array(parse_counts))
+
+        # A table with a text column is parsed on every read, but its unchanged entry is not rewritten
+        def parse_csv(source: str) -> pd.DataFrame | None:
+            parsed.append(source)
+            return pd.read_csv(source)
+
+        text_source: str = os.path.join(root, "text.csv")
+        pd.DataFrame({"name": ["a", "b"], "value": [1.0, 2.0]}).to_csv(text_source, index=False)
+        text_cache = TableCache(os.path.join(root, ".text_cache"))
+        text_counts: list[int] = []
+        entry_inodes: list[int] = []
+        for _ in range(3):
+            parsed.clear()
+            text_cache.read("text", [text_source], parse_csv)
+            text_counts.append(len(parsed))
+            entry_inodes.append(os.stat(text_cache.entry_path("text")).st_ino)
+        results["text table parses"] = (np.array([1, 1, 1]), np.array(text_counts))
+        results["text table entry"] = (np.full(3, entry_inodes[0]), np.array(entry_inodes))
+
+        databases: list[tuple[Database_2D, Database_3D]] = []
+        for use_cache in [False, True, True]:
+            foils_db = Database_2D()
+            foils_db.DATADIR = db2d
+            foils_db.use_cache = use_cache
+            vehicles_db = Database_3D()
+            vehicles_db.DATADIR = db3d
+            vehicles_db.use_cache = use_cache
+            foils_db.preload()
+            vehicles_db.preload()
+            databases.append((foils_db, vehicles_db))
+
+        (parsed_foils, parsed_vehicles) = databases[0]
+        for name, (foils_db, vehicles_db) in zip(["cold cache", "warm cache"], databases[1:]):
+            results[f"{name} airfoils"] = (
+                np.array(sorted(parsed_foils.data.keys())),
+                np.array(sorted(foils_db.data.keys())),
+            )
+            results[f"{name} planes"] = (
+                np.array(sorted(parsed_vehicles.planes.keys())),
+                np.array(sorted(vehicles_db.planes.keys())),
+            )
+            for airfoil in parsed_foils.data.keys():
+                for reynolds, polar in parsed_foils.data[airfoil]["Xfoil"].items():
+                    results[f"{name} {airfoil} {reynolds}"] = (
+                        polar.to_numpy(),
+                        foils_db.data[airfoil]["Xfoil"][reynolds].to_numpy(),
+                    )
+            for key, forces in parsed_vehicles.raw_data.items():
+                results[f"{name} {key} forces"] = (forces.to_numpy(), vehicles_db.raw_data[key].to_numpy())
+        results["cache entries"] = (
+            np.array([2, 2]),
+            np.array([len(os.listdir(os.path.join(db, ".cache"))) for db in (db2d, db3d)]),
+        )
+    return results
+
+
+def concurrent_database_scans() -> dict[str, tuple[FloatArray, FloatArray]]:
+    """
+    Scans and loads a synthetic database from several threads while other threads keep changing
+    the working directory, like the solver wrappers do. Each scanning thread preloads its own
+    databases with a pool of threads, and other threads read the entries of one lazily loaded
+    database at the same time. Every result must match a sequential load. Finally threads read
+    the entries of a database that a pool is loading, which must load each airfoil once.
+
+    Returns:
+        dict[str, tuple[FloatArray, FloatArray]]: Expected and actual results
+    """
+    print("Testing Concurrent Database Scans...")
+    results: dict[str, tuple[FloatArray, FloatArray]] = {}
+    cwd: str = os.getcwd()
+    with tempfile.TemporaryDirectory() as root:
+        db2d, db3d = make_synthetic_database(root, n_airfoils=6, n_planes=3)
+        # Forces without a plane object are kept although their coefficients cannot be computed
+        orphan_dir: str = os.path.join(db3d, "orphan")
+        os.makedirs(orphan_dir)
+        forces: pd.DataFrame = pd.read_csv(os.path.join(db3d, os.listdir(db3d)[0], "forces.lspt"))
+        forces.to_csv(os.path.join(orphan_dir, "forces.lspt"), index=False)
+
+        def make_databases() -> tuple[Database_2D, Database_3D]:
+            foils_db = Database_2D()
+            foils_db.DATADIR = db2d
+            vehicles_db = Database_3D()
+            vehicles_db.DATADIR = db3d
+            return foils_db, vehicles_db
+
+        foils_db, vehicles_db = make_databases()
+        foils_db.preload(max_workers=1)
+        vehicles_db.preload(max_workers=1)
+        expected: dict[str, FloatArray] = database_contents(foils_db, vehicles_db)
+
+        stop = threading.Event()
+
+        def solver(case: int) -> None:
+            case_dir: str = os.path.join(root, f"case_{case}")
+            os.makedirs(case_dir)
+            while not stop.is_set():
+                os.chdir(case_dir)
+                with open("input", "w") as f:
+                    f.write(str(case))
+                os.chdir(root)
+
+        def preload() -> dict[str, FloatArray]:
+            foils_db, vehicles_db = make_databases()
+            foils_db.preload(max_workers=4)
+            vehicles_db.preload(max_workers=4)
+            return database_contents(foils_db, vehicles_db)
+
+        lazy_foils, lazy_vehicles = make_databases()
+        lazy_foils.load_data()
+        lazy_vehicles.load_data()
+
+        def lazy_read() -> dict[str, FloatArray]:
+            return database_contents(lazy_foils, lazy_vehicles)
+
+        solvers: list[threading.Thread] = [threading.Thread(target=solver, args=(case,)) for case in range(2)]
+        for thread in solvers:
+            thread.start()
+        try:
+            with ThreadPoolExecutor(max_workers=6) as executor:
+                futures = [executor.submit(preload) for _ in range(3)]
+                futures += [executor.submit(lazy_read) for _ in range(3)]
+                contents: list[dict[str, FloatArray]] = [future.result() for future in futures]
+        finally:
+            stop.set()
+            for thread in solvers:
+                thread.join()
+            os.chdir(cwd)
+
+        for i, actual in enumerate(contents):
+            name: str = f"preload {i}" if i < 3 else f"lazy read {i - 3}"
+            results[f"{name} entries"] = (np.array(sorted(expected)), np.array(sorted(actual)))
+            for key, value in expected.items():
+                results[f"{name} {key}"] = (value, actual.get(key, np.array([])))
+
+        # Readers of a lazily loaded database race a pool loading it: each airfoil is read once
+        shared_foils, _ = make_databases()
+        loads: dict[str, int] = {}
+        load_airfoil_data = shared_foils.load_airfoil_data
+
+        def slow_load(airfoil: str) -> Struct:
+            loads[airfoil] = loads.get(airfoil, 0) + 1
+            time.sleep(0.01)
+            return load_airfoil_data(airfoil)
+
+        shared_foils.load_airfoil_data = slow_load  # type: ignore[assignment]
+        shared_foils.load_data()
+        airfoils: list[str] = sorted(shared_foils.data.keys())
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            pooled = executor.submit(shared_foils.data.load_all, 4)
+            read: list[list[str]] = list(
+                executor.map(lambda names: [name for name in names if shared_foils.data[name]], [airfoils] * 3),
+            )
+            pooled.result()
+        results["reads during a pooled load"] = (np.array([airfoils] * 3), np.array(read))
+        results["loads per airfoil"] = (np.ones(len(airfoils)), np.array([loads[airfoil] for airfoil in airfoils]))
+    return results
+
+
+def rewrite_table(file: str, column: str, factor: float) -> None:
+    """Scales a column of a table file in place and moves its modification time forward."""
+    table: pd.DataFrame = pd.read_csv(file)
+    table[column] *= factor
+    table.to_csv(file, index=False)
+    stat: os.stat_result = os.stat(file)
+    os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def incremental_refresh() -> dict[str, tuple[FloatArray, FloatArray]]:
+    """
+    Loads a synthetic database and then changes it as solver runs would: a new Reynolds number
+    for an airfoil, a rewritten polar of another, a new and a removed airfoil, rewritten forces
+    of a plane, a new and a removed plane. Refreshing must report the changed entries, parse only
+    the new polar files, keep the entries that did not change and match a database loaded from scratch.
+    Finally every table of an airfoil is removed, which must drop its solver from the data and the polars.
+
+    Returns:
+        dict[str, tuple[FloatArray, FloatArray]]: Expected and actual results
+    """
+    print("Testing Incremental Database Refresh...")
+    results: dict[str, tuple[FloatArray, FloatArray]] = {}
+    with tempfile.TemporaryDirectory() as root:
+        db2d, db3d = make_synthetic_database(root, n_airfoils=4, n_planes=3)
+
+        def make_databases() -> tuple[Database_2D, Database_3D]:
+            foils_db = Database_2D()
+            foils_db.DATADIR = db2d
+            vehicles_db = Database_3D()
+            vehicles_db.DATADIR = db3d
+            foils_db.preload(max_workers=1)
+            vehicles_db.preload(max_workers=1)
+            return foils_db, vehicles_db
+
+        foils_db, vehicles_db = make_databases()
+        planes: list[str] = sorted(vehicles_db.planes.keys())
+        kept_polars = foils_db.polars["NACA0003"]
+        kept_data: pd.DataFrame = vehicles_db.data[planes[2]]
+        unchanged: list[str] = foils_db.refresh() + vehicles_db.refresh()
+        results["nothing changed"] = (np.array([], dtype=str), np.array(unchanged, dtype=str))
+
+        reynolds_dir: str = os.path.join(db2d, "NACA0000", "Reynolds_4.000e05")
+        os.makedirs(reynolds_dir)
+        shutil.copy(os.path.join(db2d, "NACA0000", "Reynolds_3.000e05", "clcd.xfoil"), reynolds_dir)
+        rewrite_table(os.path.join(reynolds_dir, "clcd.xfoil"), "CL", 1.05)
+        rewrite_table(os.path.join(db2d, "NACA0001", "Reynolds_2.000e05", "clcd.xfoil"), "CL", 1.2)
+        shutil.copytree(os.path.join(db2d, "NACA0002"), os.path.join(db2d, "NACA0099"))
+        shutil.rmtree(os.path.join(db2d, "NACA0002"))
+        rewrite_table(os.path.join(db3d, planes[0], "forces.lspt"), "L", 1.1)
+        shutil.rmtree(os.path.join(db3d, planes[1]))
+        new_plane: str = write_synthetic_plane(db3d, 5)
+
+        parsed: list[str] = []
+
+        def parse(file: str) -> pd.DataFrame | None:
+            parsed.append(file)
+            return Database_2D.read_polar_file(file)
+
+        foils_db.read_polar_file = parse  # type: ignore[assignment]
+        results["changed airfoils"] = (
+            np.array(["NACA0000", "NACA0001", "NACA0002", "NACA0099"]),
+            np.array(sorted(foils_db.refresh())),
+        )
+        results["parsed polar files"] = (np.array([2.0]), np.array([len(parsed)], dtype=float))
+        results["changed planes"] = (
+            np.array(sorted([planes[0], planes[1], new_plane])),
+            np.array(sorted(vehicles_db.refresh())),
+        )
+        results["new entries not loaded"] = (
+            np.zeros(2),
+            np.array([foils_db.data.is_loaded("NACA0099"), vehicles_db.planes.is_loaded(new_plane)], dtype=float),
+        )
+        kept: list[bool] = [foils_db.polars["NACA0003"] is kept_polars, vehicles_db.data[planes[2]] is kept_data]
+        results["kept entries"] = (np.ones(2), np.array(kept, dtype=float))
+
+        expected: dict[str, FloatArray] = database_contents(*make_databases())
+        actual: dict[str, FloatArray] = database_contents(foils_db, vehicles_db)
+        results["entries"] = (np.array(sorted(expected)), np.array(sorted(actual)))
+        for key, value in expected.items():
+            results[key] = (value, actual.get(key, np.array([])))
+
+        # Removing every table of a solver removes its polars as well
+        for folder in os.listdir(os.path.join(db2d, "NACA0001")):
+            shutil.rmtree(os.path.join(db2d, "NACA0001", folder))
+        foils_db.refresh(["NACA0001"])
+        results["removed solver"] = (
+            np.array([], dtype=str),
+            np.array([*foils_db.data["NACA0001"].keys(), *foils_db.polars["NACA0001"].keys()], dtype=str),
+        )
+    return results
@@ -0,0 +1,33 @@
+import numpy as np
+
+from ICARUS.Aerodynamics.Potential.linear_solvers import LINEAR_SOLVERS
+from ICARUS.Aerodynamics.Potential.vorticity import symm_wing_panels
+from ICARUS.Aerodynamics.Potential.wing_lspt import Wing_LSPT
+from ICARUS.Core.types import FloatArray
+from ICARUS.Environment.definition import EARTH_ISA
+from testing.lspt_assembly_benchmark import get_mesh_plane
+
+
+def lspt_linear_solvers() -> dict[str, tuple[FloatArray, list[int]]]:
+    """
+    Runs an angle sequence of the benchmark wing in ground effect with every linear solver.
+
+    Returns:
+        dict[str, tuple[FloatArray, list[int]]]: CL of every angle and GMRES iterations of every
+        angle (empty for the direct solver) for each linear solver
+    """
+    print("Testing LSPT Linear Solvers...")
+    results: dict[str, tuple[FloatArray, list[int]]] = {}
+    for linear_solver in LINEAR_SOLVERS:
+        wing = Wing_LSPT(
+            get_mesh_plane(30, 8),
+            EARTH_ISA,
+            alpha=0,
+            ground_clearence=0.5,
+            linear_solver=linear_solver,
+            solver_tol=1e-10,
+        )
+        wing.treecode_theta = 0.15
+        df = wing.aseq([1.0, 2.0, 4.0], 20.0, symm_wing_panels, verbose=False)
+        results[linear_solver] = (df["CL"].to_numpy(), wing.solve_reports[-1].iterations)
+    return results
@@ -0,0 +1,165 @@
+"""
+Benchmark of the influence matrix assembly of Wing_LSPT. Compares the
+vectorized assembly (get_LHS) against the per pair loop (get_LHS_loop)
+on the benchmark plane and on a 100x20 mesh of the same wing. Then times
+the process parallel assembly of a 200x30 mesh for increasing worker counts.
+
+Run as a script:
+
+    python -m testing.lspt_assembly_benchmark
+"""
+import time
+from typing import Callable
+
+import numpy as np
+
+from ICARUS import CPU_COUNT
+from ICARUS.Aerodynamics.Potential.vorticity import symm_wing_panels
+from ICARUS.Aerodynamics.Potential.vorticity import voring
+from ICARUS.Aerodynamics.Potential.wing_lspt import Wing_LSPT
+from ICARUS.Core.types import FloatArray
+from ICARUS.Environment.definition import EARTH_ISA
+from ICARUS.Vehicle.plane import Airplane
+from ICARUS.Vehicle.wing_segment import define_linear_chord
+from ICARUS.Vehicle.wing_segment import define_linear_span
+from ICARUS.Vehicle.wing_segment import Wing_Segment
+
+
+def get_mesh_plane(N: int, M: int) -> Airplane:
+    """
+    Returns the benchmark wing discretized with N spanwise and M chordwise points.
+
+    Args:
+        N (int): Number of spanwise points
+        M (int): Number of chordwise points
+
+    Returns:
+        Airplane: Airplane with a single wing
+    """
+    wing = Wing_Segment(
+        name=f"bmark_{N}x{M}",
+        airfoil="0015",
+        origin=np.array([0.0, 0.0, 0.0]),
+        orientation=np.array([0.0, 0.0, 0.0]),
+        is_symmetric=True,
+        span=2 * 2.5,
+        sweep_offset=0.0,
+        dih_angle=0,
+        chord_fun=define_linear_chord,
+        chord=np.array([0.8, 0.8]),
+        span_fun=define_linear_span,
+        N=N,
+        M=M,
+        mass=1,
+    )
+    airplane = Airplane(wing.name, [wing])
+    airplane.CG = np.array([0.337, 0, 0])
+    return airplane
+
+
+def time_loop_rows(
+    wing: Wing_LSPT,
+    solve_fun: Callable[..., tuple[FloatArray, FloatArray]],
+    rows: int,
+) -> float:
+    """
+    Times the per pair loop of get_LHS_loop over the first rows of the matrix
+    and extrapolates it to the full matrix.
+
+    Args:
+        wing (Wing_LSPT): Wing to assemble
+        solve_fun (Callable[..., tuple[FloatArray, FloatArray]]): Scalar vorticity element
+        rows (int): Number of rows to time
+
+    Returns:
+        float: Estimated time for the full matrix in seconds
+    """
+    n_panels: int = (wing.N - 1) * wing.M
+    rows = min(rows, n_panels)
+    start_time: float = time.perf_counter()
+    for i in range(rows):
+        lp, kp = divmod(i, wing.M)
+        if kp == wing.M - 1:
+            continue
+        for j in range(n_panels):
+            l, k = divmod(j, wing.M)
+            U, Ustar = solve_fun(*wing.control_points[lp, kp], l, k, wing.grid)
+            np.dot(U, wing.control_nj[lp, kp])
+            np.dot(Ustar, wing.control_nj[lp, kp])
+    return (time.perf_counter() - start_time) * n_panels / rows
+
+
+def lspt_assembly_benchmark(loop_rows: int = 40) -> dict[str, tuple[float, float, float]]:
+    """
+    Runs the assembly benchmark. On the benchmark plane both assemblies run in full
+    and their difference is reported. On the 100x20 mesh the loop is timed over
+    loop_rows rows and extrapolated.
+
+    Args:
+        loop_rows (int, optional): Rows of the loop timed on the large mesh. Defaults to 40.
+
+    Returns:
+        dict[str, tuple[float, float, float]]: Loop time, vectorized time and max abs difference
+        (NaN if the loop was extrapolated) for each case
+    """
+    from examples.Vehicles.Planes.benchmark_plane import get_bmark_plane
+
+    results: dict[str, tuple[float, float, float]] = {}
+    for name, airplane, solve_fun in [
+        ("bmark symmetric", get_bmark_plane("bmark"), symm_wing_panels),
+        ("bmark asymmetric", get_bmark_plane("bmark"), voring),
+        ("100x20 symmetric", get_mesh_plane(100, 20), symm_wing_panels),
+    ]:
+        wing = Wing_LSPT(airplane, EARTH_ISA, alpha=0)
+
+        start_time: float = time.perf_counter()
+        a_np, b_np = wing.get_LHS(solve_fun)
+        vectorized_time: float = time.perf_counter() - start_time
+
+        if (wing.N - 1) * wing.M <= 1000:
+            start_time = time.perf_counter()
+            a_loop, b_loop = wing.get_LHS_loop(solve_fun)
+            loop_time: float = time.perf_counter() - start_time
+            diff = float(max(np.max(np.abs(a_np - a_loop)), np.max(np.abs(b_np - b_loop))))
+        else:
+            loop_time = time_loop_rows(wing, solve_fun, loop_rows)
+            diff = float("nan")
+
+        results[name] = (loop_time, vectorized_time, diff)
+        print(
+            f"{name:>18}: {(wing.N - 1) * wing.M:>5} panels | loop {loop_time:10.3f} s | "
+            f"vectorized {vectorized_time:8.4f} s | speedup {loop_time / vectorized_time:8.1f}x | max diff {diff:.2e}",
+        )
+    return results
+
+
+def lspt_parallel_benchmark(N: int = 200, M: int = 30) -> dict[int, float]:
+    """
+    Times the assembly of an N x M mesh with 1, 2, 4, ... workers up to the number of cores.
+
+    Args:
+        N (int, optional): Number of spanwise points. Defaults to 200.
+        M (int, optional): Number of chordwise points. Defaults to 30.
+
+    Returns:
+        dict[int, float]: Assembly time for each number of workers
+    """
+    wing = Wing_LSPT(get_mesh_plane(N, M), EARTH_ISA, alpha=0)
+    worker_counts: list[int] = [2**i for i in range(CPU_COUNT.bit_length()) if 2**i < CPU_COUNT] + [CPU_COUNT]
+
+    results: dict[int, float] = {}
+    for workers in worker_counts:
+        wing.assembly_workers = workers
+        start_time: float = time.perf_counter()
+        wing.get_LHS(symm_wing_panels)
+        results[workers] = time.perf_counter() - start_time
+        print(
+            f"{(wing.N - 1) * wing.M:>5} panels | {workers:>3} workers | {results[workers]:8.3f} s | "
+            f"speedup {results[1] / results[workers]:5.2f}x",
+        )
+    return results
+
+
+if __name__ == "__main__":
+    lspt_assembly_benchmark()
+    lspt_parallel_benchmark()
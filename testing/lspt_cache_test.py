@@ -0,0 +1,47 @@
+import os
+import tempfile
+from typing import Any
+
+import numpy as np
+
+from ICARUS.Aerodynamics.Potential.vorticity import symm_wing_panels
+from ICARUS.Aerodynamics.Potential.wing_lspt import Wing_LSPT
+from ICARUS.Core.types import FloatArray
+from ICARUS.Environment.definition import EARTH_ISA
+from testing.lspt_assembly_benchmark import get_mesh_plane
+
+
+def lspt_matrix_cache() -> dict[str, Any]:
+    """
+    Solves the benchmark wing with an on disk matrix cache: once to fill it, once more with a
+    new Wing_LSPT that should load the stored factorization, and with a changed geometry.
+    Finally the cache is shrunk to a single entry, the key of a reshaped grid is compared and an
+    Inflow-TE wake is swept over a few angles, which should leave the cache empty.
+
+    Returns:
+        dict[str, Any]: Gammas, cache entries and whether the matrices were loaded from disk at each step
+    """
+    print("Testing LSPT Matrix Cache...")
+    Q: FloatArray = 20.0 * np.array([[np.cos(np.pi / 60), 0.0, np.sin(np.pi / 60)]])
+    results: dict[str, Any] = {}
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for name, (N, M) in [("first run", (30, 8)), ("second run", (30, 8)), ("new geometry", (31, 8))]:
+            wing = Wing_LSPT(get_mesh_plane(N, M), EARTH_ISA, alpha=0, cache_dir=cache_dir)
+            gammas, _ = wing.solve_gamma_distributions(Q, symm_wing_panels)
+            results[name] = (gammas, isinstance(wing.a_np, np.memmap), len(os.listdir(cache_dir)))
+
+        if wing.matrix_cache is not None:
+            wing.matrix_cache.max_bytes = wing.matrix_cache.size() - 1
+            wing.matrix_cache.evict()
+        results["evicted"] = len(os.listdir(cache_dir))
+
+    # The same grid values in another shape are another lattice
+    key: str = wing.geometry_key(symm_wing_panels)
+    wing.grid = wing.grid.reshape(wing.grid.shape[1], wing.grid.shape[0], 3)
+    results["reshaped grid"] = key != wing.geometry_key(symm_wing_panels)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        wing = Wing_LSPT(get_mesh_plane(30, 8), EARTH_ISA, alpha=0, wake_geom_type="Inflow-TE", cache_dir=cache_dir)
+        wing.aseq([0.0, 2.0, 4.0], 20.0, symm_wing_panels, verbose=False)
+        results["inflow wake entries"] = len(os.listdir(cache_dir))
+    return results
@@ -0,0 +1,65 @@
+import numpy as np
+
+from ICARUS.Aerodynamics.Potential.vorticity import symm_wing_panels
+from ICARUS.Aerodynamics.Potential.wing_lspt import Wing_LSPT
+from ICARUS.Core.types import BoolArray
+from ICARUS.Core.types import FloatArray
+from ICARUS.Environment.definition import EARTH_ISA
+from testing.lspt_assembly_benchmark import get_mesh_plane
+
+
+def induced_velocities_loop(wing: Wing_LSPT, points: FloatArray, gammas: FloatArray) -> tuple[FloatArray, FloatArray]:
+    """
+    Reference field: sums the scalar element of every panel at every point.
+    """
+    U: FloatArray = np.zeros((points.shape[0], 3))
+    Ustar: FloatArray = np.zeros((points.shape[0], 3))
+    gammas_mat: FloatArray = np.reshape(gammas, (wing.N - 1, wing.M))
+    for p, (x, y, z) in enumerate(points):
+        for l in range(wing.N - 1):
+            for k in range(wing.M):
+                u, ustar = symm_wing_panels(x, y, z, l, k, wing.grid, gamma=gammas_mat[l, k])
+                U[p] += u
+                Ustar[p] += ustar
+    return U, Ustar
+
+
+def lspt_field() -> dict[str, tuple[FloatArray, FloatArray]]:
+    """
+    Evaluates the velocity field of the benchmark wing solved at three angles at points behind
+    the wing, in one call for the whole sweep. It is compared with the scalar element loop,
+    with the evaluation of each angle on its own, in small chunks and on a pool of processes.
+    At the control points the normal velocities must reproduce the no penetration condition.
+
+    Returns:
+        dict[str, tuple[FloatArray, FloatArray]]: Reference and evaluated velocities
+    """
+    print("Testing LSPT Velocity Field...")
+    umag: float = 20.0
+    alphas: FloatArray = np.array([-2.0, 1.0, 4.0]) * np.pi / 180
+    wing = Wing_LSPT(get_mesh_plane(15, 5), EARTH_ISA, alpha=0)
+    Qs: FloatArray = umag * np.stack((np.cos(alphas), np.zeros_like(alphas), np.sin(alphas)), axis=1)
+    gammas, w = wing.solve_gamma_distributions(Qs, symm_wing_panels)
+
+    rng = np.random.default_rng(5)
+    points: FloatArray = rng.uniform([0.5, 0.0, -0.3], [2.0, 1.0, 0.3], (40, 3))
+    U, Ustar = wing.induced_velocities(points, gammas)
+
+    results: dict[str, tuple[FloatArray, FloatArray]] = {}
+    for k in range(len(alphas)):
+        U_loop, Ustar_loop = induced_velocities_loop(wing, points, gammas[:, k])
+        results[f"U loop {k}"] = (U_loop, U[:, :, k])
+        results[f"Ustar loop {k}"] = (Ustar_loop, Ustar[:, :, k])
+        results[f"U single {k}"] = (U[:, :, k], wing.induced_velocities(points, gammas[:, k])[0])
+
+    results["chunked"] = (U, wing.induced_velocities(points, gammas, chunk_size=500)[0])
+    results["workers"] = (U, wing.induced_velocities(points, gammas, chunk_size=500, workers=2)[0])
+
+    # Normal velocities at the control points (Kutta rows excluded)
+    normals: FloatArray = wing.control_nj.reshape(-1, 3)
+    U_cp, Ustar_cp = wing.induced_velocities(wing.control_points.reshape(-1, 3), gammas)
+    body: BoolArray = np.arange(normals.shape[0]) % wing.M != wing.M - 1
+    RHS: FloatArray = wing.get_RHS_matrix(Qs)
+    results["no penetration"] = (RHS[body], np.einsum("pik,pi->pk", U_cp, normals)[body])
+    results["induced w"] = (w[body], np.einsum("pik,pi->pk", Ustar_cp, normals)[body])
+    return results
@@ -0,0 +1,25 @@
+import numpy as np
+
+from ICARUS.Aerodynamics.Potential.vorticity import symm_wing_panels
+from ICARUS.Aerodynamics.Potential.wing_lspt import Wing_LSPT
+from ICARUS.Environment.definition import EARTH_ISA
+from testing.lspt_assembly_benchmark import get_mesh_plane
+
+
+def lspt_ground_effect() -> dict[float | None, tuple[float, float]]:
+    """
+    Solves the benchmark wing in free air and at several heights above the ground.
+    The same Wing_LSPT is reused for every height so that its free air matrices are reused.
+
+    Returns:
+        dict[float | None, tuple[float, float]]: CL and CD at 3 degrees for each height (None for free air)
+    """
+    print("Testing LSPT Ground Effect...")
+    wing = Wing_LSPT(get_mesh_plane(10, 5), EARTH_ISA, alpha=0)
+
+    results: dict[float | None, tuple[float, float]] = {}
+    for height in [None, 1e6, 2.0, 0.5, 0.2]:
+        wing.ground_effect_dist = height
+        df = wing.aseq([3.0], 20.0, symm_wing_panels, verbose=False)
+        results[height] = (float(df["CL"].iloc[0]), float(df["CD"].iloc[0]))
+    return results
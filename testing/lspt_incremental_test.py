@@ -0,0 +1,101 @@
+import numpy as np
+
+from ICARUS.Aerodynamics.Potential.vorticity import symm_wing_panels
+from ICARUS.Aerodynamics.Potential.wing_lspt import Wing_LSPT
+from ICARUS.Core.types import FloatArray
+from ICARUS.Environment.definition import EARTH_ISA
+from ICARUS.Vehicle.plane import Airplane
+from ICARUS.Vehicle.wing_segment import define_linear_chord
+from ICARUS.Vehicle.wing_segment import define_linear_span
+from ICARUS.Vehicle.wing_segment import Wing_Segment
+
+
+def get_wing_tail_plane(
+    N: int,
+    M: int,
+    incidence: float,
+    tail_sweep_offset: float = 0.0,
+    tail_chord: list[float] = [0.4, 0.4],
+) -> Airplane:
+    """
+    Returns the benchmark wing with a horizontal tail.
+
+    Args:
+        N (int): Number of spanwise points of the wing. The tail has N // 3.
+        M (int): Number of chordwise points
+        incidence (float): Incidence of the tail in degrees
+        tail_sweep_offset (float, optional): Sweep offset of the tail. Defaults to 0.
+        tail_chord (list[float], optional): Root and tip chords of the tail. Defaults to 0.4 m.
+
+    Returns:
+        Airplane: Airplane with a wing and a tail
+    """
+    wing = Wing_Segment(
+        name="wing",
+        airfoil="0015",
+        origin=np.array([0.0, 0.0, 0.0]),
+        orientation=np.array([0.0, 0.0, 0.0]),
+        is_symmetric=True,
+        span=2 * 2.5,
+        sweep_offset=0.0,
+        dih_angle=0,
+        chord_fun=define_linear_chord,
+        chord=np.array([0.8, 0.8]),
+        span_fun=define_linear_span,
+        N=N,
+        M=M,
+        mass=1,
+    )
+    tail = Wing_Segment(
+        name="tail",
+        airfoil="0008",
+        origin=np.array([3.0, 0.0, 0.2]),
+        orientation=np.array([incidence, 0.0, 0.0]),
+        is_symmetric=True,
+        span=2 * 0.8,
+        sweep_offset=tail_sweep_offset,
+        dih_angle=0,
+        chord_fun=define_linear_chord,
+        chord=np.array(tail_chord),
+        span_fun=define_linear_span,
+        N=N // 3,
+        M=M,
+        mass=0.2,
+    )
+    airplane = Airplane("wing_tail", [wing, tail])
+    airplane.CG = np.array([0.337, 0, 0])
+    return airplane
+
+
+def lspt_incremental_solve() -> dict[str, tuple[FloatArray, FloatArray]]:
+    """
+    Sweeps the incidence of the tail updating a single Wing_LSPT and compares every solve
+    with a Wing_LSPT built from scratch for the same incidence.
+
+    Returns:
+        dict[str, tuple[FloatArray, FloatArray]]: Rebuilt and updated gammas, induced velocities
+        and transposed solves for every incidence, and the times the clean strips were factorized
+    """
+    print("Testing LSPT Incremental Solve...")
+    N, M = 30, 6
+    alpha: float = 2 * np.pi / 180
+    Q: FloatArray = 20.0 * np.array([[np.cos(alpha), 0.0, np.sin(alpha)]])
+
+    wing = Wing_LSPT(get_wing_tail_plane(N, M, 0.0), EARTH_ISA, alpha=alpha)
+    wing.solve_gamma_distributions(Q, symm_wing_panels)
+
+    results: dict[str, tuple[FloatArray, FloatArray]] = {}
+    clean_keys: set[str] = set()
+    for incidence in [-1.0, -2.5, -4.0]:
+        wing.update_plane(get_wing_tail_plane(N, M, incidence))
+        gammas, w = wing.solve_gamma_distributions(Q, symm_wing_panels)
+        if wing._clean_factorization is not None:
+            clean_keys.add(wing._clean_factorization[0])
+
+        rebuilt = Wing_LSPT(get_wing_tail_plane(N, M, incidence), EARTH_ISA, alpha=alpha)
+        gammas_rebuilt, w_rebuilt = rebuilt.solve_gamma_distributions(Q, symm_wing_panels)
+        results[f"gammas {incidence}"] = (gammas_rebuilt, gammas)
+        results[f"w {incidence}"] = (w_rebuilt, w)
+        results[f"transposed {incidence}"] = (rebuilt.solve_LHS(gammas[:, 0], 1), wing.solve_LHS(gammas[:, 0], 1))
+    results["clean factorizations"] = (np.array(1), np.array(len(clean_keys)))
+    return results
@@ -0,0 +1,55 @@
+import numpy as np
+
+from ICARUS.Aerodynamics.Potential.vorticity import symm_wing_panels
+from ICARUS.Aerodynamics.Potential.wing_lspt import Wing_LSPT
+from ICARUS.Core.types import FloatArray
+from ICARUS.Environment.definition import EARTH_ISA
+from testing.lspt_assembly_benchmark import get_mesh_plane
+
+
+def panel_loads_loop(wing: Wing_LSPT, gammas: FloatArray, w: FloatArray, umag: float) -> FloatArray:
+    """
+    Reference panel loop for the loads of one solution.
+
+    Returns:
+        FloatArray: Lift, Trefftz plane drag and the three moments
+    """
+    gammas_mat: FloatArray = np.reshape(gammas, (wing.N - 1, wing.M))
+    w_mat: FloatArray = np.reshape(w, (wing.N - 1, wing.M))
+    L: float = 0
+    D_trefftz: float = 0
+    M: FloatArray = np.zeros(3)
+    for i in range(wing.N - 1):
+        for j in range(wing.M):
+            dy: float = wing.grid[i + 1, j, 1] - wing.grid[i, j, 1]
+            g: float = gammas_mat[i, j] - (gammas_mat[i, j - 1] if j > 0 else 0)
+            L_pan: float = wing.dens * umag * dy * g
+            D_pan: float = -wing.dens * dy * g * w_mat[i, j]
+            L += L_pan
+            if j == wing.M - 2:
+                D_trefftz += -wing.dens / 2 * dy * gammas_mat[i, j] * w_mat[i, j]
+            if j < wing.M - 1:
+                arm: FloatArray = np.cross(wing.control_points[i, j] - wing.cog, wing.control_nj[i, j])
+                M += (L_pan + D_pan) * arm
+    return np.array([L, D_trefftz, *M])
+
+
+def lspt_panel_loads() -> dict[str, tuple[FloatArray, FloatArray]]:
+    """
+    Integrates the loads of several angles of attack at once and compares them with the panel loop.
+
+    Returns:
+        dict[str, tuple[FloatArray, FloatArray]]: Loop and whole array loads for each angle
+    """
+    print("Testing LSPT Panel Loads...")
+    wing = Wing_LSPT(get_mesh_plane(20, 6), EARTH_ISA, alpha=0)
+    alphas: FloatArray = np.array([-2.0, 1.0, 4.0]) * np.pi / 180
+    Qs: FloatArray = 20 * np.stack((np.cos(alphas), np.zeros_like(alphas), np.sin(alphas)), axis=-1)
+    gammas, w = wing.solve_gamma_distributions(Qs, symm_wing_panels)
+
+    L_pan, _, D_trefftz, moments = wing.integrate_panel_loads(gammas, w, 20)
+    results: dict[str, tuple[FloatArray, FloatArray]] = {}
+    for col, alpha in enumerate(alphas):
+        actual: FloatArray = np.array([np.sum(L_pan[col]), D_trefftz[col], *moments[col]])
+        results[f"alpha {alpha}"] = (panel_loads_loop(wing, gammas[:, col], w[:, col], 20), actual)
+    return results
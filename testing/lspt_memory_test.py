@@ -0,0 +1,57 @@
+import tracemalloc
+
+import numpy as np
+
+from ICARUS.Aerodynamics.Potential.assembly import assemble_LHS
+from ICARUS.Aerodynamics.Potential.vorticity import symm_wing_panels
+from ICARUS.Aerodynamics.Potential.wing_lspt import Wing_LSPT
+from ICARUS.Core.types import FloatArray
+from ICARUS.Environment.definition import EARTH_ISA
+from testing.lspt_assembly_benchmark import get_mesh_plane
+
+
+def lspt_lean_memory() -> tuple[dict[str, tuple[FloatArray, FloatArray]], tuple[int, int]]:
+    """
+    Runs an angle sequence of the benchmark wing with an Inflow-TE wake, in free air and in
+    ground effect, with the regular and the lean memory storage. The loads must agree up to
+    the float32 rounding of b and the lean solves must peak lower. A float32 b assembled by a
+    pool of processes must match the serial one.
+
+    Returns:
+        tuple[dict[str, tuple[FloatArray, FloatArray]], tuple[int, int]]: Regular and lean loads,
+        and the peak traced memory of the free air solves of the regular and the lean wing
+    """
+    print("Testing LSPT Lean Memory...")
+    umag: float = 20.0
+    angles: list[float] = [-2.0, 1.0, 4.0]
+    columns: list[str] = ["CL", "CD", "Cm"]
+
+    results: dict[str, tuple[FloatArray, FloatArray]] = {}
+    peaks: list[int] = []
+    tracemalloc.start()
+    try:
+        for ground_clearence in [None, 0.5]:
+            name: str = "free air" if ground_clearence is None else "ground effect"
+            loads: list[FloatArray] = []
+            for lean_memory in [False, True]:
+                wing = Wing_LSPT(
+                    get_mesh_plane(30, 8),
+                    EARTH_ISA,
+                    alpha=0,
+                    ground_clearence=ground_clearence,
+                    wake_geom_type="Inflow-TE",
+                    lean_memory=lean_memory,
+                )
+                df = wing.aseq(angles, umag, symm_wing_panels, verbose=False)
+                loads.append(df[columns].to_numpy())
+                if ground_clearence is None:
+                    peaks.append(max(report.peak_bytes for report in wing.solve_reports))
+            results[name] = (loads[0], loads[1])
+    finally:
+        tracemalloc.stop()
+
+    lattice = (wing.control_points, wing.control_nj, wing.grid, symm_wing_panels)
+    _, b_serial = assemble_LHS(*lattice, chunk_size=2000, b_dtype=np.float32)
+    _, b_parallel = assemble_LHS(*lattice, chunk_size=2000, workers=2, b_dtype=np.float32)
+    results["parallel float32 b"] = (b_serial, b_parallel)
+    return results, (peaks[0], peaks[1])
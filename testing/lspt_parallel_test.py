@@ -0,0 +1,36 @@
+from typing import Callable
+
+import numpy as np
+
+from ICARUS.Aerodynamics.Potential.assembly import assemble_ground_image_LHS
+from ICARUS.Aerodynamics.Potential.assembly import assemble_LHS
+from ICARUS.Aerodynamics.Potential.vorticity import symm_wing_panels
+from ICARUS.Aerodynamics.Potential.wing_lspt import Wing_LSPT
+from ICARUS.Core.types import FloatArray
+from ICARUS.Environment.definition import EARTH_ISA
+from testing.lspt_assembly_benchmark import get_mesh_plane
+
+
+def lspt_parallel_assembly(workers: int = 3) -> dict[str, tuple[FloatArray, FloatArray]]:
+    """
+    Assembles the influence matrices of a small mesh serially and with a pool of processes.
+    The chunk size is small so that the rows are split into several blocks.
+
+    Returns:
+        dict[str, tuple[FloatArray, FloatArray]]: Serial and parallel matrices for each case
+    """
+    print("Testing LSPT Parallel Assembly...")
+    wing = Wing_LSPT(get_mesh_plane(20, 6), EARTH_ISA, alpha=0)
+    lattice = (wing.control_points, wing.control_nj, wing.grid, symm_wing_panels)
+
+    results: dict[str, tuple[FloatArray, FloatArray]] = {}
+    cases: list[tuple[str, Callable[..., tuple[FloatArray, FloatArray]], dict[str, float]]] = [
+        ("free air", assemble_LHS, {}),
+        ("ground image", assemble_ground_image_LHS, {"ground": -0.5}),
+    ]
+    for name, assemble, kwargs in cases:
+        a_serial, b_serial = assemble(*lattice, chunk_size=2000, **kwargs)
+        a_parallel, b_parallel = assemble(*lattice, chunk_size=2000, workers=workers, **kwargs)
+        results[f"{name} a"] = (a_serial, a_parallel)
+        results[f"{name} b"] = (b_serial, b_parallel)
+    return results
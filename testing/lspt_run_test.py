@@ -47,7 +47,7 @@ def lspt_run() -> None:
     options.u_freestream.value = u_freestream
     options.angles.value = angles
 
-    solver_parameters.Ground_Effect.value = True
+    solver_parameters.Ground_Effect.value = None
     solver_parameters.Wake_Geom_Type.value = "TE-Geometrical"
 
     _ = lspt.get_analysis_options(verbose=True)
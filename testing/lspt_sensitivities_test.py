@@ -0,0 +1,117 @@
+from typing import Callable
+
+import numpy as np
+
+from ICARUS.Aerodynamics.Potential.vorticity import symm_wing_panels
+from ICARUS.Aerodynamics.Potential.vorticity import voring
+from ICARUS.Aerodynamics.Potential.wing_lspt import Wing_LSPT
+from ICARUS.Core.types import FloatArray
+from ICARUS.Environment.definition import EARTH_ISA
+from testing.lspt_incremental_test import get_wing_tail_plane
+
+
+def solve_coefficients(
+    wing: Wing_LSPT,
+    reference: Wing_LSPT,
+    solve_fun: Callable[..., tuple[FloatArray, FloatArray]],
+    umag: float,
+    rates: FloatArray,
+) -> FloatArray:
+    """
+    Solves the wing at its angles and angular rates and returns its CL, CD and Cm with the
+    reference area, chord and CG of the reference wing. The onset velocity at every control
+    point is the freestream minus the rotation of the airplane about the CG.
+    """
+    wing.S, wing.MAC, wing.cog = reference.S, reference.MAC, reference.cog
+    Q: FloatArray = umag * np.array(
+        [
+            np.cos(wing.alpha) * np.cos(wing.beta),
+            np.cos(wing.alpha) * np.sin(wing.beta),
+            np.sin(wing.alpha) * np.cos(wing.beta),
+        ],
+    )
+    onset: FloatArray = Q - np.cross(rates, wing.control_points.reshape(-1, 3) - wing.cog)
+    RHS: FloatArray = -np.sum(wing.control_nj.reshape(-1, 3) * onset, axis=1)
+    RHS[wing.M - 1 :: wing.M] = 0
+
+    a_np, b_np = wing.get_LHS(solve_fun)
+    gammas: FloatArray = np.linalg.solve(a_np, RHS)
+    return wing.load_coefficients(gammas, b_np @ gammas, umag)
+
+
+def lspt_sensitivities() -> dict[str, tuple[FloatArray, FloatArray]]:
+    """
+    Compares the adjoint sensitivities of Wing_LSPT with central differences of full solves. The
+    longitudinal parameters are checked on the half span lattice of a wing and tail for both kinds
+    of wake and the lateral ones on the full span lattice.
+
+    Returns:
+        dict[str, tuple[FloatArray, FloatArray]]: Finite difference and adjoint derivatives of CL, CD and Cm
+    """
+    print("Testing LSPT Sensitivities...")
+    N, M = 15, 5
+    umag: float = 20.0
+    alpha: float = 3 * np.pi / 180
+    h: float = 1e-5
+
+    cases: list[tuple[str, bool, Callable[..., tuple[FloatArray, FloatArray]], list[str]]] = [
+        (
+            "TE-Geometrical",
+            True,
+            symm_wing_panels,
+            ["alpha", "q", "tail.incidence", "tail.sweep_offset", "tail.chord[0]"],
+        ),
+        ("Inflow-TE", True, symm_wing_panels, ["alpha", "tail.incidence"]),
+        ("TE-Geometrical", False, voring, ["beta", "p", "r", "tail.chord[1]"]),
+    ]
+    results: dict[str, tuple[FloatArray, FloatArray]] = {}
+    for wake_geom_type, use_symmetry, solve_fun, names in cases:
+
+        def build(
+            alpha: float = alpha,
+            beta: float = 0.0,
+            incidence: float = -2.0,
+            sweep_offset: float = 0.0,
+            chord: list[float] = [0.4, 0.4],
+        ) -> Wing_LSPT:
+            return Wing_LSPT(
+                get_wing_tail_plane(N, M, incidence, sweep_offset, chord),
+                EARTH_ISA,
+                alpha=alpha,
+                beta=beta,
+                wake_geom_type=wake_geom_type,
+                use_symmetry=use_symmetry,
+            )
+
+        wing: Wing_LSPT = build()
+        Q: FloatArray = umag * np.array([[np.cos(alpha), 0, np.sin(alpha)]])
+        gammas, w = wing.solve_gamma_distributions(Q, solve_fun)
+        wing.set_gamma_distribution(gammas[:, 0], w[:, 0])
+        adjoint = wing.sensitivities(umag, solve_fun)
+
+        for name in names:
+            differences: list[FloatArray] = []
+            for step in [h, -h]:
+                rates: FloatArray = np.zeros(3)
+                if name in ["p", "q", "r"]:
+                    rates["pqr".index(name)] = step
+                    perturbed: Wing_LSPT = build()
+                elif name == "alpha":
+                    perturbed = build(alpha=alpha + step)
+                elif name == "beta":
+                    perturbed = build(beta=step)
+                elif name == "tail.incidence":
+                    perturbed = build(incidence=-2.0 + step * 180 / np.pi)
+                elif name == "tail.sweep_offset":
+                    perturbed = build(sweep_offset=step)
+                elif name == "tail.chord[0]":
+                    perturbed = build(chord=[0.4 + step, 0.4])
+                else:
+                    perturbed = build(chord=[0.4, 0.4 + step])
+                differences.append(solve_coefficients(perturbed, wing, solve_fun, umag, rates))
+            desired: FloatArray = (differences[0] - differences[1]) / (2 * h)
+            results[f"{wake_geom_type} {'half' if use_symmetry else 'full'} span {name}"] = (
+                desired,
+                adjoint.loc[name].to_numpy(),
+            )
+    return results
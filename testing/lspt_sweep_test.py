@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+
+from ICARUS.Aerodynamics.Potential.vorticity import symm_wing_panels
+from ICARUS.Aerodynamics.Potential.vorticity import voring
+from ICARUS.Aerodynamics.Potential.wing_lspt import Wing_LSPT
+from ICARUS.Core.types import FloatArray
+from ICARUS.Environment.definition import EARTH_ISA
+from testing.lspt_assembly_benchmark import get_mesh_plane
+
+
+def sweep_loop(wing: Wing_LSPT, umag: float, conditions: FloatArray) -> FloatArray:
+    """
+    Reference sweep: solves every condition on its own, with the onset velocity Q - omega x (r - CG)
+    evaluated at every control point.
+    """
+    loads: list[FloatArray] = []
+    for alpha, beta, p, q, r in conditions:
+        wing.alpha, wing.beta = alpha * np.pi / 180, beta * np.pi / 180
+        Q: FloatArray = umag * np.array(
+            [
+                np.cos(wing.alpha) * np.cos(wing.beta),
+                np.cos(wing.alpha) * np.sin(wing.beta),
+                np.sin(wing.alpha) * np.cos(wing.beta),
+            ],
+        )
+        points: FloatArray = wing.control_points.reshape(-1, 3)
+        onset: FloatArray = Q - np.cross([p, q, r], points - wing.cog)
+        RHS: FloatArray = -np.sum(wing.control_nj.reshape(-1, 3) * onset, axis=1)
+        RHS[wing.M - 1 :: wing.M] = 0
+
+        a_np, b_np = wing.get_LHS(voring)
+        gammas: FloatArray = np.linalg.solve(a_np, RHS)
+        L_pan, _, D_trefftz, moments = wing.integrate_panel_loads(gammas, b_np @ gammas, umag)
+        loads.append(np.array([np.sum(L_pan), D_trefftz, *moments]))
+    return np.array(loads)
+
+
+def lspt_sweep() -> dict[str, tuple[FloatArray, FloatArray]]:
+    """
+    Sweeps the benchmark wing over angles of attack, sideslip and body rates in one call and compares
+    the loads with the conditions solved one by one. The wake of the sweep must only be factorized once
+    per geometry. Opposite roll and yaw rates must give the same lift and opposite rolling and yawing
+    moments, and a pitch rate sweep of the half span lattice must match the one of the full span.
+
+    Returns:
+        dict[str, tuple[FloatArray, FloatArray]]: Reference and sweep results
+    """
+    print("Testing LSPT Sideslip and Rate Sweep...")
+    umag: float = 20.0
+    conditions: FloatArray = np.array(
+        [
+            [2.0, -3.0, 0.0, 0.0, 0.3],
+            [2.0, 0.0, 0.5, 0.0, 0.0],
+            [2.0, 3.0, 0.0, 0.0, 0.0],
+            [4.0, 0.0, 0.0, 1.0, 0.0],
+            [4.0, 2.0, -0.5, 0.5, -0.3],
+        ],
+    )
+    columns: list[str] = ["L", "D", "Mx", "My", "Mz"]
+
+    results: dict[str, tuple[FloatArray, FloatArray]] = {}
+    for wake_geom_type in ["TE-Geometrical", "Inflow-TE"]:
+        wing = Wing_LSPT(get_mesh_plane(12, 5), EARTH_ISA, alpha=0, wake_geom_type=wake_geom_type, use_symmetry=False)
+        n_reports: int = len(wing.solve_reports)
+        df: pd.DataFrame = wing.sweep(umag, voring, *conditions.T)
+        n_groups: int = 1 if wake_geom_type == "TE-Geometrical" else 2
+        results[f"{wake_geom_type} solves"] = (np.array([n_groups]), np.array([len(wing.solve_reports) - n_reports]))
+        results[f"{wake_geom_type} conditions"] = (conditions, df[["AoA", "AoS", "p", "q", "r"]].to_numpy())
+        results[f"{wake_geom_type} loads"] = (sweep_loop(wing, umag, conditions), df[columns].to_numpy())
+
+    df = wing.sweep(umag, voring, alpha=4.0, p=[-0.5, 0.5], r=[-0.3, 0.3])
+    results["rates symmetry"] = (df[["L", "D", "My"]].to_numpy()[0], df[["L", "D", "My"]].to_numpy()[1])
+    results["rates antisymmetry"] = (df[["Mx", "Mz"]].to_numpy()[0], -df[["Mx", "Mz"]].to_numpy()[1])
+
+    full = Wing_LSPT(get_mesh_plane(12, 5), EARTH_ISA, alpha=0, use_symmetry=False)
+    half = Wing_LSPT(get_mesh_plane(12, 5), EARTH_ISA, alpha=0)
+    df_full: pd.DataFrame = full.sweep(umag, voring, alpha=3.0, q=[-1.0, 0.0, 1.0])
+    df_half: pd.DataFrame = half.sweep(umag, symm_wing_panels, alpha=3.0, q=[-1.0, 0.0, 1.0])
+    results["half span pitch rate"] = (df_full.to_numpy(), df_half.to_numpy())
+    return results
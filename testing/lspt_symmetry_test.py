@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+
+from ICARUS.Aerodynamics.Potential.vorticity import symm_wing_panels
+from ICARUS.Aerodynamics.Potential.vorticity import voring
+from ICARUS.Aerodynamics.Potential.wing_lspt import Wing_LSPT
+from ICARUS.Environment.definition import EARTH_ISA
+from testing.lspt_assembly_benchmark import get_mesh_plane
+
+
+def lspt_symmetry() -> dict[str, tuple[pd.DataFrame, pd.DataFrame]]:
+    """
+    Solves a symmetric wing once on the half span lattice with mirror images
+    and once on the mirrored full span lattice.
+
+    Returns:
+        dict[str, tuple[pd.DataFrame, pd.DataFrame]]: Full span and half span results for each wake type
+    """
+    print("Testing LSPT Half Span Symmetric Solve...")
+    angles: list[float] = [-2.0, 0.0, 3.0]
+    columns: list[str] = ["L", "D", "My", "CL", "CD", "Cm"]
+
+    results: dict[str, tuple[pd.DataFrame, pd.DataFrame]] = {}
+    for wake_geom_type in ["TE-Geometrical", "Inflow-TE"]:
+        half = Wing_LSPT(get_mesh_plane(10, 5), EARTH_ISA, alpha=0, wake_geom_type=wake_geom_type)
+        full = Wing_LSPT(
+            get_mesh_plane(10, 5),
+            EARTH_ISA,
+            alpha=0,
+            wake_geom_type=wake_geom_type,
+            use_symmetry=False,
+        )
+        if not half.is_symmetric or full.is_symmetric or 2 * (half.N - 1) != full.N - 1:
+            raise ValueError("Expected a half span and a full span lattice")
+
+        df_half: pd.DataFrame = half.aseq(angles, 20.0, symm_wing_panels, verbose=False)
+        df_full: pd.DataFrame = full.aseq(angles, 20.0, voring, verbose=False)
+        results[wake_geom_type] = (df_full[columns], df_half[columns])
+    return results
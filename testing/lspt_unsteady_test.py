@@ -0,0 +1,51 @@
+import numpy as np
+
+from ICARUS.Aerodynamics.Potential.vorticity import symm_wing_panels
+from ICARUS.Aerodynamics.Potential.wing_lspt import Wing_LSPT
+from ICARUS.Core.types import FloatArray
+from ICARUS.Environment.definition import EARTH_ISA
+from testing.lspt_assembly_benchmark import get_mesh_plane
+
+
+def lspt_unsteady() -> dict[str, tuple[FloatArray, FloatArray, float]]:
+    """
+    Starts the benchmark wing impulsively at a constant freestream. Once the starting vortex
+    is far downstream the lift of the time marching solve must reach the lift of the steady
+    solve with a wake along the freestream. Capping the wake by merging its oldest rows and
+    letting it roll up must barely change the lift. A uniform gust must act as the same change
+    of the freestream.
+
+    Returns:
+        dict[str, tuple[FloatArray, FloatArray, float]]: Reference and unsteady results with their relative tolerance
+    """
+    print("Testing LSPT Unsteady Solver...")
+    umag: float = 20.0
+    alpha: float = 4 * np.pi / 180
+    Q: FloatArray = umag * np.array([np.cos(alpha), 0.0, np.sin(alpha)])
+
+    wing = Wing_LSPT(get_mesh_plane(15, 5), EARTH_ISA, alpha=alpha, wake_geom_type="Inflow-TE")
+    steady = wing.aseq([4.0], umag, symm_wing_panels, verbose=False)
+    dt: float = wing.MAC / umag / 4
+
+    results: dict[str, tuple[FloatArray, FloatArray, float]] = {}
+    rigid = wing.unsteady_run(np.tile(Q, (60, 1)), dt, free_wake=False)
+    results["steady limit"] = (steady["CL"].to_numpy(), rigid["CL"].to_numpy()[-1:], 1e-2)
+
+    capped = wing.unsteady_run(np.tile(Q, (60, 1)), dt, free_wake=False, max_wake_rows=30)
+    results["capped wake"] = (rigid["CL"].to_numpy()[-1:], capped["CL"].to_numpy()[-1:], 1e-3)
+    results["capped rows"] = (np.array([30.0]), capped["Wake Rows"].to_numpy()[-1:], 0.0)
+
+    free = wing.unsteady_run(np.tile(Q, (30, 1)), dt, free_wake=True)
+    results["free wake"] = (rigid["CL"].to_numpy()[:30], free["CL"].to_numpy(), 1e-2)
+
+    gust: FloatArray = np.array([0.0, 0.0, 1.0])
+
+    def uniform_gust(points: FloatArray, time: float) -> FloatArray:
+        return np.broadcast_to(gust, points.shape)
+
+    with_gust = wing.unsteady_run(np.tile(Q, (10, 1)), dt, gust=uniform_gust)
+    gust_wake: FloatArray = wing.unsteady_wake.grid
+    shifted = wing.unsteady_run(np.tile(Q + gust, (10, 1)), dt)
+    results["gust moment"] = (shifted["My"].to_numpy(), with_gust["My"].to_numpy(), 1e-10)
+    results["gust wake"] = (wing.unsteady_wake.grid, gust_wake, 1e-10)
+    return results
@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+
+from ICARUS.Aerodynamics.Potential.lifting_surfaces import run_lspt_variants
+from ICARUS.Aerodynamics.Potential.vorticity import symm_wing_panels
+from ICARUS.Aerodynamics.Potential.wing_lspt import Wing_LSPT
+from ICARUS.Core.types import FloatArray
+from ICARUS.Environment.definition import EARTH_ISA
+from ICARUS.Vehicle.plane import Airplane
+from testing.lspt_incremental_test import get_wing_tail_plane
+
+
+def lspt_variants() -> dict[str, tuple[FloatArray, FloatArray]]:
+    """
+    Solves tail incidence variants, and one variant with a finer mesh, with the batched
+    run_lspt_variants and one by one with aseq, for both kinds of wake.
+
+    Returns:
+        dict[str, tuple[FloatArray, FloatArray]]: One by one and batched coefficients for every wake and worker count
+    """
+    print("Testing LSPT Design Batch...")
+    planes: list[Airplane] = [get_wing_tail_plane(15, 5, incidence) for incidence in [-3.0, -2.0, -1.0, 0.0]]
+    planes.append(get_wing_tail_plane(18, 5, -2.0))
+    angles: list[float] = [-2.0, 0.0, 3.0, 3.0]
+    columns: list[str] = ["AoA", "L", "D", "My", "CL", "CD", "Cm"]
+
+    results: dict[str, tuple[FloatArray, FloatArray]] = {}
+    for wake_geom_type in ["TE-Geometrical", "Inflow-TE"]:
+        dfs: list[pd.DataFrame] = []
+        for plane in planes:
+            wing = Wing_LSPT(plane, EARTH_ISA, alpha=0, wake_geom_type=wake_geom_type)
+            dfs.append(wing.aseq(angles, 20.0, symm_wing_panels, verbose=False))
+        desired: FloatArray = pd.concat(dfs, ignore_index=True)[columns].to_numpy()
+
+        for workers in [1, 2]:
+            df: pd.DataFrame = run_lspt_variants(
+                planes,
+                EARTH_ISA,
+                20.0,
+                angles,
+                {"Wake_Geom_Type": wake_geom_type},
+                batch_size=2,
+                workers=workers,
+            )
+            if list(df["Variant"]) != list(np.repeat(np.arange(len(planes)), len(angles))):
+                raise ValueError("The variants are out of order")
+            results[f"{wake_geom_type} {workers} workers"] = (desired, df[columns].to_numpy())
+    return results
@@ -0,0 +1,82 @@
+import numpy as np
+
+from ICARUS.Aerodynamics.Potential.wing_lspt import Wing_LSPT
+from ICARUS.Core.types import FloatArray
+from ICARUS.Core.types import IntArray
+from ICARUS.Environment.definition import EARTH_ISA
+from ICARUS.Vehicle.wing_segment import define_linear_chord
+from ICARUS.Vehicle.wing_segment import define_linear_span
+from ICARUS.Vehicle.wing_segment import Wing_Segment
+from testing.lspt_incremental_test import get_wing_tail_plane
+
+
+def grid_to_panels_loop(
+    grid: FloatArray,
+    control_grid: FloatArray,
+    control_fraction: FloatArray,
+) -> tuple[FloatArray, FloatArray, FloatArray]:
+    """
+    Reference panels: sets the corners, the control point and the normal of every panel in turn.
+    """
+    N, M, _ = grid.shape
+    panels: FloatArray = np.empty((N - 1, M - 1, 4, 3))
+    control_points: FloatArray = np.empty((N - 1, M - 1, 3))
+    control_nj: FloatArray = np.empty((N - 1, M - 1, 3))
+    for i in range(N - 1):
+        for j in range(M - 1):
+            panels[i, j] = [grid[i + 1, j], grid[i, j], grid[i, j + 1], grid[i + 1, j + 1]]
+            leading_edge: FloatArray = (control_grid[i, j] + control_grid[i + 1, j]) / 2
+            trailing_edge: FloatArray = (control_grid[i, j + 1] + control_grid[i + 1, j + 1]) / 2
+            control_points[i, j] = leading_edge + control_fraction * (trailing_edge - leading_edge)
+            normal: FloatArray = np.cross(panels[i, j, 0] - panels[i, j, 2], panels[i, j, 1] - panels[i, j, 3])
+            control_nj[i, j] = normal / np.linalg.norm(normal)
+    return panels, control_points, control_nj
+
+
+def panel_construction() -> dict[str, tuple[FloatArray, FloatArray]]:
+    """
+    Compares the panels of a swept, tapered wing segment with dihedral and of the lattices of a
+    wing with a tail with the panel by panel construction. The lattice leaves out the last row of
+    every segment but the last one.
+
+    Returns:
+        dict[str, tuple[FloatArray, FloatArray]]: Reference and vectorized panels, control points and normals
+    """
+    print("Testing Panel Construction...")
+    segment = Wing_Segment(
+        name="swept",
+        airfoil="4415",
+        origin=np.array([0.1, 0.0, 0.05]),
+        orientation=np.array([2.0, 0.0, 0.0]),
+        is_symmetric=True,
+        span=3.0,
+        sweep_offset=0.3,
+        dih_angle=5,
+        chord_fun=define_linear_chord,
+        chord=np.array([0.6, 0.3]),
+        span_fun=define_linear_span,
+        N=9,
+        M=6,
+        mass=1,
+    )
+    fractions: FloatArray = np.array([3 / 4, 1 / 2, 1 / 2])
+    names: list[str] = ["panels", "control_points", "control_nj"]
+
+    results: dict[str, tuple[FloatArray, FloatArray]] = {}
+    for surface in ["", "_upper", "_lower"]:
+        reference = grid_to_panels_loop(getattr(segment, f"grid{surface}"), segment.grid, fractions)
+        for name, desired in zip(names, reference):
+            results[f"segment {name}{surface}"] = (desired, getattr(segment, f"{name}{surface}"))
+
+    plane = get_wing_tail_plane(12, 6, 2.0, tail_sweep_offset=0.1)
+    for use_symmetry in [True, False]:
+        wing = Wing_LSPT(plane, EARTH_ISA, alpha=0.05, use_symmetry=use_symmetry)
+        grids: list[FloatArray] = [
+            surface.grid if wing.is_symmetric else surface.get_grid("camber") for surface in plane.surfaces
+        ]
+        ends: IntArray = np.cumsum([grid.shape[0] for grid in grids])[:-1] - 1
+        results[f"lattice grid {use_symmetry}"] = (np.delete(np.concatenate(grids), ends, axis=0), wing.grid[:, :-1])
+        reference = grid_to_panels_loop(wing.grid, wing.grid, np.full(3, 3 / 4))
+        for name, desired in zip(names, reference):
+            results[f"lattice {name} {use_symmetry}"] = (desired, getattr(wing, name))
+    return results
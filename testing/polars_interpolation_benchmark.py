@@ -0,0 +1,85 @@
+"""
+Benchmark of the polar lookups. Times the per query lookup through the Reynolds
+subtables of the polars and the single point calls of Database_2D.interpolate_polars
+and of the dense grid interpolator of the polars. Then times the vectorized
+Polars.interpolate and the interpolator on growing batches of (Reynolds, AoA)
+queries. The cost of building the grid is reported apart.
+
+Run as a script:
+
+    python -m testing.polars_interpolation_benchmark
+"""
+import time
+from typing import Any
+from typing import Callable
+
+import numpy as np
+
+from ICARUS.Airfoils.airfoil_polars import PolarInterpolator
+from ICARUS.Airfoils.airfoil_polars import Polars
+from ICARUS.Core.struct import Struct
+from ICARUS.Core.types import FloatArray
+from ICARUS.Database import DB
+from testing.polars_interpolation_test import interpolate_polars_loop
+from testing.polars_interpolation_test import synthetic_polars
+
+
+def polars_interpolation_benchmark(
+    loop_queries: int = 200,
+    batch_sizes: list[int] = [100, 10_000, 1_000_000],
+) -> dict[str, float]:
+    """
+    Runs the polar lookup benchmark.
+
+    Args:
+        loop_queries (int, optional): Queries timed with the per query lookups. Defaults to 200.
+        batch_sizes (list[int], optional): Numbers of queries of the interpolator calls.
+
+    Returns:
+        dict[str, float]: Time per query in seconds of each lookup, and the time to build the grid
+    """
+    polars: Polars = synthetic_polars()
+    airfoil_name: str = "benchmark_synthetic"
+    DB.foils_db.polars[airfoil_name] = Struct({"Xfoil": polars})
+    rng = np.random.default_rng(0)
+
+    results: dict[str, float] = {}
+    start_time: float = time.perf_counter()
+    interpolator: PolarInterpolator = polars.interpolator
+    results["grid build"] = time.perf_counter() - start_time
+    print(f"{'grid build':>28}: {1e3 * results['grid build']:10.3f} ms")
+
+    try:
+        reynolds: FloatArray = rng.uniform(1e5, 8e5, loop_queries)
+        aoa: FloatArray = rng.uniform(-10, 16, loop_queries)
+        lookups: list[tuple[str, Callable[[float, float], Any]]] = [
+            ("subtable loop", lambda re, a: interpolate_polars_loop(polars, re, a)),
+            ("interpolate_polars", lambda re, a: DB.foils_db.interpolate_polars(re, airfoil_name, a, "Xfoil")),
+            ("interpolator single", lambda re, a: interpolator(re, a)),
+        ]
+        for name, lookup in lookups:
+            start_time = time.perf_counter()
+            for re, a in zip(reynolds, aoa):
+                lookup(re, a)
+            results[name] = (time.perf_counter() - start_time) / loop_queries
+            print(f"{name:>28}: {1e6 * results[name]:10.3f} us per query")
+    finally:
+        del DB.foils_db.polars[airfoil_name]
+
+    for batch_size in batch_sizes:
+        reynolds = rng.uniform(1e5, 8e5, batch_size)
+        aoa = rng.uniform(-10, 16, batch_size)
+        batch_lookups: list[tuple[str, Callable[[FloatArray, FloatArray], Any]]] = [
+            ("Polars.interpolate", polars.interpolate),
+            ("interpolator", interpolator),
+        ]
+        for name, batch_lookup in batch_lookups:
+            start_time = time.perf_counter()
+            batch_lookup(reynolds, aoa)
+            results[f"{name} x{batch_size}"] = (time.perf_counter() - start_time) / batch_size
+            print(f"{f'{name} x{batch_size}':>28}: {1e6 * results[f'{name} x{batch_size}']:10.3f} us per query")
+    return results
+
+
+if __name__ == "__main__":
+    polars_interpolation_benchmark()
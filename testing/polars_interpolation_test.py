@@ -0,0 +1,200 @@
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from ICARUS.Aerodynamics.Potential.vorticity import symm_wing_panels
+from ICARUS.Aerodynamics.Potential.wing_lspt import Wing_LSPT
+from ICARUS.Airfoils.airfoil_polars import PolarInterpolator
+from ICARUS.Airfoils.airfoil_polars import Polars
+from ICARUS.Core.struct import Struct
+from ICARUS.Core.types import FloatArray
+from ICARUS.Database import DB
+from ICARUS.Environment.definition import EARTH_ISA
+from testing.lspt_assembly_benchmark import get_mesh_plane
+
+
+def synthetic_polars() -> Polars:
+    """
+    Returns polars at three Reynolds numbers with different angle ranges, so that
+    the merged table has gaps filled from the neighbouring Reynolds numbers.
+    """
+    data: dict[str, DataFrame] = {}
+    for reynolds, (start, stop) in [(1e5, (-6, 10)), (3e5, (-8, 12)), (8e5, (-8, 14))]:
+        aoa: FloatArray = np.arange(start, stop + 0.5, 0.5)
+        scale: float = np.log10(reynolds) / 5
+        key: str = np.format_float_scientific(reynolds, sign=False, precision=3, min_digits=3).replace("+", "")
+        data[key] = pd.DataFrame(
+            {
+                "AoA": aoa,
+                "CL": scale * 0.11 * aoa - 0.002 * aoa**2 / scale,
+                "CD": 0.01 / scale + 0.0004 * aoa**2,
+                "Cm": -0.02 * scale + 0.001 * aoa,
+            },
+        )
+    return Polars(data)
+
+
+def interpolate_polars_loop(polars: Polars, reynolds: float, aoa: float) -> tuple[float, float, float]:
+    """
+    Reference lookup: interpolates the two bracketing Reynolds subtables in AoA and then in Reynolds.
+    """
+    reynolds_stored: list[float] = sorted(polars.reynolds_nums)
+    if reynolds in reynolds_stored:
+        lower_reynolds: float = reynolds
+        upper_reynolds: float = reynolds
+    else:
+        i: int = int(np.searchsorted(reynolds_stored, reynolds))
+        lower_reynolds, upper_reynolds = reynolds_stored[i - 1], reynolds_stored[i]
+    upper_polar: DataFrame = polars.get_reynolds_subtable(upper_reynolds)
+    lower_polar: DataFrame = polars.get_reynolds_subtable(lower_reynolds)
+    coefficients: list[float] = []
+    for name in ["CL", "CD", "Cm"]:
+        up: float = float(np.interp(aoa, upper_polar["AoA"], upper_polar[name]))
+        low: float = float(np.interp(aoa, lower_polar["AoA"], lower_polar[name]))
+        coefficients.append(float(np.interp(reynolds, [lower_reynolds, upper_reynolds], [low, up])))
+    return coefficients[0], coefficients[1], coefficients[2]
+
+
+def polars_interpolation() -> dict[str, tuple[FloatArray, FloatArray]]:
+    """
+    Compares the vectorized polar lookup with the per point lookup, on random points and
+    on stored Reynolds numbers and angles outside of the tables.
+
+    Returns:
+        dict[str, tuple[FloatArray, FloatArray]]: Per point and vectorized CL, CD and Cm
+    """
+    print("Testing Polars Interpolation...")
+    polars: Polars = synthetic_polars()
+    rng = np.random.default_rng(3)
+    reynolds: FloatArray = np.concatenate((rng.uniform(1e5, 8e5, 200), np.array([1e5, 3e5, 8e5, 3e5, 8e5])))
+    aoa: FloatArray = np.concatenate((rng.uniform(-10, 16, 200), np.array([2.25, -9.0, 15.0, 0.0, -3.3])))
+
+    desired: FloatArray = np.array([interpolate_polars_loop(polars, re, a) for re, a in zip(reynolds, aoa)]).T
+    actual: FloatArray = np.array(polars.interpolate(reynolds, aoa))
+    return {"polars": (desired, actual)}
+
+
+def polar_interpolator() -> dict[str, tuple[FloatArray, FloatArray]]:
+    """
+    Compares the dense grid interpolator with the vectorized lookup of the polars, its single
+    queries with its batched ones and its lookup on polars with unevenly spaced angles, which
+    must stay on the grid, with the per point lookup. Checks
+    the extrapolation rules on linear polars and the broadcasting of the queries.
+
+    Returns:
+        dict[str, tuple[FloatArray, FloatArray]]: Expected and interpolated CL, CD and Cm
+    """
+    print("Testing Polar Interpolator...")
+    polars: Polars = synthetic_polars()
+    rng = np.random.default_rng(4)
+    reynolds: FloatArray = rng.uniform(1e5, 8e5, 300)
+    aoa: FloatArray = rng.uniform(-10, 16, 300)
+
+    results: dict[str, tuple[FloatArray, FloatArray]] = {}
+    results["polars"] = (np.array(polars.interpolate(reynolds, aoa)), np.array(polars.interpolator(reynolds, aoa)))
+    single: FloatArray = np.array([polars.interpolator(re, a) for re, a in zip(reynolds, aoa)]).T
+    results["single queries"] = (np.array(polars.interpolator(reynolds, aoa)), single)
+
+    uneven: dict[str, DataFrame] = {}
+    for stored_reynolds, scale in [(1e5, 1.0), (5e5, 1.3)]:
+        key: str = np.format_float_scientific(stored_reynolds, sign=False, precision=3, min_digits=3).replace("+", "")
+        angles: FloatArray = np.array([-6.0, -4.0, -1.0, 0.0, 0.5, 2.0, 5.0, 9.0])
+        uneven[key] = pd.DataFrame(
+            {"AoA": angles, "CL": scale * np.sin(angles / 5), "CD": 0.01 + 0.001 * angles**2, "Cm": 0.01 * angles},
+        )
+    uneven_polars: Polars = Polars(uneven)
+    reynolds = rng.uniform(1e5, 5e5, 50)
+    aoa = rng.uniform(-8, 11, 50)
+    desired: FloatArray = np.array([interpolate_polars_loop(uneven_polars, re, a) for re, a in zip(reynolds, aoa)]).T
+    results["uneven angles"] = (desired, np.array(uneven_polars.interpolator(reynolds, aoa)))
+
+    # Linear polars: CL = 0.1 AoA + Re / 1e7
+    linear_reynolds: FloatArray = np.array([1e5, 2e5])
+    linear_angles: FloatArray = np.arange(-5.0, 10.5, 0.5)
+    coefficients: FloatArray = (0.1 * linear_angles + linear_reynolds[:, None] / 1e7)[None]
+    queries: FloatArray = np.array([-12.0, -5.0, 3.3, 10.0, 17.5])
+    for rule, expected in [
+        ("clamp", 0.1 * np.clip(queries, -5, 10) + 0.015),
+        ("linear", 0.1 * queries + 0.015),
+        ("nan", np.where((queries < -5) | (queries > 10), np.nan, 0.1 * queries + 0.015)),
+    ]:
+        interpolator = PolarInterpolator(linear_reynolds, linear_angles, coefficients, aoa_extrapolation=rule)
+        (values,) = interpolator(1.5e5, queries)
+        results[f"aoa {rule}"] = (expected, np.asarray(values))
+
+    clamped = PolarInterpolator(linear_reynolds, linear_angles, coefficients, reynolds_extrapolation="clamp")
+    results["reynolds clamp"] = (np.array([0.01, 0.02]), np.asarray(clamped(np.array([5e4, 3e5]), 0.0)[0]))
+    nans = PolarInterpolator(linear_reynolds, linear_angles, coefficients, reynolds_extrapolation="nan")
+    results["reynolds nan"] = (np.array([np.nan, 0.015, np.nan]), np.asarray(nans(np.array([5e4, 1.5e5, 3e5]), 0.0)[0]))
+    try:
+        PolarInterpolator(linear_reynolds, linear_angles, coefficients)(3e5, 0.0)
+        raised: bool = False
+    except ValueError:
+        raised = True
+    results["reynolds raise"] = (np.array([1.0]), np.array([float(raised)]))
+
+    grid_reynolds, grid_aoa = np.meshgrid(linear_reynolds, queries[1:4], indexing="ij")
+    linear = PolarInterpolator(linear_reynolds, linear_angles, coefficients)
+    results["broadcast"] = (
+        np.asarray(linear(grid_reynolds, grid_aoa)[0]),
+        np.asarray(linear(linear_reynolds[:, None], queries[1:4])[0]),
+    )
+    return results
+
+
+def lspt_strip_polars() -> dict[str, tuple[FloatArray, FloatArray]]:
+    """
+    Runs an angle sequence of the benchmark wing with synthetic polars for its airfoil. The 2D
+    loads that aseq looks up for all angles at once are compared with the per angle integration.
+    Without polars for the solver, the 2D loads of a new and of an already solved wing must be NaN.
+
+    Returns:
+        dict[str, tuple[FloatArray, FloatArray]]: Per angle and batched CL_2D, CD_2D and Cm_2D and
+        the 2D loads without polars
+    """
+    print("Testing LSPT Strip Polars...")
+    wing = Wing_LSPT(get_mesh_plane(20, 6), EARTH_ISA, alpha=0)
+    airfoil_name: str = wing.wing_segments[0].airfoil.name
+
+    stored: Struct | None = None
+    if airfoil_name in DB.foils_db.polars.keys():
+        stored = DB.foils_db.polars[airfoil_name]
+    DB.foils_db.polars[airfoil_name] = Struct({"Xfoil": synthetic_polars()})
+    try:
+        umag: float = 5.0
+        angles: list[float] = [-2.0, 1.0, 4.0]
+        df = wing.aseq(angles, umag, symm_wing_panels, verbose=False)
+
+        desired: list[list[float]] = []
+        for angle in angles:
+            wing.alpha = angle * np.pi / 180
+            Q: FloatArray = umag * np.array([[np.cos(wing.alpha), 0, np.sin(wing.alpha)]])
+            gammas, w = wing.solve_gamma_distributions(Q, symm_wing_panels)
+            wing.set_gamma_distribution(gammas[:, 0], w[:, 0])
+            wing.get_aerodynamic_loads(umag, verbose=False)
+            desired.append([2 * wing.CL_2D, 2 * wing.CD_2D, 2 * wing.Cm_2D])
+
+        # Without polars for the solver the lookup fails: the 2D loads of a new wing and of
+        # the one solved above must both be NaN
+        DB.foils_db.polars[airfoil_name] = Struct({})
+        failed: list[list[float]] = []
+        for failing_wing in [Wing_LSPT(get_mesh_plane(20, 6), EARTH_ISA, alpha=0), wing]:
+            Q = umag * np.array([np.cos(failing_wing.alpha), 0, np.sin(failing_wing.alpha)])
+            failing_wing.solve_wing_panels(Q, symm_wing_panels)
+            failing_wing.get_gamma_distribution()
+            failing_wing.get_aerodynamic_loads(umag, verbose=False)
+            failed.append(
+                [
+                    float(getattr(failing_wing, name, 0.0))
+                    for name in ["L_2D", "D_2D", "My_2D", "CL_2D", "CD_2D", "Cm_2D"]
+                ],
+            )
+    finally:
+        if stored is None:
+            del DB.foils_db.polars[airfoil_name]
+        else:
+            DB.foils_db.polars[airfoil_name] = stored
+    return {
+        "strip polars": (np.array(desired), df[["CL_2D", "CD_2D", "Cm_2D"]].to_numpy()),
+        "missing polars": (np.full((2, 6), np.nan), np.array(failed)),
+    }
@@ -0,0 +1,131 @@
+"""
+Accuracy and speed of the treecode against the direct kernel. First the velocities
+induced by a solved lattice are compared for several opening angles, then the
+dense LU solve of Wing_LSPT is compared with the matrix free GMRES solve on meshes
+of increasing size. The dense solve is skipped on meshes above dense_limit panels.
+
+Run as a script:
+
+    python -m testing.treecode_benchmark
+"""
+import time
+
+import numpy as np
+
+from ICARUS.Aerodynamics.Potential.treecode import lattice_strengths
+from ICARUS.Aerodynamics.Potential.treecode import Treecode
+from ICARUS.Aerodynamics.Potential.vorticity import _grid_segments
+from ICARUS.Aerodynamics.Potential.vorticity import symm_wing_panels
+from ICARUS.Aerodynamics.Potential.vorticity import vortexL_batch
+from ICARUS.Aerodynamics.Potential.wing_lspt import Wing_LSPT
+from ICARUS.Core.types import FloatArray
+from ICARUS.Environment.definition import EARTH_ISA
+from testing.lspt_assembly_benchmark import get_mesh_plane
+
+
+def lift(wing: Wing_LSPT, gammas: FloatArray, w: FloatArray, umag: float) -> float:
+    """Returns the lift coefficient of a solution of the wing."""
+    wing.set_gamma_distribution(gammas, w)
+    wing.get_aerodynamic_loads(umag, verbose=False)
+    return wing.CL
+
+
+def treecode_accuracy(
+    N: int = 100,
+    M: int = 20,
+    thetas: list[float] = [0.15, 0.2, 0.3, 0.5],
+) -> dict[float, tuple[float, float, float]]:
+    """
+    Compares the velocities induced at the control points by the solved lattice.
+
+    Args:
+        N (int, optional): Number of spanwise points. Defaults to 100.
+        M (int, optional): Number of chordwise points. Defaults to 20.
+        thetas (list[float], optional): Opening angles to test.
+
+    Returns:
+        dict[float, tuple[float, float, float]]: Relative error, setup time and evaluation time for each theta
+    """
+    wing = Wing_LSPT(get_mesh_plane(N, M), EARTH_ISA, alpha=0)
+    Q: FloatArray = 20.0 * np.array([np.cos(np.pi / 60), 0.0, np.sin(np.pi / 60)])
+    gammas, _ = wing.solve_gamma_distributions(Q[None, :], symm_wing_panels)
+
+    points: FloatArray = wing.control_points.reshape(-1, 3)
+    span_start, span_end, chord_start, chord_end = _grid_segments(wing.grid)
+    x1: FloatArray = np.concatenate((span_start, chord_start))
+    x2: FloatArray = np.concatenate((span_end, chord_end))
+    strengths: FloatArray = lattice_strengths(gammas[:, 0], (wing.grid.shape[0], wing.grid.shape[1]))
+
+    start_time: float = time.perf_counter()
+    U_direct: FloatArray = vortexL_batch(points, x1, x2, strengths)
+    direct_time: float = time.perf_counter() - start_time
+    print(f"{points.shape[0]} points, {x1.shape[0]} lines | direct {direct_time:.3f} s")
+
+    results: dict[float, tuple[float, float, float]] = {}
+    for theta in thetas:
+        start_time = time.perf_counter()
+        tree = Treecode(points, x1, x2, theta=theta)
+        setup_time: float = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        U: FloatArray = tree.velocities(strengths)
+        eval_time: float = time.perf_counter() - start_time
+
+        error = float(np.linalg.norm(U - U_direct) / np.linalg.norm(U_direct))
+        results[theta] = (error, setup_time, eval_time)
+        print(
+            f"theta {theta:4.2f}: relative error {error:.2e} | setup {setup_time:7.3f} s | "
+            f"evaluation {eval_time:7.4f} s | {direct_time / eval_time:6.1f}x faster than direct",
+        )
+    return results
+
+
+def treecode_solve(
+    meshes: list[tuple[int, int]] = [(50, 10), (100, 20), (200, 30), (400, 40)],
+    theta: float = 0.3,
+    dense_limit: int = 6000,
+) -> dict[tuple[int, int], tuple[float, float, float, float]]:
+    """
+    Solves the benchmark wing at 3 degrees with the dense LU and with matrix free GMRES.
+
+    Args:
+        meshes (list[tuple[int, int]], optional): (N, M) of the meshes to solve.
+        theta (float, optional): Opening angle of the treecode. Defaults to 0.3.
+        dense_limit (int, optional): Largest number of panels solved densely. Defaults to 6000.
+
+    Returns:
+        dict[tuple[int, int], tuple[float, float, float, float]]: Dense time, matrix free time,
+        dense CL and matrix free CL for each mesh (NaN when the dense solve is skipped)
+    """
+    umag: float = 20
+    Q: FloatArray = umag * np.array([np.cos(np.pi / 60), 0, np.sin(np.pi / 60)])
+
+    results: dict[tuple[int, int], tuple[float, float, float, float]] = {}
+    for N, M in meshes:
+        wing = Wing_LSPT(get_mesh_plane(N, M), EARTH_ISA, alpha=np.pi / 60)
+        n_panels: int = (wing.N - 1) * wing.M
+
+        dense_time: float = float("nan")
+        CL_dense: float = float("nan")
+        if n_panels <= dense_limit:
+            start_time: float = time.perf_counter()
+            gammas, w = wing.solve_gamma_distributions(Q[None, :], symm_wing_panels)
+            dense_time = time.perf_counter() - start_time
+            CL_dense = lift(wing, gammas[:, 0], w[:, 0], umag)
+
+        start_time = time.perf_counter()
+        gammas, w = wing.solve_gamma_distributions_matrix_free(Q[None, :], symm_wing_panels, theta=theta)
+        free_time: float = time.perf_counter() - start_time
+        CL_free: float = lift(wing, gammas[:, 0], w[:, 0], umag)
+
+        results[(N, M)] = (dense_time, free_time, CL_dense, CL_free)
+        print(
+            f"{N:>4}x{M:<3}: {n_panels:>6} panels | dense {dense_time:8.3f} s | matrix free {free_time:8.3f} s | "
+            f"CL dense {CL_dense:.6f} | CL matrix free {CL_free:.6f}",
+        )
+    return results
+
+
+if __name__ == "__main__":
+    treecode_accuracy()
+    treecode_solve()
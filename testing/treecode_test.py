@@ -0,0 +1,61 @@
+import numpy as np
+
+from ICARUS.Aerodynamics.Potential.treecode import lattice_strengths
+from ICARUS.Aerodynamics.Potential.treecode import Treecode
+from ICARUS.Aerodynamics.Potential.vorticity import _grid_segments
+from ICARUS.Aerodynamics.Potential.vorticity import symm_wing_panels
+from ICARUS.Aerodynamics.Potential.vorticity import voring
+from ICARUS.Aerodynamics.Potential.vorticity import vortexL_batch
+from ICARUS.Aerodynamics.Potential.wing_lspt import Wing_LSPT
+from ICARUS.Core.types import FloatArray
+from ICARUS.Environment.definition import EARTH_ISA
+from testing.lspt_assembly_benchmark import get_mesh_plane
+
+
+def treecode_velocities(thetas: list[float] = [0.1, 0.3]) -> dict[float, tuple[FloatArray, FloatArray]]:
+    """
+    Evaluates the field of a random lattice of vortex rings at random points
+    both with the direct kernel and with the treecode.
+
+    Returns:
+        dict[float, tuple[FloatArray, FloatArray]]: Direct and treecode velocities for each theta
+    """
+    print("Testing Treecode Velocities...")
+    rng = np.random.default_rng(7)
+    n, m = 40, 10
+    X, Y = np.meshgrid(np.linspace(0, 1, m), np.linspace(0, 4, n))
+    grid: FloatArray = np.stack((X, Y, 0.1 * np.sin(Y)), axis=-1)
+    span_start, span_end, chord_start, chord_end = _grid_segments(grid)
+    x1: FloatArray = np.concatenate((span_start, chord_start))
+    x2: FloatArray = np.concatenate((span_end, chord_end))
+    strengths: FloatArray = lattice_strengths(rng.normal(size=(n - 1) * (m - 1)), (n, m))
+    points: FloatArray = rng.uniform([-0.5, -0.5, -0.5], [1.5, 4.5, 0.5], size=(500, 3))
+
+    U_direct: FloatArray = vortexL_batch(points, x1, x2, strengths)
+    return {theta: (U_direct, Treecode(points, x1, x2, theta=theta).velocities(strengths)) for theta in thetas}
+
+
+def lspt_matrix_free(theta: float = 0.2) -> dict[str, tuple[FloatArray, FloatArray]]:
+    """
+    Solves the benchmark wing with the dense LU and matrix free, without and with ground effect.
+
+    Returns:
+        dict[str, tuple[FloatArray, FloatArray]]: Dense and matrix free gammas for each case
+    """
+    print("Testing LSPT Matrix Free Solve...")
+    Q: FloatArray = 20.0 * np.array([[np.cos(np.pi / 60), 0.0, np.sin(np.pi / 60)]])
+
+    results: dict[str, tuple[FloatArray, FloatArray]] = {}
+    for symmetric, solve_fun in [(True, symm_wing_panels), (False, voring)]:
+        for ground_clearence in [None, 0.5]:
+            wing = Wing_LSPT(
+                get_mesh_plane(30, 8),
+                EARTH_ISA,
+                alpha=np.pi / 60,
+                ground_clearence=ground_clearence,
+                use_symmetry=symmetric,
+            )
+            gammas, _ = wing.solve_gamma_distributions(Q, solve_fun)
+            gammas_free, _ = wing.solve_gamma_distributions_matrix_free(Q, solve_fun, theta=theta)
+            results[f"{solve_fun.__name__} ground {ground_clearence}"] = (gammas, gammas_free)
+    return results
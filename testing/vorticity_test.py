@@ -0,0 +1,74 @@
+from typing import Callable
+
+import numpy as np
+
+from ICARUS.Aerodynamics.Potential.assembly import ground_image
+from ICARUS.Aerodynamics.Potential.vorticity import ground_effect
+from ICARUS.Aerodynamics.Potential.vorticity import ground_effect_batch
+from ICARUS.Aerodynamics.Potential.vorticity import hshoe2
+from ICARUS.Aerodynamics.Potential.vorticity import hshoe2_batch
+from ICARUS.Aerodynamics.Potential.vorticity import hshoeSL2
+from ICARUS.Aerodynamics.Potential.vorticity import hshoeSL2_batch
+from ICARUS.Aerodynamics.Potential.vorticity import symm_wing_panels
+from ICARUS.Aerodynamics.Potential.vorticity import symm_wing_panels_batch
+from ICARUS.Aerodynamics.Potential.vorticity import voring
+from ICARUS.Aerodynamics.Potential.vorticity import voring_batch
+from ICARUS.Aerodynamics.Potential.vorticity import vortexL
+from ICARUS.Aerodynamics.Potential.vorticity import vortexL_batch
+from ICARUS.Core.types import FloatArray
+
+
+def batched_vorticity() -> dict[str, tuple[FloatArray, FloatArray]]:
+    """
+    Evaluates every vorticity element on a random grid both with the scalar
+    functions and with their batched counterparts. Some of the evaluation points
+    lie on the grid to exercise the cutoff.
+
+    Returns:
+        dict[str, tuple[FloatArray, FloatArray]]: Scalar and batched induced velocities for each element
+    """
+    print("Testing Batched Vorticity Elements...")
+    rng = np.random.default_rng(42)
+    n, m = 5, 6
+    grid: FloatArray = rng.normal(size=(n, m, 3))
+    points: FloatArray = np.vstack((rng.normal(size=(6, 3)), grid[2, 3], (grid[1, 1] + grid[2, 1]) / 2))
+
+    # (scalar, batched, number of elements per grid row, whether the scalar takes the row index first)
+    element = Callable[..., tuple[FloatArray, FloatArray]]
+    elements: list[tuple[element, element, int, bool]] = [
+        (voring, voring_batch, m - 1, True),
+        (symm_wing_panels, symm_wing_panels_batch, m - 1, True),
+        (hshoe2, hshoe2_batch, m - 1, False),
+        (hshoeSL2, hshoeSL2_batch, m - 2, False),
+        (ground_effect, ground_effect_batch, m - 2, False),
+    ]
+
+    results: dict[str, tuple[FloatArray, FloatArray]] = {}
+    for scalar, batched, cols, row_first in elements:
+        U, Ustar = batched(points, grid, chunk_size=50)
+        U_scalar: FloatArray = np.empty_like(U)
+        Ustar_scalar: FloatArray = np.empty_like(Ustar)
+        for p, (x, y, z) in enumerate(points):
+            for j in range(n - 1):
+                for k in range(cols):
+                    idx: tuple[int, int] = (j, k) if row_first else (k, j)
+                    U_scalar[p, j * cols + k], Ustar_scalar[p, j * cols + k] = scalar(x, y, z, *idx, grid)
+        results[scalar.__name__] = (np.hstack((U_scalar, Ustar_scalar)), np.hstack((U, Ustar)))
+
+    x1: FloatArray = rng.normal(size=(9, 3))
+    x2: FloatArray = rng.normal(size=(9, 3))
+    gammas: FloatArray = rng.normal(size=9)
+    U_scalar = np.zeros((points.shape[0], 3))
+    for p, (x, y, z) in enumerate(points):
+        for start, end, gamma in zip(x1, x2, gammas):
+            U_scalar[p] += vortexL(x, y, z, start[0], start[1], start[2], end[0], end[1], end[2], gamma)
+    results["vortexL"] = (U_scalar, vortexL_batch(points, x1, x2, gammas, chunk_size=10))
+
+    # The ground image is the lattice mirrored about z = ground with opposite circulation
+    ground: float = -1.5
+    mirrored_grid: FloatArray = grid * np.array([1.0, 1.0, -1.0]) + np.array([0.0, 0.0, 2 * ground])
+    U, Ustar = voring_batch(points, mirrored_grid)
+    U_image, Ustar_image = ground_image(voring, ground)(points, grid, chunk_size=50)
+    results["ground_image"] = (-np.hstack((U, Ustar)), np.hstack((U_image, Ustar_image)))
+
+    return results